@@ -0,0 +1,96 @@
+""" Compare hashing and equality of FrozenEqualityMixin classes with EqualityMixin.
+
+Run from the repository root:
+
+    python script/benchmark_equality.py
+
+Each figure is the best of five repeats, in microseconds for 200 objects. """
+
+import timeit
+
+from tala.ddd.services.service_interface import ServiceInterface
+from tala.event import Event
+from tala.model.common import Modality
+from tala.model.ddd import DDD
+from tala.model.domain import Domain
+from tala.model.interpretation import Interpretation
+from tala.model.ontology import Ontology
+from tala.model.user_move import DDDSpecificUserMove
+from tala.utils.equality import EqualityMixin
+
+AMOUNT = 200
+NUMBER = 50
+REPEAT = 5
+
+
+def with_equality_mixin(class_):
+    return type(class_.__name__, (class_, ), {"__eq__": EqualityMixin.__eq__, "__hash__": EqualityMixin.__hash__})
+
+
+def create_user_moves(wrap):
+    user_move_class = wrap(DDDSpecificUserMove)
+    return [user_move_class("mockup_ddd", "answer(city_%d)" % index, 0.9, 0.8) for index in range(AMOUNT)]
+
+
+def create_interpretations(wrap):
+    interpretation_class = wrap(Interpretation)
+    return [interpretation_class([user_move], Modality.SPEECH, "utterance") for user_move in create_user_moves(wrap)]
+
+
+def create_events(wrap):
+    event_class = wrap(Event)
+    return [event_class("INTERPRETATION", interpretation) for interpretation in create_interpretations(wrap)]
+
+
+def create_ddds(wrap):
+    ddd_class = wrap(DDD)
+    ddds = []
+    for index in range(AMOUNT):
+        name = "ddd_%d" % index
+        ontology = Ontology("ontology_%d" % index, [], [], {}, [])
+        domain = Domain(name, "domain_%d" % index, ontology)
+        ddds.append(ddd_class(name, ontology, domain, ServiceInterface([], [], []), name))
+    return ddds
+
+
+def microseconds(function):
+    return min(timeit.repeat(function, number=NUMBER, repeat=REPEAT)) / NUMBER * 1e6
+
+
+def measure(name, create, objects):
+    def hash_all():
+        for object_ in objects:
+            hash(object_)
+
+    def compare_all():
+        first = objects[0]
+        for object_ in objects:
+            first == object_
+
+    try:
+        hash_all()
+    except TypeError as exception:
+        hashing = "unhashable (%s)" % exception
+    else:
+        hashing = "hash %8.1f  set %8.1f" % (microseconds(hash_all), microseconds(lambda: set(objects)))
+    print("  %-20s create %8.1f  %s  eq %8.1f" % (name, microseconds(create), hashing, microseconds(compare_all)))
+
+
+def unchanged(class_):
+    return class_
+
+
+def main():
+    for title, create in [
+        ("user moves", create_user_moves),
+        ("interpretations", create_interpretations),
+        ("events", create_events),
+        ("DDDs", create_ddds),
+    ]:
+        print(title)
+        measure("EqualityMixin", lambda: create(with_equality_mixin), create(with_equality_mixin))
+        measure("FrozenEqualityMixin", lambda: create(unchanged), create(unchanged))
+
+
+if __name__ == "__main__":
+    main()
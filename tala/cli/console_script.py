@@ -4,7 +4,6 @@ import importlib
 import os
 import warnings
 import logging
-import json
 
 from requests.exceptions import MissingSchema
 import structlog
@@ -13,6 +12,7 @@ from tala.cli import console_formatting
 from tala.cli.tdm.tdm_cli import TDMCLI
 from tala.config import BackendConfig, DddConfig, DeploymentsConfig, BackendConfigNotFoundException, \
     DddConfigNotFoundException, DeploymentsConfigNotFoundException
+from tala.ddd.loading.compile_cache import DDDCompileCache, DEFAULT_COMPILE_CACHE_DIRECTORY
 from tala.ddd.maker.ddd_maker import DddMaker
 from tala.log.logger import configure_stdout_logging, configure_file_logging
 from tala.cli.argument_parser import add_common_backend_arguments, add_shared_frontend_and_backend_arguments
@@ -58,19 +58,38 @@ def configure_structlog_and_create_logger(args):
 
 
 def create_orchestrated_domain_bundle(args):
-    odb_as_json = domain_orchestration.create_odb_as_json(
+    odb_settings_as_json = domain_orchestration.create_odb_settings_as_json(
         args.config, args.overridden_ddd_config_paths, args.should_greet, args.logged_tis_format,
         args.tis_update_format, args.log_to_stdout, args.log_level
     )
-    odb = domain_orchestration.OrchestratedDomainBundle(odb_as_json).as_json()
-    _store_odb(odb, args.output)
+    compile_cache = DDDCompileCache(args.cache_dir) if args.use_compile_cache else None
+    ddd_compilation = domain_orchestration.DDDCompilation(
+        odb_settings_as_json["ddd_names"], args.overridden_ddd_config_paths, odb_settings_as_json["rerank_amount"],
+        args.processes, compile_cache
+    )
+    if compile_cache is not None:
+        _report_compile_cache(ddd_compilation, compile_cache)
+    odb_settings = domain_orchestration.OrchestratedDomainBundle({**odb_settings_as_json, "ddds": []}).as_json()
+    del odb_settings["ddds"]
+    _store_odb(odb_settings, ddd_compilation.ddds_as_json_api_dicts(), args.output)
+    if args.snapshot:
+        print(f"storing snapshot of orchestrated domain bundle in file '{args.snapshot}'")
+        domain_orchestration.write_odb_snapshot(list(ddd_compilation.ddds()), args.output, args.snapshot)
+
+
+def _report_compile_cache(ddd_compilation, compile_cache):
+    reused_ddd_names = ddd_compilation.reused_ddd_names
+    number_of_ddds = len(reused_ddd_names) + len(ddd_compilation.compiled_ddd_names)
+    print(
+        f"reused {len(reused_ddd_names)} of {number_of_ddds} DDDs from the compile cache in "
+        f"'{compile_cache.directory}': {reused_ddd_names}"
+    )
 
 
-def _store_odb(odb, output_dir):
+def _store_odb(odb_settings, ddds_as_json, output_dir):
     print(f"storing orchestrated domain bundle in file '{output_dir}'")
-    file = open(output_dir, 'w')
-    file.write(json.dumps(odb))
-    file.close()
+    with open(output_dir, 'w') as file:
+        domain_orchestration.write_odb(odb_settings, ddds_as_json, file)
 
 
 def create_ddd_config(args):
@@ -147,6 +166,30 @@ def add_create_odb_subparser(subparsers):
     backend_group = parser.add_argument_group("backend")
     backend_group.add_argument("output", help="Directory where the ODB file will be stored")
     backend_group.add_argument("--should-greet", action="store_true", default=False)
+    backend_group.add_argument(
+        "--snapshot",
+        metavar="SNAPSHOT_FILE",
+        help="Also store a snapshot of the built DDDs in this file, which the backend can load instead of the JSON of "
+        "the ODB"
+    )
+    backend_group.add_argument(
+        "--no-cache",
+        dest="use_compile_cache",
+        action="store_false",
+        default=True,
+        help="Compile all DDDs, instead of reusing unchanged DDDs from the compile cache"
+    )
+    backend_group.add_argument(
+        "--cache-dir",
+        default=DEFAULT_COMPILE_CACHE_DIRECTORY,
+        help="Directory of the compile cache, where compiled DDDs are stored and reused from"
+    )
+    backend_group.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="Compile the DDDs in this many worker processes, e.g. one per available core"
+    )
     add_common_backend_arguments(backend_group)
     add_shared_frontend_and_backend_arguments(backend_group)
     logging_group = parser.add_argument_group("logging")
@@ -149,7 +149,7 @@ class Config(object):
         return config
 
     def _update_with_values_from_parent(self, config, parent_path):
-        parent_config_object = self.__class__(parent_path)
+        parent_config_object = self.__class__(self._path.parent / parent_path)
         parent_config = parent_config_object.read()
         parent_config.update(config)
         return parent_config
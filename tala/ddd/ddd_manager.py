@@ -33,20 +33,37 @@ def get_ddd_json_version(ddd_as_json):
     return "1"
 
 
+def get_ddd_name_of_json(ddd_as_json):
+    if get_ddd_json_version(ddd_as_json) >= "2":
+        return ddd_as_json["data"]["attributes"]["name"]
+    if get_ddd_json_version(ddd_as_json) == "1":
+        return ddd_as_json["ddd_name"]
+
+
+def get_ontology_name_of_json(ddd_as_json):
+    if get_ddd_json_version(ddd_as_json) >= "2":
+        return ddd_as_json["data"]["relationships"]["ontology"]["data"]["id"]
+    if get_ddd_json_version(ddd_as_json) == "1":
+        return ddd_as_json["ontology"]["_name"]
+
+
 class DDDManager(object):
-    def __init__(self):
+    def __init__(self, semantic_logic_cache_size=None):
+        self._semantic_logic_cache_size = semantic_logic_cache_size
         self.reset()
 
     def reset(self):
         self.ddd_names = []
         self.ddds_as_json = []
+        self._ddds_as_json_by_name = {}
+        self._ddds_as_json_by_ontology_name = {}
         self._ddds = {}
         self.ontologies = {}
         self.domains = {}
         self.domain_manager = DomainManager(self)
         self._ddds_of_domains = {}
         self._ddds_of_ontologies = {}
-        self._semantic_logic = SemanticLogic(self)
+        self._semantic_logic = SemanticLogic(self, cache_size=self._semantic_logic_cache_size)
 
     @property
     def semantic_logic(self):
@@ -88,15 +105,9 @@ class DDDManager(object):
             self._parse_and_add(ddd_as_json)
 
     def load_ddd_for_ontology_name(self, name):
-        for ddd_as_json in self.ddds_as_json:
-            if get_ddd_json_version(ddd_as_json) >= "2":
-                ontology_name = ddd_as_json["data"]["relationships"]["ontology"]["data"]["id"]
-            elif get_ddd_json_version(ddd_as_json) == "1":
-                ontology_name = ddd_as_json["ontology"]["_name"]
-            if ontology_name == name:
-                self._parse_and_add(ddd_as_json)
-                return
-        raise UnexpectedDDDException(f"Expected ontology name of a known DDD ({self.ddd_names}), but got '{name}'")
+        if name not in self._ddds_as_json_by_ontology_name:
+            raise UnexpectedDDDException(f"Expected ontology name of a known DDD ({self.ddd_names}), but got '{name}'")
+        self._parse_and_add(self._ddds_as_json_by_ontology_name[name])
 
     def _is_loaded(self, ddd_name):
         return ddd_name in self._ddds
@@ -104,21 +115,45 @@ class DDDManager(object):
     def add_ddds_as_json(self, ddd_names, ddds_as_json):
         self.ddd_names = ddd_names
         self.ddds_as_json = ddds_as_json
+        self._ddds_as_json_by_name = {}
+        self._ddds_as_json_by_ontology_name = {}
+        for ddd_as_json in ddds_as_json:
+            self._index_ddd_as_json(ddd_as_json)
+
+    def _index_ddd_as_json(self, ddd_as_json):
+        self._ddds_as_json_by_name.setdefault(get_ddd_name_of_json(ddd_as_json), ddd_as_json)
+        self._ddds_as_json_by_ontology_name.setdefault(get_ontology_name_of_json(ddd_as_json), ddd_as_json)
+
+    def add_ddds_from_json_stream(self, ddd_names, ddds_as_json):
+        """ Parse and add each DDD as it is taken from the iterable ddds_as_json, e.g. from ODBReader.ddds_as_json(),
+        instead of reading the JSON of all DDDs before parsing the first one. The JSON is kept and indexed as with
+        add_ddds_as_json. """
+        self.ddd_names = ddd_names
+        self.ddds_as_json = []
+        self._ddds_as_json_by_name = {}
+        self._ddds_as_json_by_ontology_name = {}
+        for ddd_as_json in ddds_as_json:
+            self.ddds_as_json.append(ddd_as_json)
+            self._index_ddd_as_json(ddd_as_json)
+            self._parse_and_add(ddd_as_json)
 
     def _get_ddd_as_json(self, name):
-        for ddd_as_json in self.ddds_as_json:
-            if get_ddd_json_version(ddd_as_json) >= "2":
-                if name == ddd_as_json["data"]["attributes"]["name"]:
-                    return ddd_as_json
-            if get_ddd_json_version(ddd_as_json) == "1":
-                if name == ddd_as_json["ddd_name"]:
-                    return ddd_as_json
+        return self._ddds_as_json_by_name.get(name)
+
+    def add_built_ddds(self, ddd_names, ddds):
+        """ Add DDDs that are already built, e.g. taken from an ODB snapshot, instead of parsing them from JSON. """
+        self.ddd_names = ddd_names
+        for ddd in ddds:
+            self._extend_and_add(ddd)
 
     def _parse_and_add(self, ddd_as_json):
         if "data" in ddd_as_json and "version:id" in ddd_as_json["data"] and ddd_as_json["data"]["version:id"] == "2":
             ddd = DDD.create_from_json_api_data(ddd_as_json)
         else:
             ddd = JSONDDDParser().parse(ddd_as_json)
+        self._extend_and_add(ddd)
+
+    def _extend_and_add(self, ddd):
         parameter_retriever = ParameterRetriever(ddd.service_interface, ddd.ontology)
         parser = Parser(ddd.name, ddd.ontology, ddd.domain.name)
         extended_ddd = ExtendedDDD(ddd, parameter_retriever, parser)
@@ -1,11 +1,10 @@
 # flake8: noqa
 
-from xml.parsers.expat import ExpatError
 import os
 import re
+import threading
 import uuid
 import warnings
-import xml.dom.minidom
 
 from lxml import etree
 
@@ -59,23 +58,43 @@ class DDDXMLCompiler(object):
 
 
 class XmlCompiler(object):
+    def __init__(self):
+        self._parsed_document_as_string = None
+
     def _parse_string_attribute(self, element, name):
-        attribute = element.getAttribute(name)
+        attribute = self._get_attribute(element, name)
         if attribute != "":
             return attribute
 
     def _parse_xml(self, document_as_string):
         try:
-            self._document = xml.dom.minidom.parseString(document_as_string)
-        except ExpatError as e:
-            raise DDDXMLCompilerException(f"ExpatError when parsing XML file: {e}. XML string: '{document_as_string}'")
+            self._root = etree.fromstring(document_as_string)
+        except etree.XMLSyntaxError as e:
+            raise DDDXMLCompilerException(
+                f"XMLSyntaxError when parsing XML file: {e}. XML string: '{document_as_string}'"
+            )
+        self._parsed_document_as_string = document_as_string
+        self._children_by_tag_by_element = {}
+
+    def _parse_xml_unless_parsed(self, document_as_string):
+        if document_as_string is not self._parsed_document_as_string:
+            self._parse_xml(document_as_string)
 
     def _get_root_element(self, name):
-        elements = self._document.getElementsByTagName(name)
+        elements = self._get_elements_by_tag_name(name)
         if len(elements) != 1:
             raise DDDXMLCompilerException("expected 1 %s element" % name)
         return elements[0]
 
+    def _get_elements_by_tag_name(self, name):
+        return list(self._root.iter(name))
+
+    def _get_attribute(self, element, name):
+        return element.get(name, "")
+
+    def _has_optional_attribute(self, element, name):
+        return element.get(name) is not None
+
     def _parse_boolean(self, string):
         return string == "true"
 
@@ -83,32 +102,45 @@ class XmlCompiler(object):
         return int(string)
 
     def _has_child_node(self, element, node_name):
-        for node in element.childNodes:
-            if node.localName == node_name:
-                return True
-        return False
+        return node_name in self._children_by_tag(element)
 
     def _find_child_nodes(self, element, node_name):
-        return [node for node in element.childNodes if node.localName == node_name]
+        return self._children_by_tag(element).get(node_name, [])
+
+    def _children_by_tag(self, element):
+        if element not in self._children_by_tag_by_element:
+            children_by_tag = {}
+            for child in element:
+                children_by_tag.setdefault(child.tag, []).append(child)
+            self._children_by_tag_by_element[element] = children_by_tag
+        return self._children_by_tag_by_element[element]
+
+    def _count_child_nodes(self, element):
+        count = 1 if element.text else 0
+        for child in element:
+            count += 2 if child.tail else 1
+        return count
+
+    def _as_xml(self, element):
+        return etree.tostring(element, encoding="unicode", with_tail=False)
 
     def _get_mandatory_attribute(self, element, name):
-        if not element.hasAttribute(name):
+        if not self._has_optional_attribute(element, name):
             raise DDDXMLCompilerException("%s requires attribute %r" % (element, name))
-        return element.getAttribute(name)
+        return self._get_attribute(element, name)
 
     def _get_optional_attribute(self, element, name, default=None):
-        if not element.hasAttribute(name):
+        if not self._has_optional_attribute(element, name):
             return default
-        return element.getAttribute(name)
+        return self._get_attribute(element, name)
 
     def _has_attribute(self, element, attribute):
-        return element.getAttribute(attribute) != ""
+        return self._get_attribute(element, attribute) != ""
 
-    def _validate(self, xml_string):
+    def _validate(self):
         xml_schema = self.get_schema()
-        parsed_grammar_object = etree.fromstring(xml_string)
         try:
-            xml_schema.assertValid(parsed_grammar_object)
+            xml_schema.assertValid(self._root)
         except etree.DocumentInvalid as exception:
             raise ViolatesSchemaException(
                 "Expected %s compliant with schema but it's in violation: %s" % (self._filename, exception)
@@ -133,9 +165,23 @@ class XmlCompiler(object):
         return parsed_as_schema
 
     def get_schema(self):
-        with open(self._schema_absolute_path, "r") as loaded_schema:
-            parsed_schema = self.parse_schema(loaded_schema)
-        return parsed_schema
+        schemas = _schemas_of_thread()
+        schema_path = self._schema_absolute_path
+        if schema_path not in schemas:
+            with open(schema_path, "r") as loaded_schema:
+                schemas[schema_path] = self.parse_schema(loaded_schema)
+        return schemas[schema_path]
+
+
+_thread_local_schemas = threading.local()
+
+
+def _schemas_of_thread():
+    """ Compiled XML schemas by path. lxml schemas must not validate in more than one thread at a time, so each
+    thread compiles its own, once. """
+    if not hasattr(_thread_local_schemas, "schemas"):
+        _thread_local_schemas.schemas = {}
+    return _thread_local_schemas.schemas
 
 
 class OntologyCompiler(XmlCompiler):
@@ -152,8 +198,8 @@ class OntologyCompiler(XmlCompiler):
         return "%s.xsd" % self._name
 
     def compile(self, xml_string):
-        self._validate(xml_string)
         self._parse_xml(xml_string)
+        self._validate()
         self._ontology_element = self._get_root_element(self._name)
         self._compile_name()
         self._compile_sorts()
@@ -169,21 +215,21 @@ class OntologyCompiler(XmlCompiler):
         }
 
     def _compile_name(self):
-        self._ontology_name = self._ontology_element.getAttribute("name")
+        self._ontology_name = self._get_attribute(self._ontology_element, "name")
 
     def _compile_sorts(self):
-        elements = self._document.getElementsByTagName("sort")
+        elements = self._get_elements_by_tag_name("sort")
         self._custom_sorts_dict = {}
         for element in elements:
             self._compile_sort_element(element)
 
     def _compile_sort_element(self, element):
         name = self._get_mandatory_attribute(element, "name")
-        dynamic = self._parse_boolean(element.getAttribute("dynamic"))
+        dynamic = self._parse_boolean(self._get_attribute(element, "dynamic"))
         self._custom_sorts_dict[name] = CustomSort(self._ontology_name, name, dynamic)
 
     def _compile_predicates(self):
-        elements = self._document.getElementsByTagName("predicate")
+        elements = self._get_elements_by_tag_name("predicate")
         self._predicates = {self._compile_predicate_element(element) for element in elements}
 
     def _compile_predicate_element(self, element):
@@ -191,7 +237,7 @@ class OntologyCompiler(XmlCompiler):
         sort_name = self._get_mandatory_attribute(element, "sort")
         sort = self._get_sort(sort_name)
         feature_of_name = self._parse_string_attribute(element, "feature_of")
-        multiple_instances = self._parse_boolean(element.getAttribute("multiple_instances"))
+        multiple_instances = self._parse_boolean(self._get_attribute(element, "multiple_instances"))
         return Predicate(
             self._ontology_name,
             name,
@@ -218,7 +264,7 @@ class OntologyCompiler(XmlCompiler):
         self._custom_sorts_dict[name] = CustomSort(self._ontology_name, name, False)
 
     def _compile_individuals(self):
-        elements = self._document.getElementsByTagName("individual")
+        elements = self._get_elements_by_tag_name("individual")
         self._individuals = {}
         for element in elements:
             name = self._get_mandatory_attribute(element, "name")
@@ -227,7 +273,7 @@ class OntologyCompiler(XmlCompiler):
             self._individuals[name] = sort
 
     def _compile_actions(self):
-        elements = self._document.getElementsByTagName("action")
+        elements = self._get_elements_by_tag_name("action")
         self._actions = set()
         for element in elements:
             name = self._get_mandatory_attribute(element, "name")
@@ -248,11 +294,11 @@ class DomainCompiler(XmlCompiler):
         return "domain.xml"
 
     def compile(self, ddd_name, xml_string, ontology, parser):
-        self._validate(xml_string)
+        self._parse_xml_unless_parsed(xml_string)
+        self._validate()
         self._ddd_name = ddd_name
         self._ontology = ontology
         self._parser = parser
-        self._parse_xml(xml_string)
         self._domain_element = self._get_root_element("domain")
         self._compile_name()
         self._compile_plans()
@@ -274,16 +320,16 @@ class DomainCompiler(XmlCompiler):
         }
 
     def get_name(self, xml_string):
-        self._parse_xml(xml_string)
+        self._parse_xml_unless_parsed(xml_string)
         self._domain_element = self._get_root_element("domain")
         self._compile_name()
         return self._domain_name
 
     def _compile_name(self):
-        self._domain_name = self._domain_element.getAttribute("name")
+        self._domain_name = self._get_attribute(self._domain_element, "name")
 
     def _compile_plans(self):
-        elements = self._document.getElementsByTagName("goal")
+        elements = self._get_elements_by_tag_name("goal")
         self._plans = [self._compile_goal_element(element) for element in elements]
 
     def _compile_goal_element(self, element):
@@ -295,8 +341,8 @@ class DomainCompiler(XmlCompiler):
         self._compile_plan_single_attribute(plan, element, "restart_on_completion", self._parse_boolean)
         self._compile_plan_single_attribute(plan, element, "reraise_on_resume", self._parse_boolean)
         self._compile_plan_single_attribute(plan, element, "max_answers", self._parse_integer)
-        if element.hasAttribute("alternatives_predicate"):
-            plan["alternatives_predicate"] = element.getAttribute("alternatives_predicate")
+        if self._has_optional_attribute(element, "alternatives_predicate"):
+            plan["alternatives_predicate"] = self._get_attribute(element, "alternatives_predicate")
         self._compile_plan(plan, element, "postplan")
         self._compile_plan_element_with_multiple_children(
             plan, element, "postconds", "downdate_condition", self._compile_condition
@@ -312,7 +358,7 @@ class DomainCompiler(XmlCompiler):
     def _compile_plan(self, plan, element, attribute_name, default=None):
         plan_elements = self._find_child_nodes(element, attribute_name)
         if len(plan_elements) == 1:
-            plan_items = self._compile_plan_item_nodes(plan_elements[0].childNodes)
+            plan_items = self._compile_plan_item_nodes(plan_elements[0])
             plan[attribute_name] = Plan(reversed(plan_items))
         elif len(plan_elements) > 1:
             raise DDDXMLCompilerException("expected max 1 %r element" % attribute_name)
@@ -379,7 +425,7 @@ class DomainCompiler(XmlCompiler):
     def _create_propositions(self, predicate_name, individual_elements):
         predicate = self._ontology.get_predicate(predicate_name)
         for element in individual_elements:
-            individual_name = element.getAttribute("value")
+            individual_name = self._get_attribute(element, "value")
             individual = self._ontology.create_individual(individual_name, sort=predicate.sort)
             yield PredicateProposition(predicate, individual)
 
@@ -434,62 +480,60 @@ class DomainCompiler(XmlCompiler):
                 flat_list.extend(sublist)
             return flat_list
 
-        plan_items = [
-            self._compile_plan_item_element(node) for node in nodes if node.__class__ == xml.dom.minidom.Element
-        ]
+        plan_items = [self._compile_plan_item_element(node) for node in nodes if isinstance(node.tag, str)]
         return flatten(plan_items)
 
     def _compile_plan_item_element(self, element):
-        if element.localName in ["findout", "raise"]:
-            return self._compile_question_raising_plan_item_element(element.localName, element)
-        elif element.localName == "bind":
+        if element.tag in ["findout", "raise"]:
+            return self._compile_question_raising_plan_item_element(element.tag, element)
+        elif element.tag == "bind":
             return self._compile_bind_element(element)
-        elif element.localName == "if":
+        elif element.tag == "if":
             return self._compile_if_element(element)
-        elif element.localName == "once":
+        elif element.tag == "once":
             return self._compile_once_element(element)
-        elif element.localName == "forget":
+        elif element.tag == "forget":
             return self._compile_forget_element(element)
-        elif element.localName == "forget_shared":
+        elif element.tag == "forget_shared":
             return self._compile_forget_shared_element(element)
-        elif element.localName == "forget_all":
+        elif element.tag == "forget_all":
             return [plan_item.ForgetAll()]
-        elif element.localName == "invoke_service_query":
+        elif element.tag == "invoke_service_query":
             return self._compile_invoke_service_query_element(element)
-        elif element.localName == "invoke_domain_query":
+        elif element.tag == "invoke_domain_query":
             return self._compile_invoke_domain_query_element(element)
-        elif element.localName == "iterate":
+        elif element.tag == "iterate":
             return self._compile_iterate_element(element)
-        elif element.localName == "change_ddd":
+        elif element.tag == "change_ddd":
             return self._compile_change_ddd_element(element)
-        elif element.localName == "invoke_service_action":
+        elif element.tag == "invoke_service_action":
             return self._compile_invoke_service_action_element(element)
-        elif element.localName == "get_done":
+        elif element.tag == "get_done":
             return self._compile_get_done_element(element)
-        elif element.localName == "jumpto":
+        elif element.tag == "jumpto":
             return self._compile_jumpto_element(element)
-        elif element.localName == "assume_shared":
+        elif element.tag == "assume_shared":
             return self._compile_assume_shared_element(element)
-        elif element.localName == "assume_issue":
+        elif element.tag == "assume_issue":
             return self._compile_assume_issue_element(element)
-        elif element.localName == "assume_system_belief":
+        elif element.tag == "assume_system_belief":
             return self._compile_assume_element(element)
-        elif element.localName == "inform":
+        elif element.tag == "inform":
             return self._compile_inform_element(element)
-        elif element.localName == "log":
+        elif element.tag == "log":
             return self._compile_log_element(element)
-        elif element.localName == "signal_action_completion":
+        elif element.tag == "signal_action_completion":
             return self._compile_signal_action_completion_element(element)
-        elif element.localName == "signal_action_failure":
+        elif element.tag == "signal_action_failure":
             return self._compile_signal_action_failure_element(element)
-        elif element.localName == "end_turn":
+        elif element.tag == "end_turn":
             return self._compile_end_turn_element(element)
-        elif element.localName == "reset_domain_query":
+        elif element.tag == "reset_domain_query":
             return self._compile_reset_domain_query_element(element)
-        elif element.localName == "greet":
+        elif element.tag == "greet":
             return self._compile_greet_element(element)
         else:
-            raise DDDXMLCompilerException("unknown plan item element %s" % element.toxml())
+            raise DDDXMLCompilerException("unknown plan item element %s" % self._as_xml(element))
 
     def _compile_question_raising_plan_item_element(self, item_type, element):
         question_type = self._get_optional_attribute(element, "type", "wh_question")
@@ -538,34 +582,34 @@ class DomainCompiler(XmlCompiler):
         return self._compile_proposition_child_of(element)
 
     def _get_single_child_element(self, node, allowed_names):
-        child_elements = [child for child in node.childNodes if child.localName in allowed_names]
+        child_elements = [child for child in node if child.tag in allowed_names]
         if len(child_elements) == 1:
             return child_elements[0]
         else:
             raise DDDXMLCompilerException(
                 "expected exactly 1 child element among types %s in %s, was %s." %
-                (allowed_names, node.toxml(), child_elements)
+                (allowed_names, self._as_xml(node), child_elements)
             )
 
     def _get_child_elements(self, node, allowed_names):
-        child_elements = [child for child in node.childNodes if child.localName in allowed_names]
+        child_elements = [child for child in node if child.tag in allowed_names]
         return child_elements
 
     def _compile_forget_element(self, element):
-        if element.getAttribute("predicate"):
+        if self._get_attribute(element, "predicate"):
             predicate_name = self._get_mandatory_attribute(element, "predicate")
             predicate = self._ontology.get_predicate(predicate_name)
             return [plan_item.Forget(predicate)]
-        elif len(element.childNodes) == 1:
+        elif self._count_child_nodes(element) == 1:
             proposition = self._compile_proposition_child_of(element)
             return [plan_item.Forget(proposition)]
 
     def _compile_forget_shared_element(self, element):
-        if element.getAttribute("predicate"):
+        if self._get_attribute(element, "predicate"):
             predicate_name = self._get_mandatory_attribute(element, "predicate")
             predicate = self._ontology.get_predicate(predicate_name)
             return [plan_item.ForgetShared(predicate)]
-        elif len(element.childNodes) == 1:
+        elif self._count_child_nodes(element) == 1:
             proposition = self._compile_proposition_child_of(element)
             return [plan_item.ForgetShared(proposition)]
 
@@ -587,14 +631,14 @@ class DomainCompiler(XmlCompiler):
 
     def _compile_invoke_service_action_element(self, element):
         def parse_downdate_plan():
-            if element.hasAttribute("downdate_plan"):
-                return self._parse_boolean(element.getAttribute("downdate_plan"))
+            if self._has_optional_attribute(element, "downdate_plan"):
+                return self._parse_boolean(self._get_attribute(element, "downdate_plan"))
             else:
                 return True
 
         action = self._get_mandatory_attribute(element, "name")
-        preconfirm = self._parse_preconfirm_value(element.getAttribute("preconfirm"))
-        postconfirm = self._parse_boolean(element.getAttribute("postconfirm"))
+        preconfirm = self._parse_preconfirm_value(self._get_attribute(element, "preconfirm"))
+        postconfirm = self._parse_boolean(self._get_attribute(element, "postconfirm"))
         downdate_plan = parse_downdate_plan()
         return [
             plan_item.InvokeServiceAction(
@@ -662,7 +706,7 @@ class DomainCompiler(XmlCompiler):
         proposition = PredicateProposition(predicate)
         cond = condition.IsPrivateBelief(proposition)
 
-        plan = [plan_item.Assume(proposition)] + self._compile_plan_item_nodes(element.childNodes)
+        plan = [plan_item.Assume(proposition)] + self._compile_plan_item_nodes(element)
 
         return [plan_item.IfThenElse(cond, [], plan)]
 
@@ -712,17 +756,17 @@ class DomainCompiler(XmlCompiler):
 
     def _compile_proposition_child_of(self, element):
         child = self._get_single_child_element(element, ["proposition", "resolve", "perform"])
-        if child.localName == "proposition":
+        if child.tag == "proposition":
             return self._compile_predicate_proposition(child)
-        elif child.localName == "perform":
+        elif child.tag == "perform":
             return self._compile_perform_proposition(child)
-        elif child.localName == "resolve":
+        elif child.tag == "resolve":
             return self._compile_resolve_proposition(child)
 
     def _compile_predicate_proposition(self, element):
         predicate_name = self._get_mandatory_attribute(element, "predicate")
         predicate = self._ontology.get_predicate(predicate_name)
-        value = element.getAttribute("value")
+        value = self._get_attribute(element, "value")
         if value:
             if predicate.sort.is_boolean_sort():
                 if self._parse_boolean(value):
@@ -755,27 +799,27 @@ class DomainCompiler(XmlCompiler):
                 IS_SHARED_COMMITMENT, IS_PRIVATE_BELIEF, IS_PRIVATE_BELIEF_OR_SHARED_COMMITMENT, QUERY_HAS_MORE_ITEMS
             ]
         )
-        if child.localName == HAS_VALUE:
+        if child.tag == HAS_VALUE:
             warnings.warn("<has_value> is deprecated.", DeprecationWarning)
             return self._compile_has_value_condition(child)
-        elif child.localName == IS_TRUE:
+        elif child.tag == IS_TRUE:
             warnings.warn("<is_true> is deprecated.", DeprecationWarning)
             return self._compile_is_true_condition(child)
-        elif child.localName == HAS_SHARED_VALUE:
+        elif child.tag == HAS_SHARED_VALUE:
             return self._compile_has_shared_value_condition(child)
-        elif child.localName == HAS_PRIVATE_VALUE:
+        elif child.tag == HAS_PRIVATE_VALUE:
             return self._compile_has_private_value_condition(child)
-        elif child.localName == HAS_SHARED_OR_PRIVATE_VALUE:
+        elif child.tag == HAS_SHARED_OR_PRIVATE_VALUE:
             return self._compile_has_shared_or_private_value_condition(child)
-        elif child.localName == IS_SHARED_COMMITMENT:
+        elif child.tag == IS_SHARED_COMMITMENT:
             return self._compile_is_shared_commitment_condition(child)
-        elif child.localName == IS_PRIVATE_BELIEF:
+        elif child.tag == IS_PRIVATE_BELIEF:
             return self._compile_is_private_belief_condition(child)
-        elif child.localName == IS_PRIVATE_BELIEF_OR_SHARED_COMMITMENT:
+        elif child.tag == IS_PRIVATE_BELIEF_OR_SHARED_COMMITMENT:
             return self._compile_is_private_belief_or_shared_commitment_condition(child)
-        elif child.localName == QUERY_HAS_MORE_ITEMS:
+        elif child.tag == QUERY_HAS_MORE_ITEMS:
             return self._compile_query_has_more_items_condition(child)
-        elif child.localName == IS_SHARED_FACT:
+        elif child.tag == IS_SHARED_FACT:
             warnings.warn("<is_shared_fact> is deprecated.", DeprecationWarning)
             return self._compile_is_true_condition(child)
 
@@ -812,7 +856,7 @@ class DomainCompiler(XmlCompiler):
         return condition.IsPrivateBeliefOrSharedCommitment(proposition)
 
     def _compile_query_has_more_items_condition(self, element):
-        if element.hasAttribute("predicate"):
+        if self._has_optional_attribute(element, "predicate"):
             iterator = self._compile_question(element)
         else:
             iterator = self._get_optional_attribute(element, "iterator")
@@ -831,17 +875,17 @@ class DomainCompiler(XmlCompiler):
     def _compile_resolve_proposition(self, element):
         question = self._compile_question(element, "type")
         speaker = SYS
-        speaker_attribute = element.getAttribute("speaker")
+        speaker_attribute = self._get_attribute(element, "speaker")
         if speaker_attribute == "user":
             speaker = USR
         return GoalProposition(Resolve(question, speaker))
 
     def _compile_if_then_child_plan(self, element, node_name):
         def compile_then_or_else_node(then_or_else_node):
-            if len(then_or_else_node.childNodes) == 0:
+            if self._count_child_nodes(then_or_else_node) == 0:
                 return []
             else:
-                return self._compile_plan_item_nodes(then_or_else_node.childNodes)
+                return self._compile_plan_item_nodes(then_or_else_node)
 
         then_or_else_nodes = self._find_child_nodes(element, node_name)
         if len(then_or_else_nodes) == 0:
@@ -852,7 +896,7 @@ class DomainCompiler(XmlCompiler):
             raise DDDXMLCompilerException("expected only one %r element" % node_name)
 
     def _compile_plan_single_attribute(self, plan, element, attribute_name, compilation_method):
-        attribute = element.getAttribute(attribute_name)
+        attribute = self._get_attribute(element, attribute_name)
         if attribute:
             plan[attribute_name] = compilation_method(attribute)
 
@@ -871,31 +915,31 @@ class DomainCompiler(XmlCompiler):
             plan[attribute_name] = compilation_method(child_nodes[0])
 
     def _compile_superaction(self, node):
-        return self._ontology.create_action(node.getAttribute("name"))
+        return self._ontology.create_action(self._get_attribute(node, "name"))
 
     def _compile_default_questions(self):
         self._default_questions = [
-            self._compile_question(element) for element in self._document.getElementsByTagName("default_question")
+            self._compile_question(element) for element in self._get_elements_by_tag_name("default_question")
         ]
 
     def _compile_parameters(self):
-        elements = self._document.getElementsByTagName("parameters")
+        elements = self._get_elements_by_tag_name("parameters")
         self._parameters = dict([self._compile_parameters_element(element) for element in elements])
 
     def _compile_domain_queries(self):
-        queries = self._document.getElementsByTagName("query")
+        queries = self._get_elements_by_tag_name("query")
         self._queries = [self._compile_query_element(element) for element in queries]
 
     def _compile_iterators(self):
-        iterators = self._document.getElementsByTagName("iterator")
+        iterators = self._get_elements_by_tag_name("iterator")
         self._iterators = [self._compile_iterator_element(element) for element in iterators]
 
     def _compile_validators(self):
-        validators = self._document.getElementsByTagName("validator")
+        validators = self._get_elements_by_tag_name("validator")
         self._validators = [self._compile_validator_element(element) for element in validators]
 
     def _compile_dependencies(self):
-        elements = self._document.getElementsByTagName("dependency")
+        elements = self._get_elements_by_tag_name("dependency")
         self._dependencies = dict([self._compile_dependency_element(element) for element in elements])
 
     def _compile_dependency_element(self, element):
@@ -905,7 +949,7 @@ class DomainCompiler(XmlCompiler):
 
     def _compile_parameters_element(self, element):
         try:
-            if not element.hasAttribute("question_type"):
+            if not self._has_optional_attribute(element, "question_type"):
                 obj = self._compile_predicate(element)
             else:
                 obj = self._compile_question(element, "question_type")
@@ -979,7 +1023,7 @@ class DomainCompiler(XmlCompiler):
             "on_too_many_hits_action",
         ]
         for name in supported_parameters:
-            value_as_string = element.getAttribute(name)
+            value_as_string = self._get_attribute(element, name)
             if value_as_string:
                 value = self._parser.parse_parameter(name, value_as_string)
                 result[name] = value
@@ -1041,7 +1085,7 @@ class DomainCompiler(XmlCompiler):
         return self._parser.parse(string)
 
     def _compile_preferred(self, element):
-        if len(element.childNodes) > 0:
+        if self._count_child_nodes(element) > 0:
             child = self._get_single_child_element(element, ["proposition"])
             return self._compile_proposition_child_of(element)
         else:
@@ -1062,8 +1106,8 @@ class ServiceInterfaceCompiler(XmlCompiler):
         return "%s.xsd" % self._name
 
     def compile(self, xml_string):
-        self._validate(xml_string)
         self._parse_xml(xml_string)
+        self._validate()
         self._device_element = self._get_root_element("service_interface")
         custom_actions = list(self._compile_actions())
         actions = custom_actions
@@ -1072,7 +1116,7 @@ class ServiceInterfaceCompiler(XmlCompiler):
         return ServiceInterface(actions, queries, validities)
 
     def _compile_actions(self):
-        elements = self._document.getElementsByTagName("action")
+        elements = self._get_elements_by_tag_name("action")
         for element in elements:
             name = self._get_mandatory_attribute(element, "name")
             target = self._compile_target(element)
@@ -1082,7 +1126,7 @@ class ServiceInterfaceCompiler(XmlCompiler):
             yield action
 
     def _compile_parameters(self, element):
-        parameter_elements = element.getElementsByTagName("parameter")
+        parameter_elements = list(element.iterdescendants("parameter"))
         return [self._compile_parameter(element) for element in parameter_elements]
 
     def _compile_parameter(self, element):
@@ -1092,7 +1136,7 @@ class ServiceInterfaceCompiler(XmlCompiler):
         return ServiceParameter(name, format, is_optional)
 
     def _compile_failure_reasons(self, element):
-        failure_reason_elements = element.getElementsByTagName("failure_reason")
+        failure_reason_elements = list(element.iterdescendants("failure_reason"))
         return [self._compile_failure_reason(element) for element in failure_reason_elements]
 
     def _compile_failure_reason(self, element):
@@ -1100,31 +1144,38 @@ class ServiceInterfaceCompiler(XmlCompiler):
         return ActionFailureReason(name)
 
     def _compile_queries(self):
-        elements = self._document.getElementsByTagName("query")
+        elements = self._get_elements_by_tag_name("query")
         for element in elements:
             predicate = self._get_mandatory_attribute(element, "name")
             target = self._compile_target(element)
             parameters = self._compile_parameters(element)
-            query = ServiceQueryInterface(predicate, target, parameters)
+            cache_ttl = self._compile_cache_ttl(element)
+            query = ServiceQueryInterface(predicate, target, parameters, cache_ttl=cache_ttl)
             yield query
 
     def _compile_validities(self):
-        elements = self._document.getElementsByTagName("validator")
+        elements = self._get_elements_by_tag_name("validator")
         for element in elements:
             name = self._get_mandatory_attribute(element, "name")
             parameters = self._compile_parameters(element)
             target = self._compile_target(element)
-            validity = ServiceValidatorInterface(name, target, parameters)
+            cache_ttl = self._compile_cache_ttl(element)
+            validity = ServiceValidatorInterface(name, target, parameters, cache_ttl=cache_ttl)
             yield validity
 
+    def _compile_cache_ttl(self, element):
+        cache_ttl = self._get_optional_attribute(element, "cache_ttl")
+        if cache_ttl is not None:
+            return float(cache_ttl)
+
     def _compile_target(self, element):
-        target_elements = element.getElementsByTagName("target")
+        target_elements = list(element.iterdescendants("target"))
         target_element = target_elements[0]
-        frontend_elements = target_element.getElementsByTagName("frontend")
-        if any(frontend_elements):
+        frontend_elements = list(target_element.iterdescendants("frontend"))
+        if frontend_elements:
             return self._compile_frontend_target(frontend_elements[0])
-        http_elements = target_element.getElementsByTagName("http")
-        if any(http_elements):
+        http_elements = list(target_element.iterdescendants("http"))
+        if http_elements:
             return self._compile_http_target(http_elements[0])
 
     def _compile_frontend_target(self, element):
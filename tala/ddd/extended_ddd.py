@@ -1,15 +1,32 @@
+from tala.ddd.parser import Parser
+from tala.ddd.services.parameters.retriever import ParameterRetriever
 from tala.utils.as_json import AsJSONMixin
 from tala.utils.json_api import JSONAPIMixin
 
 
 class ExtendedDDD(AsJSONMixin, JSONAPIMixin):
-    """ This is in practice a DDD with the addition of a parameter retriever and a parser """
-    def __init__(self, ddd, parameter_retriever, parser, path=None):
+    """ This is in practice a DDD with the addition of a parameter retriever and a parser. The ontology defaults to
+    the ontology of the DDD, but a session of it can be given instead, see create_session. """
+    def __init__(self, ddd, parameter_retriever, parser, path=None, ontology=None):
         super(ExtendedDDD, self).__init__()
         self._ddd = ddd
         self._parameter_retriever = parameter_retriever
         self._parser = parser
         self._path = path
+        self._ontology = ontology
+
+    def create_session(self):
+        """ Return an ExtendedDDD for one dialogue session. It shares the DDD with this one, but has its own session
+        of the ontology, with a parser and parameter retriever for it. Entities added to the session, results parsed
+        in it and individuals interned by it are not seen by other sessions, and resetting it leaves them alone.
+
+        The domain still refers to the base ontology, and SemanticLogic looks up ontologies by name through the
+        DDDManager, so neither sees the individuals added to a session. tala itself creates no sessions; they are for
+        callers that run several dialogues on the same DDDs. """
+        ontology = self.ontology.create_session()
+        parameter_retriever = ParameterRetriever(self.service_interface, ontology)
+        parser = None if self.parser is None else Parser(self.name, ontology, self.domain.name)
+        return ExtendedDDD(self.ddd, parameter_retriever, parser, self.path, ontology)
 
     @property
     def parameter_retriever(self):
@@ -33,7 +50,9 @@ class ExtendedDDD(AsJSONMixin, JSONAPIMixin):
 
     @property
     def ontology(self):
-        return self.ddd.ontology
+        if self._ontology is None:
+            return self.ddd.ontology
+        return self._ontology
 
     @property
     def domain(self):
@@ -45,38 +45,109 @@ class JSONParseFailure(Exception):
     pass
 
 
+FLOAT_KEYS = ["perception_confidence", "understanding_confidence"]
+
+
 def preprocess_json_dict(json_dict_original):
-    json_dict = copy.copy(json_dict_original)
-    for float_key in ["perception_confidence", "understanding_confidence"]:
+    json_dict = json_dict_original
+    for float_key in FLOAT_KEYS:
         if float_key in json_dict:
             try:
-                json_dict[float_key] = float(json_dict[float_key])
+                value = json_dict[float_key]
+                if isinstance(value, float):
+                    continue
+                value = float(value)
             except TypeError:
-                pass
+                continue
+            if json_dict is json_dict_original:
+                json_dict = copy.copy(json_dict_original)
+            json_dict[float_key] = value
     return json_dict
 
 
+KIND_CONDITION = 0
+KIND_PLAN_ITEM = 1
+KIND_INDIVIDUAL = 2
+KIND_SET = 3
+KIND_OPENQUEUE = 4
+KIND_MOVE = 5
+KIND_ACTION = 6
+KIND_GOAL = 7
+KIND_QUESTION = 8
+KIND_PREDICATE = 9
+KIND_PROPOSITION_SET = 10
+KIND_PROPOSITION = 11
+KIND_LAMBDA_ABSTRACTED_PROPOSITION = 12
+KIND_SERVICE_ACTION_OUTCOME = 13
+KIND_YES_NO = 14
+KIND_ACTION_STATUS = 15
+
+QUESTION_TYPES = frozenset(Question.TYPES)
+PROPOSITION_TYPES = frozenset(Proposition.TYPES)
+
+KIND_OF_SEMANTIC_OBJECT_TYPE = {
+    condition.SEMANTIC_OBJECT_TYPE: KIND_CONDITION,
+    "LambdaAbstractedProposition": KIND_LAMBDA_ABSTRACTED_PROPOSITION,
+    "yes/no": KIND_YES_NO,
+}
+
+
+def _kind_of_semantic_object_type_key(json_dict):
+    return KIND_OF_SEMANTIC_OBJECT_TYPE.get(json_dict["semantic_object_type"])
+
+
+def _kind_of_value_key(json_dict):
+    if "sort" in json_dict:
+        return KIND_INDIVIDUAL
+    return KIND_ACTION
+
+
+def _kind_of_name_key(json_dict):
+    if "sort" in json_dict:
+        return KIND_PREDICATE
+
+
+def _kind_of_type_key(json_dict):
+    type_ = json_dict["_type"]
+    if type_ in QUESTION_TYPES:
+        return KIND_QUESTION
+    if type_ in PROPOSITION_TYPES:
+        return KIND_PROPOSITION
+
+
+KIND_OF_KEY = {
+    "semantic_object_type": _kind_of_semantic_object_type_key,
+    "value": _kind_of_value_key,
+    "name": _kind_of_name_key,
+    "_type": _kind_of_type_key,
+    "set": KIND_SET,
+    "openqueue": KIND_OPENQUEUE,
+    "move_type": KIND_MOVE,
+    "_goal_type": KIND_GOAL,
+    "_propositions": KIND_PROPOSITION_SET,
+    "service_action_outcome": KIND_SERVICE_ACTION_OUTCOME,
+    "action_status": KIND_ACTION_STATUS,
+} | {plan_item_type: KIND_PLAN_ITEM for plan_item_type in plan_item.ALL_PLAN_ITEM_TYPES}  # yapf: disable
+
+
+def kinds_of(json_dict):
+    """ Returns the kinds of semantic object that json_dict can be parsed as, in order of precedence, by looking
+    up each of its keys in KIND_OF_KEY. Raises AttributeError if json_dict is not a dict. """
+    kinds = []
+    for key in json_dict.keys():
+        kind = KIND_OF_KEY.get(key)
+        if callable(kind):
+            kind = kind(json_dict)
+        if kind is not None:
+            kinds.append(kind)
+    kinds.sort()
+    return kinds
+
+
 def create_sort(definition):
     sort_name = definition["_name"]
     if sort_name in sort.BUILTIN_SORTS:
-        if sort_name == sort.DATETIME:
-            return sort.DateTimeSort()
-        if sort_name == sort.REAL:
-            return sort.RealSort()
-        if sort_name == sort.PERSON_NAME:
-            return sort.PersonNameSort()
-        if sort_name == sort.INTEGER:
-            return sort.IntegerSort()
-        if sort_name == sort.BOOLEAN:
-            return sort.BooleanSort()
-        if sort_name == sort.STRING:
-            return sort.StringSort()
-        if sort_name == sort.DOMAIN:
-            return sort.DomainSort()
-        if sort_name == sort.IMAGE:
-            return sort.ImageSort()
-        if sort_name == sort.WEBVIEW:
-            return sort.WebviewSort()
+        return sort.create_builtin_sort(sort_name)
 
     ontology_name = definition.get("_ontology_name")
     if ontology_name:
@@ -402,7 +473,12 @@ class JSONServiceInterfaceParser():
         name = query_dict["_name"]
         target = self.parse_target(query_dict["_target"])
         parameters = self.parse_parameters(query_dict["_parameters"])
-        return service_interface.ServiceQueryInterface(name, target, parameters)
+        cache_ttl = self.parse_cache_ttl(query_dict.get("_cache_ttl"))
+        return service_interface.ServiceQueryInterface(name, target, parameters, cache_ttl=cache_ttl)
+
+    def parse_cache_ttl(self, cache_ttl):
+        if cache_ttl is not None:
+            return float(cache_ttl)
 
     def parse_validators(self, validators_dict):
         return [self.parse_validator(validator) for validator in validators_dict.values()]
@@ -411,104 +487,39 @@ class JSONServiceInterfaceParser():
         name = validator_dict["_name"]
         target = self.parse_target(validator_dict["_target"])
         parameters = self.parse_parameters(validator_dict["_parameters"])
-        return service_interface.ServiceValidatorInterface(name, target, parameters)
+        cache_ttl = self.parse_cache_ttl(validator_dict.get("_cache_ttl"))
+        return service_interface.ServiceValidatorInterface(name, target, parameters, cache_ttl=cache_ttl)
 
 
 class NonCheckingJSONParser():
-    def parse(self, json_dict_unchecked):
-        def is_condition():
-            """ This is the template for extending the semantic object JSON
-            with type information, which should be done for all semantic objects.
-            """
-
-            return json_dict.get("semantic_object_type") == condition.SEMANTIC_OBJECT_TYPE
-
-        def is_plan_item():
-            for item in plan_item.ALL_PLAN_ITEM_TYPES:
-                if item in json_dict:
-                    return True
-            return False
-
-        def is_individual():
-            return "value" in json_dict and "sort" in json_dict
-
-        def is_yes_no():
-            return json_dict.get("semantic_object_type") == "yes/no"
-
-        def is_move():
-            return "move_type" in json_dict
-
-        def is_action():
-            return "value" in json_dict
-
-        def is_goal():
-            return "_goal_type" in json_dict
-
-        def is_question():
-            question_type = json_dict.get("_type", None)
-            return question_type in Question.TYPES
-
-        def is_predicate():
-            return "name" in json_dict and "sort" in json_dict
-
-        def is_lambda_abstracted_proposition():
-            return json_dict.get("semantic_object_type") == "LambdaAbstractedProposition"
-
-        def is_set():
-            return "set" in json_dict
-
-        def is_openqueue():
-            return "openqueue" in json_dict
-
-        def is_service_action_outcome():
-            return "service_action_outcome" in json_dict
-
-        def is_proposition():
-            prop_type = json_dict.get("_type", None)
-            return prop_type in Proposition.TYPES
-
-        def is_proposition_set():
-            return "_propositions" in json_dict
-
-        def is_action_status():
-            return "action_status" in json_dict
+    KIND_PARSERS = {
+        KIND_CONDITION: lambda parser, json_dict: parser.parse_condition(json_dict),
+        KIND_PLAN_ITEM: lambda parser, json_dict: parser.parse_plan_item(json_dict),
+        KIND_INDIVIDUAL: lambda parser, json_dict: parser.parse_individual(json_dict),
+        KIND_SET: lambda parser, json_dict: parser.parse_set(json_dict["set"]),
+        KIND_OPENQUEUE: lambda parser, json_dict: parser.parse_openqueue(json_dict["openqueue"]),
+        KIND_MOVE: lambda parser, json_dict: parser.parse_move(json_dict),
+        KIND_ACTION: lambda parser, json_dict: parser.parse_action(json_dict),
+        KIND_GOAL: lambda parser, json_dict: parser.parse_goal(json_dict),
+        KIND_QUESTION: lambda parser, json_dict: parser.parse_question(json_dict),
+        KIND_PREDICATE: lambda parser, json_dict: parser.parse_predicate(json_dict),
+        KIND_PROPOSITION_SET: lambda parser, json_dict: parser.parse_proposition_set(json_dict),
+        KIND_PROPOSITION: lambda parser, json_dict: parser.parse_proposition(json_dict),
+        KIND_LAMBDA_ABSTRACTED_PROPOSITION: lambda parser, json_dict: parser.parse_lambda_abstraction(json_dict),
+        KIND_SERVICE_ACTION_OUTCOME: lambda parser, json_dict: parser.parse_service_action_outcome(json_dict),
+        KIND_ACTION_STATUS: lambda parser, json_dict: parser.parse_action_status(json_dict),
+    }  # yapf: disable
 
+    def parse(self, json_dict_unchecked):
         json_dict = preprocess_json_dict(json_dict_unchecked)
-        if is_condition():
-            return self.parse_condition(json_dict)
-        if is_plan_item():
-            return self.parse_plan_item(json_dict)
-        if is_individual():
-            return self.parse_individual(json_dict)
-        if is_set():
-            return self.parse_set(json_dict["set"])
-        if is_openqueue():
-            return self.parse_openqueue(json_dict["openqueue"])
-        if is_move():
-            return self.parse_move(json_dict)
-        if is_action():
-            return self.parse_action(json_dict)
-        if is_goal():
-            return self.parse_goal(json_dict)
-        if is_question():
-            return self.parse_question(json_dict)
-        if is_predicate():
-            return self.parse_predicate(json_dict)
-        if is_proposition_set():
-            return self.parse_proposition_set(json_dict)
-        if is_proposition():
-            return self.parse_proposition(json_dict)
-        if is_lambda_abstracted_proposition():
-            return self.parse_lambda_abstraction(json_dict)
-        if is_service_action_outcome():
-            return self.parse_service_action_outcome(json_dict)
-        if is_yes_no():
-            if json_dict["instance"] == No.NO:
-                return No()
-            if json_dict["instance"] == Yes.YES:
-                return Yes()
-        if is_action_status():
-            return self.parse_action_status(json_dict)
+        for kind in kinds_of(json_dict):
+            if kind == KIND_YES_NO:
+                if json_dict["instance"] == No.NO:
+                    return No()
+                if json_dict["instance"] == Yes.YES:
+                    return Yes()
+                continue
+            return self.KIND_PARSERS[kind](self, json_dict)
         raise JSONParseFailure(f"JSONParser cannot parse: {json_dict}")
 
     def parse_condition(self, condition_json):
@@ -525,75 +536,61 @@ class NonCheckingJSONParser():
             return condition.create_condition(condition_json["type"], argument)
         raise JSONParseFailure(f"Failed to parse {condition_json} as a condition.")
 
+    PLAN_ITEM_PARSERS = {
+        plan_item.TYPE_FINDOUT: lambda parser, data: parser.parse_findout_plan_item(data),
+        plan_item.TYPE_RAISE: lambda parser, data: parser.parse_raise_plan_item(data),
+        plan_item.TYPE_RESPOND: lambda parser, data: parser.parse_respond_plan_item(data[plan_item.TYPE_RESPOND]),
+        plan_item.TYPE_ASSUME: lambda parser, data: parser.parse_assume_plan_item(data[plan_item.TYPE_ASSUME]),
+        plan_item.TYPE_ASSUME_ISSUE: lambda parser, data: parser.parse_assume_issue_plan_item(data),
+        plan_item.TYPE_ASSUME_SHARED:
+            lambda parser, data: parser.parse_assume_shared_plan_item(data[plan_item.TYPE_ASSUME_SHARED]),
+        plan_item.TYPE_BIND: lambda parser, data: parser.parse_bind_plan_item(data[plan_item.TYPE_BIND]),
+        plan_item.TYPE_DO: lambda parser, data: parser.parse_do_plan_item(data[plan_item.TYPE_DO]),
+        plan_item.TYPE_EMIT_ICM: lambda parser, data: parser.parse_emit_icm_plan_item(data[plan_item.TYPE_EMIT_ICM]),
+        plan_item.TYPE_FORGET: lambda parser, data: parser.parse_forget_plan_item(data[plan_item.TYPE_FORGET]),
+        plan_item.TYPE_FORGET_SHARED:
+            lambda parser, data: parser.parse_forget_shared_plan_item(data[plan_item.TYPE_FORGET_SHARED]),
+        plan_item.TYPE_FORGET_ALL:
+            lambda parser, data: parser.parse_forget_all_plan_item(data[plan_item.TYPE_FORGET_ALL]),
+        plan_item.TYPE_FORGET_ISSUE:
+            lambda parser, data: parser.parse_forget_issue_plan_item(data[plan_item.TYPE_FORGET_ISSUE]),
+        plan_item.TYPE_IF_THEN_ELSE:
+            lambda parser, data: parser.parse_if_then_else_plan_item(data[plan_item.TYPE_IF_THEN_ELSE]),
+        plan_item.TYPE_JUMPTO: lambda parser, data: parser.parse_jumpto_plan_item(data[plan_item.TYPE_JUMPTO]),
+        plan_item.TYPE_INVOKE_SERVICE_QUERY:
+            lambda parser, data: parser.parse_invoke_service_query_plan_item(data[plan_item.TYPE_INVOKE_SERVICE_QUERY]),
+        plan_item.TYPE_INVOKE_DOMAIN_QUERY:
+            lambda parser, data: parser.parse_invoke_domain_query_plan_item(data[plan_item.TYPE_INVOKE_DOMAIN_QUERY]),
+        plan_item.TYPE_INVOKE_SERVICE_ACTION:
+            lambda parser, data: parser.parse_invoke_service_action_plan_item(data[plan_item.TYPE_INVOKE_SERVICE_ACTION]),
+        plan_item.TYPE_LOG: lambda parser, data: parser.parse_log_plan_item(data[plan_item.TYPE_LOG]),
+        plan_item.TYPE_ACTION_PERFORMED:
+            lambda parser, data: parser.parse_action_performed_plan_item(data[plan_item.TYPE_ACTION_PERFORMED]),
+        plan_item.TYPE_ACTION_ABORTED:
+            lambda parser, data: parser.parse_action_aborted_plan_item(data[plan_item.TYPE_ACTION_ABORTED]),
+        plan_item.TYPE_CHANGE_DDD:
+            lambda parser, data: parser.parse_change_ddd_plan_item(data[plan_item.TYPE_CHANGE_DDD]),
+        plan_item.TYPE_GET_DONE: lambda parser, data: parser.parse_get_done_plan_item(data),
+        plan_item.TYPE_END_TURN: lambda parser, data: parser.parse_end_turn_plan_item(data[plan_item.TYPE_END_TURN]),
+        plan_item.TYPE_RESET_DOMAIN_QUERY:
+            lambda parser, data: parser.parse_reset_domain_query(data[plan_item.TYPE_RESET_DOMAIN_QUERY]),
+        plan_item.TYPE_ITERATE: lambda parser, data: parser.parse_iterate_plan_item(data[plan_item.TYPE_ITERATE]),
+        plan_item.TYPE_ACTION_REPORT:
+            lambda parser, data: parser.parse_action_report_plan_item(data[plan_item.TYPE_ACTION_REPORT]),
+        plan_item.TYPE_GREET: lambda parser, data: plan_item.Greet(),
+        plan_item.TYPE_EMIT_MOVE: lambda parser, data: parser.parse_emit_move_plan_item(data),
+        plan_item.TYPE_QUESTION_REPORT: lambda parser, data: parser.parse_question_report_plan_item(data),
+        plan_item.TYPE_SERVICE_REPORT: lambda parser, data: parser.parse_service_report_plan_item(data),
+        plan_item.TYPE_RESPOND_TO_INSULT: lambda parser, data: plan_item.RespondToInsult(),
+        plan_item.TYPE_RESPOND_TO_THANK_YOU: lambda parser, data: plan_item.RespondToThankYou(),
+    }  # yapf: disable
+    PLAN_ITEM_PRECEDENCE = {plan_item_type: index for index, plan_item_type in enumerate(PLAN_ITEM_PARSERS)}
+
     def parse_plan_item(self, data):
-        if plan_item.TYPE_FINDOUT in data:
-            return self.parse_findout_plan_item(data)
-        if plan_item.TYPE_RAISE in data:
-            return self.parse_raise_plan_item(data)
-        if plan_item.TYPE_RESPOND in data:
-            return self.parse_respond_plan_item(data[plan_item.TYPE_RESPOND])
-        if plan_item.TYPE_ASSUME in data:
-            return self.parse_assume_plan_item(data[plan_item.TYPE_ASSUME])
-        if plan_item.TYPE_ASSUME_ISSUE in data:
-            return self.parse_assume_issue_plan_item(data)
-        if plan_item.TYPE_ASSUME_SHARED in data:
-            return self.parse_assume_shared_plan_item(data[plan_item.TYPE_ASSUME_SHARED])
-        if plan_item.TYPE_BIND in data:
-            return self.parse_bind_plan_item(data[plan_item.TYPE_BIND])
-        if plan_item.TYPE_DO in data:
-            return self.parse_do_plan_item(data[plan_item.TYPE_DO])
-        if plan_item.TYPE_EMIT_ICM in data:
-            return self.parse_emit_icm_plan_item(data[plan_item.TYPE_EMIT_ICM])
-        if plan_item.TYPE_FORGET in data:
-            return self.parse_forget_plan_item(data[plan_item.TYPE_FORGET])
-        if plan_item.TYPE_FORGET_SHARED in data:
-            return self.parse_forget_shared_plan_item(data[plan_item.TYPE_FORGET_SHARED])
-        if plan_item.TYPE_FORGET_ALL in data:
-            return self.parse_forget_all_plan_item(data[plan_item.TYPE_FORGET_ALL])
-        if plan_item.TYPE_FORGET_ISSUE in data:
-            return self.parse_forget_issue_plan_item(data[plan_item.TYPE_FORGET_ISSUE])
-        if plan_item.TYPE_IF_THEN_ELSE in data:
-            return self.parse_if_then_else_plan_item(data[plan_item.TYPE_IF_THEN_ELSE])
-        if plan_item.TYPE_JUMPTO in data:
-            return self.parse_jumpto_plan_item(data[plan_item.TYPE_JUMPTO])
-        if plan_item.TYPE_INVOKE_SERVICE_QUERY in data:
-            return self.parse_invoke_service_query_plan_item(data[plan_item.TYPE_INVOKE_SERVICE_QUERY])
-        if plan_item.TYPE_INVOKE_DOMAIN_QUERY in data:
-            return self.parse_invoke_domain_query_plan_item(data[plan_item.TYPE_INVOKE_DOMAIN_QUERY])
-        if plan_item.TYPE_INVOKE_SERVICE_ACTION in data:
-            return self.parse_invoke_service_action_plan_item(data[plan_item.TYPE_INVOKE_SERVICE_ACTION])
-        if plan_item.TYPE_LOG in data:
-            return self.parse_log_plan_item(data[plan_item.TYPE_LOG])
-        if plan_item.TYPE_ACTION_PERFORMED in data:
-            return self.parse_action_performed_plan_item(data[plan_item.TYPE_ACTION_PERFORMED])
-        if plan_item.TYPE_ACTION_ABORTED in data:
-            return self.parse_action_aborted_plan_item(data[plan_item.TYPE_ACTION_ABORTED])
-        if plan_item.TYPE_CHANGE_DDD in data:
-            return self.parse_change_ddd_plan_item(data[plan_item.TYPE_CHANGE_DDD])
-        if plan_item.TYPE_GET_DONE in data:
-            return self.parse_get_done_plan_item(data)
-        if plan_item.TYPE_INVOKE_DOMAIN_QUERY in data:
-            return self.parse_invoke_domain_query(data[plan_item.INVOKE_DOMAIN_QUERY])
-        if plan_item.TYPE_END_TURN in data:
-            return self.parse_end_turn_plan_item(data[plan_item.TYPE_END_TURN])
-        if plan_item.TYPE_RESET_DOMAIN_QUERY in data:
-            return self.parse_reset_domain_query(data[plan_item.TYPE_RESET_DOMAIN_QUERY])
-        if plan_item.TYPE_ITERATE in data:
-            return self.parse_iterate_plan_item(data[plan_item.TYPE_ITERATE])
-        if plan_item.TYPE_ACTION_REPORT in data:
-            return self.parse_action_report_plan_item(data[plan_item.TYPE_ACTION_REPORT])
-        if plan_item.TYPE_GREET in data:
-            return plan_item.Greet()
-        if plan_item.TYPE_EMIT_MOVE in data:
-            return self.parse_emit_move_plan_item(data)
-        if plan_item.TYPE_QUESTION_REPORT in data:
-            return self.parse_question_report_plan_item(data)
-        if plan_item.TYPE_SERVICE_REPORT in data:
-            return self.parse_service_report_plan_item(data)
-        if plan_item.TYPE_RESPOND_TO_INSULT in data:
-            return plan_item.RespondToInsult()
-        if plan_item.TYPE_RESPOND_TO_THANK_YOU in data:
-            return plan_item.RespondToThankYou()
+        plan_item_types = [key for key in data if key in self.PLAN_ITEM_PRECEDENCE]
+        if plan_item_types:
+            plan_item_type = min(plan_item_types, key=self.PLAN_ITEM_PRECEDENCE.__getitem__)
+            return self.PLAN_ITEM_PARSERS[plan_item_type](self, data)
 
         raise JSONParseFailure(f"PlanItem {data} not supported by json parser")
 
@@ -0,0 +1,51 @@
+import hashlib
+import json
+import os
+import tempfile
+
+from tala.utils.version import installed_tala_version
+
+COMPILE_CACHE_FORMAT_VERSION = 1
+DEFAULT_COMPILE_CACHE_DIRECTORY = os.path.join(".tala_cache", "ddds")
+DDD_XML_RESOURCES = ["ontology.xml", "domain.xml", "service_interface.xml"]
+
+
+class DDDCompileCache(object):
+    """ An on-disk cache of the JSON API documents of compiled DDDs. An entry is keyed by the content of the XML files
+    of the DDD, its path and config, and the tala version, so a DDD is only recompiled when any of them changes. """
+    def __init__(self, directory=DEFAULT_COMPILE_CACHE_DIRECTORY):
+        self._directory = directory
+
+    @property
+    def directory(self):
+        return self._directory
+
+    def key(self, ddd_name, ddd_path, ddd_config):
+        sha256 = hashlib.sha256()
+        tala_version = installed_tala_version()
+        header = [COMPILE_CACHE_FORMAT_VERSION, tala_version, ddd_name, os.path.abspath(ddd_path), ddd_config]
+        sha256.update(json.dumps(header, sort_keys=True).encode("utf-8"))
+        for resource_name in DDD_XML_RESOURCES:
+            sha256.update(b"\0%s\0" % resource_name.encode("utf-8"))
+            resource_path = os.path.join(ddd_path, resource_name)
+            if os.path.exists(resource_path):
+                with open(resource_path, "rb") as file:
+                    sha256.update(file.read())
+        return sha256.hexdigest()
+
+    def has_entry(self, key):
+        return os.path.exists(self._path_of(key))
+
+    def get(self, key):
+        with open(self._path_of(key)) as file:
+            return json.load(file)
+
+    def put(self, key, ddd_as_json):
+        os.makedirs(self._directory, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        with os.fdopen(file_descriptor, "w") as file:
+            json.dump(ddd_as_json, file)
+        os.replace(temporary_path, self._path_of(key))
+
+    def _path_of(self, key):
+        return os.path.join(self._directory, "%s.json" % key)
@@ -2,7 +2,6 @@ import os
 
 from tala.config import DddConfig, DddConfigNotFoundException
 from tala.ddd.loading.ddd_loader import DDDLoader
-from tala.utils.chdir import chdir
 
 
 class DddNotFoundException(Exception):
@@ -29,36 +28,37 @@ class DDDSetLoader(object):
 
     def _validate_that_configs_in_overridden_ddd_configs_exist(self):
         for overridden_config in self._overridden_ddd_configs:
-            with chdir(overridden_config.ddd_name):
-                try:
-                    DddConfig(overridden_config.path).read()
-                except DddConfigNotFoundException:
-                    raise OverriddenDddConfigNotFoundException(
-                        "Expected DDD config '%s' to exist in DDD '%s' but it was not found." %
-                        (overridden_config.path, overridden_config.ddd_name)
-                    )
+            try:
+                self._overridden_ddd_config(overridden_config, overridden_config.ddd_name).read()
+            except DddConfigNotFoundException:
+                raise OverriddenDddConfigNotFoundException(
+                    "Expected DDD config '%s' to exist in DDD '%s' but it was not found." %
+                    (overridden_config.path, overridden_config.ddd_name)
+                )
+
+    @staticmethod
+    def _overridden_ddd_config(overridden_config, ddd_path):
+        return DddConfig(os.path.join(ddd_path, overridden_config.path or DddConfig.default_name()))
 
     def ddds_as_list(self, ddds, path=".", *args, **kwargs):
-        with chdir(path):
-            return list(self._load_ddds(ddds, *args, **kwargs))
+        return list(self._load_ddds(ddds, path, *args, **kwargs))
 
-    def _load_ddds(self, ddd_names, *args, **kwargs):
+    def _load_ddds(self, ddd_names, path, *args, **kwargs):
         configs = {}
         for ddd_name in ddd_names:
-            configs[ddd_name] = self._ddd_config(ddd_name)
+            configs[ddd_name] = self.ddd_config(ddd_name, path)
 
         for ddd_name in ddd_names:
             config = configs[ddd_name]
-            yield self._load_ddd(ddd_name, config, *args, **kwargs)
+            yield self._load_ddd(ddd_name, config, *args, path=os.path.abspath(os.path.join(path, ddd_name)), **kwargs)
 
     def _load_ddd(self, *args, **kwargs):
         ddd_loader = DDDLoader(*args, **kwargs)
         return ddd_loader.load()
 
-    def _ddd_config(self, ddd_name):
+    def ddd_config(self, ddd_name, path="."):
+        ddd_path = os.path.join(path, ddd_name)
         for overridden_config in self._overridden_ddd_configs:
             if overridden_config.ddd_name == ddd_name:
-                with chdir(ddd_name):
-                    return DddConfig(overridden_config.path).read()
-        with chdir(ddd_name):
-            return DddConfig().read()
+                return self._overridden_ddd_config(overridden_config, ddd_path).read()
+        return DddConfig(os.path.join(ddd_path, DddConfig.default_name())).read()
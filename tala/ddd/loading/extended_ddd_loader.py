@@ -1,6 +1,3 @@
-import os
-
-from tala.utils.chdir import chdir
 from tala.ddd.loading.ddd_loader import DDDLoader
 from tala.ddd.parser import Parser
 
@@ -9,19 +6,23 @@ from tala.ddd.services.parameters.retriever import ParameterRetriever
 
 
 class ExtendedDDDLoader(object):
-    def __init__(self, ddd_manager, name, ddd_config, rerank_amount):
-        ddd_loader = DDDLoader(name, ddd_config)
-        self._ddd = ddd_loader.load()
+    def __init__(self, ddd_manager, name, ddd_config, rerank_amount, path=None):
+        self._ddd = compile_ddd(name, ddd_config, rerank_amount, path)
         self._ddd_config = ddd_config
         self._ddd_manager = ddd_manager
         self._rerank_amount = rerank_amount
 
     def load(self):
-        path = os.path.join(os.getcwd(), self._ddd.name)
+        return extend_ddd(self._ddd)
+
+
+def extend_ddd(ddd):
+    parser = Parser(ddd.name, ddd.ontology, ddd.domain.name)
+    parameter_retriever = ParameterRetriever(ddd.service_interface, ddd.ontology)
+    return ExtendedDDD(ddd, parameter_retriever, parser, ddd.path)
 
-        with chdir(self._ddd.name):
-            parser = Parser(self._ddd.name, self._ddd.ontology, self._ddd.domain.name)
-            parameter_retriever = ParameterRetriever(self._ddd.service_interface, self._ddd.ontology)
 
-        ddd = ExtendedDDD(self._ddd, parameter_retriever, parser, path)
-        return ddd
+def compile_ddd(name, ddd_config, rerank_amount, path=None):
+    """ Compile the DDD that ExtendedDDDLoader extends. It takes the arguments of ExtendedDDDLoader except the DDD
+    manager, so that it can be called in a worker process. """
+    return DDDLoader(name, ddd_config, path).load()
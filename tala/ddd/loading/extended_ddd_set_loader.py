@@ -1,35 +1,57 @@
-from tala.ddd.loading.extended_ddd_loader import ExtendedDDDLoader
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+from tala.ddd.loading.extended_ddd_loader import ExtendedDDDLoader, compile_ddd, extend_ddd
 from tala.ddd.loading.ddd_set_loader import DDDSetLoader
-from tala.utils.chdir import chdir
 
 
 class ExtendedDDDSetLoader(DDDSetLoader):
-    def __init__(self, ddd_manager, overridden_ddd_config_paths=None):
+    def __init__(self, ddd_manager, overridden_ddd_config_paths=None, processes=1):
         super(ExtendedDDDSetLoader, self).__init__(overridden_ddd_config_paths)
         self._ddd_manager = ddd_manager
+        self._processes = processes
 
     def ddds_as_list(self, ddds, path=".", *args, **kwargs):
-        with chdir(path):
-            ddds_dict = self._load_ddds(ddds, *args, **kwargs)
-            return list(ddds_dict.values())
+        ddds_dict = self._load_ddds(ddds, path, *args, **kwargs)
+        return list(ddds_dict.values())
 
-    def _load_ddds(self, ddd_names, *args, **kwargs):
+    def _load_ddds(self, ddd_names, path, *args, **kwargs):
         ddds = {}
         configs = {}
         for ddd_name in ddd_names:
-            configs[ddd_name] = self._ddd_config(ddd_name)
+            configs[ddd_name] = self.ddd_config(ddd_name, path)
+
+        if self._processes > 1 and len(ddd_names) > 1:
+            return self._load_ddds_in_parallel(ddd_names, configs, path, *args, **kwargs)
 
         for ddd_name in ddd_names:
             config = configs[ddd_name]
-            ddds[ddd_name] = self._load_ddd(ddd_name, config, *args, **kwargs)
+            ddd_path = self._ddd_path(path, ddd_name)
+            ddds[ddd_name] = self._load_ddd(ddd_name, config, *args, path=ddd_path, **kwargs)
         return ddds
 
+    @staticmethod
+    def _ddd_path(path, ddd_name):
+        return os.path.abspath(os.path.join(path, ddd_name))
+
     def _load_ddd(self, *args, **kwargs):
         ddd_loader = ExtendedDDDLoader(self._ddd_manager, *args, **kwargs)
         return ddd_loader.load()
 
+    def _load_ddds_in_parallel(self, ddd_names, configs, path, *args, **kwargs):
+        """ Compile the ontology, domain and service interface of each DDD in a worker process, with the same
+        arguments as when loading serially. The compiled DDDs are pickled back to this process, where they are
+        extended. """
+        with ProcessPoolExecutor(max_workers=min(self._processes, len(ddd_names))) as executor:
+            compiled_ddds = {
+                ddd_name: executor.submit(
+                    compile_ddd, ddd_name, configs[ddd_name], *args, path=self._ddd_path(path, ddd_name), **kwargs
+                )
+                for ddd_name in ddd_names
+            }
+            return {ddd_name: extend_ddd(compiled_ddd.result()) for ddd_name, compiled_ddd in compiled_ddds.items()}
+
     def ensure_ddds_loaded(self, ddds, path=".", *args, **kwargs):
-        with chdir(path):
-            ddds = self._load_ddds(ddds, *args, **kwargs)
-            for ddd in list(ddds.values()):
-                self._ddd_manager.ensure_ddd_added(ddd)
+        ddds = self._load_ddds(ddds, path, *args, **kwargs)
+        for ddd in list(ddds.values()):
+            self._ddd_manager.ensure_ddd_added(ddd)
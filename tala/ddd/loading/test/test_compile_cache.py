@@ -0,0 +1,53 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from tala.ddd.loading import compile_cache
+from tala.ddd.loading.compile_cache import DDDCompileCache
+
+
+class DDDCompileCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = tempfile.mkdtemp(prefix="DDDCompileCacheTest")
+        self._ddd_path = os.path.join(self._temp_dir, "mockup_ddd")
+        os.makedirs(self._ddd_path)
+        for resource_name in ["ontology.xml", "domain.xml", "service_interface.xml"]:
+            self._write_resource(resource_name, "<%s/>" % resource_name)
+        self._cache = DDDCompileCache(os.path.join(self._temp_dir, "cache"))
+
+    def tearDown(self):
+        shutil.rmtree(self._temp_dir)
+
+    def _write_resource(self, resource_name, content):
+        with open(os.path.join(self._ddd_path, resource_name), "w") as file:
+            file.write(content)
+
+    def _key(self, ddd_config=None):
+        return self._cache.key("mockup_ddd", self._ddd_path, ddd_config or {"use_rgl": False})
+
+    def test_key_is_same_for_unchanged_ddd(self):
+        self.assertEqual(self._key(), self._key())
+
+    def test_key_changes_with_xml_resource(self):
+        key = self._key()
+        self._write_resource("domain.xml", "<domain name='ChangedDomain'/>")
+        self.assertNotEqual(key, self._key())
+
+    def test_key_changes_with_ddd_config(self):
+        self.assertNotEqual(self._key({"use_rgl": False}), self._key({"use_rgl": True}))
+
+    def test_key_changes_with_tala_version(self):
+        with patch("{}.installed_tala_version".format(compile_cache.__name__), return_value="1.0.0"):
+            key = self._key()
+        with patch("{}.installed_tala_version".format(compile_cache.__name__), return_value="1.0.1"):
+            self.assertNotEqual(key, self._key())
+
+    def test_missing_entry(self):
+        self.assertFalse(self._cache.has_entry(self._key()))
+
+    def test_stored_entry_is_returned(self):
+        self._cache.put(self._key(), {"data": {"id": "mockup_ddd"}})
+        self.assertTrue(self._cache.has_entry(self._key()))
+        self.assertEqual({"data": {"id": "mockup_ddd"}}, self._cache.get(self._key()))
@@ -1,3 +1,4 @@
+import os
 from unittest.mock import Mock
 
 from tala.config import BackendConfig
@@ -92,13 +93,14 @@ class TestExtendedDDDLoader(DddMockingTestCase):
     def _when_load_is_called(self, *args, **kwargs):
         self._load(*args, **kwargs)
 
-    def _load(self, ddd_name):
+    def _load(self, ddd_name, path=None):
         mock_ddd_manager = Mock(spec=DDDManager)
         mock_ddd_loader = MockExtendedDDDLoader(
             ddd_manager=mock_ddd_manager,
             name=ddd_name,
             ddd_config=self._mock_ddd_config,
-            rerank_amount=self._backend_config["rerank_amount"]
+            rerank_amount=self._backend_config["rerank_amount"],
+            path=path
         )
         self._result = mock_ddd_loader.load()
 
@@ -120,6 +122,19 @@ class TestExtendedDDDLoader(DddMockingTestCase):
     def _then_loaded_ddd_has_path(self, path):
         self.assertEqual(path, self._result.path)
 
+    def test_load_from_explicit_path_outside_working_directory(self):
+        self._given_ontology_xml_file("mockup_app/ontology.xml")
+        self._given_domain_xml_file("mockup_app/domain.xml")
+        self._given_service_interface_xml_file("mockup_app/service_interface.xml")
+        self._given_working_directory("other_directory")
+        self._when_load_is_called("mockup_app", path="%s/mockup_app" % self._temp_dir)
+        self._then_result_contains_ddd("mockup_app")
+        self._then_loaded_ddd_has_path("%s/mockup_app" % self._temp_dir)
+
+    def _given_working_directory(self, path):
+        os.makedirs(path)
+        os.chdir(path)
+
 
 class MockExtendedDDDLoader(ExtendedDDDLoader):
     def _load_ddds_as_dict(self):
@@ -1,3 +1,4 @@
+import os
 import unittest
 
 from unittest.mock import patch
@@ -10,6 +11,8 @@ from tala.ddd.loading.ddd_set_loader import DddNotFoundException, \
 from tala.ddd.ddd_manager import DDDManager
 from tala.log import logger
 from tala.ddd.loading import extended_ddd_set_loader
+from tala.testing.ddd_mocker import DddMockingTestCase
+from tala.config import DddConfig
 
 
 class TestDDDSetLoader(unittest.TestCase):
@@ -48,7 +51,7 @@ class TestDDDSetLoader(unittest.TestCase):
             self._given_overridden_ddd_config_paths([OverriddenDddConfig("hello_world", "mock_config.json")])
             self._given_extended_ddd_set_loader_created()
             self._when_ensuring_ddds_loaded_from("hello_world.json")
-            self._then_method_called_with(MockDddConfig, "mock_config.json")
+            self._then_method_called_with(MockDddConfig, os.path.join(".", "hello_world", "mock_config.json"))
 
     def _given_overridden_ddd_config_paths(self, overridden_ddd_config_paths):
         self._overridden_ddd_config_paths = overridden_ddd_config_paths
@@ -90,3 +93,61 @@ class TestDDDSetLoader(unittest.TestCase):
             self._extended_ddd_set_loader.ensure_ddds_loaded(
                 self._ddds, logger=self.test_logger, rerank_amount=BackendConfig.DEFAULT_RERANK_AMOUNT
             )
+
+
+class TestParallelDDDSetLoading(DddMockingTestCase):
+    def test_ddds_compiled_in_worker_processes(self):
+        self._given_ddd("first_ddd", "FirstOntology", "FirstDomain")
+        self._given_ddd("second_ddd", "SecondOntology", "SecondDomain")
+        self._when_loading_ddds(["first_ddd", "second_ddd"], processes=2)
+        self._then_loaded_ddds_are([("first_ddd", "FirstOntology", "FirstDomain"),
+                                    ("second_ddd", "SecondOntology", "SecondDomain")])
+
+    def _given_ddd(self, name, ontology_name, domain_name, directory="."):
+        path = os.path.join(directory, name)
+        self.create_mockup_file("%s/ontology.xml" % path, '<ontology name="%s"/>' % ontology_name)
+        self._given_domain_xml_file("%s/domain.xml" % path, domain_name)
+        self._given_service_interface_xml_file("%s/service_interface.xml" % path)
+        DddConfig.write_default_config(path="%s/%s" % (path, DddConfig.default_name()))
+
+    def _when_loading_ddds(self, ddd_names, processes, path=".", **kwargs):
+        ddd_set_loader = extended_ddd_set_loader.ExtendedDDDSetLoader(DDDManager(), processes=processes)
+        self._result = ddd_set_loader.ddds_as_list(
+            ddd_names, path, rerank_amount=BackendConfig.DEFAULT_RERANK_AMOUNT, **kwargs
+        )
+
+    def _then_loaded_ddds_are(self, expected, directory=None):
+        directory = directory or self._temp_dir
+        actual = [(ddd.name, ddd.ontology.get_name(), ddd.domain.get_name()) for ddd in self._result]
+        self.assertEqual(expected, actual)
+        for ddd in self._result:
+            self.assertEqual("%s/%s" % (directory, ddd.name), ddd.path)
+
+    def test_ddds_compiled_in_worker_processes_from_path(self):
+        self._given_ddd("first_ddd", "FirstOntology", "FirstDomain", directory="ddds")
+        self._given_ddd("second_ddd", "SecondOntology", "SecondDomain", directory="ddds")
+        self._when_loading_ddds(["first_ddd", "second_ddd"], processes=2, path="%s/ddds" % self._temp_dir)
+        self._then_loaded_ddds_are([("first_ddd", "FirstOntology", "FirstDomain"),
+                                    ("second_ddd", "SecondOntology", "SecondDomain")],
+                                   directory="%s/ddds" % self._temp_dir)
+        self.assertEqual(self._temp_dir, os.getcwd())
+
+    def test_ddd_configs_read_from_path(self):
+        self._given_ddd("first_ddd", "FirstOntology", "FirstDomain", directory="ddds")
+        DddConfig.write_default_config(path="ddds/first_ddd/%s" % DddConfig.default_name(), word_list="words.txt")
+        self._when_reading_ddd_config("first_ddd", path="ddds")
+        self._then_result_has_entry("word_list", "words.txt")
+        self.assertEqual(self._temp_dir, os.getcwd())
+
+    def _when_reading_ddd_config(self, ddd_name, path):
+        ddd_set_loader = extended_ddd_set_loader.ExtendedDDDSetLoader(DDDManager())
+        self._result = ddd_set_loader.ddd_config(ddd_name, path)
+
+    def _then_result_has_entry(self, key, expected_value):
+        self.assertEqual(expected_value, self._result[key])
+
+    def test_worker_processes_are_given_the_loader_arguments(self):
+        self._given_ddd("first_ddd", "FirstOntology", "FirstDomain")
+        self._given_ddd("second_ddd", "SecondOntology", "SecondDomain")
+        with self.assertRaises(TypeError):
+            self._when_loading_ddds(["first_ddd", "second_ddd"], processes=2, unexpected_argument=True)
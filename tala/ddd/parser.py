@@ -2,6 +2,7 @@ import copy
 import re
 
 from tala.ddd.utils import CacheMethod
+from tala.utils.lru_cache import LRUCache
 from tala.model.action_status import Done
 from tala.model.ask_feature import AskFeature
 from tala.model.goal import Perform, Resolve
@@ -19,6 +20,30 @@ from tala.model.service_action_outcome import SuccessfulServiceAction, FailedSer
 from tala.model.person_name import PersonName
 from tala.model.date_time import DateTime
 from tala.ddd.json_parser import CheckingJSONParser, JSONParseFailure
+from tala.utils.immutable import ImmutableMixin
+
+DEFAULT_CACHE_SIZE = 10000
+
+TOKEN_PATTERN = re.compile(r"""\s*(\w+|"[^"]*"|'[^']*'|\S)""")
+SPACED_TOKEN_PATTERN = re.compile(r"""\s*(?:\w+|"[^"]*"|'[^']*'|\S)""")
+REAL_PATTERN = re.compile(r"[0-9]*\.[0-9]+")
+INTEGER_PATTERN = re.compile(r"[0-9]+")
+CLOSING_BRACKETS = {"(": ")", "[": "]", "{": "}"}
+CLOSERS = set(CLOSING_BRACKETS.values())
+QUOTES = "\"'"
+
+BASIC_MOVES = {
+    move.GREET: move.Greet,
+    move.INSULT: move.Insult,
+    move.INSULT_RESPONSE: move.InsultResponse,
+    move.MUTE: move.Mute,
+    move.UNMUTE: move.Unmute,
+    move.QUIT: move.Quit,
+    move.THANK_YOU: move.ThankYou,
+    move.THANK_YOU_RESPONSE: move.ThankYouResponse,
+}
+SPEAKERS = {speaker.USR: speaker.USR, speaker.SYS: speaker.SYS, speaker.MODEL: speaker.MODEL, "None": None}
+ICM_POLARITIES = {move.ICM.POS, move.ICM.NEG, move.ICM.INT}
 
 
 class ParseError(Exception):
@@ -29,483 +54,487 @@ class ParseFailure(Exception):
     pass
 
 
+class Tokens:
+    """ The tokens of a semantic expression: words, quoted strings and single punctuation characters. For each opening
+    bracket, the index of its matching closing bracket is kept. Parts of the expression are addressed as spans of
+    tokens, from lo up to but not including hi. The text of a span is read verbatim from the expression, including
+    whitespace, so that free-form arguments are kept as written. """
+    def __init__(self, string):
+        self._string = string
+        self._spaced_texts = None
+        self.texts = TOKEN_PATTERN.findall(string)
+        self.closers = {}
+        open_brackets = []
+        for index, text in enumerate(self.texts):
+            if text in CLOSING_BRACKETS:
+                open_brackets.append(index)
+            elif text in CLOSERS and open_brackets and text == CLOSING_BRACKETS[self.texts[open_brackets[-1]]]:
+                self.closers[open_brackets.pop()] = index
+
+    def __len__(self):
+        return len(self.texts)
+
+    def text(self, lo, hi):
+        if hi - lo == 1:
+            return self.texts[lo]
+        if self._spaced_texts is None:
+            self._spaced_texts = SPACED_TOKEN_PATTERN.findall(self._string)
+        return "".join(self._spaced_texts[lo:hi]).lstrip()
+
+    def head(self, lo, hi):
+        index = lo + 1 if self.texts[lo] == "~" and hi - lo > 1 else lo
+        text = self.texts[index]
+        return text[0] if text[0] in QUOTES else text
+
+    def is_word(self, index):
+        character = self.texts[index][0]
+        return character.isalnum() or character == "_"
+
+    def is_word_span(self, lo, hi):
+        return hi - lo == 1 and self.is_word(lo)
+
+    def is_bracketed(self, lo, hi, opening_bracket):
+        return hi - lo > 1 and self.texts[lo] == opening_bracket and self.closers.get(lo) == hi - 1
+
+    def arguments(self, lo, hi, name):
+        """ Returns the span of the arguments if the span is 'name(...)', and otherwise None. """
+        if hi - lo > 2 and self.texts[lo] == name and self.texts[lo + 1] == "(" and self.closers.get(lo + 1) == hi - 1:
+            return lo + 2, hi - 1
+        return None
+
+    def split(self, lo, hi, separator=","):
+        """ Returns the spans between the separators of the span that are not within brackets. """
+        spans = []
+        if lo >= hi:
+            return spans
+        texts = self.texts
+        closers = self.closers
+        start = lo
+        index = lo
+        while index < hi:
+            text = texts[index]
+            if text == separator:
+                spans.append((start, index))
+                start = index + 1
+            elif text in CLOSING_BRACKETS:
+                index = closers.get(index, index)
+            index += 1
+        spans.append((start, hi))
+        return spans
+
+
+def index_clauses_by_head(clauses):
+    """ Returns the clauses that apply to expressions with any head, and for each head, the clauses that apply to
+    expressions with that head, in their original order. Clauses with the heads None apply to any head. """
+    generic_clauses = [clause for clause, heads in clauses if heads is None]
+    all_heads = set().union(*[heads for clause, heads in clauses if heads is not None])
+    clauses_by_head = {
+        head: [clause for clause, heads in clauses if heads is None or head in heads]
+        for head in all_heads
+    }
+    return generic_clauses, clauses_by_head
+
+
 class Parser:
-    def __init__(self, ddd_name, ontology, domain_name=None):
+    """ Parses semantic expressions into model objects. The expression is split into tokens once, and is then parsed
+    by recursive descent over spans of the tokens, choosing among the clauses by the head token of each span. A
+    clause returns None when the span is not of its form, so that the next clause can be tried.
+
+    Results are cached in an LRUCache, which can be shared between parsers. Entries are kept apart by the ontology
+    object and its individuals revision, so that parsers for different sessions of an ontology, or an ontology whose
+    individuals have changed, don't get each other's results. Every call to parse returns a deep copy of the cached
+    object, except that with share_results, an immutable result such as an individual or a predicate proposition is
+    returned as it is. """
+    def __init__(self, ddd_name, ontology, domain_name=None, cache=None, share_results=False):
         self._ddd_name = ddd_name
         self.ontology = ontology
         self.ontology_name = ontology.get_name()
         self.domain_name = domain_name
-        self._cache_method = CacheMethod(self, self._cacheable_parse)
-        self._clauses = [
-            self._parse_set,
-            self._parse_decorated_non_icm_move,
-            self._parse_non_icm_move,
-            self._parse_findout_plan_item,
-            self._parse_do_plan_item,
-            self._parse_raise_plan_item,
-            self._parse_bind_plan_item,
-            self._parse_respond_plan_item,
-            self._parse_if_then_else_plan_item,
-            self._parse_jumpto_plan_item,
-            self._parse_forget_all_plan_item,
-            self._parse_forget_plan_item,
-            self._parse_forget_shared_plan_item,
-            self._parse_assume_plan_item,
-            self._parse_assume_shared_plan_item,
-            self._parse_action_performed_plan_item,
-            self._parse_action_aborted_plan_item,
-            self._parse_goal,
-            self._parse_assume_issue_item,
-            self._parse_insist_assume_issue_item,
-            self._parse_log_item,
-            self._parse_forget_issue_plan_item,
-            self._parse_invoke_service_query_plan_item,
-            self._parse_deprecated_dev_query_plan_item,
-            self._parse_invoke_service_action_plan_item,
-            self._parse_deprecated_dev_perform_plan_item,
-            self._parse_change_ddd_plan_item,
-            self._parse_question,
-            self._parse_lambda_abstracted_goal_proposition,
-            self._parse_lambda_abstracted_predicate_proposition,
-            self._parse_lambda_abstracted_implication_proposition,
-            self._parse_service_result_proposition,
-            self._parse_successful_service_action,
-            self._parse_failed_service_action,
-            self._parse_action_status,
-            self._parse_decorated_icm_move,
-            self._parse_icm_move,
-            self._parse_proposition,
-            self._parse_yes_or_no,
-            self._parse_prop_set,
-            self._parse_action,
-            self._parse_individual,
-            self._parse_predicate,
-            self._parse_string,
-            self._parse_action_status_proposition
-        ]  # yapf: disable
+        self._share_results = share_results
+        if cache is None:
+            cache = LRUCache(DEFAULT_CACHE_SIZE)
+        self._cache_method = CacheMethod(
+            self, self._cacheable_parse, cache, namespace=(ddd_name, ontology, domain_name)
+        )
+
+    @property
+    def cache(self):
+        return self._cache_method.cache
 
     def clear(self):
         self._cache_method.clear()
 
     def parse(self, string):
-        object = self._cacheable_parse(string)
+        object = self._cacheable_parse(string, self.ontology.individuals_revision)
+        if self._share_results and isinstance(object, ImmutableMixin):
+            return object
         new_instance = copy.deepcopy(object)
         return new_instance
 
-    def _cacheable_parse(self, string):
-        try:
-            json_parser = CheckingJSONParser(self._ddd_name, self.ontology, self.domain_name)
-            return json_parser.parse(string)
-        except (AttributeError, TypeError, JSONParseFailure):
-            pass
+    def _cacheable_parse(self, string, individuals_revision):
+        """ The individuals revision is not used here, but makes it part of the cache key. """
+        if not isinstance(string, str):
+            try:
+                json_parser = CheckingJSONParser(self._ddd_name, self.ontology, self.domain_name)
+                return json_parser.parse(string)
+            except (AttributeError, TypeError, JSONParseFailure):
+                pass
+        tokens = Tokens(string)
         try:
-            return self._parse(string)
+            result = self._parse_expression(tokens, 0, len(tokens.texts))
         except OntologyError as exception:
             raise ParseError("failed to parse '%s': %s" % (string, exception))
+        if result is None:
+            raise ParseError("failed to parse '" + string + "' (ontology=" + str(self.ontology) + ")")
+        return result
 
     def parse_parameters(self, string):
+        tokens = Tokens(string)
+        lo, hi = 0, len(tokens)
+        if tokens.is_bracketed(lo, hi, "{"):
+            lo, hi = lo + 1, hi - 1
         params = {}
-        string = self._strip_curly_brackets(string)
-        while self._more_data_to_read(string):
-            (key, value, rest) = self._get_next_question_param(string)
-            params[key] = value
-            string = rest
+        for parameter_lo, parameter_hi in tokens.split(lo, hi):
+            if parameter_hi - parameter_lo < 3 or tokens.texts[parameter_lo + 1] != "=":
+                raise ParseError("failed to parse parameters %s" % string)
+            key = tokens.texts[parameter_lo]
+            params[key] = self._parse_parameter(key, tokens, parameter_lo + 2, parameter_hi)
         return params
 
-    def _parse(self, string):
-        for parse_method in self._clauses:
-            try:
-                return parse_method(string)
-            except ParseFailure:
-                pass
-        raise ParseError("failed to parse '" + string + "' (ontology=" + str(self.ontology) + ")")
-
-    def _parse_incrementally(self, string):
-        for n in range(1, len(string) + 1):
-            try:
-                result = self._parse(string[0:n])
-                if result:
-                    return result, string[n:]
-            except ParseError:
-                pass
-
-    def _parse_goal(self, string):
-        try:
-            return self._parse_resolve_goal(string)
-        except ParseFailure:
-            pass
-        try:
-            return self._parse_resolve_user_goal(string)
-        except ParseFailure:
-            pass
-        try:
-            return self._parse_perform_goal(string)
-        except ParseFailure:
-            pass
-        raise ParseFailure()
-
-    def _parse_decorated_non_icm_move(self, string):
-        m = re.search(r'^Move\((.*)\)$', string)
-        if m:
-            move_and_maybe_realization_data_string = m.group(1)
-            move, rest = self._parse_incrementally(move_and_maybe_realization_data_string)
-            if rest:
-                m = re.search(r'^, (.*)$', rest)
-                if m:
-                    realization_data_string = m.group(1)
-                    realization_data = self._parse_realization_data(realization_data_string)
-                    move.set_realization_data(**realization_data)
-            return move
-        else:
-            raise ParseFailure()
-
-    def _parse_non_icm_move(self, string):
-        try:
-            return self._parse_basic_move(string)
-        except ParseFailure:
-            pass
-        try:
-            return self._parse_request_move(string)
-        except ParseFailure:
-            pass
-        try:
-            return self._parse_ask_move(string)
-        except ParseFailure:
-            pass
-        try:
-            return self._parse_answer_move(string)
-        except ParseFailure:
-            pass
-        try:
-            return self._parse_report_move(string)
-        except ParseFailure:
-            pass
-        try:
-            return self._parse_prereport_move(string)
-        except ParseFailure:
-            pass
-        raise ParseFailure()
-
-    def _parse_basic_move(self, string):
-        matcher = re.search(
-            fr'^({move.GREET}|{move.INSULT}|{move.INSULT_RESPONSE}|{move.MUTE}|{move.UNMUTE}|{move.QUIT}|{move.THANK_YOU}|{move.THANK_YOU_RESPONSE})$',
-            string
-        )
-        if matcher:
-            move_type_string = matcher.group(1)
-            if move_type_string == move.GREET:
-                return move.Greet()
-            elif move_type_string == move.MUTE:
-                return move.Mute()
-            elif move_type_string == move.UNMUTE:
-                return move.Unmute()
-            elif move_type_string == move.QUIT:
-                return move.Quit()
-            elif move_type_string == move.THANK_YOU:
-                return move.ThankYou()
-            elif move_type_string == move.THANK_YOU_RESPONSE:
-                return move.ThankYouResponse()
-            elif move_type_string == move.INSULT_RESPONSE:
-                return move.InsultResponse()
-            elif move_type_string == move.INSULT:
-                return move.Insult()
-
-        raise ParseFailure()
-
-    def _parse_set(self, string):
-        m = re.search(r'^\{(.*)\}$', string)
-        if m:
-            if m.group(1) == "":
-                return Set()
-            else:
-                content_as_strings = m.group(1).split(", ")
-                s = Set()
-                for content_as_string in content_as_strings:
-                    s.add(self.parse(content_as_string))
-                return s
-        else:
-            raise ParseFailure()
-
-    def _parse_string(self, string):
-        m = re.search(r'^(["\'])(?P<string>[^\1]*)\1$', string)
-        if m:
-            return m.group("string")
-        else:
-            raise ParseFailure()
-
-    def _parse_proposition(self, string):
-        try:
-            return self._parse_deprecated_service_action_terminated_proposition(string)
-        except ParseFailure:
-            pass
-        try:
-            return self._parse_deprecated_service_action_started_proposition(string)
-        except ParseFailure:
-            pass
-        try:
-            return self._parse_preconfirmation_proposition(string)
-        except ParseFailure:
-            pass
-        try:
-            return self._parse_prereport_proposition(string)
-        except ParseFailure:
-            pass
-        try:
-            return self._parse_goal_proposition(string)
-        except ParseFailure:
-            pass
-        try:
-            return self._parse_rejected_proposition(string)
-        except ParseFailure:
-            pass
-        try:
-            return self._parse_implication_proposition(string)
-        except ParseFailure:
-            pass
-        try:
-            return self._parse_predicate_proposition(string)
-        except ParseFailure:
-            pass
-        try:
-            return self._parse_understanding_proposition(string)
-        except ParseFailure:
-            pass
-        try:
-            return self._parse_resolvedness_proposition(string)
-        except ParseFailure:
-            pass
+    def _parse_expression(self, tokens, lo, hi):
+        if lo >= hi:
+            return None
+        for clause in self._clauses_by_head.get(tokens.head(lo, hi), self._generic_clauses):
+            result = clause(self, tokens, lo, hi)
+            if result is not None:
+                return result
+        return None
+
+    def _parse_nested(self, tokens, lo, hi):
+        string = tokens.text(lo, hi)
         try:
-            return self._parse_knowledge_precondition_proposition(string)
-        except ParseFailure:
-            pass
-        self._check_if_deprecated_action_proposition(string)
-        self._check_if_deprecated_issue_proposition(string)
-        raise ParseFailure()
-
-    def _check_if_deprecated_action_proposition(self, string):
-        m = re.search(r'^action\((\w+)\)$', string)
-        if m:
-            action_name = m.group(1)
+            result = self._parse_expression(tokens, lo, hi)
+        except OntologyError as exception:
+            raise ParseError("failed to parse '%s': %s" % (string, exception))
+        if result is None:
+            raise ParseError("failed to parse '" + string + "' (ontology=" + str(self.ontology) + ")")
+        return result
+
+    def _polarity(self, tokens, lo):
+        if tokens.texts[lo] == "~":
+            return Polarity.NEG, lo + 1
+        return Polarity.POS, lo
+
+    def _parse_goal(self, tokens, lo, hi):
+        head = tokens.texts[lo]
+        if head == "resolve":
+            return self._parse_resolve_goal(tokens, lo, hi)
+        if head == "resolve_user":
+            return self._parse_resolve_user_goal(tokens, lo, hi)
+        if head == "perform":
+            return self._parse_perform_goal(tokens, lo, hi)
+        return None
+
+    def _parse_decorated_non_icm_move(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "Move")
+        if arguments is None:
+            return None
+        spans = tokens.split(*arguments)
+        if not spans:
+            return None
+        (move_lo, move_hi), *realization_data_spans = spans
+        parsed_move = self._parse_expression(tokens, move_lo, move_hi)
+        if parsed_move is None:
+            return None
+        if realization_data_spans:
+            realization_data = self._parse_realization_data(tokens, realization_data_spans)
+            if realization_data is None:
+                return None
+            parsed_move.set_realization_data(**realization_data)
+        return parsed_move
+
+    def _parse_basic_move(self, tokens, lo, hi):
+        if hi - lo == 1 and tokens.texts[lo] in BASIC_MOVES:
+            return BASIC_MOVES[tokens.texts[lo]]()
+        return None
+
+    def _parse_set(self, tokens, lo, hi):
+        if not tokens.is_bracketed(lo, hi, "{"):
+            return None
+        s = Set()
+        for element_lo, element_hi in tokens.split(lo + 1, hi - 1):
+            s.add(self._parse_nested(tokens, element_lo, element_hi))
+        return s
+
+    def _parse_string(self, tokens, lo, hi):
+        if hi - lo == 1 and tokens.texts[lo][0] in QUOTES:
+            return tokens.texts[lo][1:-1]
+        return None
+
+    def _parse_proposition(self, tokens, lo, hi):
+        clauses = self._proposition_clauses_by_head.get(tokens.head(lo, hi), self._generic_proposition_clauses)
+        for clause in clauses:
+            result = clause(self, tokens, lo, hi)
+            if result is not None:
+                return result
+        self._check_if_deprecated_action_proposition(tokens, lo, hi)
+        self._check_if_deprecated_issue_proposition(tokens, lo, hi)
+        return None
+
+    def _check_if_deprecated_action_proposition(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "action")
+        if arguments and tokens.is_word_span(*arguments):
+            action_name = tokens.text(*arguments)
             raise ParseError(
                 "'action(%s)' is not a valid proposition. Perhaps you mean 'goal(perform(%s))'." %
                 (action_name, action_name)
             )
 
-    def _check_if_deprecated_issue_proposition(self, string):
-        m = re.search(r'^issue\((.+)\)$', string)
-        if m:
-            issue_name = m.group(1)
+    def _check_if_deprecated_issue_proposition(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "issue")
+        if arguments:
+            issue_name = tokens.text(*arguments)
             raise ParseError(
                 "'issue(%s)' is not a valid proposition. Perhaps you mean 'goal(resolve(%s))'." %
                 (issue_name, issue_name)
             )
 
-    def _parse_preconfirmation_proposition(self, string):
-        m = re.search(r'^(~?)preconfirmed\((?P<action>\w+), (\[[^\]]*\])\)$', string)
-        if m:
-            (polarity_str, action_value, parameter_string) = (m.group(1), m.group("action"), m.group(3))
-            polarity = self._parse_polarity(polarity_str)
-            parameter_list = self._parse_proposition_list(parameter_string)
-            return PreconfirmationProposition(self.ontology_name, action_value, parameter_list, polarity)
-        raise ParseFailure()
-
-    def _parse_prereport_proposition(self, string):
-        m = re.search(r'^prereported\((?P<action>\w+), (\[[^\]]*\])\)$', string)
-        if m:
-            (action_value, parameter_string) = (m.group("action"), m.group(2))
-            parameter_list = self._parse_proposition_list(parameter_string)
-            return PrereportProposition(self.ontology_name, action_value, parameter_list)
-        raise ParseFailure()
-
-    def _parse_report_move(self, string):
-        m = re.search(r'^report\((.*)\)$', string)
-        if m:
-            content_string = m.group(1)
-            content = self._parse(content_string)
-            return move.Report(content)
-        raise ParseFailure()
-
-    def _parse_service_result_proposition(self, string):
-        m = re.search(r'^ServiceResultProposition\((\w+), (\[[^\]]*\]), (.+)\)$', string)
-        if m:
-            (action_value, parameter_string, action_outcome_string) = m.groups()
-            parameter_list = self._parse_proposition_list(parameter_string)
-            action_outcome = self._parse(action_outcome_string)
-            return ServiceResultProposition(self.ontology_name, action_value, parameter_list, action_outcome)
-        raise ParseFailure()
-
-    def _parse_successful_service_action(self, string):
-        if string == "SuccessfulServiceAction()":
+    def _parse_action_and_proposition_list(self, tokens, lo, hi):
+        arguments = tokens.split(lo, hi)
+        if len(arguments) != 2:
+            return None
+        (action_lo, action_hi), (list_lo, list_hi) = arguments
+        if not tokens.is_word_span(action_lo, action_hi) or not tokens.is_bracketed(list_lo, list_hi, "["):
+            return None
+        propositions = self._parse_proposition_list(tokens, list_lo, list_hi)
+        if propositions is None:
+            return None
+        return tokens.texts[action_lo], propositions
+
+    def _parse_preconfirmation_proposition(self, tokens, lo, hi):
+        polarity, lo = self._polarity(tokens, lo)
+        arguments = tokens.arguments(lo, hi, "preconfirmed")
+        if arguments is None:
+            return None
+        action_and_propositions = self._parse_action_and_proposition_list(tokens, *arguments)
+        if action_and_propositions is None:
+            return None
+        action_value, parameter_list = action_and_propositions
+        return PreconfirmationProposition(self.ontology_name, action_value, parameter_list, polarity)
+
+    def _parse_prereport_proposition(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "prereported")
+        if arguments is None:
+            return None
+        action_and_propositions = self._parse_action_and_proposition_list(tokens, *arguments)
+        if action_and_propositions is None:
+            return None
+        action_value, parameter_list = action_and_propositions
+        return PrereportProposition(self.ontology_name, action_value, parameter_list)
+
+    def _parse_report_move(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "report")
+        if arguments is None:
+            return None
+        content = self._parse_nested(tokens, *arguments)
+        return move.Report(content)
+
+    def _parse_service_result_proposition(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "ServiceResultProposition")
+        if arguments is None:
+            return None
+        spans = tokens.split(*arguments)
+        if len(spans) != 3:
+            return None
+        action_and_propositions = self._parse_action_and_proposition_list(tokens, spans[0][0], spans[1][1])
+        if action_and_propositions is None:
+            return None
+        action_value, parameter_list = action_and_propositions
+        action_outcome = self._parse_nested(tokens, *spans[2])
+        return ServiceResultProposition(self.ontology_name, action_value, parameter_list, action_outcome)
+
+    def _parse_successful_service_action(self, tokens, lo, hi):
+        if hi - lo == 3 and tokens.arguments(lo, hi, "SuccessfulServiceAction"):
             return SuccessfulServiceAction()
-        raise ParseFailure()
+        return None
 
-    def _parse_failed_service_action(self, string):
-        m = re.search(r'^FailedServiceAction\((\w+)\)$', string)
-        if m:
-            (failure_reason, ) = m.groups()
-            return FailedServiceAction(failure_reason)
-        raise ParseFailure()
+    def _parse_failed_service_action(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "FailedServiceAction")
+        if arguments and tokens.is_word_span(*arguments):
+            return FailedServiceAction(tokens.text(*arguments))
+        return None
 
-    def _parse_action_status(self, string):
-        if string == "done":
+    def _parse_action_status(self, tokens, lo, hi):
+        if hi - lo == 1 and tokens.texts[lo] == "done":
             return Done()
-        raise ParseFailure()
-
-    def _parse_action_status_proposition(self, string):
-        m = re.search(r'^action_status\((\w+), (\w+)\)$', string)
-        if m:
-            (action_name, status_name) = m.groups()
-            action = self._parse_action(action_name)
-            status = self._parse_action_status(status_name)
-            return ActionStatusProposition(action, status)
-        raise ParseFailure()
-
-    def _parse_prereport_move(self, string):
-        m = re.search(r'^prereport\((\w+), (\[[^\]]*\])\)$', string)
-        if m:
-            (action_value, arguments_string) = m.groups()
-            arguments_list = self._parse_proposition_list(arguments_string)
-            return move.Prereport(self.ontology_name, action_value, arguments_list)
-        raise ParseFailure()
-
-    def _parse_ask_move(self, string):
-        m = re.search(r'^ask\((.+)\)', string)
-        if m:
-            question_string = m.group(1)
-            question = self._parse_question(question_string)
-            return move.Ask(question)
-        else:
-            raise ParseFailure()
+        return None
 
-    def _parse_question(self, string):
-        m = re.search(r'^\?(.*)$', string)
-        if m:
-            question_content_string = m.group(1)
-            question_content = self.parse(question_content_string)
-
-            try:
-                if question_content.is_knowledge_precondition_proposition():
-                    return KnowledgePreconditionQuestion(question_content.embedded_question)
-            except AttributeError:
-                pass
-            try:
-                if question_content.is_lambda_abstracted_predicate_proposition():
-                    return WhQuestion(question_content)
-            except AttributeError:
-                pass
-            try:
-                if question_content.is_lambda_abstracted_goal_proposition():
-                    return WhQuestion(question_content)
-            except AttributeError:
-                pass
-            try:
-                if question_content.is_proposition_set():
-                    return AltQuestion(question_content)
-            except AttributeError:
-                pass
-            try:
-                if question_content.is_proposition():
-                    return YesNoQuestion(question_content)
-            except AttributeError:
-                pass
-            try:
-                if question_content.is_lambda_abstracted_implication_proposition_for_consequent():
-                    return ConsequentQuestion(question_content)
-            except AttributeError:
-                pass
-            if question_content.is_predicate():
-                predicate = question_content
-                if predicate.sort.is_boolean_sort():
-                    return YesNoQuestion(PredicateProposition(predicate))
-        raise ParseFailure()
-
-    def _parse_list_of_questions(self, string):
-        string_without_brackets = self._strip_brackets(string)
-        question_strings = [str.strip() for str in string_without_brackets.split(",")]
-        return [self._parse_question(question_string) for question_string in question_strings]
-
-    def _parse_lambda_abstracted_goal_proposition(self, string):
-        if string == "X.goal(X)":
-            return LambdaAbstractedGoalProposition()
-        else:
-            raise ParseFailure()
+    def _parse_action_status_proposition(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "action_status")
+        if arguments is None:
+            return None
+        spans = tokens.split(*arguments)
+        if len(spans) != 2:
+            return None
+        action = self._parse_action(tokens, *spans[0])
+        status = self._parse_action_status(tokens, *spans[1])
+        if action is None or status is None:
+            return None
+        return ActionStatusProposition(action, status)
 
-    def _parse_lambda_abstracted_predicate_proposition(self, string):
-        m = re.search(r'^X\.(.+)\(X\)$', string)
-        if m:
-            predicate_name = m.group(1)
-            if predicate_name == "action":
-                raise ParseError("'?X.action(X)' is not a valid question. Perhaps you mean '?X.goal(X)'.")
-            predicate = self.ontology.get_predicate(predicate_name)
-            return self.ontology.create_lambda_abstracted_predicate_proposition(predicate)
-        else:
-            raise ParseFailure()
+    def _parse_prereport_move(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "prereport")
+        if arguments is None:
+            return None
+        action_and_propositions = self._parse_action_and_proposition_list(tokens, *arguments)
+        if action_and_propositions is None:
+            return None
+        action_value, arguments_list = action_and_propositions
+        return move.Prereport(self.ontology_name, action_value, arguments_list)
 
-    def _parse_lambda_abstracted_implication_proposition(self, string):
-        m = re.search(r'^X\.implies\((.+), (.+)\(X\)\)$', string)
-        if m:
-            antecedent_string, consequent_predicate_name = m.groups()
-            antecedent = self._parse_proposition(antecedent_string)
-            consequent_predicate = self.ontology.get_predicate(consequent_predicate_name)
-            return LambdaAbstractedImplicationPropositionForConsequent(
-                antecedent, consequent_predicate, self.ontology_name
-            )
-        else:
-            raise ParseFailure()
+    def _parse_ask_move(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "ask")
+        if arguments is None:
+            return None
+        question = self._parse_question(tokens, *arguments)
+        if question is None:
+            return None
+        return move.Ask(question)
 
-    def _parse_answer_move(self, string):
-        m = re.search(r'^answer\((.+)\)', string)
-        if m:
-            answer_string = m.group(1)
-            answer = self._parse_yes_no_proposition_or_individual(answer_string)
-            answer_move = move.Answer(answer)
-            return answer_move
-        else:
-            raise ParseFailure()
+    def _parse_question(self, tokens, lo, hi):
+        if lo >= hi or tokens.texts[lo] != "?":
+            return None
+        question_content = self._parse_nested(tokens, lo + 1, hi)
 
-    def _parse_yes_no_proposition_or_individual(self, answer_string):
         try:
-            return self._parse_yes_or_no(answer_string)
-        except ParseFailure:
+            if question_content.is_knowledge_precondition_proposition():
+                return KnowledgePreconditionQuestion(question_content.embedded_question)
+        except AttributeError:
             pass
         try:
-            return self._parse_proposition(answer_string)
-        except ParseFailure:
+            if question_content.is_lambda_abstracted_predicate_proposition():
+                return WhQuestion(question_content)
+        except AttributeError:
             pass
-        return self._parse_individual(answer_string)
-
-    def _parse_decorated_icm_move(self, string):
-        m = re.search(r'^ICMMove\(([^,]+)((, *)(.+))?\)$', string)
-        if m:
-            icm_string = m.group(1)
-            realization_data_string = m.group(4)
-            icm = self._parse_icm_move(icm_string)
-            if realization_data_string:
-                realization_data = self._parse_realization_data(realization_data_string)
-                icm.set_realization_data(**realization_data)
-            return icm
-        else:
-            raise ParseFailure()
+        try:
+            if question_content.is_lambda_abstracted_goal_proposition():
+                return WhQuestion(question_content)
+        except AttributeError:
+            pass
+        try:
+            if question_content.is_proposition_set():
+                return AltQuestion(question_content)
+        except AttributeError:
+            pass
+        try:
+            if question_content.is_proposition():
+                return YesNoQuestion(question_content)
+        except AttributeError:
+            pass
+        try:
+            if question_content.is_lambda_abstracted_implication_proposition_for_consequent():
+                return ConsequentQuestion(question_content)
+        except AttributeError:
+            pass
+        if question_content.is_predicate():
+            predicate = question_content
+            if predicate.sort.is_boolean_sort():
+                return YesNoQuestion(PredicateProposition(predicate))
+        return None
+
+    def _parse_list_of_questions(self, tokens, lo, hi):
+        lo, hi = self._strip_brackets(tokens, lo, hi)
+        questions = []
+        for question_lo, question_hi in tokens.split(lo, hi):
+            question = self._parse_question(tokens, question_lo, question_hi)
+            if question is None:
+                return None
+            questions.append(question)
+        return questions
+
+    def _parse_lambda_abstracted_goal_proposition(self, tokens, lo, hi):
+        if tokens.texts[lo:hi] == ["X", ".", "goal", "(", "X", ")"]:
+            return LambdaAbstractedGoalProposition()
+        return None
 
-    def _parse_realization_data(self, string):
-        realization_data = dict()
-        while self._more_data_to_read(string):
-            (key, value, rest) = self._get_next_realization_data(string)
-            realization_data[key] = value
-            string = rest
+    def _lambda_abstracted_predicate_name(self, tokens, lo, hi):
+        texts = tokens.texts
+        if hi - lo == 4 and texts[lo + 1] == "(" and texts[lo + 2] == "X" and texts[lo + 3] == ")" \
+                and tokens.is_word(lo):
+            return texts[lo]
+        return None
 
-        return realization_data
+    def _parse_lambda_abstracted_predicate_proposition(self, tokens, lo, hi):
+        if tokens.texts[lo] != "X" or hi - lo < 2 or tokens.texts[lo + 1] != ".":
+            return None
+        predicate_name = self._lambda_abstracted_predicate_name(tokens, lo + 2, hi)
+        if predicate_name is None:
+            return None
+        if predicate_name == "action":
+            raise ParseError("'?X.action(X)' is not a valid question. Perhaps you mean '?X.goal(X)'.")
+        predicate = self.ontology.get_predicate(predicate_name)
+        return self.ontology.create_lambda_abstracted_predicate_proposition(predicate)
 
-    def _get_next_realization_data(self, string):
-        m = re.search(r'^(?P<key>[^=]+)=(?P<value>[^=]+) *\, *(?P<rest>[^=]+=.*)$', string)
-        if m:
-            rest = m.group('rest')
-        else:
-            m = re.search(r'^(?P<key>[^=]+)=(?P<value>.+)$', string)
-            rest = ""
-        if m:
-            key = m.group('key')
-            value_as_string = m.group('value')
+    def _parse_lambda_abstracted_implication_proposition(self, tokens, lo, hi):
+        if tokens.texts[lo] != "X" or hi - lo < 2 or tokens.texts[lo + 1] != ".":
+            return None
+        arguments = tokens.arguments(lo + 2, hi, "implies")
+        if arguments is None:
+            return None
+        spans = tokens.split(*arguments)
+        if len(spans) < 2:
+            return None
+        consequent_predicate_name = self._lambda_abstracted_predicate_name(tokens, *spans[-1])
+        if consequent_predicate_name is None:
+            return None
+        antecedent = self._parse_proposition(tokens, spans[0][0], spans[-1][0] - 1)
+        if antecedent is None:
+            return None
+        consequent_predicate = self.ontology.get_predicate(consequent_predicate_name)
+        return LambdaAbstractedImplicationPropositionForConsequent(antecedent, consequent_predicate, self.ontology_name)
+
+    def _parse_answer_move(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "answer")
+        if arguments is None:
+            return None
+        answer = self._parse_yes_no_proposition_or_individual(tokens, *arguments)
+        if answer is None:
+            return None
+        return move.Answer(answer)
+
+    def _parse_yes_no_proposition_or_individual(self, tokens, lo, hi):
+        answer = self._parse_yes_or_no(tokens, lo, hi)
+        if answer is None:
+            answer = self._parse_proposition(tokens, lo, hi)
+        if answer is None:
+            answer = self._parse_individual(tokens, lo, hi)
+        return answer
+
+    def _parse_decorated_icm_move(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "ICMMove")
+        if arguments is None:
+            return None
+        spans = tokens.split(*arguments)
+        if not spans:
+            return None
+        (icm_lo, icm_hi), *realization_data_spans = spans
+        icm = self._parse_icm_move(tokens, icm_lo, icm_hi)
+        if icm is None:
+            return None
+        if realization_data_spans:
+            realization_data = self._parse_realization_data(tokens, realization_data_spans)
+            if realization_data is None:
+                return None
+            icm.set_realization_data(**realization_data)
+        return icm
+
+    def _parse_realization_data(self, tokens, spans):
+        realization_data = dict()
+        for lo, hi in spans:
+            if hi - lo < 3 or tokens.texts[lo + 1] != "=":
+                return None
+            key = tokens.texts[lo]
+            value_as_string = tokens.text(lo + 2, hi)
             if key == "speaker":
                 value = value_as_string
             elif key == "perception_confidence":
@@ -514,800 +543,669 @@ class Parser:
                 value = float(value_as_string)
             elif key == "utterance" or key == "ddd_name":
                 value = self._strip_quotes(value_as_string)
+                if value is None:
+                    return None
             else:
-                raise ParseFailure("unsupported realization attribute '%s'" % key)
-            return (key, value, rest)
-        else:
-            raise ParseFailure()
+                return None
+            realization_data[key] = value
+        return realization_data
 
     def _strip_quotes(self, string):
-        m = re.search(r'^"([^"]*)"$', string)
-        if m:
-            return m.group(1)
-        else:
-            m = re.search("^'([^']*)'$", string)
-            if m:
-                return m.group(1)
-            else:
-                raise ParseFailure()
-
-    def _parse_icm_move(self, string):
-        m = re.search(r'^icm:', string)
-        if m:
-            try:
-                return self._parse_reraise_or_accommodate_or_resume_icm(string)
-            except ParseFailure:
-                pass
-            try:
-                return self._parse_loadplan_icm(string)
-            except ParseFailure:
-                pass
-            try:
-                return self._parse_perception_or_acceptance_icm(string)
-            except ParseFailure:
-                pass
-            try:
-                return self._parse_understanding_icm(string)
-            except ParseFailure:
-                pass
-        raise ParseFailure()
-
-    def _parse_reraise_or_accommodate_or_resume_icm(self, string):
-        matcher = re.search(
-            '^icm:(%s|%s|%s)(:([^:]+))?$' % (move.ICM.RERAISE, move.ICM.ACCOMMODATE, move.ICM.RESUME), string
-        )
-        if matcher:
-            (icm_type, content_string) = (matcher.group(1), matcher.group(3))
-            if content_string:
-                content = self.parse(content_string)
-                return move.ICMWithSemanticContent(icm_type, content)
-            return move.ICM(icm_type)
-        else:
-            raise ParseFailure()
+        if len(string) > 1 and string[0] in QUOTES and string[-1] == string[0] and string[0] not in string[1:-1]:
+            return string[1:-1]
+        return None
 
-    def _parse_loadplan_icm(self, string):
-        matcher = re.search(r'^icm:loadplan', string)
-        if matcher:
+    def _parse_icm_move(self, tokens, lo, hi):
+        texts = tokens.texts
+        if hi - lo < 3 or texts[lo] != "icm" or texts[lo + 1] != ":":
+            return None
+        icm_type = texts[lo + 2]
+        if icm_type in [move.ICM.RERAISE, move.ICM.ACCOMMODATE, move.ICM.RESUME]:
+            return self._parse_reraise_or_accommodate_or_resume_icm(tokens, icm_type, lo + 3, hi)
+        if icm_type == move.ICM.LOADPLAN:
             return move.ICM(move.ICM.LOADPLAN)
-        else:
-            raise ParseFailure()
-
-    def _parse_perception_or_acceptance_icm(self, string):
-        try:
-            return self._parse_contentless_perception_or_acceptance_icm(string)
-        except ParseFailure:
-            pass
-        try:
-            return self._parse_contentful_perception_icm(string)
-        except ParseFailure:
-            pass
-        try:
-            return self._parse_contentful_acceptance_icm(string)
-        except ParseFailure:
-            pass
-        raise ParseFailure()
+        if hi - lo < 5 or texts[lo + 3] != "*" or texts[lo + 4] not in ICM_POLARITIES:
+            return None
+        polarity = texts[lo + 4]
+        if lo + 5 < hi and texts[lo + 5] != ":":
+            return None
+        if icm_type in [move.ICM.PER, move.ICM.ACC]:
+            return self._parse_perception_or_acceptance_icm(tokens, icm_type, polarity, lo + 6, hi)
+        if icm_type in [move.ICM.SEM, move.ICM.UND]:
+            return self._parse_understanding_icm(tokens, icm_type, polarity, lo + 6, hi)
+        return None
+
+    def _parse_reraise_or_accommodate_or_resume_icm(self, tokens, icm_type, lo, hi):
+        if lo == hi:
+            return move.ICM(icm_type)
+        if tokens.texts[lo] != ":":
+            return None
+        content = self._parse_nested(tokens, lo + 1, hi)
+        return move.ICMWithSemanticContent(icm_type, content)
 
-    def _parse_contentless_perception_or_acceptance_icm(self, string):
-        m = re.search(r'^icm:(per|acc)\*(pos|neg|int)$', string)
-        if m:
-            icm_type = m.group(1)
-            polarity = m.group(2)
+    def _parse_perception_or_acceptance_icm(self, tokens, icm_type, polarity, content_lo, hi):
+        if content_lo > hi:
             return move.ICM(icm_type, polarity=polarity)
-        raise ParseFailure()
-
-    def _parse_contentful_perception_icm(self, string):
-        m = re.search(r'^icm:per\*(pos|neg|int):"([^"]*)"$', string)
-        if m:
-            (polarity, content_string) = m.groups()
-            return move.ICMWithStringContent(move.ICM.PER, content_string, polarity=polarity)
-        raise ParseFailure()
-
-    def _parse_contentful_acceptance_icm(self, string):
-        m = re.search(r'^icm:(per|acc)\*(pos|neg|int)(:([^:]*))?$', string)
-        if m:
-            (icm_type, polarity, junk, content_string) = m.groups()
-            if content_string == "issue":
-                return move.IssueICM(icm_type, polarity=polarity)
-            else:
-                content = self.parse(content_string)
-            return move.ICMWithSemanticContent(type=icm_type, content=content, polarity=polarity)
-        raise ParseFailure()
-
-    def _parse_understanding_icm(self, string):
-        m = re.search(r'^icm:(sem|und)\*(int|pos|neg)(:((.+)\*)?([^:]+))?$', string)
-        if m:
-            (type, polarity, foo, foo, content_speaker, content_string) = m.groups()
-            if content_string:
-                content = self.parse(content_string)
-                return move.ICMWithSemanticContent(type, content, content_speaker=content_speaker, polarity=polarity)
-
-            content = None
-            return move.ICM(type, polarity=polarity)
-        else:
-            raise ParseFailure()
+        if icm_type == move.ICM.PER and hi - content_lo == 1 and tokens.texts[content_lo][0] == '"':
+            return move.ICMWithStringContent(move.ICM.PER, tokens.texts[content_lo][1:-1], polarity=polarity)
+        if tokens.text(content_lo, hi) == "issue":
+            return move.IssueICM(icm_type, polarity=polarity)
+        content = self._parse_nested(tokens, content_lo, hi)
+        return move.ICMWithSemanticContent(type=icm_type, content=content, polarity=polarity)
+
+    def _parse_understanding_icm(self, tokens, icm_type, polarity, content_lo, hi):
+        if content_lo > hi:
+            return move.ICM(icm_type, polarity=polarity)
+        content_speaker = None
+        spans = tokens.split(content_lo, hi, separator="*")
+        if len(spans) > 1:
+            content_speaker = tokens.text(content_lo, spans[-1][0] - 1)
+            content_lo = spans[-1][0]
+        content = self._parse_nested(tokens, content_lo, hi)
+        return move.ICMWithSemanticContent(icm_type, content, content_speaker=content_speaker, polarity=polarity)
+
+    def _parse_resolvedness_proposition(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "resolved")
+        if arguments is None:
+            return None
+        issue = self._parse_nested(tokens, *arguments)
+        return ResolvednessProposition(issue)
 
-    def _parse_resolvedness_proposition(self, string):
-        m = re.search(r'^resolved\((.+)\)$', string)
-        if m:
-            issue_string = m.group(1)
-            issue = self.parse(issue_string)
-            return ResolvednessProposition(issue)
-        else:
-            raise ParseFailure()
+    def _parse_knowledge_precondition_proposition(self, tokens, lo, hi):
+        polarity, lo = self._polarity(tokens, lo)
+        arguments = tokens.arguments(lo, hi, "know_answer")
+        if arguments is None:
+            return None
+        issue = self._parse_nested(tokens, *arguments)
+        return KnowledgePreconditionProposition(issue, polarity)
 
-    def _parse_knowledge_precondition_proposition(self, string):
-        m = re.search(r'^(~?)know_answer\((.+)\)$', string)
-        if m:
-            polarity_string, issue_string = m.group(1), m.group(2)
-            issue = self.parse(issue_string)
-            polarity = self._parse_polarity(polarity_string)
-            return KnowledgePreconditionProposition(issue, polarity)
-        else:
-            raise ParseFailure()
+    def _parse_request_move(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "request")
+        if arguments is None:
+            return None
+        action = self._parse_action(tokens, *arguments)
+        if action is None:
+            return None
+        return move.Request(action)
 
-    def _parse_request_move(self, string):
-        matcher = re.search(r'^request\(([^\{\}]+)\)(.*)', string)
-        if matcher:
-            action_string = matcher.group(1)
-            action = self._parse_action(action_string)
-            return move.Request(action)
-        else:
-            raise ParseFailure()
+    def _parse_question_argument(self, tokens, lo, hi, name):
+        arguments = tokens.arguments(lo, hi, name)
+        if arguments is None:
+            return None
+        return self._parse_question(tokens, *arguments)
 
-    def _parse_findout_plan_item(self, string):
-        m = re.search(r'^findout\((.*)\)$', string)
-        if m:
-            question_string = m.group(1)
-            question = self._parse_question(question_string)
-            return plan_item.Findout(self.domain_name, question)
-        else:
-            raise ParseFailure()
+    def _parse_findout_plan_item(self, tokens, lo, hi):
+        question = self._parse_question_argument(tokens, lo, hi, "findout")
+        if question is None:
+            return None
+        return plan_item.Findout(self.domain_name, question)
 
-    def _parse_do_plan_item(self, string):
-        m = re.search(r'^do\((\w+)\)$', string)
-        if m:
-            action_string = m.group(1)
-            action = self.parse(action_string)
-            return plan_item.Do(action)
-        else:
-            raise ParseFailure()
+    def _parse_do_plan_item(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "do")
+        if arguments is None or not tokens.is_word_span(*arguments):
+            return None
+        action = self._parse_nested(tokens, *arguments)
+        return plan_item.Do(action)
 
-    def _parse_bind_plan_item(self, string):
-        m = re.search(r'^bind\((.+)\)$', string)
-        if m:
-            question_string = m.group(1)
-            question = self._parse_question(question_string)
-            return plan_item.Bind(question)
-        else:
-            raise ParseFailure()
+    def _parse_bind_plan_item(self, tokens, lo, hi):
+        question = self._parse_question_argument(tokens, lo, hi, "bind")
+        if question is None:
+            return None
+        return plan_item.Bind(question)
 
-    def _parse_forget_all_plan_item(self, string):
-        if string == "forget_all":
+    def _parse_forget_all_plan_item(self, tokens, lo, hi):
+        if hi - lo == 1 and tokens.texts[lo] == "forget_all":
             return plan_item.ForgetAll()
-        else:
-            raise ParseFailure()
+        return None
 
-    def _parse_forget_plan_item(self, string):
-        m = re.search(r'^forget\((.+)\)$', string)
-        if m:
-            proposition_string = m.group(1)
-            proposition = self.parse(proposition_string)
-            return plan_item.Forget(proposition)
-        else:
-            raise ParseFailure()
+    def _parse_nested_argument(self, tokens, lo, hi, name):
+        arguments = tokens.arguments(lo, hi, name)
+        if arguments is None:
+            return None
+        return self._parse_nested(tokens, *arguments)
 
-    def _parse_forget_shared_plan_item(self, string):
-        m = re.search(r'^forget_shared\((.+)\)$', string)
-        if m:
-            proposition_string = m.group(1)
-            proposition = self.parse(proposition_string)
-            return plan_item.ForgetShared(proposition)
-        else:
-            raise ParseFailure()
+    def _parse_forget_plan_item(self, tokens, lo, hi):
+        proposition = self._parse_nested_argument(tokens, lo, hi, "forget")
+        if proposition is None:
+            return None
+        return plan_item.Forget(proposition)
 
-    def _parse_assume_plan_item(self, string):
-        m = re.search(r'^assume\((.+)\)$', string)
-        if m:
-            proposition_string = m.group(1)
-            proposition = self._parse_proposition(proposition_string)
-            return plan_item.Assume(proposition)
-        else:
-            raise ParseFailure()
+    def _parse_forget_shared_plan_item(self, tokens, lo, hi):
+        proposition = self._parse_nested_argument(tokens, lo, hi, "forget_shared")
+        if proposition is None:
+            return None
+        return plan_item.ForgetShared(proposition)
 
-    def _parse_assume_shared_plan_item(self, string):
-        m = re.search(r'^assume_shared\((.+)\)$', string)
-        if m:
-            proposition_string = m.group(1)
-            proposition = self._parse_proposition(proposition_string)
-            return plan_item.AssumeShared(proposition)
-        else:
-            raise ParseFailure()
+    def _parse_proposition_argument(self, tokens, lo, hi, name):
+        arguments = tokens.arguments(lo, hi, name)
+        if arguments is None:
+            return None
+        return self._parse_proposition(tokens, *arguments)
 
-    def _parse_assume_issue_item(self, string):
-        m = re.search(r'^assume_issue\((.+)\)$', string)
-        if m:
-            issue_string = m.group(1)
-            issue = self.parse(issue_string)
-            return plan_item.AssumeIssue(issue)
-        else:
-            raise ParseFailure()
+    def _parse_assume_plan_item(self, tokens, lo, hi):
+        proposition = self._parse_proposition_argument(tokens, lo, hi, "assume")
+        if proposition is None:
+            return None
+        return plan_item.Assume(proposition)
 
-    def _parse_insist_assume_issue_item(self, string):
-        m = re.search(r'^insist_assume_issue\((.+)\)$', string)
-        if m:
-            issue_string = m.group(1)
-            issue = self.parse(issue_string)
-            return plan_item.AssumeIssue(issue, insist=True)
-        else:
-            raise ParseFailure()
+    def _parse_assume_shared_plan_item(self, tokens, lo, hi):
+        proposition = self._parse_proposition_argument(tokens, lo, hi, "assume_shared")
+        if proposition is None:
+            return None
+        return plan_item.AssumeShared(proposition)
 
-    def _parse_action_performed_plan_item(self, string):
-        m = re.search(r'^signal_action_completion\((true|false)(, (\S+))?\)$', string)
-        if m:
-            true_or_false = True if m.group(1) == "true" else False
-            possible_action = m.group(3)
+    def _parse_assume_issue_item(self, tokens, lo, hi):
+        issue = self._parse_nested_argument(tokens, lo, hi, "assume_issue")
+        if issue is None:
+            return None
+        return plan_item.AssumeIssue(issue)
 
-            if possible_action:
-                action = self._parse_action(possible_action)
-                return plan_item.GoalPerformed(true_or_false, action)
-            else:
-                return plan_item.GoalPerformed(true_or_false)
-
-        raise ParseFailure()
-
-    def _parse_action_aborted_plan_item(self, string):
-        m = re.search(r'^signal_action_failure\(([^,)]+)(, (\S+))?\)$', string)
-        if m:
-            reason = m.group(1)
-            possible_action = m.group(3)
-            if possible_action:
-                action = self._parse_action(possible_action)
-                return plan_item.GoalAborted(reason, action)
-            else:
-                return plan_item.GoalAborted(reason)
-        else:
-            raise ParseFailure()
+    def _parse_insist_assume_issue_item(self, tokens, lo, hi):
+        issue = self._parse_nested_argument(tokens, lo, hi, "insist_assume_issue")
+        if issue is None:
+            return None
+        return plan_item.AssumeIssue(issue, insist=True)
 
-    def _parse_log_item(self, string):
-        m = re.search(r'^log\("(.+)"\)$', string)
-        if m:
-            log_message = m.group(1)
-            return plan_item.Log(log_message)
-        else:
-            raise ParseFailure()
+    def _parse_action_performed_plan_item(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "signal_action_completion")
+        if arguments is None:
+            return None
+        spans = tokens.split(*arguments)
+        if not spans or len(spans) > 2 or tokens.text(*spans[0]) not in ["true", "false"]:
+            return None
+        true_or_false = tokens.text(*spans[0]) == "true"
+        if len(spans) == 2:
+            action = self._parse_action(tokens, *spans[1])
+            if action is None:
+                return None
+            return plan_item.GoalPerformed(true_or_false, action)
+        return plan_item.GoalPerformed(true_or_false)
+
+    def _parse_action_aborted_plan_item(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "signal_action_failure")
+        if arguments is None:
+            return None
+        spans = tokens.split(*arguments)
+        if not spans or len(spans) > 2 or spans[0][0] == spans[0][1]:
+            return None
+        reason = tokens.text(*spans[0])
+        if len(spans) == 2:
+            action = self._parse_action(tokens, *spans[1])
+            if action is None:
+                return None
+            return plan_item.GoalAborted(reason, action)
+        return plan_item.GoalAborted(reason)
+
+    def _parse_log_item(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "log")
+        if arguments is None:
+            return None
+        message = tokens.text(*arguments)
+        if len(message) > 2 and message[0] == '"' and message[-1] == '"':
+            return plan_item.Log(message[1:-1])
+        return None
+
+    def _parse_change_ddd_plan_item(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "change_ddd")
+        if arguments is None:
+            return None
+        return plan_item.ChangeDDD(tokens.text(*arguments))
 
-    def _parse_change_ddd_plan_item(self, string):
-        m = re.search(r'^change_ddd\((.+)\)$', string)
-        if m:
-            ddd_name = m.group(1)
-            return plan_item.ChangeDDD(ddd_name)
-        else:
-            raise ParseFailure()
+    def _parse_forget_issue_plan_item(self, tokens, lo, hi):
+        issue = self._parse_nested_argument(tokens, lo, hi, "forget_issue")
+        if issue is None:
+            return None
+        return plan_item.ForgetIssue(issue)
 
-    def _parse_forget_issue_plan_item(self, string):
-        m = re.search(r'^forget_issue\((.+)\)$', string)
-        if m:
-            issue_string = m.group(1)
-            issue = self.parse(issue_string)
-            return plan_item.ForgetIssue(issue)
-        else:
-            raise ParseFailure()
+    def _parse_service_query_plan_item(self, tokens, lo, hi, name):
+        arguments = tokens.arguments(lo, hi, name)
+        if arguments is None or len(tokens.split(*arguments)) != 1:
+            return None
+        issue = self._parse_nested(tokens, *arguments)
+        return plan_item.InvokeServiceQuery(issue, min_results=1, max_results=1)
 
-    def _parse_invoke_service_query_plan_item(self, string):
-        m = re.search(r'^invoke_service_query\(([^,]+)\)$', string)
-        if m:
-            (issue_string, ) = m.groups()
-            issue = self.parse(issue_string)
-            return plan_item.InvokeServiceQuery(issue, min_results=1, max_results=1)
-        else:
-            raise ParseFailure()
+    def _parse_invoke_service_query_plan_item(self, tokens, lo, hi):
+        return self._parse_service_query_plan_item(tokens, lo, hi, "invoke_service_query")
 
-    def _parse_deprecated_dev_query_plan_item(self, string):
-        m = re.search(r'^dev_query\(([^,]+)\)$', string)
-        if m:
-            (issue_string, ) = m.groups()
-            issue = self.parse(issue_string)
-            return plan_item.InvokeServiceQuery(issue, min_results=1, max_results=1)
-        else:
-            raise ParseFailure()
+    def _parse_deprecated_dev_query_plan_item(self, tokens, lo, hi):
+        return self._parse_service_query_plan_item(tokens, lo, hi, "dev_query")
 
-    def _parse_invoke_service_action_plan_item(self, string):
-        m = re.search(r'^invoke_service_action\(([^,]+), *(\{.*\})\)$', string)
-        if m:
-            (service_action, params_string) = m.groups()
-            params = self._parse_invoke_service_action_params(params_string)
-            return plan_item.InvokeServiceAction(self.ontology.name, service_action, **params)
-        else:
-            raise ParseFailure()
+    def _parse_service_action_plan_item(self, tokens, lo, hi, name):
+        arguments = tokens.arguments(lo, hi, name)
+        if arguments is None:
+            return None
+        spans = tokens.split(*arguments)
+        if len(spans) != 2 or not tokens.is_bracketed(*spans[1], "{"):
+            return None
+        service_action = tokens.text(*spans[0])
+        params = self._parse_invoke_service_action_params(tokens, *spans[1])
+        if not service_action or params is None:
+            return None
+        return plan_item.InvokeServiceAction(self.ontology.name, service_action, **params)
 
-    def _parse_deprecated_dev_perform_plan_item(self, string):
-        m = re.search(r'^dev_perform\(([^,]+), *(\{.*\})\)$', string)
-        if m:
-            (service_action, params_string) = m.groups()
-            params = self._parse_invoke_service_action_params(params_string)
-            return plan_item.InvokeServiceAction(self.ontology.name, service_action, **params)
-        else:
-            raise ParseFailure()
+    def _parse_invoke_service_action_plan_item(self, tokens, lo, hi):
+        return self._parse_service_action_plan_item(tokens, lo, hi, "invoke_service_action")
 
-    def _parse_raise_plan_item(self, string):
-        m = re.search(r'^raise\((.+)\)$', string)
-        if m:
-            question_string = m.group(1)
-            question = self._parse_question(question_string)
-            return plan_item.Raise(self.domain_name, question)
-        else:
-            raise ParseFailure()
+    def _parse_deprecated_dev_perform_plan_item(self, tokens, lo, hi):
+        return self._parse_service_action_plan_item(tokens, lo, hi, "dev_perform")
 
-    def _parse_respond_plan_item(self, string):
-        m = re.search(r'^respond\((.+)\)$', string)
-        if m:
-            question_string = m.group(1)
-            question = self._parse_question(question_string)
-            return plan_item.Respond(question)
-        else:
-            raise ParseFailure()
+    def _parse_raise_plan_item(self, tokens, lo, hi):
+        question = self._parse_question_argument(tokens, lo, hi, "raise")
+        if question is None:
+            return None
+        return plan_item.Raise(self.domain_name, question)
 
-    def _parse_resolve_goal(self, string):
-        m = re.search(r'^resolve\((.+)\)$', string)
-        if m:
-            question_string = m.group(1)
-            question = self._parse_question(question_string)
-            return Resolve(question, speaker.SYS)
-        else:
-            raise ParseFailure()
+    def _parse_respond_plan_item(self, tokens, lo, hi):
+        question = self._parse_question_argument(tokens, lo, hi, "respond")
+        if question is None:
+            return None
+        return plan_item.Respond(question)
 
-    def _parse_resolve_user_goal(self, string):
-        m = re.search(r'^resolve_user\((.+)\)$', string)
-        if m:
-            question_string = m.group(1)
-            question = self._parse_question(question_string)
-            return Resolve(question, speaker.USR)
-        else:
-            raise ParseFailure()
+    def _parse_resolve_goal(self, tokens, lo, hi):
+        question = self._parse_question_argument(tokens, lo, hi, "resolve")
+        if question is None:
+            return None
+        return Resolve(question, speaker.SYS)
 
-    def _parse_perform_goal(self, string):
-        m = re.search(r'^perform\((.+)\)$', string)
-        if m:
-            action_string = m.group(1)
-            action = self._parse_action(action_string)
-            return Perform(action)
-        else:
-            raise ParseFailure()
+    def _parse_resolve_user_goal(self, tokens, lo, hi):
+        question = self._parse_question_argument(tokens, lo, hi, "resolve_user")
+        if question is None:
+            return None
+        return Resolve(question, speaker.USR)
 
-    def _parse_if_then_else_plan_item(self, string):
-        m = re.search(r'^if (.+) then (.*) else (.*)$', string)
-        if m:
-            (condition_string, consequent_string, alternative_string) = m.groups()
-            condition = self._parse_proposition(condition_string)
-            if consequent_string != "":
-                consequent = [self.parse(consequent_string)]
-            else:
-                consequent = []
-            if alternative_string != "":
-                alternative = [self.parse(alternative_string)]
-            else:
-                alternative = []
-            return plan_item.IfThenElse(condition, consequent, alternative)
-        else:
-            raise ParseFailure()
+    def _parse_perform_goal(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "perform")
+        if arguments is None:
+            return None
+        action = self._parse_action(tokens, *arguments)
+        if action is None:
+            return None
+        return Perform(action)
 
-    def _parse_jumpto_plan_item(self, string):
-        m = re.search(r'^jumpto\((.+)\)$', string)
-        if m:
-            goal_string = m.group(1)
-            goal = self._parse_goal(goal_string)
-            return plan_item.JumpTo(goal)
+    def _parse_if_then_else_plan_item(self, tokens, lo, hi):
+        if tokens.texts[lo] != "if":
+            return None
+        spans_around_else = tokens.split(lo + 1, hi, separator="else")
+        if len(spans_around_else) < 2:
+            return None
+        alternative_lo, alternative_hi = spans_around_else[-1]
+        spans_around_then = tokens.split(lo + 1, alternative_lo - 1, separator="then")
+        if len(spans_around_then) < 2:
+            return None
+        consequent_lo, consequent_hi = spans_around_then[-1]
+        condition = self._parse_proposition(tokens, lo + 1, consequent_lo - 1)
+        if condition is None:
+            return None
+        if consequent_lo < consequent_hi:
+            consequent = [self._parse_nested(tokens, consequent_lo, consequent_hi)]
         else:
-            raise ParseFailure()
-
-    def _parse_goal_proposition(self, string):
-        m = re.search(r'^(~?)goal\((.+)\)$', string)
-        if m:
-            (polarity_str, goal_string) = (m.group(1), m.group(2))
-            polarity = self._parse_polarity(polarity_str)
-            goal = self._parse_goal(goal_string)
-            return GoalProposition(goal, polarity)
-        raise ParseFailure()
-
-    def _parse_rejected_proposition(self, string):
-        m = re.search(r'^rejected\(([^,]+)(, *(.+))?\)$', string)
-        if m:
-            (content_string, dummy, reason_string) = m.groups()
-            rejected = self.parse(content_string)
-            return RejectedPropositions(rejected, reason=reason_string)
-        raise ParseFailure()
-
-    def _parse_deprecated_service_action_terminated_proposition(self, string):
-        m = re.search(r'^service_action_terminated\((.+)\)$', string)
-        if m:
-            service_action = m.group(1)
-            return ServiceActionTerminatedProposition(self.ontology_name, service_action)
-        raise ParseFailure()
-
-    def _parse_deprecated_service_action_started_proposition(self, string):
-        m = re.search(r'^service_action_started\((.+)\)$', string)
-        if m:
-            service_action = m.group(1)
-            return ServiceActionStartedProposition(self.ontology_name, service_action)
-        raise ParseFailure()
-
-    def _parse_implication_proposition(self, string):
-        m = re.search(r'^implies\((.*), (.*)\)$', string)
-        if m:
-            antecedent_string, consequent_string = m.groups()
-            antecedent = self._parse_proposition(antecedent_string)
-            consequent = self._parse_proposition(consequent_string)
-            return ImplicationProposition(antecedent, consequent)
-        raise ParseFailure()
-
-    def _parse_predicate_proposition(self, string):
-        m = re.search(r'^(~?)(\w+)(\((.*)\))$', string)
-        if m:
-            (polarity_str, predicate_name, individual_string) = (m.group(1), m.group(2), m.group(4))
-
-            if self.ontology.has_predicate(predicate_name):
-                predicate = self.ontology.get_predicate(predicate_name)
-                if individual_string is None or individual_string == "":
-                    if not predicate.sort.is_boolean_sort():
-                        raise ParseFailure()
-                    individual = None
-                elif predicate.sort.is_builtin():
-                    individual = self._parse_individual(individual_string)
-                else:
-                    individual = self._parse_individual(individual_string, predicate.sort)
-                polarity = self._parse_polarity(polarity_str)
-                return PredicateProposition(predicate, individual, polarity)
-        raise ParseFailure()
-
-    def _parse_individual(self, string, sort=None):
-        def negate_if_negative_polarity(individual, polarity):
-            if polarity is Polarity.NEG:
-                return individual.negate()
-            else:
-                return individual
-
-        m = re.search(r'^(~?)(.+)$', string)
-        polarity_string = m.group(1)
-        individual_string = m.group(2)
-        polarity = self._parse_polarity(polarity_string)
-        if sort is not None:
-            return self._parse_individual_of_sort(individual_string, sort)
-        try:
-            individual = self._parse_real_individual(individual_string)
-            return negate_if_negative_polarity(individual, polarity)
-        except ParseFailure:
-            pass
-        try:
-            individual = self._parse_integer_individual(individual_string)
-            return negate_if_negative_polarity(individual, polarity)
-        except ParseFailure:
-            pass
-        try:
-            individual = self._parse_string_individual(individual_string)
-            return negate_if_negative_polarity(individual, polarity)
-        except ParseFailure:
-            pass
-        try:
-            individual = self._parse_individual_of_enumerated_sort(individual_string)
-            return negate_if_negative_polarity(individual, polarity)
-        except ParseFailure:
-            pass
-        try:
-            individual = self._parse_individual_of_person_name_sort(individual_string)
-            return negate_if_negative_polarity(individual, polarity)
-        except ParseFailure:
-            pass
-        try:
-            individual = self._parse_individual_of_datetime_sort(individual_string)
-            return negate_if_negative_polarity(individual, polarity)
-        except ParseFailure:
-            pass
-        raise ParseFailure()
-
-    def _parse_individual_of_sort(self, string, sort):
-        m = re.search(r'^(.+)$', string)
-        if m:
-            individual_value = m.group(1)
-            return self.ontology.create_individual(individual_value, sort)
-        raise ParseFailure()
-
-    def _parse_individual_of_enumerated_sort(self, string):
-        m = re.search(r'^(.+)$', string)
-        if m:
-            individual_value = m.group(1)
-            try:
-                sort = self.ontology.individual_sort(individual_value)
-            except OntologyError:
-                raise ParseFailure()
-            if not sort.is_string_sort() and not sort.is_real_sort():
-                return self.ontology.create_individual(individual_value)
-        raise ParseFailure()
-
-    def _parse_real_individual(self, string):
-        m = re.search(r'^[0-9]*\.[0-9]+$', string)
-        if m:
-            individual_value = float(string)
-            return self.ontology.create_individual(individual_value)
+            consequent = []
+        if alternative_lo < alternative_hi:
+            alternative = [self._parse_nested(tokens, alternative_lo, alternative_hi)]
         else:
-            raise ParseFailure()
+            alternative = []
+        return plan_item.IfThenElse(condition, consequent, alternative)
 
-    def _parse_integer_individual(self, string):
-        m = re.search(r'^[0-9]+$', string)
-        if m:
-            individual_value = int(string)
-            return self.ontology.create_individual(individual_value)
-        else:
-            raise ParseFailure()
+    def _parse_jumpto_plan_item(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "jumpto")
+        if arguments is None:
+            return None
+        goal = self._parse_goal(tokens, *arguments)
+        if goal is None:
+            return None
+        return plan_item.JumpTo(goal)
 
-    def _parse_individual_of_person_name_sort(self, string):
-        m = re.search(r'^person_name\((.+)\)$', string)
-        if m:
-            individual_value_string = m.group(1)
-            individual_value = PersonName(individual_value_string)
-            return self.ontology.create_individual(individual_value)
-        else:
-            raise ParseFailure()
+    def _parse_goal_proposition(self, tokens, lo, hi):
+        polarity, lo = self._polarity(tokens, lo)
+        arguments = tokens.arguments(lo, hi, "goal")
+        if arguments is None:
+            return None
+        goal = self._parse_goal(tokens, *arguments)
+        if goal is None:
+            return None
+        return GoalProposition(goal, polarity)
 
-    def _parse_individual_of_datetime_sort(self, string):
-        m = re.search(r'^datetime\((.+)\)$', string)
-        if m:
-            individual_value_string = m.group(1)
-            individual_value = DateTime(individual_value_string)
-            return self.ontology.create_individual(individual_value)
-        else:
-            raise ParseFailure()
+    def _parse_rejected_proposition(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "rejected")
+        if arguments is None:
+            return None
+        spans = tokens.split(*arguments)
+        if not spans:
+            return None
+        rejected = self._parse_nested(tokens, *spans[0])
+        reason = tokens.text(spans[1][0], arguments[1]) if len(spans) > 1 else None
+        return RejectedPropositions(rejected, reason=reason)
 
-    def _parse_string_individual(self, string):
-        string_content = self._parse_string(string)
-        individual = self.ontology.create_individual(f'"{string_content}"')
-        return individual
+    def _parse_deprecated_service_action_terminated_proposition(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "service_action_terminated")
+        if arguments is None:
+            return None
+        return ServiceActionTerminatedProposition(self.ontology_name, tokens.text(*arguments))
 
-    def _parse_understanding_proposition(self, string):
-        m = re.search(r'^(\~?)und\((USR|SYS|MODEL|None),[ ]*(.+)\)$', string)
-        if m:
-            negation = m.group(1)
-            if negation == "":
-                polarity = Polarity.POS
-            else:
-                polarity = Polarity.NEG
-            speaker = self._parse_speaker(m.group(2))
-            proposition_str = m.group(3)
-            proposition = self.parse(proposition_str)
-            und = UnderstandingProposition(speaker, proposition, polarity)
-            return und
-        else:
-            raise ParseFailure()
+    def _parse_deprecated_service_action_started_proposition(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "service_action_started")
+        if arguments is None:
+            return None
+        return ServiceActionStartedProposition(self.ontology_name, tokens.text(*arguments))
 
-    def _parse_speaker(self, string):
-        if string == speaker.USR:
-            return speaker.USR
-        elif string == speaker.SYS:
-            return speaker.SYS
-        elif string == speaker.MODEL:
-            return speaker.MODEL
-        elif string == "None":
-            return None
-
-    def _parse_yes_no_question(self, string):
-        m = re.search(r'^\?(\w+\(\w+\))$', string)
-        if m:
-            proposition_string = m.group(1)
-            proposition = self._parse_predicate_proposition(proposition_string)
-            return YesNoQuestion(proposition)
-        else:
-            raise ParseFailure()
+    def _parse_implication_proposition(self, tokens, lo, hi):
+        arguments = tokens.arguments(lo, hi, "implies")
+        if arguments is None:
+            return None
+        spans = tokens.split(*arguments)
+        if len(spans) < 2:
+            return None
+        antecedent = self._parse_proposition(tokens, spans[0][0], spans[-1][0] - 1)
+        if antecedent is None:
+            return None
+        consequent = self._parse_proposition(tokens, *spans[-1])
+        if consequent is None:
+            return None
+        return ImplicationProposition(antecedent, consequent)
 
-    def _parse_yes_or_no(self, string):
-        m = re.search(r'^(yes|no)$', string)
-        if m:
-            yes_no_string = m.group(1)
-            if yes_no_string == "yes":
-                return Yes()
-            return No()
+    def _parse_predicate_proposition(self, tokens, lo, hi):
+        polarity, lo = self._polarity(tokens, lo)
+        if lo >= hi:
+            return None
+        predicate_name = tokens.texts[lo]
+        arguments = tokens.arguments(lo, hi, predicate_name)
+        if arguments is None or not self.ontology.has_predicate(predicate_name):
+            return None
+        predicate = self.ontology.get_predicate(predicate_name)
+        if arguments[0] == arguments[1]:
+            if not predicate.sort.is_boolean_sort():
+                return None
+            individual = None
+        elif predicate.sort.is_builtin():
+            individual = self._parse_individual(tokens, *arguments)
+            if individual is None:
+                return None
         else:
-            raise ParseFailure()
+            individual = self._parse_individual(tokens, *arguments, sort=predicate.sort)
+        return PredicateProposition(predicate, individual, polarity)
+
+    def _parse_individual(self, tokens, lo, hi, sort=None):
+        polarity, lo = self._polarity(tokens, lo)
+        if lo >= hi:
+            return None
+        if sort is not None:
+            return self.ontology.create_individual(tokens.text(lo, hi), sort)
+        individual = self._parse_individual_of_any_sort(tokens, lo, hi)
+        if individual is not None and polarity is Polarity.NEG:
+            return individual.negate()
+        return individual
 
-    def _parse_action(self, string):
-        m = re.search(r'^(\w+)$', string)
+    def _parse_individual_of_any_sort(self, tokens, lo, hi):
+        string = tokens.text(lo, hi)
+        if REAL_PATTERN.fullmatch(string):
+            return self.ontology.create_individual(float(string))
+        if INTEGER_PATTERN.fullmatch(string):
+            return self.ontology.create_individual(int(string))
+        if hi - lo == 1 and string[0] in QUOTES:
+            return self.ontology.create_individual(f'"{string[1:-1]}"')
+        sort = self._enumerated_sort_of_individual(string)
+        if sort is not None:
+            return self.ontology.create_individual(string, sort)
+        arguments = tokens.arguments(lo, hi, "person_name")
+        if arguments:
+            return self.ontology.create_individual(PersonName(tokens.text(*arguments)))
+        arguments = tokens.arguments(lo, hi, "datetime")
+        if arguments:
+            return self.ontology.create_individual(DateTime(tokens.text(*arguments)))
+        return None
+
+    def _enumerated_sort_of_individual(self, string):
+        if not self.ontology.has_individual(string):
+            return None
         try:
-            if m:
-                action_value = m.group(1)
-                return self.ontology.create_action(action_value)
+            sort = self.ontology.individual_sort(string)
         except OntologyError:
-            pass
-        raise ParseFailure()
+            return None
+        if sort.is_string_sort() or sort.is_real_sort():
+            return None
+        return sort
 
-    def _parse_predicate(self, string):
-        m = re.search(r'^(\w+)$', string)
-        if m:
-            predicate_value = m.group(1)
-            try:
-                return self.ontology.get_predicate(predicate_value)
-            except OntologyError:
-                pass
-        raise ParseFailure()
-
-    def _parse_prop_set(self, string):
-        m = re.search(r'^(~?)set\((.+)\)$', string)
-        if m:
-            (polarity_str, alts_as_string) = m.groups()
-            propositions = self._parse_proposition_list(alts_as_string)
-            polarity = self._parse_polarity(polarity_str)
-            return PropositionSet(propositions, polarity)
-        raise ParseFailure()
-
-    def _parse_proposition_list(self, string):
+    def _parse_understanding_proposition(self, tokens, lo, hi):
+        polarity, lo = self._polarity(tokens, lo)
+        arguments = tokens.arguments(lo, hi, "und")
+        if arguments is None:
+            return None
+        spans = tokens.split(*arguments)
+        if len(spans) < 2 or tokens.text(*spans[0]) not in SPEAKERS:
+            return None
+        understanding_speaker = SPEAKERS[tokens.text(*spans[0])]
+        proposition = self._parse_nested(tokens, spans[1][0], arguments[1])
+        return UnderstandingProposition(understanding_speaker, proposition, polarity)
+
+    def _parse_yes_or_no(self, tokens, lo, hi):
+        if hi - lo == 1:
+            if tokens.texts[lo] == "yes":
+                return Yes()
+            if tokens.texts[lo] == "no":
+                return No()
+        return None
+
+    def _parse_action(self, tokens, lo, hi):
+        if tokens.is_word_span(lo, hi) and self.ontology.is_action(tokens.texts[lo]):
+            return self.ontology.create_action(tokens.texts[lo])
+        return None
+
+    def _parse_predicate(self, tokens, lo, hi):
+        if tokens.is_word_span(lo, hi) and self.ontology.has_predicate(tokens.texts[lo]):
+            return self.ontology.get_predicate(tokens.texts[lo])
+        return None
+
+    def _parse_prop_set(self, tokens, lo, hi):
+        polarity, lo = self._polarity(tokens, lo)
+        arguments = tokens.arguments(lo, hi, "set")
+        if arguments is None:
+            return None
+        propositions = self._parse_proposition_list(tokens, *arguments)
+        if propositions is None:
+            return None
+        return PropositionSet(propositions, polarity)
+
+    def _parse_proposition_list(self, tokens, lo, hi):
         propositions = []
-        string = self._strip_brackets(string)
-        while self._more_data_to_read(string):
-            (proposition, rest) = self._get_next_proposition(string)
+        lo, hi = self._strip_brackets(tokens, lo, hi)
+        for proposition_lo, proposition_hi in tokens.split(lo, hi):
+            proposition = self._parse_proposition(tokens, proposition_lo, proposition_hi)
+            if proposition is None:
+                return None
             propositions.append(proposition)
-            string = rest
         return propositions
 
-    def _get_next_proposition(self, string):
-        m = re.search(r'^(?P<prop_group>([^,]+)) *\,? *(?P<rest>.*)', string)
-        if m:
-            proposition = self._parse_proposition(m.group('prop_group'))
-            rest = m.group('rest')
-            return (proposition, rest)
-        else:
-            raise ParseFailure()
+    def parse_parameter(self, key, string):
+        tokens = Tokens(string)
+        return self._parse_parameter(key, tokens, 0, len(tokens))
 
-    def _get_next_question_param(self, string):
-        m = re.search(r'^(?P<key>[^=]+)=(?P<value>[^=]+) *\, *(?P<rest>[^=]+=.*)$', string)
-        if m:
-            rest = m.group('rest')
-        else:
-            m = re.search(r'^(?P<key>[^=]+)=(?P<value>.+)$', string)
-            rest = ""
-        if m:
-            key = m.group('key')
-            value_as_string = m.group('value')
-            value = self.parse_parameter(key, value_as_string)
-            return (key, value, rest)
+    def _parse_parameter(self, key, tokens, lo, hi):
+        string = tokens.text(lo, hi)
+        if lo >= hi:
+            raise ParseError(f"failed to parse parameter {key}={string}")
+        if key == "source":
+            value = self._parse_findout_source(string)
+        elif key == "incremental":
+            value = self._parse_boolean(string)
+        elif key == "alts":
+            value = self._parse_prop_set(tokens, lo, hi)
+        elif key == "service_query":
+            value = self._parse_question(tokens, lo, hi)
+        elif key == "device":
+            value = string
+        elif key == "verbalize":
+            value = self._parse_boolean(string)
+        elif key == "default":
+            value = self._parse_question(tokens, lo, hi)
+        elif key == "format":
+            value = string
+        elif key == "label_questions":
+            value = self._parse_list_of_questions(tokens, lo, hi)
+        elif key == "sort_order":
+            value = self._parse_findout_sort_order(string)
+        elif key == "background":
+            value = self._parse_predicate_list(tokens, lo, hi)
+        elif key == "ask_features":
+            value = self._parse_ask_features(tokens, lo, hi)
+        elif key == "related_information":
+            value = self._parse_list_of_questions(tokens, lo, hi)
+        elif key == "allow_goal_accommodation":
+            value = self._parse_boolean(string)
+        elif key == "always_ground":
+            value = self._parse_boolean(string)
+        elif key == "on_zero_hits_action":
+            value = self._parse_action(tokens, lo, hi)
+        elif key == "on_too_many_hits_action":
+            value = self._parse_action(tokens, lo, hi)
+        elif key == "max_spoken_alts":
+            value = self._parse_integer(string)
+        elif key == "max_reported_hit_count":
+            value = self._parse_integer(string)
         else:
-            raise ParseFailure()
-
-    def parse_parameter(self, key, string):
-        try:
-            if key == "source":
-                return self._parse_findout_source(string)
-            elif key == "incremental":
-                return self._parse_boolean(string)
-            elif key == "alts":
-                return self._parse_prop_set(string)
-            elif key == "service_query":
-                return self._parse_question(string)
-            elif key == "device":
-                return string
-            elif key == "verbalize":
-                return self._parse_boolean(string)
-            elif key == "default":
-                return self._parse_question(string)
-            elif key == "format":
-                return string
-            elif key == "label_questions":
-                return self._parse_list_of_questions(string)
-            elif key == "sort_order":
-                return self._parse_findout_sort_order(string)
-            elif key == "background":
-                return self._parse_predicate_list(string)
-            elif key == "ask_features":
-                return self._parse_ask_features(string)
-            elif key == "related_information":
-                return self._parse_list_of_questions(string)
-            elif key == "allow_goal_accommodation":
-                return self._parse_boolean(string)
-            elif key == "always_ground":
-                return self._parse_boolean(string)
-            elif key == "on_zero_hits_action":
-                return self._parse_action(string)
-            elif key == "on_too_many_hits_action":
-                return self._parse_action(string)
-            elif key == "max_spoken_alts":
-                return self._parse_integer(string)
-            elif key == "max_reported_hit_count":
-                return self._parse_integer(string)
-            else:
-                raise ParseError(f"unsupported question parameter '{key}'")
-        except ParseFailure:
+            raise ParseError(f"unsupported question parameter '{key}'")
+        if value is None:
             raise ParseError(f"failed to parse parameter {key}={string}")
+        return value
 
-    def _parse_predicate_list(self, string):
-        string_without_brackets = self._strip_brackets(string)
-        predicate_strings = [str.strip() for str in string_without_brackets.split(",")]
-        return [self._parse_predicate(predicate_string) for predicate_string in predicate_strings]
-
-    def _parse_ask_features(self, string):
-        string_without_brackets = self._strip_brackets(string)
-        predicate_strings = [str.strip() for str in string_without_brackets.split(",")]
-        return [AskFeature(predicate_string) for predicate_string in predicate_strings]
+    def _parse_predicate_list(self, tokens, lo, hi):
+        if not tokens.is_bracketed(lo, hi, "["):
+            return None
+        predicates = []
+        for predicate_lo, predicate_hi in tokens.split(lo + 1, hi - 1):
+            predicate = self._parse_predicate(tokens, predicate_lo, predicate_hi)
+            if predicate is None:
+                return None
+            predicates.append(predicate)
+        return predicates
+
+    def _parse_ask_features(self, tokens, lo, hi):
+        lo, hi = self._strip_brackets(tokens, lo, hi)
+        return [AskFeature(tokens.text(*span)) for span in tokens.split(lo, hi)]
 
     def _parse_findout_source(self, string):
         if string in [
             plan_item.QuestionRaisingPlanItem.SOURCE_SERVICE, plan_item.QuestionRaisingPlanItem.SOURCE_DOMAIN
         ]:
             return string
-        else:
-            raise ParseFailure()
+        return None
 
     def _parse_findout_sort_order(self, string):
         if string in [plan_item.QuestionRaisingPlanItem.ALPHABETIC]:
             return string
-        else:
-            raise ParseFailure()
+        return None
 
     def _parse_boolean(self, string):
         if string.lower() == "true":
             return True
         elif string.lower() == "false":
             return False
-        else:
-            raise ParseFailure()
+        return None
 
     def _parse_integer(self, string):
-        m = re.search(r'^[0-9]+$', string)
-        if m:
-            individual_value = int(string)
-            return individual_value
-        else:
-            raise ParseFailure()
+        if INTEGER_PATTERN.fullmatch(string):
+            return int(string)
+        return None
 
-    def _parse_invoke_service_action_params(self, string):
+    def _parse_invoke_service_action_params(self, tokens, lo, hi):
         params = {}
-        string = self._strip_curly_brackets(string)
-        while self._more_data_to_read(string):
-            (key, value, rest) = self._get_next_invoke_service_action_param(string)
-            params[key] = value
-            string = rest
-        return params
-
-    def _get_next_invoke_service_action_param(self, string):
-        m = re.search(r'^(?P<key>[^=]+)=(?P<value>[^, ]+) *\,? *(?P<rest>.*)', string)
-        if m:
-            key = m.group('key')
-            value_as_string = m.group('value')
+        for param_lo, param_hi in tokens.split(lo + 1, hi - 1):
+            if param_hi - param_lo != 3 or tokens.texts[param_lo + 1] != "=":
+                return None
+            key = tokens.texts[param_lo]
+            value_as_string = tokens.texts[param_lo + 2]
             if key == "postconfirm":
                 value = self._parse_boolean(value_as_string)
             elif key == "preconfirm":
-                value = self.parse_preconfirm_value(value_as_string)
+                value = self._preconfirm_value(value_as_string)
             elif key == "downdate_plan":
                 value = self._parse_boolean(value_as_string)
             else:
-                raise ParseFailure()
-            rest = m.group('rest')
-            return (key, value, rest)
-        else:
-            raise ParseFailure()
+                return None
+            if value is None:
+                return None
+            params[key] = value
+        return params
 
     def parse_preconfirm_value(self, string):
+        value = self._preconfirm_value(string)
+        if value is None:
+            raise ParseFailure()
+        return value
+
+    def _preconfirm_value(self, string):
         if string == "interrogative":
             return plan_item.InvokeServiceAction.INTERROGATIVE
         elif string == "assertive":
             return plan_item.InvokeServiceAction.ASSERTIVE
-        else:
-            raise ParseFailure()
-
-    def _strip_brackets(self, bracketed_string):
-        matcher = re.search(r'^\[(.*)\]$', bracketed_string)
-        if matcher:
-            return matcher.group(1)
-        else:
-            raise ParseError("_strip_brackets failed for '%s'" % bracketed_string)
-
-    def _strip_curly_brackets(self, bracketed_string):
-        matcher = re.search(r'^{(.*)}$', bracketed_string)
-        if matcher:
-            return matcher.group(1)
-
-    def _more_data_to_read(self, string):
-        return string != ""
-
-    def _parse_polarity(self, string):
-        if string == "":
-            return Polarity.POS
-        elif string == "~":
-            return Polarity.NEG
-        else:
-            raise Exception("expected polarity string but got '%s'" % string)
+        return None
+
+    def _strip_brackets(self, tokens, lo, hi):
+        if tokens.is_bracketed(lo, hi, "["):
+            return lo + 1, hi - 1
+        raise ParseError("_strip_brackets failed for '%s'" % tokens.text(lo, hi))
+
+    _generic_clauses, _clauses_by_head = index_clauses_by_head([
+        (_parse_set, {"{"}),
+        (_parse_decorated_non_icm_move, {"Move"}),
+        (_parse_basic_move, set(BASIC_MOVES)),
+        (_parse_request_move, {"request"}),
+        (_parse_ask_move, {"ask"}),
+        (_parse_answer_move, {"answer"}),
+        (_parse_report_move, {"report"}),
+        (_parse_prereport_move, {"prereport"}),
+        (_parse_findout_plan_item, {"findout"}),
+        (_parse_do_plan_item, {"do"}),
+        (_parse_raise_plan_item, {"raise"}),
+        (_parse_bind_plan_item, {"bind"}),
+        (_parse_respond_plan_item, {"respond"}),
+        (_parse_if_then_else_plan_item, {"if"}),
+        (_parse_jumpto_plan_item, {"jumpto"}),
+        (_parse_forget_all_plan_item, {"forget_all"}),
+        (_parse_forget_plan_item, {"forget"}),
+        (_parse_forget_shared_plan_item, {"forget_shared"}),
+        (_parse_assume_plan_item, {"assume"}),
+        (_parse_assume_shared_plan_item, {"assume_shared"}),
+        (_parse_action_performed_plan_item, {"signal_action_completion"}),
+        (_parse_action_aborted_plan_item, {"signal_action_failure"}),
+        (_parse_goal, {"resolve", "resolve_user", "perform"}),
+        (_parse_assume_issue_item, {"assume_issue"}),
+        (_parse_insist_assume_issue_item, {"insist_assume_issue"}),
+        (_parse_log_item, {"log"}),
+        (_parse_forget_issue_plan_item, {"forget_issue"}),
+        (_parse_invoke_service_query_plan_item, {"invoke_service_query"}),
+        (_parse_deprecated_dev_query_plan_item, {"dev_query"}),
+        (_parse_invoke_service_action_plan_item, {"invoke_service_action"}),
+        (_parse_deprecated_dev_perform_plan_item, {"dev_perform"}),
+        (_parse_change_ddd_plan_item, {"change_ddd"}),
+        (_parse_question, {"?"}),
+        (_parse_lambda_abstracted_goal_proposition, {"X"}),
+        (_parse_lambda_abstracted_predicate_proposition, {"X"}),
+        (_parse_lambda_abstracted_implication_proposition, {"X"}),
+        (_parse_service_result_proposition, {"ServiceResultProposition"}),
+        (_parse_successful_service_action, {"SuccessfulServiceAction"}),
+        (_parse_failed_service_action, {"FailedServiceAction"}),
+        (_parse_action_status, {"done"}),
+        (_parse_decorated_icm_move, {"ICMMove"}),
+        (_parse_icm_move, {"icm"}),
+        (_parse_proposition, None),
+        (_parse_yes_or_no, {"yes", "no"}),
+        (_parse_prop_set, {"set"}),
+        (_parse_action, None),
+        (_parse_individual, None),
+        (_parse_predicate, None),
+        (_parse_string, set(QUOTES)),
+        (_parse_action_status_proposition, {"action_status"}),
+    ])  # yapf: disable
+    _generic_proposition_clauses, _proposition_clauses_by_head = index_clauses_by_head([
+        (_parse_deprecated_service_action_terminated_proposition, {"service_action_terminated"}),
+        (_parse_deprecated_service_action_started_proposition, {"service_action_started"}),
+        (_parse_preconfirmation_proposition, {"preconfirmed"}),
+        (_parse_prereport_proposition, {"prereported"}),
+        (_parse_goal_proposition, {"goal"}),
+        (_parse_rejected_proposition, {"rejected"}),
+        (_parse_implication_proposition, {"implies"}),
+        (_parse_predicate_proposition, None),
+        (_parse_understanding_proposition, {"und"}),
+        (_parse_resolvedness_proposition, {"resolved"}),
+        (_parse_knowledge_precondition_proposition, {"know_answer"}),
+    ])  # yapf: disable
@@ -1,8 +1,14 @@
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
 import json
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
+from tala.ddd.services import query_cache
 from tala.ddd.services.abstract_service_wrapper import AbstractServiceWrapper
 from tala.model.service_invocation import PROTOCOL_VERSION
 from tala.model.service_query_result import QueryResultFromService
@@ -12,19 +18,39 @@ from tala import http_formatting
 CURRENT_VERSION = "1.1"
 DEPRECATED_PROTOCOL_VERSIONS = ["1.0"]
 SUPPORTED_PROTOCOL_VERSIONS = DEPRECATED_PROTOCOL_VERSIONS + [CURRENT_VERSION]
+DEFAULT_POOL_SIZE = 10
+JSON_HEADERS = {"Content-type": "application/json"}
 
 
 class HttpServiceInvocationException(Exception):
     pass
 
 
+class ServiceQuery(namedtuple("ServiceQuery", ["question", "parameters", "min_results", "max_results"])):
+    pass
+
+
 class HttpServiceClient(AbstractServiceWrapper):
-    def __init__(self, logger, endpoint, name):
+    def __init__(self, logger, endpoint, name, pool_size=DEFAULT_POOL_SIZE, keep_alive=True, cache=None):
         super(HttpServiceClient, self).__init__()
         self._logger = logger
         self._endpoint = endpoint
         self._name = name
-        self._session = requests.Session()
+        self._session = self._create_session(pool_size, keep_alive)
+        self._cache = cache
+
+    @staticmethod
+    def _create_session(pool_size, keep_alive):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def close(self):
+        self._session.close()
 
     def _post(self, data, headers, session):
         def get_http_service_timeout(session):
@@ -38,13 +64,12 @@ class HttpServiceClient(AbstractServiceWrapper):
             response = self._session.post(
                 self._endpoint, data=json.dumps(data), headers=headers, timeout=http_service_timeout
             )
-            self._validate_response(response)
-            return response
+            return self._parse_response(response)
         except RequestException as exception:
             self._logger.exception("RequestException encountered.")
             raise HttpServiceInvocationException(str(exception))
 
-    def _validate_response(self, response):
+    def _parse_response(self, response):
         def validate_http_status(response):
             response.raise_for_status()
 
@@ -72,64 +97,59 @@ class HttpServiceClient(AbstractServiceWrapper):
         payload = json.loads(response.text)
         validate_status(payload)
         validate_version(payload)
+        return payload
 
     def perform(self, action, parameters, session, context):
-        def get_outcome_from_response(response):
-            status = response["status"]
-            if status == "success":
-                return SuccessfulServiceAction()
-            elif status == "fail":
-                return FailedServiceAction(response["data"]["reason"])
-            else:
-                raise HttpServiceInvocationException(
-                    "Expected 'success' or 'fail' as response status but got {status}."
-                )
-
         response = self._post(
-            data={
-                "version": PROTOCOL_VERSION,
-                "session": session,
-                "request": {
+            data=self._request(
+                session, context, {
                     "type": "request",
                     "name": action,
                     "parameters": self._parameter_bindings_to_json_dict(parameters, session)
-                },
-                "context": {
-                    "active_ddd": context.active_ddd,
-                    "facts": http_formatting.facts_to_json_object(context.facts, session),
-                    "invocation_id": context.invocation_id
                 }
-            },
-            headers={"Content-type": "application/json"},
+            ),
+            headers=JSON_HEADERS,
             session=session
         )
+        return self._outcome_of_perform(response)
 
-        response = json.loads(response.text)
-        return get_outcome_from_response(response)
+    @staticmethod
+    def _outcome_of_perform(response):
+        status = response["status"]
+        if status == "success":
+            return SuccessfulServiceAction()
+        elif status == "fail":
+            return FailedServiceAction(response["data"]["reason"])
+        else:
+            raise HttpServiceInvocationException("Expected 'success' or 'fail' as response status but got {status}.")
 
     def query(self, question, parameters, min_results, max_results, session, context):
-        response = self._post(
-            data={
-                "version": PROTOCOL_VERSION,
-                "session": session,
-                "request": {
-                    "type": "query",
-                    "name": question.predicate.get_name(),
-                    "parameters": self._parameter_bindings_to_json_dict(parameters, session),
-                    "min_results": min_results,
-                    "max_results": max_results
-                },
-                "context": {
-                    "active_ddd": context.active_ddd,
-                    "facts": http_formatting.facts_to_json_object(context.facts, session),
-                    "invocation_id": context.invocation_id
-                }
-            },
-            headers={"Content-type": "application/json"},
-            session=session
-        )
+        name = question.predicate.get_name()
+        parameters_as_json = self._parameter_bindings_to_json_dict(parameters, session)
+
+        def call_service():
+            response = self._post(
+                data=self._request(
+                    session, context, {
+                        "type": "query",
+                        "name": name,
+                        "parameters": parameters_as_json,
+                        "min_results": min_results,
+                        "max_results": max_results
+                    }
+                ),
+                headers=JSON_HEADERS,
+                session=session
+            )
+            return self._results_of_query(response)
+
+        if self._cache is None:
+            return call_service()
+        key = (self._name, self._normalized(parameters_as_json), min_results, max_results)
+        results = self._cache.get_or_call(query_cache.QUERY, name, key, lambda: tuple(call_service()))
+        return list(results)
 
-        response = json.loads(response.text)
+    def _results_of_query(self, response):
         self._assert_successful(response)
         result_dicts = response["data"]["result"]
         return [
@@ -138,28 +158,44 @@ class HttpServiceClient(AbstractServiceWrapper):
         ]
 
     def validate(self, validator_name, parameters, session, context):
-        response = self._post(
-            data={
-                "version": PROTOCOL_VERSION,
-                "session": session,
-                "request": {
-                    "type": "validator",
-                    "name": self._name,
-                    "parameters": self._parameter_bindings_to_json_dict(parameters, session)
-                },
-                "context": {
-                    "active_ddd": context.active_ddd,
-                    "facts": http_formatting.facts_to_json_object(context.facts, session),
-                    "invocation_id": context.invocation_id
-                }
-            },
-            headers={"Content-type": "application/json"},
-            session=session
-        )
+        parameters_as_json = self._parameter_bindings_to_json_dict(parameters, session)
+
+        def call_service():
+            response = self._post(
+                data=self._request(
+                    session, context, {
+                        "type": "validator",
+                        "name": self._name,
+                        "parameters": parameters_as_json
+                    }
+                ),
+                headers=JSON_HEADERS,
+                session=session
+            )
+            self._assert_successful(response)
+            return response["data"]["is_valid"]
 
-        response = json.loads(response.text)
-        self._assert_successful(response)
-        return response["data"]["is_valid"]
+        if self._cache is None:
+            return call_service()
+        key = (self._name, self._normalized(parameters_as_json))
+        return self._cache.get_or_call(query_cache.VALIDATOR, validator_name, key, call_service)
+
+    @staticmethod
+    def _normalized(parameters_as_json):
+        return json.dumps(parameters_as_json, sort_keys=True)
+
+    @staticmethod
+    def _request(session, context, request):
+        return {
+            "version": PROTOCOL_VERSION,
+            "session": session,
+            "request": request,
+            "context": {
+                "active_ddd": context.active_ddd,
+                "facts": http_formatting.facts_to_json_object(context.facts, session),
+                "invocation_id": context.invocation_id
+            }
+        }
 
     @staticmethod
     def _assert_successful(response):
@@ -178,3 +214,35 @@ class HttpServiceClient(AbstractServiceWrapper):
                 return http_formatting.fact_to_json_object(binding.proposition, session)
 
         return {binding.parameter.name: binding_to_json(binding) for binding in bindings}
+
+
+class AsyncHttpServiceClient(object):
+    """ An asyncio interface to a service. Calls are made by an HttpServiceClient in a thread pool as large as its
+    connection pool, so that up to pool_size calls are in flight at once, each on a pooled connection. """
+    def __init__(self, logger, endpoint, name, pool_size=DEFAULT_POOL_SIZE, keep_alive=True, cache=None):
+        self._client = HttpServiceClient(
+            logger, endpoint, name, pool_size=pool_size, keep_alive=keep_alive, cache=cache
+        )
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="http_service_%s" % name)
+
+    def close(self):
+        self._executor.shutdown()
+        self._client.close()
+
+    async def perform(self, action, parameters, session, context):
+        return await self._call(self._client.perform, action, parameters, session, context)
+
+    async def query(self, question, parameters, min_results, max_results, session, context):
+        return await self._call(self._client.query, question, parameters, min_results, max_results, session, context)
+
+    async def validate(self, validator_name, parameters, session, context):
+        return await self._call(self._client.validate, validator_name, parameters, session, context)
+
+    async def query_all(self, queries, session, context):
+        """ Make the independent ServiceQuery queries concurrently and return their results in the same order. """
+        results = await asyncio.gather(*[self.query(*query, session, context) for query in queries])
+        return list(results)
+
+    async def _call(self, method, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(method, *args))
@@ -0,0 +1,81 @@
+from collections import OrderedDict
+import threading
+import time
+
+DEFAULT_MAX_ENTRIES = 1024
+
+QUERY = "query"
+VALIDATOR = "validator"
+
+
+class ServiceQueryCache(object):
+    """ An LRU cache of the results of service queries and validators. A result is kept for the cache TTL of its
+    query or validator in the service interface, and results of queries and validators without a TTL are never
+    cached. Actions are never cached, since performing them has effects. """
+    def __init__(self, ttls, max_entries=DEFAULT_MAX_ENTRIES, clock=time.monotonic):
+        self._ttls = ttls
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @classmethod
+    def for_service_interface(cls, service_interface, max_entries=DEFAULT_MAX_ENTRIES, clock=time.monotonic):
+        ttls = {}
+        for query in service_interface.queries:
+            if query.cache_ttl is not None:
+                ttls[QUERY, query.name] = query.cache_ttl
+        for validator in service_interface.validators:
+            if validator.cache_ttl is not None:
+                ttls[VALIDATOR, validator.name] = validator.cache_ttl
+        return cls(ttls, max_entries, clock)
+
+    def is_cached(self, kind, name):
+        return (kind, name) in self._ttls
+
+    def get_or_call(self, kind, name, key, call):
+        """ Return the cached result of the kind and name for the key, or call to get it and cache it. """
+        if not self.is_cached(kind, name):
+            return call()
+        entry_key = (kind, name, key)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None:
+                expires_at, result = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(entry_key)
+                    self._hits += 1
+                    return result
+                del self._entries[entry_key]
+                self._expirations += 1
+            self._misses += 1
+        result = call()
+        self._put(entry_key, result, self._ttls[kind, name])
+        return result
+
+    def _put(self, entry_key, result, ttl):
+        with self._lock:
+            self._entries[entry_key] = (self._clock() + ttl, result)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def metrics(self):
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "size": len(self._entries)
+            }
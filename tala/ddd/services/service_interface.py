@@ -283,46 +283,46 @@ class ServiceActionInterface(ParameterizedSpecificServiceInterface):
         }
 
 
-class ServiceQueryInterface(ParameterizedSpecificServiceInterface):
-    def __init__(self, *args, **kwargs):
-        super(ServiceQueryInterface, self).__init__("query", *args, **kwargs)
+class CacheableSpecificServiceInterface(ParameterizedSpecificServiceInterface):
+    """ A query or validator whose results may be cached by the client for cache_ttl seconds. None means that
+    results are never cached. """
+    def __init__(self, interface_type, name, target, parameters, cache_ttl=None):
+        super(CacheableSpecificServiceInterface, self).__init__(interface_type, name, target, parameters)
+        self._cache_ttl = cache_ttl
         self.ensure_target_is_not_frontend()
 
     @classmethod
     def create_from_json_api_dict(cls, data):
         parameters = super().create_parameters_from_json_api_dict(data)
-        return cls(*parameters)
+        return cls(*parameters, cache_ttl=data["attributes"].get("cache_ttl"))
+
+    @property
+    def cache_ttl(self):
+        return self._cache_ttl
 
     def as_json_api_dict(self):
         return {
-            "type": "tala.ddd.services.service_interface.ServiceQueryInterface",
+            "type": "tala.ddd.services.service_interface.%s" % self.__class__.__name__,
             "id": self.name,
             "attributes": {
                 "target": self.target.as_json_api_attribute(),
                 "parameters": [parameter.as_json_api_attribute() for parameter in self.parameters],
+                "cache_ttl": self.cache_ttl,
             }
         }
 
+    def __eq__(self, other):
+        return super(CacheableSpecificServiceInterface, self).__eq__(other) and self.cache_ttl == other.cache_ttl
+
 
-class ServiceValidatorInterface(ParameterizedSpecificServiceInterface):
+class ServiceQueryInterface(CacheableSpecificServiceInterface):
     def __init__(self, *args, **kwargs):
-        super(ServiceValidatorInterface, self).__init__("validator", *args, **kwargs)
-        self.ensure_target_is_not_frontend()
+        super(ServiceQueryInterface, self).__init__("query", *args, **kwargs)
 
-    def as_json_api_dict(self):
-        return {
-            "type": "tala.ddd.services.service_interface.ServiceValidatorInterface",
-            "id": self.name,
-            "attributes": {
-                "target": self.target.as_json_api_attribute(),
-                "parameters": [parameter.as_json_api_attribute() for parameter in self.parameters],
-            }
-        }
 
-    @classmethod
-    def create_from_json_api_dict(cls, data):
-        parameters = super().create_parameters_from_json_api_dict(data)
-        return cls(*parameters)
+class ServiceValidatorInterface(CacheableSpecificServiceInterface):
+    def __init__(self, *args, **kwargs):
+        super(ServiceValidatorInterface, self).__init__("validator", *args, **kwargs)
 
 
 class ServiceImplicationInterface(SpecificServiceInterface):
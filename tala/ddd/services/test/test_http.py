@@ -1,4 +1,6 @@
+import asyncio
 import json
+import threading
 import unittest
 import requests
 import logging
@@ -18,8 +20,10 @@ from tala.model.sort import Sort
 
 import tala.ddd.services.http
 from tala.ddd.extended_ddd import ExtendedDDD
-from tala.ddd.services.http import HttpServiceClient, HttpServiceInvocationException
+from tala.ddd.services.http import HttpServiceClient, HttpServiceInvocationException, AsyncHttpServiceClient, \
+    ServiceQuery
 from tala.ddd.services.parameters.binding import SingleInstanceParameterBinding
+from tala.ddd.services.query_cache import ServiceQueryCache, QUERY, VALIDATOR
 
 
 class HttpServiceClientTest(unittest.TestCase):
@@ -620,3 +624,193 @@ class HttpServiceClientTest(unittest.TestCase):
             )
         )
         self.then_result_is([QueryResultFromService("mock_value", "mock_confidence", "mock_grammar_entry")])
+
+    def test_connection_pool_has_pool_size(self):
+        self._http_service_client = HttpServiceClient(self._mock_logger, "http://mock_endpoint", "mock_name", 3)
+        self.then_connection_pool_size_is(3)
+
+    def then_connection_pool_size_is(self, expected):
+        adapter = self._http_service_client._session.get_adapter("http://mock_endpoint")
+        self.assertEqual(expected, adapter._pool_maxsize)
+
+    def test_connections_are_closed_without_keep_alive(self):
+        self._http_service_client = HttpServiceClient(
+            self._mock_logger, "http://mock_endpoint", "mock_name", keep_alive=False
+        )
+        self.assertEqual("close", self._http_service_client._session.headers["Connection"])
+
+    def test_response_is_parsed_once(self):
+        self.given_http_service_client("mock_endpoint", "mock_question_predicate")
+        self.given_requests_post_returns_response(
+            json.dumps({
+                "status": "success",
+                "data": {
+                    "version": PROTOCOL_VERSION,
+                    "result": []
+                }
+            })
+        )
+        with patch.object(json, "loads", wraps=json.loads) as mock_loads:
+            self.when_query(
+                question=self.mock_wh_question("mock_question_predicate"),
+                parameters=self._mock_parameter_bindings,
+                min_results=0,
+                max_results=None,
+                session={'session_id': 'mock_session_id'},
+                context=Context("mock_active_ddd", self._mock_facts(), "mock_invocation_id")
+            )
+        mock_loads.assert_called_once()
+
+    def given_async_http_service_client(self, endpoint, name, pool_size=2):
+        self._async_http_service_client = AsyncHttpServiceClient(self._mock_logger, endpoint, name, pool_size)
+        self._async_http_service_client._client._session = self._mock_session
+        self.addCleanup(self._async_http_service_client.close)
+
+    def given_requests_post_returns_responses_by_name(self, responses_by_name):
+        def post(url, data, headers, timeout):
+            return self._mock_response(responses_by_name[json.loads(data)["request"]["name"]])
+
+        self._mock_session.post.side_effect = post
+
+    def _query_response(self, value):
+        return json.dumps({
+            "status": "success",
+            "data": {
+                "version": PROTOCOL_VERSION,
+                "result": [{
+                    "value": value,
+                    "confidence": 1.0,
+                    "grammar_entry": None
+                }]
+            }
+        })
+
+    def when_query_all(self, queries):
+        self._actual_result = asyncio.run(
+            self._async_http_service_client.query_all(
+                queries, {'session_id': 'mock_session_id'},
+                Context("mock_active_ddd", self._mock_facts(), "mock_invocation_id")
+            )
+        )
+
+    def _service_query(self, predicate_name):
+        return ServiceQuery(self.mock_wh_question(predicate_name), self._mock_parameter_bindings, 0, None)
+
+    def test_query_all_returns_results_in_order_of_queries(self):
+        self.given_async_http_service_client("mock_endpoint", "mock_name")
+        self.given_requests_post_returns_responses_by_name({
+            "first_predicate": self._query_response("first_value"),
+            "second_predicate": self._query_response("second_value")
+        })
+        self.when_query_all([self._service_query("first_predicate"), self._service_query("second_predicate")])
+        self.then_result_is([[QueryResultFromService("first_value", 1.0, None)],
+                             [QueryResultFromService("second_value", 1.0, None)]])
+
+    def test_query_all_makes_queries_concurrently(self):
+        self.given_async_http_service_client("mock_endpoint", "mock_name", pool_size=2)
+        self.given_posts_wait_for_each_other(2)
+        self.when_query_all([self._service_query("first_predicate"), self._service_query("second_predicate")])
+        self.then_result_is([[QueryResultFromService("value", 1.0, None)]] * 2)
+
+    def given_posts_wait_for_each_other(self, number_of_posts):
+        barrier = threading.Barrier(number_of_posts, timeout=5)
+
+        def post(url, data, headers, timeout):
+            barrier.wait()
+            return self._mock_response(self._query_response("value"))
+
+        self._mock_session.post.side_effect = post
+
+    def test_async_perform(self):
+        self.given_async_http_service_client("mock_endpoint", "mock_action")
+        self.given_requests_post_returns_response(
+            json.dumps({
+                "status": "success",
+                "data": {
+                    "version": PROTOCOL_VERSION,
+                }
+            })
+        )
+        self._actual_result = asyncio.run(
+            self._async_http_service_client.perform(
+                "mock_action", self._mock_parameter_bindings, {'session_id': 'mock_session_id'},
+                Context("mock_active_ddd", self._mock_facts(), "mock_invocation_id")
+            )
+        )
+        self.then_result_is(SuccessfulServiceAction())
+
+    def given_http_service_client_with_cache(self, endpoint, name, ttls):
+        self._cache = ServiceQueryCache(ttls)
+        self._http_service_client = HttpServiceClient(self._mock_logger, endpoint, name, cache=self._cache)
+        self._http_service_client._session = self._mock_session
+
+    def when_query_twice(self, predicate_name, min_results=0, other_min_results=0):
+        for min_results_of_query in [min_results, other_min_results]:
+            self.when_query(
+                question=self.mock_wh_question(predicate_name),
+                parameters=self._mock_parameter_bindings,
+                min_results=min_results_of_query,
+                max_results=None,
+                session={'session_id': 'mock_session_id'},
+                context=Context("mock_active_ddd", self._mock_facts(), "mock_invocation_id")
+            )
+
+    def then_number_of_posts_is(self, expected):
+        self.assertEqual(expected, self._mock_session.post.call_count)
+
+    def test_cached_query_is_posted_once(self):
+        self.given_http_service_client_with_cache("mock_endpoint", "mock_name", {(QUERY, "mock_predicate"): 30})
+        self.given_requests_post_returns_response(self._query_response("mock_value"))
+        self.when_query_twice("mock_predicate")
+        self.then_number_of_posts_is(1)
+        self.then_result_is([QueryResultFromService("mock_value", 1.0, None)])
+
+    def test_cached_query_is_posted_again_with_other_min_results(self):
+        self.given_http_service_client_with_cache("mock_endpoint", "mock_name", {(QUERY, "mock_predicate"): 30})
+        self.given_requests_post_returns_response(self._query_response("mock_value"))
+        self.when_query_twice("mock_predicate", min_results=0, other_min_results=1)
+        self.then_number_of_posts_is(2)
+
+    def test_query_without_cache_ttl_is_posted_every_time(self):
+        self.given_http_service_client_with_cache("mock_endpoint", "mock_name", {(QUERY, "other_predicate"): 30})
+        self.given_requests_post_returns_response(self._query_response("mock_value"))
+        self.when_query_twice("mock_predicate")
+        self.then_number_of_posts_is(2)
+
+    def test_cached_validation_is_posted_once(self):
+        self.given_http_service_client_with_cache("mock_endpoint", "MockValidator", {(VALIDATOR, "MockValidator"): 30})
+        self.given_requests_post_returns_response(
+            json.dumps({
+                "status": "success",
+                "data": {
+                    "version": PROTOCOL_VERSION,
+                    "is_valid": True,
+                }
+            })
+        )
+        self.given_session([], "mock_session_id")
+        for _ in range(2):
+            self.when_validate(
+                "MockValidator", self._mock_parameter_bindings,
+                Context("mock_active_ddd", self._mock_facts(), "mock_invocation_id")
+            )
+        self.then_number_of_posts_is(1)
+        self.then_result_is(True)
+
+    def test_perform_is_never_cached(self):
+        self.given_http_service_client_with_cache("mock_endpoint", "mock_action", {(QUERY, "mock_action"): 30})
+        self.given_requests_post_returns_response(
+            json.dumps({
+                "status": "success",
+                "data": {
+                    "version": PROTOCOL_VERSION,
+                }
+            })
+        )
+        self.given_session([], "mock_session_id")
+        for _ in range(2):
+            self.when_perform(
+                "mock_action", self._mock_parameter_bindings,
+                Context("mock_active_ddd", self._mock_facts(), "mock_invocation_id")
+            )
+        self.then_number_of_posts_is(2)
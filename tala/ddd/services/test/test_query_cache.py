@@ -0,0 +1,89 @@
+import unittest
+from unittest.mock import Mock
+
+from tala.ddd.services.query_cache import ServiceQueryCache, QUERY, VALIDATOR
+from tala.ddd.services.service_interface import ServiceInterface, ServiceQueryInterface, \
+    ServiceValidatorInterface, HttpTarget
+
+
+class ServiceQueryCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._now = 0.0
+        self._call = Mock(side_effect=lambda: "result %d" % self._call.call_count)
+
+    def _clock(self):
+        return self._now
+
+    def _given_cache(self, ttls, max_entries=10):
+        self._cache = ServiceQueryCache(ttls, max_entries=max_entries, clock=self._clock)
+
+    def _when_get_or_call(self, kind, name, key):
+        self._result = self._cache.get_or_call(kind, name, key, self._call)
+
+    def _then_result_is(self, expected):
+        self.assertEqual(expected, self._result)
+
+    def _then_metrics_are(self, **expected):
+        metrics = self._cache.metrics
+        self.assertEqual(expected, {name: metrics[name] for name in expected})
+
+    def test_result_is_reused_for_same_key(self):
+        self._given_cache({(QUERY, "available_city"): 30})
+        self._when_get_or_call(QUERY, "available_city", "key")
+        self._when_get_or_call(QUERY, "available_city", "key")
+        self._then_result_is("result 1")
+        self._then_metrics_are(hits=1, misses=1, size=1)
+
+    def test_result_is_not_reused_for_other_key(self):
+        self._given_cache({(QUERY, "available_city"): 30})
+        self._when_get_or_call(QUERY, "available_city", "key")
+        self._when_get_or_call(QUERY, "available_city", "other key")
+        self._then_result_is("result 2")
+        self._then_metrics_are(hits=0, misses=2, size=2)
+
+    def test_result_is_not_reused_after_ttl(self):
+        self._given_cache({(QUERY, "available_city"): 30})
+        self._when_get_or_call(QUERY, "available_city", "key")
+        self._now = 30.0
+        self._when_get_or_call(QUERY, "available_city", "key")
+        self._then_result_is("result 2")
+        self._then_metrics_are(hits=0, misses=2, expirations=1, size=1)
+
+    def test_results_without_ttl_are_not_cached(self):
+        self._given_cache({(QUERY, "available_city"): 30})
+        self._when_get_or_call(VALIDATOR, "available_city", "key")
+        self._when_get_or_call(VALIDATOR, "available_city", "key")
+        self._then_result_is("result 2")
+        self._then_metrics_are(hits=0, misses=0, size=0)
+
+    def test_least_recently_used_result_is_evicted(self):
+        self._given_cache({(QUERY, "available_city"): 30}, max_entries=2)
+        self._when_get_or_call(QUERY, "available_city", "first key")
+        self._when_get_or_call(QUERY, "available_city", "second key")
+        self._when_get_or_call(QUERY, "available_city", "first key")
+        self._when_get_or_call(QUERY, "available_city", "third key")
+        self._when_get_or_call(QUERY, "available_city", "first key")
+        self._then_result_is("result 1")
+        self._when_get_or_call(QUERY, "available_city", "second key")
+        self._then_result_is("result 4")
+        self._then_metrics_are(evictions=2, size=2)
+
+    def test_failed_call_is_not_cached(self):
+        self._given_cache({(QUERY, "available_city"): 30})
+        self._call.side_effect = [Exception("failed"), "result"]
+        with self.assertRaises(Exception):
+            self._when_get_or_call(QUERY, "available_city", "key")
+        self._when_get_or_call(QUERY, "available_city", "key")
+        self._then_result_is("result")
+
+    def test_ttls_from_service_interface(self):
+        target = HttpTarget("mock_endpoint")
+        service_interface = ServiceInterface([], [
+            ServiceQueryInterface("cached_query", target, [], cache_ttl=30.0),
+            ServiceQueryInterface("uncached_query", target, []),
+        ], [ServiceValidatorInterface("cached_validator", target, [], cache_ttl=2.0)])
+        cache = ServiceQueryCache.for_service_interface(service_interface)
+        self.assertTrue(cache.is_cached(QUERY, "cached_query"))
+        self.assertFalse(cache.is_cached(QUERY, "uncached_query"))
+        self.assertTrue(cache.is_cached(VALIDATOR, "cached_validator"))
+        self.assertFalse(cache.is_cached(QUERY, "cached_validator"))
@@ -124,6 +124,23 @@ class ServiceInterfaceTests(unittest.TestCase):
     def _create_validator(self, name):
         return ServiceValidatorInterface(name, self._http_target, [])
 
+    def test_cache_ttls_are_kept_through_json(self):
+        self._queries = [ServiceQueryInterface("mocked_query", self._http_target, [], cache_ttl=30.0)]
+        self._validators = [ServiceValidatorInterface("validator", self._http_target, [], cache_ttl=2.5)]
+        self._given_service_interface()
+        self.assertEqual(30.0, self._service_interface.get_query("mocked_query").cache_ttl)
+        self.assertEqual(2.5, self._service_interface.get_validator("validator").cache_ttl)
+
+    def test_cache_ttls_are_kept_through_json_api(self):
+        query = ServiceQueryInterface("mocked_query", self._http_target, [], cache_ttl=30.0)
+        self.assertEqual(query, ServiceQueryInterface.create_from_json_api_dict(query.as_json_api_dict()))
+
+    def test_queries_with_different_cache_ttls_are_unequal(self):
+        self.assertNotEqual(
+            ServiceQueryInterface("mocked_query", self._http_target, [], cache_ttl=30.0),
+            ServiceQueryInterface("mocked_query", self._http_target, [])
+        )
+
 
 class ActionInterfaceCreationTests(unittest.TestCase):
     def setUp(self):
@@ -1,9 +1,11 @@
 from unittest.mock import Mock, patch
 
 import pytest
+from lxml import etree
 
 import tala.ddd.ddd_xml_compiler
-from tala.ddd.ddd_xml_compiler import DDDXMLCompiler, DDDXMLCompilerException, ViolatesSchemaException, OntologyWarning
+from tala.ddd.ddd_xml_compiler import DDDXMLCompiler, DDDXMLCompilerException, ViolatesSchemaException, OntologyWarning, \
+    DomainCompiler
 from tala.ddd.parser import Parser
 from tala.ddd.services.service_interface import (
     ServiceParameter, ServiceActionInterface, ServiceQueryInterface, ServiceValidatorInterface, FrontendTarget,
@@ -1109,6 +1111,29 @@ class TestDomainCompiler(DDDXMLCompilerTestCase):
         with pytest.raises(expected_exception, match=expected_message):
             self._when_compile_domain(xml)
 
+    def test_malformed_xml_yields_exception(self):
+        self._given_compiled_ontology('<ontology name="Ontology"/>')
+        self._when_compile_domain_then_exception_is_raised_matching(
+            '<domain name="Domain">', DDDXMLCompilerException, "XMLSyntaxError when parsing XML file"
+        )
+
+    def test_schema_is_compiled_once_per_thread(self):
+        self._given_compiled_ontology('<ontology name="Ontology"/>')
+        with patch.object(DomainCompiler, "parse_schema", side_effect=DomainCompiler().parse_schema) as parse_schema:
+            with patch.dict(tala.ddd.ddd_xml_compiler._schemas_of_thread(), clear=True):
+                self._when_compile_domain()
+                self._when_compile_domain()
+        parse_schema.assert_called_once()
+
+    def test_name_and_domain_are_compiled_from_one_parse(self):
+        self._given_compiled_ontology('<ontology name="Ontology"/>')
+        domain_xml = '<domain name="Domain"><goal type="perform" action="top"/></domain>'
+        compiler = DomainCompiler()
+        with patch.object(tala.ddd.ddd_xml_compiler.etree, "fromstring", wraps=etree.fromstring) as fromstring:
+            compiler.get_name(domain_xml)
+            compiler.compile(self._ddd_name, domain_xml, self._ontology, self._parser)
+        fromstring.assert_called_once_with(domain_xml)
+
     def test_malformed_log_element(self):
         self._given_compiled_ontology()
         self._when_compile_domain_with_plan_then_exception_is_raised_matching(
@@ -2875,3 +2900,43 @@ class TestServiceInterfaceCompiler(DDDXMLCompilerTestCase):
                 ]
             )
         ])
+
+    def test_cache_ttl_for_query_and_validator(self):
+        self._when_compile_service_interface(
+            """
+<service_interface>
+  <query name="available_dest_city" cache_ttl="30">
+    <parameters/>
+    <target>
+      <http endpoint="mock_endpoint"/>
+    </target>
+  </query>
+  <validator name="RouteValidator" cache_ttl="2.5">
+    <parameters/>
+    <target>
+      <http endpoint="mock_endpoint"/>
+    </target>
+  </validator>
+</service_interface>
+"""
+        )
+        self._then_service_interface_has_queries([
+            ServiceQueryInterface("available_dest_city", HttpTarget("mock_endpoint"), parameters=[], cache_ttl=30.0)
+        ])
+        self._then_service_interface_has_validities([
+            ServiceValidatorInterface("RouteValidator", HttpTarget("mock_endpoint"), parameters=[], cache_ttl=2.5)
+        ])
+
+    def test_negative_cache_ttl_violates_schema(self):
+        self._when_compile_service_interface_then_exception_is_raised_matching(
+            """
+<service_interface>
+  <query name="available_dest_city" cache_ttl="-1">
+    <parameters/>
+    <target>
+      <http endpoint="mock_endpoint"/>
+    </target>
+  </query>
+</service_interface>
+""", ViolatesSchemaException, "attribute 'cache_ttl'"
+        )
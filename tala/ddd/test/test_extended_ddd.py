@@ -35,11 +35,10 @@ class TestExtendedDDD(unittest.TestCase):
         return ExtendedDDD(ddd, parameter_retriever=Mock(spec=ParameterRetriever), parser=self._mocked_parser)
 
     def _create_ddd(self):
+        domain = Mock(spec=Domain)
+        domain.name = "a_domain"
         return DDD(
-            "a_ddd",
-            ontology=self._mocked_ontology,
-            domain=Mock(spec=Domain),
-            service_interface=Mock(spec=ServiceInterface)
+            "a_ddd", ontology=self._mocked_ontology, domain=domain, service_interface=Mock(spec=ServiceInterface)
         )
 
     def when_calling_reset(self):
@@ -60,3 +59,32 @@ class TestExtendedDDD(unittest.TestCase):
 
     def then_parser_is_cleared(self):
         self._mocked_parser.clear.assert_called_once_with()
+
+    def test_reset_of_session_resets_session_ontology(self):
+        self.given_mocked_ontology()
+        self.given_extended_ddd_created()
+        self.given_session_created()
+        self.when_calling_reset_of_session()
+        self.then_only_session_ontology_is_reset()
+
+    def given_session_created(self):
+        self._session = self._extended_ddd.create_session()
+
+    def when_calling_reset_of_session(self):
+        self._session.reset()
+
+    def then_only_session_ontology_is_reset(self):
+        self._mocked_ontology.create_session.return_value.reset.assert_called_once_with()
+        self._mocked_ontology.reset.assert_not_called()
+
+    def test_session_has_own_parser_for_session_ontology(self):
+        self.given_mocked_ontology()
+        self.given_mocked_parser()
+        self.given_extended_ddd_created()
+        self.given_session_created()
+        self.then_session_parser_is_new_parser_for_session_ontology()
+
+    def then_session_parser_is_new_parser_for_session_ontology(self):
+        self.assertIsNot(self._mocked_parser, self._session.parser)
+        self.assertIs(self._mocked_ontology.create_session.return_value, self._session.parser.ontology)
+        self.assertIs(self._mocked_ontology.create_session.return_value, self._session.ontology)
@@ -1,6 +1,7 @@
 import unittest
 
 from tala.ddd.parser import Parser, ParseError
+from tala.utils.lru_cache import LRUCache
 from tala.ddd.json_parser import CheckingJSONParser
 from tala.model.action import Action
 from tala.model.action_status import Done
@@ -312,6 +313,14 @@ class ParserTests(unittest.TestCase):
         expected_move = self.parse("ask(?set([goal(perform(top)), goal(perform(buy))]))")
         self.assertEqual(expected_move, self.parse(string))
 
+    def test_move_with_comma_inside_quoted_content(self):
+        self._when_parse('Move(answer("paris, london"), speaker=USR)')
+        self._then_result_is(
+            MoveFactoryWithPredefinedBoilerplate(self.ontology.name, speaker=USR).create_answer_move(
+                Individual(self.ontology_name, 'paris, london', StringSort())
+            )
+        )
+
     def test_Individual(self):
         individual_from_string = self.parse("paris")
         self.assertEqual(self.individual_paris, individual_from_string)
@@ -1265,3 +1274,67 @@ class ParserTests(unittest.TestCase):
         string = "change_ddd(ddd_name)"
         expected_object = ChangeDDD("ddd_name")
         self.assertEqual(expected_object, self.parse(string))
+
+
+class ParserCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._ddd_name = "mockup_ddd"
+        self.ontology_name = "mockup_ontology"
+        self.domain_name = "mockup_domain"
+        city = CustomSort(self.ontology_name, "city")
+        predicates = {Predicate(self.ontology_name, "dest_city", city)}
+        individuals = {"paris": city, "london": city}
+        self.ontology = Ontology(self.ontology_name, {city}, predicates, individuals, set())
+        self._parser = Parser(self._ddd_name, self.ontology, self.domain_name)
+
+    def test_parse_returns_copy_of_cached_result_by_default(self):
+        first = self._parser.parse("dest_city(paris)")
+        second = self._parser.parse("dest_city(paris)")
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+    def test_parse_returns_cached_result_when_sharing_results(self):
+        parser = Parser(self._ddd_name, self.ontology, self.domain_name, share_results=True)
+        self.assertIs(parser.parse("dest_city(paris)"), parser.parse("dest_city(paris)"))
+
+    def test_parse_returns_copy_of_mutable_result_when_sharing_results(self):
+        parser = Parser(self._ddd_name, self.ontology, self.domain_name, share_results=True)
+        first = parser.parse("{dest_city(paris)}")
+        first.add(parser.parse("dest_city(london)"))
+        self.assertEqual(1, len(parser.parse("{dest_city(paris)}")))
+
+    def test_shared_cache_distinguishes_ontology_sessions(self):
+        cache = LRUCache()
+        Parser(self._ddd_name, self.ontology, self.domain_name, cache=cache).parse("paris")
+        Parser(self._ddd_name, self.ontology.create_session(), self.domain_name, cache=cache).parse("paris")
+        self.assertEqual(0, cache.hits)
+
+    def test_result_is_parsed_again_when_individuals_change(self):
+        self._parser.parse("paris")
+        self.ontology.add_individual("berlin", "city")
+        self._parser.parse("paris")
+        self.assertEqual(0, self._parser.cache.hits)
+
+    def test_cache_counts_hits_and_misses(self):
+        self._parser.parse("paris")
+        self._parser.parse("paris")
+        self.assertEqual(1, self._parser.cache.hits)
+        self.assertEqual(1, self._parser.cache.misses)
+
+    def test_cache_is_bounded(self):
+        parser = Parser(self._ddd_name, self.ontology, self.domain_name, cache=LRUCache(max_size=1))
+        parser.parse("paris")
+        parser.parse("london")
+        self.assertEqual(1, len(parser.cache))
+
+    def test_cache_shared_between_parsers_for_same_ontology(self):
+        cache = LRUCache()
+        Parser(self._ddd_name, self.ontology, self.domain_name, cache=cache).parse("paris")
+        Parser(self._ddd_name, self.ontology, self.domain_name, cache=cache).parse("paris")
+        self.assertEqual(1, cache.hits)
+
+    def test_shared_cache_distinguishes_domains(self):
+        cache = LRUCache()
+        Parser(self._ddd_name, self.ontology, "some_domain", cache=cache).parse("findout(?X.dest_city(X))")
+        findout = Parser(self._ddd_name, self.ontology, "other_domain", cache=cache).parse("findout(?X.dest_city(X))")
+        self.assertEqual("other_domain", findout.domain_name)
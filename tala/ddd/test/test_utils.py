@@ -1,12 +1,13 @@
 import unittest
 
 from tala.ddd.utils import CacheMethod
+from tala.utils.lru_cache import LRUCache
 
 
 class MockClass:
-    def __init__(self):
+    def __init__(self, cache=None, namespace=()):
         self.times_called = 0
-        self.cache = CacheMethod(self, self.increase)
+        self.cache = CacheMethod(self, self.increase, cache, namespace)
         self.increment = 1
 
     def increase(self, x):
@@ -36,3 +37,23 @@ class CacheTest(unittest.TestCase):
         self.assertEqual(2, obj.increase(1))
         obj.set_increment(4)
         self.assertEqual(5, obj.increase(1))
+
+    def test_shared_cache_is_namespaced(self):
+        cache = LRUCache()
+        first = MockClass(cache=cache, namespace=("first", ))
+        second = MockClass(cache=cache, namespace=("second", ))
+        second.increment = 2
+        self.assertEqual(2, first.increase(1))
+        self.assertEqual(3, second.increase(1))
+        self.assertEqual(2, len(cache))
+
+    def test_clear_keeps_results_of_other_namespaces(self):
+        cache = LRUCache()
+        first = MockClass(cache=cache, namespace=("first", ))
+        second = MockClass(cache=cache, namespace=("second", ))
+        first.increase(1)
+        second.increase(1)
+        first.set_increment(4)
+        self.assertEqual(1, len(cache))
+        second.increase(1)
+        self.assertEqual(1, second.times_called)
@@ -1,20 +1,34 @@
+from tala.utils.lru_cache import LRUCache
+
+MISSING = object()
+
+
 class CacheMethod:
-    def __init__(self, instance, method):
+    def __init__(self, instance, method, cache=None, namespace=()):
         self._method = method
-        self._cache = {}
+        self._cache = LRUCache() if cache is None else cache
+        self._namespace = namespace
 
         def cached_method(*args):
-            if args in self._cache:
-                return self._cache[args]
-            else:
+            key = self._namespace + args
+            value = self._cache.get(key, MISSING)
+            if value is MISSING:
                 value = self._method.__call__(*args)
-                self._cache[args] = value
-                return value
+                self._cache[key] = value
+            return value
 
         setattr(instance, method.__name__, cached_method)
 
+    @property
+    def cache(self):
+        return self._cache
+
     def __str__(self):
         return "CacheMethod(%s, _cache=%s)" % (self._method, self._cache)
 
     def clear(self):
-        self._cache = {}
+        """ Removes the results of this method from the cache, keeping those of other namespaces. """
+        namespace_length = len(self._namespace)
+        keys = [key for key in self._cache if key[:namespace_length] == self._namespace]
+        for key in keys:
+            del self._cache[key]
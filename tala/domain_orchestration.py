@@ -1,17 +1,53 @@
+import hashlib
+import json
 import logging
+import mmap
+import pickle
+
+import structlog
+
 from tala.ddd.ddd_manager import DDDManager
 from tala.ddd.loading.extended_ddd_set_loader import ExtendedDDDSetLoader
+from tala.model.ddd import DDD
 from tala.log.formats import TIS_LOGGING_COMPACT, TIS_LOGGING_FULL, TIS_LOGGING_AUTO
 from tala.config import BackendConfig
-from tala.utils.as_json import AsJSONMixin
+from tala.utils.as_json import AsJSONMixin, convert_to_json
+from tala.utils.version import installed_tala_version
+
+JSON_WHITESPACE = " \t\n\r"
+ODB_READ_CHUNK_SIZE = 64 * 1024
+ODB_SNAPSHOT_MAGIC = b"TALA ODB SNAPSHOT\n"
+ODB_SNAPSHOT_FORMAT_VERSION = 1
+
+logger = structlog.get_logger(__name__)
 
 
 class UnknownActiveDddException(Exception):
     pass
 
 
+class InvalidODBException(Exception):
+    pass
+
+
+class StaleODBSnapshotException(Exception):
+    pass
+
+
 def create_odb_as_json(
     config, overridden_ddd_config_paths, should_greet, logged_tis_format, tis_update_format, log_to_stdout, log_level
+):
+    odb_as_json = create_odb_settings_as_json(
+        config, overridden_ddd_config_paths, should_greet, logged_tis_format, tis_update_format, log_to_stdout,
+        log_level
+    )
+    extended_ddds = load_ddds(odb_as_json["ddd_names"], overridden_ddd_config_paths, odb_as_json["rerank_amount"])
+    odb_as_json["ddds"] = [extended_ddd.ddd.as_json_api_dict() for extended_ddd in extended_ddds]
+    return odb_as_json
+
+
+def create_odb_settings_as_json(
+    config, overridden_ddd_config_paths, should_greet, logged_tis_format, tis_update_format, log_to_stdout, log_level
 ):
     odb_as_json = {}
 
@@ -35,20 +71,231 @@ def create_odb_as_json(
     odb_as_json["log_to_stdout"] = log_to_stdout
     odb_as_json["log_level"] = log_level
 
-    extended_ddds = load_ddds(odb_as_json["ddd_names"], overridden_ddd_config_paths, raw_config["rerank_amount"])
-
-    odb_as_json["ddds"] = [extended_ddd.ddd.as_json_api_dict() for extended_ddd in extended_ddds]
-
     return odb_as_json
 
 
-def load_ddds(ddd_names, overridden_config_paths, rerank_amount):
+def load_ddds(ddd_names, overridden_config_paths, rerank_amount, processes=1):
     ddd_manager = DDDManager()
-    extended_ddd_set_loader = ExtendedDDDSetLoader(ddd_manager, overridden_config_paths)
+    extended_ddd_set_loader = ExtendedDDDSetLoader(ddd_manager, overridden_config_paths, processes)
     ddds = extended_ddd_set_loader.ddds_as_list(ddd_names, rerank_amount=rerank_amount)
     return ddds
 
 
+def ddds_as_json_api_dicts(extended_ddds):
+    for extended_ddd in extended_ddds:
+        yield convert_to_json(extended_ddd.ddd.as_json_api_dict())
+
+
+class DDDCompilation(object):
+    """ Compiles the DDDs of an ODB from XML. With a DDDCompileCache, DDDs that are unchanged since they were last
+    compiled are taken from the cache instead, and the others are stored in it. """
+    def __init__(self, ddd_names, overridden_config_paths, rerank_amount, processes=1, cache=None):
+        self._ddd_names = ddd_names
+        self._cache = cache
+        extended_ddd_set_loader = ExtendedDDDSetLoader(DDDManager(), overridden_config_paths, processes)
+        self._cache_keys = {}
+        if cache is not None:
+            for ddd_name in ddd_names:
+                ddd_config = extended_ddd_set_loader.ddd_config(ddd_name)
+                self._cache_keys[ddd_name] = cache.key(ddd_name, ddd_name, ddd_config)
+        self._reused_ddd_names = [
+            ddd_name for ddd_name in ddd_names
+            if ddd_name in self._cache_keys and cache.has_entry(self._cache_keys[ddd_name])
+        ]
+        self._compiled_ddd_names = [ddd_name for ddd_name in ddd_names if ddd_name not in self._reused_ddd_names]
+        extended_ddds = extended_ddd_set_loader.ddds_as_list(self._compiled_ddd_names, rerank_amount=rerank_amount)
+        self._extended_ddds = dict(zip(self._compiled_ddd_names, extended_ddds))
+
+    @property
+    def reused_ddd_names(self):
+        return self._reused_ddd_names
+
+    @property
+    def compiled_ddd_names(self):
+        return self._compiled_ddd_names
+
+    def ddds_as_json_api_dicts(self):
+        for ddd_name in self._ddd_names:
+            if ddd_name in self._extended_ddds:
+                ddd_as_json = convert_to_json(self._extended_ddds[ddd_name].ddd.as_json_api_dict())
+                if self._cache is not None:
+                    self._cache.put(self._cache_keys[ddd_name], ddd_as_json)
+                yield ddd_as_json
+            else:
+                yield self._cache.get(self._cache_keys[ddd_name])
+
+    def ddds(self):
+        for ddd_name in self._ddd_names:
+            if ddd_name in self._extended_ddds:
+                yield self._extended_ddds[ddd_name].ddd
+            else:
+                yield DDD.create_from_json_api_data(self._cache.get(self._cache_keys[ddd_name]))
+
+
+def write_odb(odb_settings_as_json, ddds_as_json, file):
+    """ Write the ODB to file, one DDD at a time. The DDDs are taken from the iterable ddds_as_json and written after
+    the settings, as the last member. The written JSON is the same as json.dumps gives for the complete ODB. """
+    file.write("{")
+    for key, value in odb_settings_as_json.items():
+        file.write("%s: %s, " % (json.dumps(key), json.dumps(value)))
+    file.write('"ddds": [')
+    for index, ddd_as_json in enumerate(ddds_as_json):
+        if index > 0:
+            file.write(", ")
+        file.write(json.dumps(ddd_as_json))
+    file.write("]}")
+
+
+class ODBReader(object):
+    """ Reads an ODB from file without reading all of it at once. The settings are read up to the DDDs, which are then
+    taken one at a time from ddds_as_json(). """
+    def __init__(self, file, chunk_size=ODB_READ_CHUNK_SIZE):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._position = 0
+        self._decoder = json.JSONDecoder()
+        self._settings = {}
+        self._expect("{")
+        self._has_ddds = self._read_settings()
+
+    @property
+    def settings(self):
+        return self._settings
+
+    def ddds_as_json(self):
+        if not self._has_ddds:
+            return
+        self._has_ddds = False
+        self._expect("[")
+        if not self._skip("]"):
+            yield self._read_value()
+            while self._skip(","):
+                yield self._read_value()
+            self._expect("]")
+        if self._skip(","):
+            self._read_settings()
+        else:
+            self._expect("}")
+
+    def _read_settings(self):
+        if self._skip("}"):
+            return False
+        while True:
+            key = self._read_value()
+            if not isinstance(key, str):
+                raise InvalidODBException(f"Expected a member name in the ODB but got {key!r}")
+            self._expect(":")
+            if key == "ddds":
+                return True
+            self._settings[key] = self._read_value()
+            if not self._skip(","):
+                self._expect("}")
+                return False
+
+    def _read_value(self):
+        self._next_character()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError as exception:
+                if not self._read_more():
+                    raise InvalidODBException(f"Expected a JSON value in the ODB but got: {exception}")
+                continue
+            if end < len(self._buffer) or not self._read_more():
+                self._position = end
+                return value
+
+    def _expect(self, character):
+        if not self._skip(character):
+            raise InvalidODBException(f"Expected '{character}' in the ODB but got '{self._next_character()}'")
+
+    def _skip(self, character):
+        if self._next_character() == character:
+            self._position += 1
+            return True
+        return False
+
+    def _next_character(self):
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position] in JSON_WHITESPACE:
+                self._position += 1
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read_more():
+                raise InvalidODBException("Expected more of the ODB but it ended")
+
+    def _read_more(self):
+        unread = self._buffer[self._position:]
+        chunk = self._file.read(max(self._chunk_size, 3 * len(unread)))
+        if not chunk:
+            return False
+        self._buffer = unread + chunk
+        self._position = 0
+        return True
+
+
+def write_odb_snapshot(ddds, odb_path, snapshot_path):
+    """ Write the built DDDs, including derived indexes, to a snapshot of the ODB in odb_path. The snapshot is only
+    valid for the same tala version and the same ODB file. It is unpickled when read, so it must be as trusted as the
+    code itself. """
+    for ddd in ddds:
+        ddd.domain.index.build()
+    header = {
+        "format_version": ODB_SNAPSHOT_FORMAT_VERSION,
+        "tala_version": installed_tala_version(),
+        "odb_sha256": _sha256_of_file(odb_path),
+    }
+    with open(snapshot_path, "wb") as file:
+        file.write(ODB_SNAPSHOT_MAGIC)
+        file.write(json.dumps(header).encode("utf-8") + b"\n")
+        pickle.dump(list(ddds), file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def read_odb_snapshot(snapshot_path, odb_path):
+    with open(snapshot_path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as snapshot:
+        if snapshot[:len(ODB_SNAPSHOT_MAGIC)] != ODB_SNAPSHOT_MAGIC:
+            raise StaleODBSnapshotException(f"Expected '{snapshot_path}' to be an ODB snapshot but it is not")
+        header_end = snapshot.find(b"\n", len(ODB_SNAPSHOT_MAGIC))
+        header = json.loads(snapshot[len(ODB_SNAPSHOT_MAGIC):header_end])
+        expected_header = {
+            "format_version": ODB_SNAPSHOT_FORMAT_VERSION,
+            "tala_version": installed_tala_version(),
+            "odb_sha256": _sha256_of_file(odb_path),
+        }
+        if header != expected_header:
+            raise StaleODBSnapshotException(
+                f"Expected ODB snapshot '{snapshot_path}' to match {expected_header} but it was written for {header}"
+            )
+        with memoryview(snapshot) as view, view[header_end + 1:] as pickled_ddds:
+            return pickle.loads(pickled_ddds)
+
+
+def load_odb(odb_path, ddd_manager, snapshot_path=None):
+    """ Add the DDDs of the ODB in odb_path to ddd_manager and return the settings of the ODB. The DDDs are taken from
+    the snapshot in snapshot_path if it matches the ODB and the tala version, otherwise from the ODB. """
+    with open(odb_path) as file:
+        reader = ODBReader(file)
+        if snapshot_path is not None:
+            try:
+                ddds = read_odb_snapshot(snapshot_path, odb_path)
+            except (OSError, EOFError, ValueError, StaleODBSnapshotException, pickle.UnpicklingError) as exception:
+                logger.warning("falling back to the JSON of the ODB", snapshot=snapshot_path, reason=str(exception))
+            else:
+                ddd_manager.add_built_ddds(reader.settings["ddd_names"], ddds)
+                return reader.settings
+        ddd_manager.add_ddds_from_json_stream(reader.settings["ddd_names"], reader.ddds_as_json())
+        return reader.settings
+
+
+def _sha256_of_file(path):
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(ODB_READ_CHUNK_SIZE), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
 class OrchestratedDomainBundle(AsJSONMixin):
     def __init__(self, argument_dict):
         self._overridden_ddd_config_paths = argument_dict["overridden_ddd_config_paths"]
@@ -1,5 +1,5 @@
 from tala.utils.as_json import AsJSONMixin
-from tala.utils.equality import EqualityMixin
+from tala.utils.equality import FrozenEqualityMixin
 from tala.utils.unicodify import unicodify
 
 SEMANTIC_OBJECT_TYPE = "event"
@@ -16,7 +16,7 @@ SYSTEM_MOVES_SELECTED = "SYSTEM_MOVES_SELECTED"
 TO_FRONTEND_DEVICE = "TO_FRONTEND_DEVICE"
 
 
-class Event(AsJSONMixin, EqualityMixin):
+class Event(AsJSONMixin, FrozenEqualityMixin):
     def __init__(self, type_, content=None, sender=None, reason=None):
         self._type = type_
         self._content = content
@@ -14,7 +14,13 @@ class Commitments(AsSemanticExpressionMixin, AsJSONMixin):
             meta_com = {}
         if meta_pcom is None:
             meta_pcom = {}
-        self._backing_set = Set([item for item in content])
+        self._backing_set = Set()
+        self._commitments_by_predicate_name = {}
+        self._commitments_by_feature_of_name = {}
+        self._positions = {}
+        self._next_position = 0
+        for item in content:
+            self._add_to_backing_set(item)
         self._meta_pcom = {k: v for k, v in meta_pcom.items()}
         self._meta_com = {k: v for k, v in meta_com.items()}
         self._pcom = Set([item for item in pcom])
@@ -65,26 +71,70 @@ class Commitments(AsSemanticExpressionMixin, AsJSONMixin):
 
     def add(self, proposition, turn_number=-1, topmost_goal=None):
         self._remove_incompatible_commitments(proposition)
-        self._backing_set.add(proposition)
+        self._add_to_backing_set(proposition)
         self._meta_com[proposition] = (topmost_goal, turn_number)
 
+    def _add_to_backing_set(self, proposition):
+        if proposition in self._backing_set:
+            return
+        self._backing_set.add(proposition)
+        self._positions[proposition] = self._next_position
+        self._next_position += 1
+        for index, name in self._index_names_of(proposition):
+            index.setdefault(name, {})[proposition] = None
+
+    def _index_names_of(self, proposition):
+        if not proposition.is_predicate_proposition():
+            return []
+        names = [(self._commitments_by_predicate_name, proposition.predicate.get_name())]
+        feature_of_name = proposition.predicate.get_feature_of_name()
+        if feature_of_name:
+            names.append((self._commitments_by_feature_of_name, feature_of_name))
+        return names
+
+    def _remove_from_backing_set(self, proposition):
+        self._backing_set.remove(proposition)
+        del self._positions[proposition]
+        for index, name in self._index_names_of(proposition):
+            del index[name][proposition]
+            if not index[name]:
+                del index[name]
+
     def _remove_incompatible_commitments(self, proposition):
         to_remove = []
 
-        for commitment in self:
+        for commitment in self._candidates_for_incompatibility_with(proposition):
             if proposition.is_incompatible_with(commitment):
                 to_remove.append(commitment)
 
         for commitment_to_remove in to_remove:
             self.remove(commitment_to_remove)
 
+    def _candidates_for_incompatibility_with(self, proposition):
+        """ A predicate proposition can only be incompatible with predicate propositions of the same predicate, of the
+        predicate that it is a feature of, or of the predicates that are features of it. Other propositions are
+        checked against all commitments. """
+        if not proposition.is_predicate_proposition():
+            return list(self)
+        name = proposition.predicate.get_name()
+        feature_of_name = proposition.predicate.get_feature_of_name()
+        candidates = {}
+        candidates.update(self._commitments_by_predicate_name.get(name, {}))
+        candidates.update(self._commitments_by_feature_of_name.get(name, {}))
+        if feature_of_name:
+            candidates.update(self._commitments_by_predicate_name.get(feature_of_name, {}))
+        return sorted(candidates, key=self._positions.__getitem__)
+
     def __iter__(self):
         return self._backing_set.__iter__()
 
+    def __contains__(self, proposition):
+        return proposition in self._backing_set
+
     def remove(self, proposition):
         if proposition in self._meta_com:
             self._meta_pcom[proposition] = self._meta_com[proposition]
-        self._backing_set.remove(proposition)
+        self._remove_from_backing_set(proposition)
         self.pcom.add(proposition)
 
     def remove_if_exists(self, proposition):
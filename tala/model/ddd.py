@@ -1,11 +1,11 @@
 from tala.utils.as_json import AsJSONMixin
-from tala.utils.equality import EqualityMixin
+from tala.utils.equality import FrozenEqualityMixin
 from tala.utils.json_api import JSONAPIMixin, IncludedObject
 from tala import model
 from tala.ddd.services.service_interface import ServiceInterface
 
 
-class DDD(AsJSONMixin, EqualityMixin, JSONAPIMixin):
+class DDD(AsJSONMixin, FrozenEqualityMixin, JSONAPIMixin):
     @classmethod
     def create_from_json_api_data(cls, ddd_as_dict):
         ddd_entry = ddd_as_dict["data"]
@@ -4,7 +4,8 @@ import tala.model
 from tala.model.proposition import PropositionSet, ImplicationProposition
 from tala.model.action import Action
 from tala.model.error import DomainError
-from tala.model.goal import PerformGoal, ResolveGoal, PERFORM
+from tala.model.domain_index import DomainIndex
+from tala.model.goal import Goal, PerformGoal, ResolveGoal, PERFORM
 from tala.model.question import KnowledgePreconditionQuestion, Question
 from tala.model import speaker
 from tala.model.plan import Plan, InvalidPlansException
@@ -12,6 +13,7 @@ from tala.model import plan_item
 from tala.model.proposition import PredicateProposition, ServiceActionTerminatedProposition
 from tala.utils.as_json import AsJSONMixin, convert_to_json
 from tala.utils.json_api import (JSONAPIMixin, JSONAPIObject, get_attribute)
+from tala.utils.lazy_dict import LazyDict
 from tala.utils.unique import unique
 
 SEMANTIC_OBJECT_TYPE = "domain"
@@ -58,29 +60,32 @@ def serialize_iterator(iterator):
 class Domain(AsJSONMixin, JSONAPIMixin):
     @classmethod
     def create_from_json_api_data(cls, data, included, ontology):
-        def create_plans(plans, included):
-            for (
+        def create_plan(plan_data, included):
+            (
                 goal, plan, postplan, downdate_conditions, superactions, preferred, unrestricted_accommodation,
                 reraise_on_resume, max_answers, alternatives_predicate, accommodate_without_feedback
-            ) in create_plans_content(plans, included):
-                yield {
-                    "goal": goal,
-                    "plan": plan,
-                    "postplan": postplan,
-                    "postconds": downdate_conditions,
-                    "superactions": superactions,
-                    "preferred": preferred,
-                    "unrestricted_accommodation": unrestricted_accommodation,
-                    "reraise_on_resume": reraise_on_resume,
-                    "max_answers": max_answers,
-                    "alternatives_predicate": alternatives_predicate,
-                    "accommodate_without_feedback": accommodate_without_feedback
-                }
-
-        def create_plans_content(plans, included):
-            for planref in plans:
-                plan_data = included.get_object_from_relationship(planref)
-                yield Plan.create_from_json_api_data(plan_data, included)
+            ) = Plan.create_from_json_api_data(plan_data, included)
+            return {
+                "goal": goal,
+                "plan": plan,
+                "postplan": postplan,
+                "postconds": downdate_conditions,
+                "superactions": superactions,
+                "preferred": preferred,
+                "unrestricted_accommodation": unrestricted_accommodation,
+                "reraise_on_resume": reraise_on_resume,
+                "max_answers": max_answers,
+                "alternatives_predicate": alternatives_predicate,
+                "accommodate_without_feedback": accommodate_without_feedback
+            }
+
+        def create_goal_of_plan(plan_data, included):
+            goal_data = included.get_object_from_relationship(plan_data["relationships"]["goal"]["data"])
+            return Goal.create_from_json_api_data(goal_data, included)
+
+        def create_loader(create, object_data, included):
+            needed = included.subset_for(object_data)
+            return lambda: create(object_data, needed)
 
         def create_dependency(dependency_data, included):
             key_question_data = included.get_object_from_relationship(dependency_data["relationships"]["key"]["data"])
@@ -90,6 +95,10 @@ class Domain(AsJSONMixin, JSONAPIMixin):
                 values.add(Question.create_from_json_api_data(value_item, included))
             return Question.create_from_json_api_data(key_question_data, included), values
 
+        def create_parameters_key(parameter_data, included):
+            key_question_data = included.get_object_from_relationship(parameter_data["relationships"]["key"]["data"])
+            return Question.create_from_json_api_data(key_question_data, included)
+
         def create_parameters(parameter_data, included):
             BOOLEAN_PARAMETERS = [
                 "always_ground",
@@ -104,8 +113,6 @@ class Domain(AsJSONMixin, JSONAPIMixin):
             ACTION_PARAMETERS = ["on_zero_hits_action", "on_too_many_hits_action"]
 
             parameters = {}
-            key_question_data = included.get_object_from_relationship(parameter_data["relationships"]["key"]["data"])
-            key_question = Question.create_from_json_api_data(key_question_data, included)
             for boolean_parameter in BOOLEAN_PARAMETERS:
                 if boolean_parameter in parameter_data["attributes"]:
                     parameters[boolean_parameter] = bool(parameter_data["attributes"][boolean_parameter])
@@ -139,7 +146,13 @@ class Domain(AsJSONMixin, JSONAPIMixin):
             if "related_information" in parameter_data["relationships"]:
                 parameters["related_information"] = create_related_information_parameter(parameter_data, included)
 
-            return key_question, parameters
+            return parameters
+
+        def create_query_key(query_data, included):
+            if query_data["type"] == "iterator":
+                return get_attribute("query", query_data)
+            query_json = included.get_data_for_relationship("query", query_data)
+            return Question.create_from_json_api_data(query_json, included)
 
         def create_query(query_data, included):
             if query_data["type"] == "implication":
@@ -251,7 +264,11 @@ class Domain(AsJSONMixin, JSONAPIMixin):
         ddd_name = data["id"]
         user_defined_name = data["attributes"]["tala.model.domain.Domain.user_defined_name"]
 
-        plans = list(create_plans(data["relationships"]["plans"]["data"], included))
+        plan_loaders = []
+        for plan_ref in data["relationships"]["plans"]["data"]:
+            plan_data = included.get_object_from_relationship(plan_ref)
+            goal = create_goal_of_plan(plan_data, included)
+            plan_loaders.append((goal, create_loader(create_plan, plan_data, included)))
 
         default_questions = []
         if "default_questions" in data["relationships"]:
@@ -259,12 +276,12 @@ class Domain(AsJSONMixin, JSONAPIMixin):
                 question_data = included.get_object_from_relationship(question_ref)
                 default_questions.append(Question.create_from_json_api_data(question_data, included))
 
-        parameters = {}
+        parameter_loaders = []
         if "parameters" in data["relationships"]:
             for parameters_ref in data["relationships"]["parameters"]["data"]:
                 parameters_data = included.get_object_from_relationship(parameters_ref)
-                k, v = create_parameters(parameters_data, included)
-                parameters[k] = v
+                question = create_parameters_key(parameters_data, included)
+                parameter_loaders.append((question, create_loader(create_parameters, parameters_data, included)))
 
         dependencies = {}
         if "dependencies" in data["relationships"]:
@@ -274,11 +291,12 @@ class Domain(AsJSONMixin, JSONAPIMixin):
                 key, value = create_dependency(dependency_data, included)
                 dependencies[key] = value
 
-        queries = []
+        query_loaders = []
         if "queries" in data["relationships"]:
             for query_ref in data["relationships"]["queries"]["data"]:
                 query_data = included.get_object_from_relationship(query_ref)
-                queries.append(create_query(query_data, included))
+                query = create_query_key(query_data, included)
+                query_loaders.append((query, create_loader(create_query, query_data, included)))
 
         validators = []
         if "validators" in data["relationships"]:
@@ -290,18 +308,23 @@ class Domain(AsJSONMixin, JSONAPIMixin):
             ddd_name,
             user_defined_name,
             ontology,
-            plans,
-            default_questions,
-            parameters,
+            default_questions=default_questions,
             validators=validators,
             dependencies=dependencies,
-            queries=queries,
+            plan_loaders=plan_loaders,
+            parameter_loaders=parameter_loaders,
+            query_loaders=query_loaders,
         )
 
     def __init__(
             self, ddd_name, name, ontology, plans=None, default_questions=None, parameters=None,
-            validators=None, dependencies=None, queries=None
+            validators=None, dependencies=None, queries=None, plan_loaders=None, parameter_loaders=None,
+            query_loaders=None
     ):  # yapf: disable
+        """ Plans, parameters and queries can also be given as loaders, which are lists of (key, load) pairs. The
+        key is the goal, question or query, and load() creates its plan info, parameters or query info the first
+        time it is looked up. Only the keys are created up front, so a malformed plan, parameter or query is not
+        reported when the domain is created, but raises its error at its first lookup. """
         if plans is None:
             plans = []
         if default_questions is None:
@@ -314,24 +337,32 @@ class Domain(AsJSONMixin, JSONAPIMixin):
             dependencies = {}
         if queries is None:
             queries = []
+        plan_loaders = plan_loaders or []
+        parameter_loaders = parameter_loaders or []
+        query_loaders = query_loaders or []
 
         self.ddd_name = ddd_name  # identifier
         self.name = name  # defined in XML
         self.ontology = ontology
         self.default_questions = default_questions
-        self.parameters = parameters
+        self.parameters = LazyDict(parameters)
+        for question, load_parameters in parameter_loaders:
+            self.parameters.set_loader(question, load_parameters)
         self.dependencies = dependencies
-        self.plans = self._plan_list_to_dict_indexed_by_goal(plans)
-        self.queries = self._query_list_to_dict_indexed_by_question(queries)
+        self.plans = self._plan_list_to_dict_indexed_by_goal(plans, plan_loaders)
+        self.queries = self._query_list_to_dict_indexed_by_question(queries, query_loaders)
         self.validators = validators
-        self._goals_in_defined_order = [plan["goal"] for plan in plans]
+        self._goals_in_defined_order = [plan["goal"] for plan in plans] + [goal for goal, _ in plan_loaders]
         self._add_top_plan_if_missing()
         self._add_up_plan()
+        self._index = None
 
     def as_dict(self):
         json = super(Domain, self).as_dict()
         json["ontology"] = "<skipped>"
+        del json["_index"]
         json["semantic_object_type"] = SEMANTIC_OBJECT_TYPE
+        json["plans"] = dict(self.plans)
         json["parameters"] = dict_as_key_value_list(self.parameters)
         json["dependencies"] = dict_as_key_value_list(self.dependencies)
         json["queries"] = queries_dict_as_list(self.queries)
@@ -499,6 +530,13 @@ class Domain(AsJSONMixin, JSONAPIMixin):
     def goals(self):
         return list(self.plans.keys())
 
+    @property
+    def index(self):
+        """ The DomainIndex of the plans. It is replaced with a new one when plans are added or removed. """
+        if self._index is None or self._index.plans_revision != self.plans.revision:
+            self._index = DomainIndex(self)
+        return self._index
+
     def _has_top_plan(self):
         return any([
             plan for plan in list(self.plans.values()) if (
@@ -557,10 +595,7 @@ class Domain(AsJSONMixin, JSONAPIMixin):
         return False
 
     def get_dependent_question(self, question):
-        for other_question in self.get_plan_questions():
-            if self.is_depending_on(other_question, question):
-                return other_question
-        return None
+        return self.index.get_dependent_question(question)
 
     def has_goal(self, goal):
         return goal in self.plans
@@ -576,20 +611,7 @@ class Domain(AsJSONMixin, JSONAPIMixin):
             raise DomainError("no plan for goal '%s' in domain '%s'" % (goal, self.get_name()))
 
     def dominates(self, supergoal, subgoal):
-        if self.has_goal(supergoal):
-            plan = self.get_plan(supergoal)
-            for item in plan:
-                if item.type_ in plan_item.QUESTION_TYPES:
-                    question = item.content
-                    if question.is_alt_question():
-                        for proposition in question.content:
-                            if proposition.is_goal_proposition():
-                                goal = proposition.get_goal()
-                                if goal == subgoal:
-                                    return True
-                                elif self.dominates(goal, subgoal):
-                                    return True
-        return False
+        return self.index.dominates(supergoal, subgoal)
 
     def _is_action_goal(self, goal):
         try:
@@ -609,13 +631,7 @@ class Domain(AsJSONMixin, JSONAPIMixin):
         return question in self.default_questions
 
     def get_plan_questions(self):
-        already_found = set()
-        for goal in self.plans:
-            plan = self.get_plan(goal)
-            for question in self.get_questions_in_plan(plan):
-                if question not in already_found:
-                    already_found.add(question)
-                    yield question
+        return iter(self.index.plan_questions)
 
     def get_plan_goal_iterator(self):
         for goal in self.plans:
@@ -695,24 +711,36 @@ class Domain(AsJSONMixin, JSONAPIMixin):
 
         return unique(all_answers(question))
 
-    def _query_list_to_dict_indexed_by_question(self, query_list):
-        plans = {}
-        for query_info in query_list:
-            query = query_info["query"]
+    def _query_list_to_dict_indexed_by_question(self, query_list, query_loaders):
+        def check_new(query):
             if query in plans:
                 raise InvalidPlansException(f"multiple definitions for query {query}")
+
+        plans = LazyDict()
+        for query_info in query_list:
+            query = query_info["query"]
+            check_new(query)
             plans[query] = query_info
+        for query, load_query_info in query_loaders:
+            check_new(query)
+            plans.set_loader(query, load_query_info)
         return plans
 
-    def _plan_list_to_dict_indexed_by_goal(self, plan_list):
-        plans = {}
-        for plan_info in plan_list:
-            goal = plan_info["goal"]
+    def _plan_list_to_dict_indexed_by_goal(self, plan_list, plan_loaders):
+        def check_new(goal):
             if not goal.is_goal():
                 raise Exception("expected goal but found %s" % goal)
             if goal in plans:
                 raise InvalidPlansException("multiple plans for goal %s" % goal)
+
+        plans = LazyDict()
+        for plan_info in plan_list:
+            goal = plan_info["goal"]
+            check_new(goal)
             plans[goal] = plan_info
+        for goal, load_plan_info in plan_loaders:
+            check_new(goal)
+            plans.set_loader(goal, load_plan_info)
         return plans
 
     def _add_up_plan(self):
@@ -824,30 +852,19 @@ class Domain(AsJSONMixin, JSONAPIMixin):
     def get_feature_questions_for_plan_item(self, question, plan_item):
         feature_questions = []
         if question.content.is_lambda_abstracted_predicate_proposition():
-            for predicate in list(self.ontology.get_predicates().values()):
-                if predicate.is_feature_of(question.content.predicate):
-                    feature_question = self.ontology.create_wh_question(predicate.get_name())
-                    feature_questions.append(feature_question)
+            for predicate in self.ontology.get_feature_predicates(question.content.predicate.get_name()):
+                feature_question = self.ontology.create_wh_question(predicate.get_name())
+                feature_questions.append(feature_question)
         return feature_questions
 
     def is_question_in_plan(self, question, plan):
-        return question in self.get_questions_in_plan(plan)
+        return self.index.is_question_in_plan(question, plan)
 
     def get_invoke_service_action_items_for_action(self, action_name):
-        for goal in self.all_goals:
-            plan = self.get_plan(goal)
-            for item in plan:
-                if item.type_ == plan_item.TYPE_INVOKE_SERVICE_ACTION and item.get_service_action() == action_name:
-                    yield item
+        return iter(self.index.get_invoke_service_action_items_for_action(action_name))
 
     def get_names_of_user_targeted_actions(self):
-        actions = []
-        for goal in self.all_goals:
-            plan = self.get_plan(goal)
-            for item in plan:
-                if item.type_ == plan_item.TYPE_GET_DONE:
-                    actions.append(item.content.value)
-        return actions
+        return list(self.index.names_of_user_targeted_actions)
 
     def get_implications_for_domain_query(self, query):
         return self.queries[query]["implications"]
@@ -0,0 +1,229 @@
+import time
+
+from tala.model.goal import ResolveGoal
+from tala.model import plan_item
+from tala.model import speaker
+
+
+class DomainIndex(object):
+    """ Lookups over the plans of a domain that would otherwise walk every plan on every call. Each part of the index
+    is built the first time it is looked up, so that a lookup that concerns some plans only loads those plans: the
+    questions of a plan for is_question_in_plan, and the goals reachable from a goal for dominates. The other lookups
+    concern every plan. build builds all parts at once, e.g. before the domain is pickled.
+
+    The index reflects the plans of the domain at the revision it was created for, see Domain.index. The dependencies
+    and parameters of the domain are read when a part is built, and are not expected to change afterwards. """
+    def __init__(self, domain):
+        self._domain = domain
+        self._plans_revision = domain.plans.revision
+        self._build_time = 0.0
+        self._questions_in_plan_by_plan_id = {}
+        self._loaded_plans_by_plan_id = {}
+        self._loaded_plans_count = None
+        self._goals_by_question = None
+        self._plan_questions = None
+        self._plan_question_positions = None
+        self._dependents_by_question = None
+        self._plan_questions_by_predicate_name = None
+        self._invoke_service_action_items_by_action = None
+        self._names_of_user_targeted_actions = None
+        self._dominated_goals_by_goal = {}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._questions_in_plan_by_plan_id = {
+            id(plan): (plan, questions)
+            for plan, questions in state["_questions_in_plan_by_plan_id"].values()
+        }
+        self._loaded_plans_by_plan_id = {}
+        self._loaded_plans_count = None
+
+    @property
+    def plans_revision(self):
+        return self._plans_revision
+
+    @property
+    def build_time(self):
+        """ The time in seconds spent building the parts of the index that have been built so far. """
+        return self._build_time
+
+    def build(self):
+        self._ensure_plans_indexed()
+        self._ensure_dependents_indexed()
+        self._ensure_service_actions_indexed()
+        for goal in self._domain.all_goals:
+            self._dominated_goals_of(goal)
+
+    def _timed(self, build_part, *args):
+        start_time = time.perf_counter()
+        result = build_part(*args)
+        self._build_time += time.perf_counter() - start_time
+        return result
+
+    @property
+    def plan_questions(self):
+        self._ensure_plans_indexed()
+        return self._plan_questions
+
+    @property
+    def names_of_user_targeted_actions(self):
+        self._ensure_service_actions_indexed()
+        return self._names_of_user_targeted_actions
+
+    def _questions_in_plan(self, plan):
+        indexed_plan, questions = self._questions_in_plan_by_plan_id.get(id(plan), (None, None))
+        if indexed_plan is plan:
+            return questions
+        if self._is_loaded_plan_of_domain(plan):
+            return self._timed(self._index_questions_in_plan, plan)
+        return set(self._domain.get_questions_in_plan(plan))
+
+    def _is_loaded_plan_of_domain(self, plan):
+        if self._loaded_plans_count != self._domain.plans.loaded_count:
+            self._timed(self._index_loaded_plans)
+        return self._loaded_plans_by_plan_id.get(id(plan)) is plan
+
+    def _index_loaded_plans(self):
+        plans = self._domain.plans
+        for goal in plans:
+            if plans.is_loaded(goal):
+                plan = plans[goal]["plan"]
+                self._loaded_plans_by_plan_id[id(plan)] = plan
+        self._loaded_plans_count = plans.loaded_count
+
+    def _index_questions_in_plan(self, plan):
+        questions = list(self._domain.get_questions_in_plan(plan))
+        self._questions_in_plan_by_plan_id[id(plan)] = (plan, set(questions))
+        return questions
+
+    def _ensure_plans_indexed(self):
+        if self._plan_questions is None:
+            self._timed(self._index_plans)
+
+    def _index_plans(self):
+        goals_by_question = {}
+        plan_questions = []
+        plan_question_positions = {}
+        for goal in self._domain.all_goals:
+            plan = self._domain.get_plan(goal)
+            for question in self._index_questions_in_plan(plan):
+                goals_by_question.setdefault(question, []).append(goal)
+                if question not in plan_question_positions:
+                    plan_question_positions[question] = len(plan_questions)
+                    plan_questions.append(question)
+        self._goals_by_question = goals_by_question
+        self._plan_question_positions = plan_question_positions
+        self._plan_questions = plan_questions
+
+    def _ensure_service_actions_indexed(self):
+        if self._invoke_service_action_items_by_action is None:
+            self._timed(self._index_service_actions)
+
+    def _index_service_actions(self):
+        invoke_service_action_items_by_action = {}
+        names_of_user_targeted_actions = []
+        for goal in self._domain.all_goals:
+            for item in self._domain.get_plan(goal):
+                if item.type_ == plan_item.TYPE_INVOKE_SERVICE_ACTION:
+                    invoke_service_action_items_by_action.setdefault(item.get_service_action(), []).append(item)
+                if item.type_ == plan_item.TYPE_GET_DONE:
+                    names_of_user_targeted_actions.append(item.content.value)
+        self._names_of_user_targeted_actions = names_of_user_targeted_actions
+        self._invoke_service_action_items_by_action = invoke_service_action_items_by_action
+
+    def _ensure_dependents_indexed(self):
+        if self._dependents_by_question is None:
+            self._ensure_plans_indexed()
+            self._timed(self._index_dependents)
+
+    def _index_dependents(self):
+        dependents_by_question = {}
+        plan_questions_by_predicate_name = {}
+
+        def add_dependent(question, dependent):
+            dependents_by_question.setdefault(question, set()).add(dependent)
+
+        for dependent, questions in self._domain.dependencies.items():
+            for question in questions:
+                add_dependent(question, dependent)
+
+        for dependent in self._plan_questions:
+            resolve_goal = ResolveGoal(dependent, speaker.SYS)
+            if self._domain.has_goal(resolve_goal):
+                for item in self._domain.get_plan(resolve_goal):
+                    if item.type_ in plan_item.QUESTION_TYPES:
+                        add_dependent(item.content, dependent)
+            predicate_name = self._predicate_name_of(dependent)
+            if predicate_name is not None:
+                plan_questions_by_predicate_name.setdefault(predicate_name, []).append(dependent)
+        self._plan_questions_by_predicate_name = plan_questions_by_predicate_name
+        self._dependents_by_question = dependents_by_question
+
+    def _predicate_name_of(self, question):
+        try:
+            return question.content.predicate.get_name()
+        except AttributeError:
+            return None
+
+    def _feature_of_name_of(self, question):
+        try:
+            return question.content.predicate.get_feature_of_name()
+        except AttributeError:
+            return None
+
+    def _dominated_goals_of(self, supergoal):
+        try:
+            return self._dominated_goals_by_goal[supergoal]
+        except KeyError:
+            return self._timed(self._index_dominated_goals, supergoal)
+
+    def _index_dominated_goals(self, supergoal):
+        def goals_in_alt_questions_of(goal):
+            for item in self._domain.get_plan(goal):
+                if item.type_ in plan_item.QUESTION_TYPES:
+                    question = item.content
+                    if question.is_alt_question():
+                        for proposition in question.content:
+                            if proposition.is_goal_proposition():
+                                yield proposition.get_goal()
+
+        dominated_goals = set()
+        if self._domain.has_goal(supergoal):
+            goals_to_visit = [supergoal]
+            while goals_to_visit:
+                goal = goals_to_visit.pop()
+                for subgoal in goals_in_alt_questions_of(goal):
+                    if subgoal not in dominated_goals:
+                        dominated_goals.add(subgoal)
+                        if self._domain.has_goal(subgoal):
+                            goals_to_visit.append(subgoal)
+        self._dominated_goals_by_goal[supergoal] = dominated_goals
+        return dominated_goals
+
+    def goals_with_question_in_plan(self, question):
+        self._ensure_plans_indexed()
+        return self._goals_by_question.get(question, [])
+
+    def is_question_in_plan(self, question, plan):
+        return question in self._questions_in_plan(plan)
+
+    def get_dependent_question(self, question):
+        self._ensure_dependents_indexed()
+        dependents = set(self._dependents_by_question.get(question, set()))
+        feature_of_name = self._feature_of_name_of(question)
+        if feature_of_name is not None:
+            dependents.update(self._plan_questions_by_predicate_name.get(feature_of_name, []))
+        positions = [
+            self._plan_question_positions[dependent] for dependent in dependents
+            if dependent in self._plan_question_positions
+        ]
+        if positions:
+            return self._plan_questions[min(positions)]
+        return None
+
+    def get_invoke_service_action_items_for_action(self, action_name):
+        self._ensure_service_actions_indexed()
+        return self._invoke_service_action_items_by_action.get(action_name, [])
+
+    def dominates(self, supergoal, subgoal):
+        return subgoal in self._dominated_goals_of(supergoal)
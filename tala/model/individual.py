@@ -4,9 +4,10 @@ from tala.model.semantic_object import SemanticObject, OntologySpecificSemanticO
 from tala.utils.as_semantic_expression import AsSemanticExpressionMixin
 from tala.model.polarity import Polarity
 from tala.model.sort import Sort
+from tala.utils.immutable import ImmutableMixin
 
 
-class Individual(OntologySpecificSemanticObject, AsSemanticExpressionMixin):
+class Individual(ImmutableMixin, OntologySpecificSemanticObject, AsSemanticExpressionMixin):
     @classmethod
     def create_from_json_api_data(cls, individual_data, included):
         sort_entry = included.get_object_from_relationship(individual_data["relationships"]["sort"]["data"])
@@ -16,12 +17,9 @@ class Individual(OntologySpecificSemanticObject, AsSemanticExpressionMixin):
         return cls(ontology_name, value, sort)
 
     def __init__(self, ontology_name, value, sort):
-        OntologySpecificSemanticObject.__init__(self, ontology_name)
         if sort.is_string_sort():
             value = self._strip_quotes(value)
-        self.value = value
-        self.sort = sort
-        self.polarity = Polarity.POS
+        self._set_attributes(_ontology_name=ontology_name, value=value, sort=sort, polarity=Polarity.POS)
 
     def is_individual(self):
         return True
@@ -30,6 +28,8 @@ class Individual(OntologySpecificSemanticObject, AsSemanticExpressionMixin):
         return True
 
     def __eq__(self, other):
+        if self is other:
+            return True
         try:
             if other.is_positive():
                 return self.value == other.value and self.sort == other.sort
@@ -42,6 +42,9 @@ class Individual(OntologySpecificSemanticObject, AsSemanticExpressionMixin):
         return not (self == other)
 
     def __hash__(self):
+        return self._cached_hash()
+
+    def _compute_hash(self):
         return hash((self.value, self.sort))
 
     def __str__(self):
@@ -86,12 +89,9 @@ class Individual(OntologySpecificSemanticObject, AsSemanticExpressionMixin):
 
 class NegativeIndividual(Individual):
     def __init__(self, ontology_name, value, sort):
-        OntologySpecificSemanticObject.__init__(self, ontology_name)
         if sort.is_string_sort():
             value = self._strip_quotes(value)
-        self.value = value
-        self.sort = sort
-        self.polarity = Polarity.NEG
+        self._set_attributes(_ontology_name=ontology_name, value=value, sort=sort, polarity=Polarity.NEG)
 
     def negate(self):
         return Individual(self.ontology_name, self.value, self.sort)
@@ -100,6 +100,8 @@ class NegativeIndividual(Individual):
         return "~%s" % self.value
 
     def __eq__(self, other):
+        if self is other:
+            return True
         try:
             if other.is_positive():
                 return False
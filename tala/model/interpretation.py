@@ -1,7 +1,7 @@
 from tala.model.common import Modality
 from tala.model.user_move import UserMove, create
 from tala.utils.as_json import AsJSONMixin
-from tala.utils.equality import EqualityMixin
+from tala.utils.equality import FrozenEqualityMixin
 from tala.utils.unicodify import unicodify
 
 
@@ -9,7 +9,7 @@ class UnexpectedModalityException(Exception):
     pass
 
 
-class Interpretation(EqualityMixin, AsJSONMixin):
+class Interpretation(FrozenEqualityMixin, AsJSONMixin):
     @classmethod
     def from_dict(cls, json_data):
         moves = [create(move) for move in json_data.get("moves", [])]
@@ -19,7 +19,7 @@ class Interpretation(EqualityMixin, AsJSONMixin):
         return cls(moves, modality, utterance, perception_confidence)
 
     def __init__(self, moves: [UserMove], modality: str, utterance: str = None, perception_confidence: str = None):
-        self._moves = moves
+        self._moves = tuple(moves)
         if modality not in Modality.SUPPORTED_MODALITIES:
             raise UnexpectedModalityException(
                 f"Expected one of the supported modalities {Modality.SUPPORTED_MODALITIES} but got '{modality}'"
@@ -64,7 +64,7 @@ class Interpretation(EqualityMixin, AsJSONMixin):
 
     def __repr__(self):
         return (
-            f"{self.__class__.__name__}({unicodify(self._moves)}, {self._modality}, {self._utterance}, "
+            f"{self.__class__.__name__}({unicodify(list(self._moves))}, {self._modality}, {self._utterance}, "
             f"{self._perception_confidence})"
         )
 
@@ -72,7 +72,7 @@ class Interpretation(EqualityMixin, AsJSONMixin):
 class InterpretationWithoutUtterance(Interpretation):
     def __init__(self, moves: [UserMove], modality: str):
         super().__init__(moves, modality)
-        self._moves = moves
+        self._moves = tuple(moves)
         self._modality = modality
 
     def as_dict(self):
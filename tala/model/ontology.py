@@ -11,10 +11,11 @@ from tala.model.polarity import Polarity
 from tala.model.predicate import Predicate
 from tala.model.proposition import PredicateProposition
 from tala.model.question import YesNoQuestion, WhQuestion
-from tala.model.sort import DomainSort, Sort, BuiltinSortRepository
+from tala.model.sort import DOMAIN, Sort, BuiltinSortRepository
 from tala.utils.as_json import AsJSONMixin
 from tala.utils.unique import unique
 from tala.utils.json_api import JSONAPIObject, JSONAPIMixin
+from tala.utils.lru_cache import LRUCache
 
 
 class IndividualExistsException(Exception):
@@ -51,6 +52,9 @@ class DddOntology:
 
 DEFAULT_ACTIONS = {"top", "up", "how"}
 
+INTERNED_INDIVIDUALS_CACHE_SIZE = 10000
+INTERNED_PREDICATE_PROPOSITIONS_CACHE_SIZE = 10000
+
 
 class Ontology(AsJSONMixin, JSONAPIMixin):
     @classmethod
@@ -96,14 +100,19 @@ class Ontology(AsJSONMixin, JSONAPIMixin):
         self._name = name
         self._sorts = self._set_to_dict(sorts)
         self._predicates = self._set_to_dict(predicates)
-        self._individuals = individuals
-        self._original_individuals = copy.deepcopy(individuals)
+        self._individuals = dict(individuals)
         self._actions = DEFAULT_ACTIONS.union(actions)
         self._add_default_sorts()
         self._add_builtin_sorts_for_predicates()
         self._validate_individuals()
         self._validate_predicates()
         self._check_predicate_action_integrity()
+        self._index_predicates()
+        self._index_individuals_by_sort()
+        self._individuals_revision = 0
+        self._interned_individuals = LRUCache(max_size=INTERNED_INDIVIDUALS_CACHE_SIZE)
+        self._interned_predicate_propositions = LRUCache(max_size=INTERNED_PREDICATE_PROPOSITIONS_CACHE_SIZE)
+        self._start_session()
 
     def as_json_api_dict(self):
         def create_relationship_data_and_include(resource_object):
@@ -148,13 +157,72 @@ class Ontology(AsJSONMixin, JSONAPIMixin):
 
     def as_dict(self):
         json = super(Ontology, self).as_dict()
-        json["_original_individuals"] = "<skipped>"
+        json["_individuals"] = self.get_individuals()
+        del json["_predicate_sort_names"]
+        del json["_feature_predicates_by_predicate_name"]
+        del json["_feature_predicates_by_predicate_name_and_sort"]
+        del json["_individuals_by_sort_name"]
+        del json["_session_individuals"]
+        del json["_session_individuals_by_sort_name"]
+        del json["_individuals_revision"]
+        del json["_interned_individuals"]
+        del json["_interned_predicate_propositions"]
         json["semantic_object_type"] = SEMANTIC_OBJECT_TYPE
         json["_sorts"] = [sort.as_dict() for sort in self._sorts.values() if not sort.is_builtin()]
         return json
 
     def reset(self):
-        self._individuals = copy.deepcopy(self._original_individuals)
+        self._start_session()
+
+    def create_session(self):
+        """ Return an ontology that shares sorts and individuals with this one, but keeps the individuals and
+        predicates added to it, and its interned individuals and propositions, to itself. Many sessions can use the same base ontology
+        at once, each from its own thread. """
+        session = copy.copy(self)
+        session._predicates = dict(self._predicates)
+        session._index_predicates()
+        session._interned_individuals = LRUCache(max_size=INTERNED_INDIVIDUALS_CACHE_SIZE)
+        session._interned_predicate_propositions = LRUCache(max_size=INTERNED_PREDICATE_PROPOSITIONS_CACHE_SIZE)
+        session._start_session()
+        return session
+
+    def _start_session(self):
+        self._session_individuals = {}
+        self._session_individuals_by_sort_name = {}
+        self._individuals_revision += 1
+
+    @property
+    def individuals_revision(self):
+        """ A number that changes whenever the individuals of the ontology change. """
+        return self._individuals_revision
+
+    def _index_predicates(self):
+        self._predicate_sort_names = set()
+        self._feature_predicates_by_predicate_name = {}
+        self._feature_predicates_by_predicate_name_and_sort = {}
+        for predicate in self._predicates.values():
+            self._index_predicate(predicate)
+
+    def _index_predicate(self, predicate):
+        self._predicate_sort_names.add(predicate.sort.get_name())
+        feature_of_name = predicate.get_feature_of_name()
+        if feature_of_name is not None:
+            self._feature_predicates_by_predicate_name.setdefault(feature_of_name, []).append(predicate)
+            key = (feature_of_name, predicate.sort)
+            self._feature_predicates_by_predicate_name_and_sort.setdefault(key, []).append(predicate)
+
+    def _index_individuals_by_sort(self):
+        self._individuals_by_sort_name = {}
+        for name, sort in self._individuals.items():
+            self._index_individual(name, sort)
+
+    def _index_individual(self, name, sort):
+        self._individuals_by_sort_name.setdefault(sort.get_name(), {})[name] = sort
+
+    def _add_session_individual(self, name, sort):
+        self._session_individuals[name] = sort
+        self._session_individuals_by_sort_name.setdefault(sort.get_name(), {})[name] = sort
+        self._individuals_revision += 1
 
     @property
     def name(self):
@@ -166,7 +234,7 @@ class Ontology(AsJSONMixin, JSONAPIMixin):
 
     @property
     def individuals(self):
-        return self._individuals.items()
+        return self.get_individuals().items()
 
     @property
     def predicates(self):
@@ -192,11 +260,11 @@ class Ontology(AsJSONMixin, JSONAPIMixin):
             raise InvalidIndividualName("invalid individual name %r" % name)
 
     def _validate_individual_sort(self, name, sort):
-        if sort not in list(self._sorts.values()):
+        if not self._has_sort_object(sort):
             raise OntologyError("individual '%s' has unknown sort '%s' (%s)" % (name, sort.get_name(), self.__dict__))
 
     def _add_default_sorts(self):
-        self._sorts["domain"] = DomainSort()
+        self._sorts[DOMAIN] = BuiltinSortRepository.get_sort(DOMAIN)
 
     def _add_builtin_sorts_for_predicates(self):
         for predicate in list(self._predicates.values()):
@@ -209,19 +277,22 @@ class Ontology(AsJSONMixin, JSONAPIMixin):
 
     def _validate_predicates(self):
         for predicate in list(self._predicates.values()):
-            if predicate.sort not in list(self._sorts.values()):
+            if not self._has_sort_object(predicate.sort):
                 raise OntologyError(
                     "predicate '%s' has unknown sort '%s' (sorts=%s)" %
                     (predicate.get_name(), predicate.sort, self._sorts)
                 )
 
         for name in self._predicates.keys():
-            if name in self._sorts.keys():
+            if name in self._sorts:
                 raise AmbiguousNamesException(
                     f"Expected predicate and sort names to be unique but there is both a predicate and sort named "
                     f"'{name}' in ontology '{self.name}'"
                 )
 
+    def _has_sort_object(self, sort):
+        return sort.get_name() in self._sorts and self._sorts[sort.get_name()] == sort
+
     def _check_predicate_action_integrity(self):
         for action in self._actions:
             if action in self._predicates:
@@ -240,34 +311,43 @@ class Ontology(AsJSONMixin, JSONAPIMixin):
 
     @property
     def individuals_as_objects(self):
-        return [Individual(self.name, value, sort) for value, sort in self._individuals.items()]
+        return [Individual(self.name, value, sort) for value, sort in self.individuals]
 
     def get_individuals(self):
-        return self._individuals
+        if not self._session_individuals:
+            return self._individuals
+        return {**self._individuals, **self._session_individuals}
 
     def get_individuals_of_sort(self, expected_sort):
-        return [individual for individual, sort in list(self._individuals.items()) if sort.get_name() == expected_sort]
+        individuals = list(self._individuals_by_sort_name.get(expected_sort, {}))
+        individuals.extend(self._session_individuals_by_sort_name.get(expected_sort, {}))
+        return individuals
+
+    def has_individual(self, name):
+        return name in self._individuals or name in self._session_individuals
 
     def add_individual(self, name, sort_as_string):
-        if name in list(self._individuals.keys()):
+        if self.has_individual(name):
             raise IndividualExistsException("invididual %r already exists" % name)
         self._validate_name_and_add_individual(name, sort_as_string)
 
     def add_predicate(self, name, sort_as_string):
-        if name in list(self._predicates.keys()):
+        if name in self._predicates:
             raise OntologyError(f"predicate '{name}' already exists")
         if self.has_sort(sort_as_string):
             sort = self.get_sort(sort_as_string)
         else:
             sort = BuiltinSortRepository.get_sort(sort_as_string)
-        self._predicates[name] = Predicate(self.name, name, sort)
+        predicate = Predicate(self.name, name, sort)
+        self._predicates[name] = predicate
+        self._index_predicate(predicate)
 
     def _validate_name_and_add_individual(self, name, sort_as_string):
         self._validate_individual_name(name)
-        self._individuals[name] = self.get_sort(sort_as_string)
+        self._add_session_individual(name, self.get_sort(sort_as_string))
 
     def ensure_individual_exists(self, name, sort_as_string):
-        if name not in list(self._individuals.keys()):
+        if not self.has_individual(name):
             self._validate_name_and_add_individual(name, sort_as_string)
 
     def get_name(self):
@@ -291,14 +371,24 @@ class Ontology(AsJSONMixin, JSONAPIMixin):
                 f"The predicate '{name}' is not known in ontology '{self}'. Known predicates: {[key for key in self._predicates.keys()]}. Missing predicate definition:\n  {template}"
             )
 
+    def get_feature_predicates(self, predicate_name):
+        return self._feature_predicates_by_predicate_name.get(predicate_name, [])
+
+    def get_feature_predicates_of_sort(self, predicate_name, sort):
+        return self._feature_predicates_by_predicate_name_and_sort.get((predicate_name, sort), [])
+
     def has_predicate(self, name):
-        return name in list(self._predicates.keys())
+        return name in self._predicates
 
     def has_sort(self, name):
-        return name in list(self._sorts.keys())
+        return name in self._sorts
 
     def is_predicate(self, object_):
-        return object_ in list(self._predicates.values())
+        try:
+            name = object_.get_name()
+        except AttributeError:
+            return False
+        return name in self._predicates and self._predicates[name] == object_
 
     def isPredicate(self, object_):
         warnings.warn(
@@ -328,16 +418,18 @@ class Ontology(AsJSONMixin, JSONAPIMixin):
         return sort
 
     def _individual_is_of_enumerated_sort(self, value):
-        return value in self._individuals
+        return self.has_individual(value)
 
     def _get_enumerated_individual_sort(self, value):
         try:
+            if value in self._session_individuals:
+                return self._session_individuals[value]
             return self._individuals[value]
         except KeyError:
             raise OntologyError("failed to get sort of unknown individual: " + str(value))
 
     def predicates_contain_sort(self, name):
-        return name in [sort.get_name() for sort in self.predicate_sorts]
+        return name in self._predicate_sort_names
 
     @property
     def predicate_sorts(self):
@@ -361,7 +453,18 @@ class Ontology(AsJSONMixin, JSONAPIMixin):
             sort = self.individual_sort(value)
 
         value = self._normalize_and_assert_valid_individual_value(value, sort)
-        return Individual(self.name, value, sort)
+        return self._interned_individual(Individual, value, sort)
+
+    def _interned_individual(self, individual_class, value, sort):
+        key = (individual_class, type(value), value, sort)
+        try:
+            individual = self._interned_individuals.get(key)
+        except TypeError:
+            return individual_class(self.name, value, sort)
+        if individual is None:
+            individual = individual_class(self.name, value, sort)
+            self._interned_individuals[key] = individual
+        return individual
 
     def _normalize_and_assert_valid_individual_value(self, value, sort):
         if sort.is_dynamic():
@@ -391,7 +494,7 @@ class Ontology(AsJSONMixin, JSONAPIMixin):
             sort = self.individual_sort(value)
         except OntologyError:
             raise OntologyError("failed to create negative individual with unknown value: %r" % value)
-        return NegativeIndividual(self.name, value, sort)
+        return self._interned_individual(NegativeIndividual, value, sort)
 
     def create_yes_no_question(self, predicate_name, individual_value):
         predicate = self.get_predicate(predicate_name)
@@ -405,5 +508,14 @@ class Ontology(AsJSONMixin, JSONAPIMixin):
         return WhQuestion(lambda_abstracted_prop)
 
     def create_predicate_proposition(self, predicate, individual, polarity=Polarity.POS):
-        proposition = PredicateProposition(predicate, individual, polarity)
+        key = (predicate, predicate.ontology_name, polarity)
+        if individual is not None:
+            key += (individual, individual.ontology_name, type(individual.value))
+        try:
+            proposition = self._interned_predicate_propositions.get(key)
+        except TypeError:
+            return PredicateProposition(predicate, individual, polarity)
+        if proposition is None:
+            proposition = PredicateProposition(predicate, individual, polarity)
+            self._interned_predicate_propositions[key] = proposition
         return proposition
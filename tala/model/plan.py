@@ -181,7 +181,7 @@ class Plan(Stack, SemanticObject):
             elif item.type_ == plan_item.TYPE_IF_THEN_ELSE:
                 self.remove_nested(item_to_remove, item)
         for item in items_to_remove:
-            self.content.remove(item)
+            Stack.remove(self, item)
 
     def remove_nested(self, to_remove, item):
         if to_remove in item.consequent:
@@ -199,10 +199,10 @@ class Plan(Stack, SemanticObject):
                 yield question
 
     def __str__(self):
-        return "Plan(%s)" % self.content
+        return "Plan(%s)" % list(self.content)
 
     def __repr__(self):
-        return "%s%s" % (self.__class__.__name__, (self.content))
+        return "%s%s" % (self.__class__.__name__, list(self.content))
 
 
 class InvalidPlansException(Exception):
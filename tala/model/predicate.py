@@ -1,9 +1,10 @@
 from tala.model.semantic_object import OntologySpecificSemanticObject
 from tala.model.sort import Sort
 from tala.utils.as_semantic_expression import AsSemanticExpressionMixin
+from tala.utils.immutable import ImmutableMixin
 
 
-class Predicate(OntologySpecificSemanticObject, AsSemanticExpressionMixin):
+class Predicate(ImmutableMixin, OntologySpecificSemanticObject, AsSemanticExpressionMixin):
     @classmethod
     def create_from_json_api_data(cls, predicate_entry, included):
         sort_entry = included.get_object_from_relationship(predicate_entry["relationships"]["sort"]["data"])
@@ -15,11 +16,13 @@ class Predicate(OntologySpecificSemanticObject, AsSemanticExpressionMixin):
         return cls(ontology_name, name, sort, feature_of_name, multiple_instances)
 
     def __init__(self, ontology_name, name, sort, feature_of_name=None, multiple_instances=False):
-        OntologySpecificSemanticObject.__init__(self, ontology_name)
-        self.name = name
-        self.sort = sort
-        self.feature_of_name = feature_of_name
-        self._multiple_instances = multiple_instances
+        self._set_attributes(
+            _ontology_name=ontology_name,
+            name=name,
+            sort=sort,
+            feature_of_name=feature_of_name,
+            _multiple_instances=multiple_instances
+        )
 
     def get_name(self):
         return self.name
@@ -49,6 +52,8 @@ class Predicate(OntologySpecificSemanticObject, AsSemanticExpressionMixin):
         return ["sort"]
 
     def __eq__(self, other):
+        if self is other:
+            return True
         try:
             return other.get_name() == self.get_name() \
                 and other.sort == self.sort \
@@ -64,6 +69,9 @@ class Predicate(OntologySpecificSemanticObject, AsSemanticExpressionMixin):
         return not (self == other)
 
     def __hash__(self):
+        return self._cached_hash()
+
+    def _compute_hash(self):
         return hash((self.name, self.sort, self.feature_of_name, self._multiple_instances))
 
     def __str__(self):
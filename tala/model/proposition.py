@@ -9,6 +9,7 @@ from tala.model.predicate import Predicate
 from tala.model.individual import Individual
 from tala.model.semantic_object import SemanticObject, OntologySpecificSemanticObject, SemanticObjectWithContent
 from tala.utils.as_semantic_expression import AsSemanticExpressionMixin
+from tala.utils.immutable import ImmutableMixin
 from tala.utils.unicodify import unicodify
 from tala.utils.json_api import JSONAPIObject
 
@@ -281,7 +282,7 @@ class QuitProposition(ControlProposition):
         Proposition.__init__(self, Proposition.QUIT)
 
 
-class PredicateProposition(PropositionWithSemanticContent):
+class PredicateProposition(ImmutableMixin, PropositionWithSemanticContent):
     @classmethod
     def create_from_json_api_data(cls, proposition_data, included):
         predicate_entry = included.get_object_from_relationship(proposition_data["relationships"]["predicate"]["data"])
@@ -301,13 +302,22 @@ class PredicateProposition(PropositionWithSemanticContent):
     def __init__(self, predicate, individual=None, polarity=None, predicted=False):
         if polarity is None:
             polarity = Polarity.POS
-        PropositionWithSemanticContent.__init__(self, Proposition.PREDICATE, predicate, polarity=polarity)
-        self.predicate = predicate
-        self.individual = individual
-        self._predicted = predicted
         if individual is not None and individual.sort != predicate.sort:
             raise OntologyError(("Sortal mismatch between predicate %s " + "(sort %s) and individual %s (sort %s)") %
                                 (predicate, predicate.sort, individual, individual.sort))
+        self._set_attributes(
+            _type=Proposition.PREDICATE,
+            _polarity=polarity,
+            _predicted=predicted,
+            _confidence_estimates=None,
+            _content=predicate,
+            predicate=predicate,
+            individual=individual
+        )
+
+    def negate(self):
+        polarity = Polarity.NEG if self.is_positive() else Polarity.POS
+        return PredicateProposition(self.predicate, self.individual, polarity, self._predicted)
 
     def as_move(self):
         if self.individual is None:
@@ -346,6 +356,8 @@ class PredicateProposition(PropositionWithSemanticContent):
         return (answer.is_predicate_proposition() and answer.predicate.is_feature_of(self.predicate))
 
     def __eq__(self, other):
+        if self is other:
+            return True
         try:
             return other is not None and other.is_proposition() and other.is_predicate_proposition(
             ) and self.predicate == other.predicate and self.individual == other.individual and self.polarity == other.polarity
@@ -362,6 +374,9 @@ class PredicateProposition(PropositionWithSemanticContent):
             return f"{self.polarity_prefix}{self.predicate}({self.individual})"
 
     def __hash__(self):
+        return self._cached_hash()
+
+    def _compute_hash(self):
         return hash((self.predicate, self.individual, self.polarity))
 
     def __repr__(self):
@@ -796,6 +811,8 @@ class RejectedPropositions(PropositionWithSemanticContent):
 
 
 class PropositionSet(Proposition):
+    __slots__ = ("_hash", )
+
     @classmethod
     def create_from_json_api_data(cls, data, included):
         if data["relationships"]:
@@ -809,7 +826,6 @@ class PropositionSet(Proposition):
 
     def __init__(self, propositions, polarity=Polarity.POS):
         self._propositions = propositions
-        self._hash = hash(frozenset(propositions))
         Proposition.__init__(self, Proposition.PROPOSITION_SET, polarity)
 
     def is_proposition_set(self):
@@ -819,7 +835,15 @@ class PropositionSet(Proposition):
         return self.propositions.__iter__()
 
     def __hash__(self):
-        return self._hash
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(frozenset(self._propositions))
+            return self._hash
+
+    def __getstate__(self):
+        """ Leaves out the cached hash, since hashes of strings differ between processes. """
+        return self.__dict__
 
     @property
     def propositions(self):
@@ -1,3 +1,5 @@
+import threading
+
 from tala.model.domain import DomainError
 from tala.model.individual import Individual
 from tala.model.lambda_abstraction import LambdaAbstractedPredicateProposition, \
@@ -7,6 +9,7 @@ from tala.model.polarity import Polarity
 from tala.model.proposition import Proposition, PredicateProposition, GoalProposition, PropositionSet, \
     PreconfirmationProposition, UnderstandingProposition, KnowledgePreconditionProposition
 from tala.model.question import KnowledgePreconditionQuestion, ConsequentQuestion
+from tala.utils.lru_cache import LRUCache
 
 
 class UnknownObjectClassException(Exception):
@@ -22,14 +25,31 @@ class InvalidSemanticObjectException(Exception):
 
 
 class SemanticLogic:
-    def __init__(self, ddd_manager):
+    def __init__(self, ddd_manager, cache_size=None):
+        """ With a cache_size, the results of is_relevant, are_combinable and resolves are memoized in a cache of
+        at most that many entries. Each result is kept with the ontologies that were consulted to compute it, and
+        is only reused while the DDD manager still has those ontologies and their individuals have not changed.
+        Results of combine are not memoized, since they can be the very answer object that was passed in.
+
+        The ontologies consulted by the computation in progress are tracked per thread, so that one instance can be
+        used from several threads at once. """
         self._ddd_manager = ddd_manager
+        self._cache = None if cache_size is None else LRUCache(max_size=cache_size)
+        self._hits = 0
+        self._misses = 0
+        self._memoization = threading.local()
 
     def is_relevant(self, semantic_object, other_semantic_object):
+        return self._memoized("is_relevant", self._is_relevant, semantic_object, other_semantic_object)
+
+    def _is_relevant(self, semantic_object, other_semantic_object):
         logic_object = self.from_semantic_object(semantic_object)
         return logic_object.relevant(other_semantic_object)
 
     def are_combinable(self, semantic_object, other_semantic_object):
+        return self._memoized("are_combinable", self._are_combinable, semantic_object, other_semantic_object)
+
+    def _are_combinable(self, semantic_object, other_semantic_object):
         logic_object = self.from_semantic_object(semantic_object)
         return logic_object.is_combinable_with(other_semantic_object)
 
@@ -38,9 +58,59 @@ class SemanticLogic:
         return logic_object.combine_with(other_semantic_object)
 
     def resolves(self, semantic_object, other_semantic_object):
+        return self._memoized("resolves", self._resolves, semantic_object, other_semantic_object)
+
+    def _resolves(self, semantic_object, other_semantic_object):
         logic_object = self.from_semantic_object(semantic_object)
         return logic_object.is_resolved_by(other_semantic_object)
 
+    def _memoized(self, operation, compute, semantic_object, other_semantic_object):
+        if self._cache is None:
+            return compute(semantic_object, other_semantic_object)
+        key = (operation, type(semantic_object), semantic_object, type(other_semantic_object), other_semantic_object)
+        try:
+            entry = self._cache.get(key)
+        except TypeError:
+            return compute(semantic_object, other_semantic_object)
+        outer_consulted_ontologies = self._current_consulted_ontologies()
+        if entry is not None:
+            result, consulted_ontologies = entry
+            if self._are_unchanged(consulted_ontologies):
+                self._hits += 1
+                if outer_consulted_ontologies is not None:
+                    outer_consulted_ontologies.extend(consulted_ontologies)
+                return result
+        self._misses += 1
+        consulted_ontologies = []
+        self._memoization.consulted_ontologies = consulted_ontologies
+        try:
+            result = compute(semantic_object, other_semantic_object)
+        finally:
+            self._memoization.consulted_ontologies = outer_consulted_ontologies
+        if outer_consulted_ontologies is not None:
+            outer_consulted_ontologies.extend(consulted_ontologies)
+        self._cache[key] = (result, tuple(consulted_ontologies))
+        return result
+
+    def _current_consulted_ontologies(self):
+        return getattr(self._memoization, "consulted_ontologies", None)
+
+    def _are_unchanged(self, consulted_ontologies):
+        ontologies = self._ddd_manager.ontologies
+        for name, ontology, revision in consulted_ontologies:
+            if ontologies.get(name) is not ontology or ontology.individuals_revision != revision:
+                return False
+        return True
+
+    def cache_stats(self):
+        if self._cache is None:
+            return None
+        return dict(self._cache.stats(), hits=self._hits, misses=self._misses)
+
+    def clear_cache(self):
+        if self._cache is not None:
+            self._cache.clear()
+
     def from_semantic_object(self, semantic_object):
         if semantic_object.is_lambda_abstracted_predicate_proposition():
             ontology = self._ontology_of_semantic_object(semantic_object)
@@ -71,6 +141,9 @@ class SemanticLogic:
     def _ontology_of_semantic_object(self, semantic_object):
         if semantic_object.is_ontology_specific():
             ontology = self._ddd_manager.get_ontology(semantic_object.ontology_name)
+            consulted_ontologies = self._current_consulted_ontologies()
+            if consulted_ontologies is not None:
+                consulted_ontologies.append((semantic_object.ontology_name, ontology, ontology.individuals_revision))
             return ontology
         raise InvalidSemanticObjectException("Semantic object %s does not belong to an ontology" % semantic_object)
 
@@ -115,10 +188,10 @@ class LambdaAbstractedPredicatePropositionLogic(SemanticObjectAndOntologySpecifi
         return self.is_combinable_with(answer) or is_relevant_individual or is_relevant_predicate_proposition
 
     def _relevant_feature_for_individual(self, individual):
-        for predicate in list(self._ontology.get_predicates().values()):
-            if predicate.is_feature_of(self._semantic_object.predicate)\
-               and predicate.sort == individual.sort:
-                return predicate
+        predicate_name = self._semantic_object.predicate.get_name()
+        feature_predicates = self._ontology.get_feature_predicates_of_sort(predicate_name, individual.sort)
+        if feature_predicates:
+            return feature_predicates[0]
 
     def is_combinable_with(self, answer):
         try:
@@ -223,12 +296,10 @@ class PredicatePropositionLogic(PropositionLogic, SemanticObjectAndOntologySpeci
         )
 
     def _has_feature_combinable_with(self, answer):
-        return (
-            answer.is_individual() and any([
-                predicate for predicate in list(self._ontology.get_predicates().values())
-                if predicate.is_feature_of(self._semantic_object.predicate) and predicate.sort == answer.sort
-            ])
-        )
+        if not answer.is_individual():
+            return False
+        predicate_name = self._semantic_object.predicate.get_name()
+        return bool(self._ontology.get_feature_predicates_of_sort(predicate_name, answer.sort))
 
     def is_combinable_with(self, answer):
         if answer.is_yes() or answer.is_no():
@@ -2,26 +2,65 @@ import warnings
 
 from tala.utils.as_json import AsJSONMixin
 from tala.utils.as_semantic_expression import AsSemanticExpressionMixin
+from tala.utils.immutable import ImmutableMixin
+
+IMMUTABLE_TYPES = (str, int, float, ImmutableMixin)
+
+
+class UnhashableElement:
+    """ Stands in for an unhashable element among the keys of a Set. It is hashed by identity, so unhashable elements
+    are found by comparing them for equality one by one. """
+    def __init__(self, element):
+        self.element = element
 
 
 class Set(AsSemanticExpressionMixin, AsJSONMixin):
+    """ An insertion ordered set. Elements are looked up by hash. Since the hash of a mutable element changes if the
+    element is changed after it was added, mutable and unhashable elements are also looked up by comparing them for
+    equality one by one, when the hash lookup misses. Elements of IMMUTABLE_TYPES are only looked up by hash.
+    content is a read-only tuple of the elements. Iterating over the set does not copy it, so the set must not be
+    changed while it is iterated over. """
     def __init__(self, content=None):
         if content is None:
             content = []
         super(Set, self).__init__()
-        self.content = []
+        self._elements = {}
+        self._keys_compared_by_equality = []
         for x in content:
             self.add(x)
 
+    @property
+    def content(self):
+        return tuple(self._elements.values())
+
+    def _key_of(self, element):
+        try:
+            if element in self._elements:
+                return element
+        except TypeError:
+            pass
+        for key in self._keys_compared_by_equality:
+            if self._element_of(key) == element:
+                return key
+        return None
+
+    def _element_of(self, key):
+        if isinstance(key, UnhashableElement):
+            return key.element
+        return key
+
+    def __contains__(self, element):
+        return self._key_of(element) is not None
+
     def __str__(self):
         return "{" + ", ".join(map(str, self.content)) + "}"
 
     def __repr__(self):
-        return "%s(%s)" % (self.__class__.__name__, self.content)
+        return "%s(%s)" % (self.__class__.__name__, list(self))
 
     def as_dict(self):
         return {
-            "set": self.content,
+            "set": list(self),
         }
 
     def __eq__(self, other):
@@ -33,28 +72,48 @@ class Set(AsSemanticExpressionMixin, AsJSONMixin):
         except TypeError:
             return False
 
-    def __hash__(self):
-        return hash(self.__class__.__name__) + hash(self.content)
-
     def add(self, element):
-        if element not in self.content:
-            self.content.append(element)
+        if element in self:
+            return
+        try:
+            self._elements[element] = element
+            key = element
+        except TypeError:
+            key = UnhashableElement(element)
+            self._elements[key] = element
+        if not isinstance(element, IMMUTABLE_TYPES):
+            self._keys_compared_by_equality.append(key)
 
     def remove(self, element):
-        self.content.remove(element)
+        key = self._key_of(element)
+        if key is None:
+            raise ValueError(f"{element!r} not in {self!r}")
+        try:
+            stored_element = self._elements.pop(key)
+        except KeyError:
+            stored_element = self._element_of(key)
+            self._elements = {
+                other_key: other_element
+                for other_key, other_element in self._elements.items() if other_element is not stored_element
+            }
+        if not isinstance(stored_element, IMMUTABLE_TYPES):
+            self._keys_compared_by_equality = [
+                other_key for other_key in self._keys_compared_by_equality
+                if self._element_of(other_key) is not stored_element
+            ]
 
     def remove_if_exists(self, element):
-        if element in self.content:
+        if element in self:
             self.remove(element)
 
     def is_subset_of(self, other):
-        for item in self.content:
+        for item in self:
             if item not in other:
                 return False
         return True
 
     def __len__(self):
-        return len(self.content)
+        return len(self._elements)
 
     def is_empty(self):
         return len(self) == 0
@@ -64,10 +123,11 @@ class Set(AsSemanticExpressionMixin, AsJSONMixin):
         return self.is_empty()
 
     def clear(self):
-        self.content = []
+        self._elements = {}
+        self._keys_compared_by_equality = []
 
     def __iter__(self):
-        return self.content.__iter__()
+        return iter(self._elements.values())
 
     def union(self, other):
         union_set = Set()
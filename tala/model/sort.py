@@ -9,6 +9,7 @@ from tala.model.semantic_object import OntologySpecificSemanticObject, SemanticO
 from tala.model.image import Image
 from tala.model.webview import Webview
 from tala.model.date_time import DateTime
+from tala.utils.immutable import ImmutableMixin
 
 BOOLEAN = "boolean"
 INTEGER = "integer"
@@ -23,7 +24,7 @@ PERSON_NAME = "person_name"
 BUILTIN_SORTS = [BOOLEAN, INTEGER, DATETIME, REAL, STRING, IMAGE, DOMAIN, WEBVIEW, PERSON_NAME]
 
 
-class Sort(SemanticObject):
+class Sort(ImmutableMixin, SemanticObject):
     @classmethod
     def create_from_json_api_data(cls, sort_entry, included):
         if sort_entry["type"].endswith("CustomSort"):
@@ -32,8 +33,7 @@ class Sort(SemanticObject):
             return create_builtin_sort(sort_entry["id"])
 
     def __init__(self, name, dynamic=False):
-        self._name = name
-        self._dynamic = dynamic
+        self._set_attributes(_name=name, _dynamic=dynamic)
 
     def get_name(self):
         return self._name
@@ -86,12 +86,17 @@ class Sort(SemanticObject):
         return "%s%s" % (self.__class__.__name__, (self._name, self._dynamic))
 
     def __eq__(self, other):
+        if self is other:
+            return True
         try:
             return (other.get_name() == self.get_name() and other.is_dynamic() == self.is_dynamic())
         except AttributeError:
             return False
 
     def __hash__(self):
+        return self._cached_hash()
+
+    def _compute_hash(self):
         return hash((self.get_name(), self.is_dynamic()))
 
     def value_as_basic_type(self, value):
@@ -106,21 +111,21 @@ class Sort(SemanticObject):
     @classmethod
     def from_value(cls, value):
         if cls._is_float_value(value):
-            return RealSort()
+            return BuiltinSortRepository.get_sort(REAL)
         if cls._is_boolean_value(value):
-            return BooleanSort()
+            return BuiltinSortRepository.get_sort(BOOLEAN)
         if cls._is_integer_value(value):
-            return IntegerSort()
+            return BuiltinSortRepository.get_sort(INTEGER)
         if isinstance(value, Image):
-            return ImageSort()
+            return BuiltinSortRepository.get_sort(IMAGE)
         if isinstance(value, Webview):
-            return WebviewSort()
+            return BuiltinSortRepository.get_sort(WEBVIEW)
         if cls._is_string_value(value):
-            return StringSort()
+            return BuiltinSortRepository.get_sort(STRING)
         if isinstance(value, DateTime):
-            return DateTimeSort()
+            return BuiltinSortRepository.get_sort(DATETIME)
         if isinstance(value, PersonName):
-            return PersonNameSort()
+            return BuiltinSortRepository.get_sort(PERSON_NAME)
         raise UnsupportedValue("Expected a supported value but got '%s'" % value)
 
     @classmethod
@@ -134,7 +139,7 @@ class Sort(SemanticObject):
     @classmethod
     def _is_boolean_value(cls, value):
         try:
-            BooleanSort().normalize_value(value)
+            BuiltinSortRepository.get_sort(BOOLEAN).normalize_value(value)
         except InvalidValueException:
             return False
         return True
@@ -142,7 +147,7 @@ class Sort(SemanticObject):
     @classmethod
     def _is_string_value(cls, value):
         try:
-            StringSort().normalize_value(value)
+            BuiltinSortRepository.get_sort(STRING).normalize_value(value)
         except InvalidValueException:
             return False
         return True
@@ -167,25 +172,8 @@ class Sort(SemanticObject):
 
 
 def create_builtin_sort(sort_name):
-    if sort_name in BUILTIN_SORTS:
-        if sort_name == DATETIME:
-            return DateTimeSort()
-        if sort_name == REAL:
-            return RealSort()
-        if sort_name == PERSON_NAME:
-            return PersonNameSort()
-        if sort_name == INTEGER:
-            return IntegerSort()
-        if sort_name == BOOLEAN:
-            return BooleanSort()
-        if sort_name == STRING:
-            return StringSort()
-        if sort_name == DOMAIN:
-            return DomainSort()
-        if sort_name == IMAGE:
-            return ImageSort()
-        if sort_name == WEBVIEW:
-            return WebviewSort()
+    if BuiltinSortRepository.has_sort(sort_name):
+        return BuiltinSortRepository.get_sort(sort_name)
     raise BuiltinSortException(f"sort {sort_name} is not a built-in sort.")
 
 
@@ -374,16 +362,21 @@ class CustomSort(Sort, OntologySpecificSemanticObject):
 
     def __init__(self, ontology_name, name, dynamic=False):
         Sort.__init__(self, name, dynamic=dynamic)
-        OntologySpecificSemanticObject.__init__(self, ontology_name)
+        self._set_attributes(_ontology_name=ontology_name)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         try:
             return (Sort.__eq__(self, other) and self.ontology_name == other.ontology_name)
         except AttributeError:
             return False
 
     def __hash__(self):
-        return hash((self.ontology_name, Sort.__hash__(self)))
+        return self._cached_hash()
+
+    def _compute_hash(self):
+        return hash((self.ontology_name, Sort._compute_hash(self)))
 
 
 class BuiltinSortRepository(object):
@@ -9,40 +9,44 @@ class StackError(Exception):
 
 
 class Stack(AsJSONMixin):
+    """ A stack whose elements are stored bottom first, so that the top can be pushed and popped in constant time.
+    content and iteration are top first. content is a read-only tuple of the elements. Iterating over the stack does
+    not copy it, so the stack must not be changed while it is iterated over. """
     def __init__(self, content=None):
         if content is None:
             content = []
         super(Stack, self).__init__()
-        self.content = list()
+        self._elements = list()
         for x in content:
             self.push(x)
 
+    @property
+    def content(self):
+        return tuple(reversed(self._elements))
+
     def as_dict(self):
         return {
-            "stack": self.content,
+            "stack": list(self.content),
         }
 
     def __repr__(self):
-        return "{name}(content={content})".format(name=self.__class__.__name__, content=self.content)
+        return "{name}(content={content})".format(name=self.__class__.__name__, content=list(self.content))
 
     def __str__(self):
-        string = "Stack(" + unicodify(self.content) + ")"
+        string = "Stack(" + unicodify(list(self.content)) + ")"
         return string
 
     def __eq__(self, other):
         try:
-            return self.content == other.content
+            return self.content == tuple(other.content)
         except AttributeError:
             return False
 
-    def __hash__(self):
-        return hash(self.__class__.__name__) + hash(self.content)
-
     def __ne__(self, other):
         return not (self == other)
 
     def push(self, element):
-        self.content.insert(0, element)
+        self._elements.append(element)
 
     def push_stack(self, other_stack):
         other_stack_elements = list(other_stack)
@@ -53,7 +57,7 @@ class Stack(AsJSONMixin):
     def top(self):
         if len(self) < 1:
             raise StackError("Cannot call 'top()' when stacksize <= 0")
-        return self.content[0]
+        return self._elements[-1]
 
     def is_top(self, element):
         try:
@@ -68,10 +72,10 @@ class Stack(AsJSONMixin):
     def pop(self):
         if len(self) < 1:
             raise StackError("Cannot call 'pop()' when stacksize <= 0")
-        return self.content.pop(0)
+        return self._elements.pop()
 
     def __len__(self):
-        return len(self.content)
+        return len(self._elements)
 
     def isEmpty(self):
         warnings.warn("Stack.isEmpty() is deprecated. Use Stack.is_empty() instead.", DeprecationWarning, stacklevel=2)
@@ -81,37 +85,76 @@ class Stack(AsJSONMixin):
         return len(self) == 0
 
     def clear(self):
-        self.content = list()
+        self._elements = list()
 
     def remove(self, element):
-        self.content.remove(element)
+        for index in range(len(self._elements) - 1, -1, -1):
+            if self._elements[index] == element:
+                del self._elements[index]
+                return
+        raise ValueError(f"{element!r} not in {self!r}")
+
+    def __contains__(self, element):
+        return element in self._elements
 
     def __iter__(self):
-        return self.content.__iter__()
+        return reversed(self._elements)
 
 
 class StackSet(Stack):
+    """ A stack without duplicates. Pushing an element that is already on the stack moves it to the top. Membership of
+    hashable elements is looked up by hash. """
     def __init__(self, content=None):
         if content is None:
             content = []
+        self._hashable_members = {}
         super().__init__(content)
 
     def as_dict(self):
         return {
-            "stackset": self.content,
+            "stackset": list(self.content),
         }
 
     def __str__(self):
-        string = "stackset(" + unicodify(self.content) + ")"
+        string = "stackset(" + unicodify(list(self.content)) + ")"
         return string
 
     def push(self, element):
-        if element in self.content:
-            self.content.remove(element)
-        self.content.insert(0, element)
+        if element in self:
+            self.remove(element)
+        super().push(element)
+        try:
+            self._hashable_members[element] = None
+        except TypeError:
+            pass
+
+    def pop(self):
+        element = super().pop()
+        self._forget(element)
+        return element
+
+    def remove(self, element):
+        super().remove(element)
+        self._forget(element)
+
+    def _forget(self, element):
+        try:
+            self._hashable_members.pop(element, None)
+        except TypeError:
+            pass
+
+    def clear(self):
+        super().clear()
+        self._hashable_members = {}
+
+    def __contains__(self, element):
+        try:
+            return element in self._hashable_members
+        except TypeError:
+            return super().__contains__(element)
 
     def remove_if_exists(self, element):
-        if element in self.content:
+        if element in self:
             self.remove(element)
 
     def create_view(self, philter):
@@ -1,9 +1,13 @@
 import unittest
 
 from tala.model.commitments import Commitments
-from tala.model.proposition import ActionStatusProposition
+from tala.model.individual import Individual
+from tala.model.polarity import Polarity
+from tala.model.predicate import Predicate
+from tala.model.proposition import ActionStatusProposition, PredicateProposition
 from tala.model.action_status import Done
 from tala.model.action import Action
+from tala.model.sort import CustomSort
 
 
 class CommitmentsTests(unittest.TestCase):
@@ -285,3 +289,37 @@ class CommitmentsTests(unittest.TestCase):
 
     def then_no_exceptions_are_raised(self):
         self.assertTrue(True)
+
+    def test_proposition_replaces_other_individual_of_same_predicate(self):
+        self.given_a_commitment(self._proposition("city", "paris"))
+        self.given_a_commitment(self._proposition("destination", "london"))
+        self.given_a_commitment(self._proposition("city", "london"))
+        self.then_commitments_are([self._proposition("destination", "london"), self._proposition("city", "london")])
+
+    def _proposition(self, predicate_name, individual_name, polarity=Polarity.POS, feature_of_name=None):
+        sort = CustomSort("some_ontology", "city", dynamic=True)
+        predicate = Predicate("some_ontology", predicate_name, sort, feature_of_name)
+        individual = Individual("some_ontology", individual_name, sort) if individual_name else None
+        return PredicateProposition(predicate, individual, polarity)
+
+    def then_commitments_are(self, expected):
+        self.assertEqual(expected, list(self.commitments))
+
+    def test_negative_proposition_removes_its_features(self):
+        self.given_a_commitment(self._proposition("city_area", "centre", feature_of_name="city"))
+        self.given_a_commitment(self._proposition("destination", "london"))
+        self.given_a_commitment(self._proposition("city", "paris", Polarity.NEG))
+        self.then_commitments_are([
+            self._proposition("destination", "london"),
+            self._proposition("city", "paris", Polarity.NEG)
+        ])
+        self.then_previous_commitments_are([self._proposition("city_area", "centre", feature_of_name="city")])
+
+    def then_previous_commitments_are(self, expected):
+        self.assertEqual(expected, list(self.commitments.pcom))
+
+    def test_removed_commitment_is_no_longer_incompatible(self):
+        self.given_a_commitment(self._proposition("city", "paris"))
+        self.given_commitment_was_removed(self._proposition("city", "paris"))
+        self.given_a_commitment(self._proposition("city", "london"))
+        self.then_commitments_are([self._proposition("city", "london")])
@@ -1,4 +1,6 @@
 import copy
+import pickle
+from unittest.mock import patch
 
 from tala.model.ask_feature import AskFeature
 from tala.model.domain import Domain
@@ -14,6 +16,7 @@ from tala.model.proposition import PredicateProposition, GoalProposition, Propos
 from tala.model.question import WhQuestion, AltQuestion, KnowledgePreconditionQuestion
 from tala.model.sort import CustomSort, RealSort
 from tala.testing.lib_test_case import LibTestCase
+from tala.utils.json_api import IncludedObject
 from tala.ddd.json_parser import JSONDomainParser
 
 
@@ -341,6 +344,59 @@ class DomainTests(LibTestCase):
         actual_goals = {goal for goal in self.domain.get_plan_goal_iterator()}
         self.assertEqual(expected_goals, actual_goals)
 
+    def test_plans_from_json_api_data_are_created_on_lookup(self):
+        goal = PerformGoal(self.buy_action)
+        domain = self._domain_from_json_api_data()
+        self.assertTrue(domain.has_goal(goal))
+        self.assertFalse(domain.plans.is_loaded(goal))
+        self.assertEqual(self.domain.get_plan(goal), domain.get_plan(goal))
+        self.assertTrue(domain.plans.is_loaded(goal))
+
+    def test_domain_from_json_api_data_has_goals_in_defined_order(self):
+        domain = self._domain_from_json_api_data()
+        self.assertEqual(self.domain.get_all_goals_in_defined_order(), domain.get_all_goals_in_defined_order())
+
+    def _domain_from_json_api_data(self):
+        json_api_dict = self.domain.as_json_api_dict()
+        included = IncludedObject(json_api_dict["included"])
+        return Domain.create_from_json_api_data(json_api_dict["data"], included, self.ontology)
+
+    def test_is_question_in_plan_true_for_question_in_plan_of_domain(self):
+        plan = self.domain.get_plan(ResolveGoal(self.price_question, speaker.SYS))
+        self.assertTrue(self.domain.is_question_in_plan(self.dest_city_question, plan))
+
+    def test_is_question_in_plan_false_for_question_not_in_plan_of_domain(self):
+        plan = self.domain.get_plan(PerformGoal(self.buy_action))
+        self.assertFalse(self.domain.is_question_in_plan(self.dest_city_question, plan))
+
+    def test_is_question_in_plan_for_plan_outside_of_domain(self):
+        plan = Plan([Findout(self.domain_name, self.dest_city_question)])
+        self.assertTrue(self.domain.is_question_in_plan(self.dest_city_question, plan))
+
+    def test_get_invoke_service_action_items_for_action(self):
+        items = list(self.domain.get_invoke_service_action_items_for_action("mock_service_action"))
+        self.assertEqual([True, False], [item.should_downdate_plan() for item in items])
+
+    def test_get_invoke_service_action_items_for_unknown_action(self):
+        self.assertEqual([], list(self.domain.get_invoke_service_action_items_for_action("unknown_service_action")))
+
+    def test_is_question_in_plan_of_unpickled_domain_is_looked_up_in_index(self):
+        self.domain.index.build()
+        domain = pickle.loads(pickle.dumps(self.domain))
+        plan = domain.get_plan(ResolveGoal(self.price_question, speaker.SYS))
+        with patch.object(domain, "get_questions_in_plan") as mock_get_questions_in_plan:
+            self.assertTrue(domain.index.is_question_in_plan(self.dest_city_question, plan))
+            mock_get_questions_in_plan.assert_not_called()
+
+    def test_index_reports_build_time(self):
+        self.assertGreaterEqual(self.domain.index.build_time, 0.0)
+
+    def test_index_is_replaced_when_plan_is_added(self):
+        self.domain.get_names_of_user_targeted_actions()
+        goal = PerformGoal(self.instructional)
+        self.domain.plans[goal] = {"goal": goal, "plan": Plan([GetDone(self.buy_action)])}
+        self.assertIn("buy", self.domain.get_names_of_user_targeted_actions())
+
     def test_get_downdate_conditions_for_goal_with_downdate_condition(self):
         action_with_downdate_conditions = self.buy_action
         self.assertEqual([self.condition],
@@ -666,6 +722,30 @@ class DominatesTests(LibTestCase):
             )
         )
 
+    def test_dominates_loads_only_plans_of_dominated_goals(self):
+        loaded_goals = []
+
+        def plan_loader(goal):
+            def load_plan_info():
+                loaded_goals.append(goal)
+                return {"goal": goal, "plan": []}
+
+            return load_plan_info
+
+        lazy_goals = [PerformGoal(self.super_dominated_action), PerformGoal(self.non_dominated_action)]
+        domain = Domain(
+            self.DDD_NAME,
+            self.domain_name,
+            self.ontology,
+            plans=[{
+                "goal": PerformGoal(self.dominating_action),
+                "plan": [self._findout_with_alts([GoalProposition(PerformGoal(self.super_dominated_action))])]
+            }],
+            plan_loaders=[(goal, plan_loader(goal)) for goal in lazy_goals]
+        )
+        self.assertTrue(domain.dominates(PerformGoal(self.dominating_action), PerformGoal(self.super_dominated_action)))
+        self.assertEqual([PerformGoal(self.super_dominated_action)], loaded_goals)
+
     def test_dominates_false_for_action_without_plan(self):
         self.assertFalse(self.domain.dominates(PerformGoal(self.planless_action), PerformGoal(self.dominated_action)))
 
@@ -676,5 +756,17 @@ class DominatesTests(LibTestCase):
             )
         )
 
+    def test_dominates_terminates_for_mutually_dominating_actions(self):
+        plans = [{
+            "goal": PerformGoal(self.dominating_action),
+            "plan": [self._findout_with_alts([GoalProposition(PerformGoal(self.dominated_action))])]
+        }, {
+            "goal": PerformGoal(self.dominated_action),
+            "plan": [self._findout_with_alts([GoalProposition(PerformGoal(self.dominating_action))])]
+        }]
+        domain = Domain(self.DDD_NAME, self.domain_name, self.ontology, plans=plans)
+        self.assertTrue(domain.dominates(PerformGoal(self.dominated_action), PerformGoal(self.dominating_action)))
+        self.assertFalse(domain.dominates(PerformGoal(self.dominated_action), PerformGoal(self.non_dominated_action)))
+
     def _findout_with_alts(self, alts):
         return Findout(self.domain_name, AltQuestion(PropositionSet(alts)))
@@ -1,4 +1,5 @@
 from unittest.mock import Mock
+import pickle
 
 from tala.model.individual import Individual
 from tala.model.ontology import Ontology, OntologyError
@@ -9,6 +10,7 @@ from tala.model.image import Image
 from tala.model.webview import Webview
 from tala.model.date_time import DateTime
 from tala.testing.lib_test_case import LibTestCase
+from tala.utils.immutable import ImmutableObjectException
 
 
 class IndividualTestBase(LibTestCase):
@@ -56,6 +58,20 @@ class IndividualTestBase(LibTestCase):
 
 
 class IndividualTest(IndividualTestBase):
+    def test_cached_hash_is_not_pickled(self):
+        individual = self.ontology.create_individual("paris")
+        hash(individual)
+        unpickled_individual = pickle.loads(pickle.dumps(individual))
+        with self.assertRaises(AttributeError):
+            unpickled_individual._hash
+        self.assertEqual(individual, unpickled_individual)
+
+    def test_individual_is_immutable(self):
+        individual = self.ontology.create_individual("paris")
+        with self.assertRaises(ImmutableObjectException):
+            individual.value = "london"
+        self.assertEqual("paris", individual.value)
+
     def test_create_real_individual_with_ontology_with_real_type(self):
         self.ontology.create_individual(123.50)
 
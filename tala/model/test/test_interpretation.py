@@ -1,4 +1,7 @@
+from unittest.mock import patch
+
 from tala.model.interpretation import Interpretation
+from tala.utils.equality import structural_key
 
 
 class TestInterpretation:
@@ -25,3 +28,23 @@ class TestInterpretation:
 
     def then_interpretation_as_dict_equals_original_dict(self):
         assert self._interpretation_as_json_dict == self._interpretation.as_dict()
+
+    def test_hash_is_computed_once(self):
+        self.given_interpretation_as_dict({
+            'moves': [{
+                'ddd': 'some-ddd',
+                'perception_confidence': 1.0,
+                'semantic_expression': 'ask(?X.qna_response(X))',
+                'understanding_confidence': 1.0,
+            }],
+            'utterance': 'some-utterance',
+            'modality': 'speech'
+        })
+        self.when_create_interpretation()
+        self.then_hash_is_computed_once()
+
+    def then_hash_is_computed_once(self):
+        hash(self._interpretation)
+        with patch("tala.utils.equality.structural_key", wraps=structural_key) as mock_structural_key:
+            hash(self._interpretation)
+        mock_structural_key.assert_not_called()
@@ -2,6 +2,9 @@ import pytest
 
 from tala.ddd.json_parser import NonCheckingJSONParser
 from tala.model import plan_item
+from tala.model.individual import Individual, Yes
+from tala.model.move import Greet
+from tala.model.sort import CustomSort
 
 
 class TestNonCheckingJsonParser:
@@ -42,3 +45,31 @@ class TestNonCheckingJsonParser:
         self._given_plan_item_as_dict({'log': {'message': 'test message', 'level': "kalle_kula"}})
         with pytest.raises(plan_item.UnexpectedLogLevelException):
             self._when_parsing_dict_as_plan_item()
+
+    def test_yes_no_parsed_from_dict(self):
+        self._when_parsing({"semantic_object_type": "yes/no", "instance": "yes"})
+        self._then_result_is(Yes())
+
+    def test_individual_takes_precedence_over_action(self):
+        self._when_parsing(self._individual_as_dict())
+        self._then_result_is(Individual("mockup_ontology", "paris", CustomSort("mockup_ontology", "city")))
+
+    def _individual_as_dict(self):
+        individual = Individual("mockup_ontology", "paris", CustomSort("mockup_ontology", "city"))
+        return individual.as_json()
+
+    def _when_parsing(self, json_dict):
+        self._parse_result = self._parser.parse(json_dict)
+
+    def _then_result_is(self, expected):
+        assert expected == self._parse_result
+
+    def test_parsing_move_does_not_modify_input(self):
+        move_as_dict = Greet(understanding_confidence=0.5, speaker="USR").as_json()
+        move_as_dict["understanding_confidence"] = "0.5"
+        self._parser.parse(move_as_dict)
+        assert move_as_dict["understanding_confidence"] == "0.5"
+
+    def test_parse_of_non_dict_raises_attribute_error(self):
+        with pytest.raises(AttributeError):
+            self._parser.parse(["some", "list"])
@@ -1,6 +1,10 @@
+import threading
+
 import pytest
 
 from tala.model.ontology import Ontology, OntologyError, InvalidIndividualName, AmbiguousNamesException, IndividualExistsException, SortDoesNotExistException
+from tala.model.individual import Individual
+from tala.model.polarity import Polarity
 from tala.model.predicate import Predicate
 from tala.model.sort import RealSort, IntegerSort, ImageSort, DomainSort, CustomSort, BooleanSort, DateTimeSort, WebviewSort, StringSort, PersonNameSort, REAL, INTEGER, IMAGE, BOOLEAN, DATETIME, WEBVIEW, STRING
 from tala.model.image import Image
@@ -348,6 +352,107 @@ class TestOntologyBasic(TestOntology):
         with pytest.raises(expected_exception, match=expected_message):
             self._create_ontology(*args, **kwargs)
 
+    def test_is_predicate_true_for_predicate_of_ontology(self):
+        predicate = self._create_predicate("selected_city", CustomSort(self.DEFAULT_NAME, "city"))
+        self._given_ontology(sorts={CustomSort(self.DEFAULT_NAME, "city")}, predicates={predicate})
+        assert self._ontology.is_predicate(predicate)
+
+    def test_is_predicate_false_for_predicate_with_other_sort(self):
+        self._given_ontology(
+            sorts={CustomSort(self.DEFAULT_NAME, "city")},
+            predicates={self._create_predicate("selected_city", CustomSort(self.DEFAULT_NAME, "city"))}
+        )
+        assert not self._ontology.is_predicate(self._create_predicate("selected_city", StringSort()))
+
+    def test_is_predicate_false_for_non_predicate(self):
+        self._given_ontology()
+        assert not self._ontology.is_predicate("selected_city")
+
+    def test_get_feature_predicates(self):
+        self._given_ontology_with_features_of_dest_city()
+        self._when_get_feature_predicates_is_called_with("dest_city")
+        self._then_result_is_predicates_named(["dest_city_type", "dest_city_name"])
+
+    def _given_ontology_with_features_of_dest_city(self):
+        self._given_ontology(
+            sorts={CustomSort(self.DEFAULT_NAME, "city"),
+                   CustomSort(self.DEFAULT_NAME, "city_type")},
+            predicates={
+                self._create_predicate("dest_city", CustomSort(self.DEFAULT_NAME, "city")),
+                self._create_predicate(
+                    "dest_city_type", CustomSort(self.DEFAULT_NAME, "city_type"), feature_of_name="dest_city"
+                ),
+                self._create_predicate("dest_city_name", StringSort(), feature_of_name="dest_city"),
+            }
+        )
+
+    def _when_get_feature_predicates_is_called_with(self, predicate_name):
+        self._result = self._ontology.get_feature_predicates(predicate_name)
+
+    def _then_result_is_predicates_named(self, expected_names):
+        assert sorted(expected_names) == sorted(predicate.get_name() for predicate in self._result)
+
+    def test_get_feature_predicates_for_predicate_without_features(self):
+        self._given_ontology_with_features_of_dest_city()
+        self._when_get_feature_predicates_is_called_with("dest_city_type")
+        self._then_result_is_predicates_named([])
+
+    def test_get_feature_predicates_of_sort(self):
+        self._given_ontology_with_features_of_dest_city()
+        self._when_get_feature_predicates_of_sort_is_called_with("dest_city", StringSort())
+        self._then_result_is_predicates_named(["dest_city_name"])
+
+    def _when_get_feature_predicates_of_sort_is_called_with(self, predicate_name, sort):
+        self._result = self._ontology.get_feature_predicates_of_sort(predicate_name, sort)
+
+    def test_get_feature_predicates_of_sort_without_features_of_the_sort(self):
+        self._given_ontology_with_features_of_dest_city()
+        self._when_get_feature_predicates_of_sort_is_called_with("dest_city", RealSort())
+        self._then_result_is_predicates_named([])
+
+    def test_create_individual_returns_interned_individual(self):
+        self._given_ontology(
+            sorts={CustomSort(self.DEFAULT_NAME, "city")},
+            predicates={self._create_predicate("dest_city", CustomSort(self.DEFAULT_NAME, "city"))},
+            individuals={"paris": CustomSort(self.DEFAULT_NAME, "city")}
+        )
+        assert self._ontology.create_individual("paris") is self._ontology.create_individual("paris")
+
+    def test_negative_individual_is_interned_apart_from_positive_individual(self):
+        self._given_ontology(
+            sorts={CustomSort(self.DEFAULT_NAME, "city")},
+            predicates={self._create_predicate("dest_city", CustomSort(self.DEFAULT_NAME, "city"))},
+            individuals={"paris": CustomSort(self.DEFAULT_NAME, "city")}
+        )
+        negative_individual = self._ontology.create_negative_individual("paris")
+        assert not negative_individual.is_positive()
+        assert self._ontology.create_individual("paris").is_positive()
+        assert negative_individual is self._ontology.create_negative_individual("paris")
+
+    def test_create_predicate_proposition_returns_interned_proposition(self):
+        self._given_ontology(
+            sorts={CustomSort(self.DEFAULT_NAME, "city")},
+            predicates={self._create_predicate("dest_city", CustomSort(self.DEFAULT_NAME, "city"))},
+            individuals={"paris": CustomSort(self.DEFAULT_NAME, "city")}
+        )
+        predicate = self._ontology.get_predicate("dest_city")
+        individual = self._ontology.create_individual("paris")
+        proposition = self._ontology.create_predicate_proposition(predicate, individual)
+        assert proposition is self._ontology.create_predicate_proposition(predicate, individual)
+        assert proposition is not self._ontology.create_predicate_proposition(predicate, individual, Polarity.NEG)
+
+    def test_predicate_propositions_with_equal_values_of_different_types_are_interned_apart(self):
+        self._given_ontology(predicates={self._create_predicate("price", RealSort())})
+        predicate = self._ontology.get_predicate("price")
+        integer_proposition = self._ontology.create_predicate_proposition(
+            predicate, Individual(self.DEFAULT_NAME, 1, RealSort())
+        )
+        real_proposition = self._ontology.create_predicate_proposition(
+            predicate, Individual(self.DEFAULT_NAME, 1.0, RealSort())
+        )
+        assert 1 == integer_proposition.individual.value
+        assert isinstance(real_proposition.individual.value, float)
+
 
 class TestDynamicOntology(TestOntology):
     def test_add_dynamic_individual(self):
@@ -413,3 +518,135 @@ class TestDynamicOntology(TestOntology):
     def _then_individual_is_of_right_type(self):
         assert self._individual.sort == PersonNameSort()
         assert self._individual.value == PersonName("Anna Kronlid")
+
+    def test_added_individual_is_of_its_sort(self):
+        self._given_ontology(
+            sorts={CustomSort(self.DEFAULT_NAME, "city")}, individuals={"paris": CustomSort(self.DEFAULT_NAME, "city")}
+        )
+        self._when_individual_is_added("london", "city")
+        self._then_individuals_of_sort_are("city", ["paris", "london"])
+
+    def _then_individuals_of_sort_are(self, sort, expected_individuals):
+        assert expected_individuals == self._ontology.get_individuals_of_sort(sort)
+
+    def test_reset_forgets_added_individuals_of_sort(self):
+        self._given_ontology(
+            sorts={CustomSort(self.DEFAULT_NAME, "city")}, individuals={"paris": CustomSort(self.DEFAULT_NAME, "city")}
+        )
+        self._given_individual_is_added("london", "city")
+        self._when_ontology_is_reset()
+        self._then_individuals_of_sort_are("city", ["paris"])
+
+    def _given_individual_is_added(self, name, sort):
+        self._ontology.add_individual(name, sort)
+
+    def _when_ontology_is_reset(self):
+        self._ontology.reset()
+
+    def test_sort_of_added_predicate_is_a_predicate_sort(self):
+        self._given_ontology()
+        self._when_predicate_is_added("temperature", REAL)
+        self._then_predicates_contain_sort(REAL)
+
+    def _when_predicate_is_added(self, name, sort):
+        self._ontology.add_predicate(name, sort)
+
+    def _then_predicates_contain_sort(self, sort):
+        assert self._ontology.predicates_contain_sort(sort)
+
+    def test_individual_added_to_session_is_in_the_session(self):
+        self._given_ontology(sorts={CustomSort(self.DEFAULT_NAME, "city")})
+        self._given_session()
+        self._when_individual_is_added_to_session("paris", "city")
+        self._then_session_has_individual("paris")
+
+    def _given_session(self):
+        self._session = self._ontology.create_session()
+
+    def _when_individual_is_added_to_session(self, name, sort):
+        self._session.add_individual(name, sort)
+
+    def _then_session_has_individual(self, name):
+        assert self._session.has_individual(name)
+
+    def test_individual_added_to_session_is_not_in_the_base_ontology(self):
+        self._given_ontology(sorts={CustomSort(self.DEFAULT_NAME, "city")})
+        self._given_session()
+        self._when_individual_is_added_to_session("paris", "city")
+        self._then_ontology_does_not_have_individual("paris")
+
+    def _then_ontology_does_not_have_individual(self, name):
+        assert not self._ontology.has_individual(name)
+        assert name not in self._ontology.get_individuals_of_sort("city")
+
+    def test_individual_added_to_session_is_not_in_another_session(self):
+        self._given_ontology(sorts={CustomSort(self.DEFAULT_NAME, "city")})
+        self._given_session()
+        other_session = self._ontology.create_session()
+        self._when_individual_is_added_to_session("paris", "city")
+        assert not other_session.has_individual("paris")
+
+    def test_session_has_individuals_of_base_ontology(self):
+        self._given_ontology(
+            sorts={CustomSort(self.DEFAULT_NAME, "city")}, individuals={"paris": CustomSort(self.DEFAULT_NAME, "city")}
+        )
+        self._given_session()
+        self._when_individual_is_added_to_session("london", "city")
+        assert ["paris", "london"] == self._session.get_individuals_of_sort("city")
+
+    def test_reset_keeps_individuals_of_base_ontology(self):
+        self._given_ontology(
+            sorts={CustomSort(self.DEFAULT_NAME, "city")}, individuals={"paris": CustomSort(self.DEFAULT_NAME, "city")}
+        )
+        self._given_individual_is_added("london", "city")
+        self._when_ontology_is_reset()
+        assert {"paris": CustomSort(self.DEFAULT_NAME, "city")} == self._ontology.get_individuals()
+
+    def test_session_interns_individuals_apart_from_base_ontology(self):
+        self._given_ontology(
+            sorts={CustomSort(self.DEFAULT_NAME, "city")},
+            predicates={self._create_predicate("dest_city", CustomSort(self.DEFAULT_NAME, "city"))},
+            individuals={"paris": CustomSort(self.DEFAULT_NAME, "city")}
+        )
+        self._given_session()
+        assert self._session.create_individual("paris") is not self._ontology.create_individual("paris")
+        assert self._session.create_individual("paris") == self._ontology.create_individual("paris")
+
+    def test_predicate_added_to_session_is_not_in_the_base_ontology(self):
+        self._given_ontology()
+        self._given_session()
+        self._session.add_predicate("temperature", REAL)
+        assert self._session.has_predicate("temperature")
+        assert not self._ontology.has_predicate("temperature")
+        assert not self._ontology.predicates_contain_sort(REAL)
+
+    def test_concurrent_sessions_keep_their_entities_to_themselves(self):
+        self._given_ontology(
+            sorts={CustomSort(self.DEFAULT_NAME, "city")}, individuals={"paris": CustomSort(self.DEFAULT_NAME, "city")}
+        )
+        sessions = [self._ontology.create_session(), self._ontology.create_session()]
+        self._when_sessions_add_entities_concurrently(sessions)
+        for index, session in enumerate(sessions):
+            expected_cities = ["paris"] + ["city_%d_%d" % (index, number) for number in range(200)]
+            assert expected_cities == session.get_individuals_of_sort("city")
+            assert [session.has_predicate("predicate_%d" % other_index) for other_index in range(2)
+                    ] == [other_index == index for other_index in range(2)]
+        assert ["paris"] == self._ontology.get_individuals_of_sort("city")
+        assert not any(self._ontology.has_predicate("predicate_%d" % index) for index in range(2))
+
+    def _when_sessions_add_entities_concurrently(self, sessions):
+        barrier = threading.Barrier(len(sessions))
+
+        def add_entities(index, session):
+            barrier.wait()
+            for number in range(200):
+                session.add_individual("city_%d_%d" % (index, number), "city")
+            session.add_predicate("predicate_%d" % index, REAL)
+
+        threads = [
+            threading.Thread(target=add_entities, args=(index, session)) for index, session in enumerate(sessions)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
@@ -3,7 +3,7 @@ import unittest
 from tala import model
 
 from tala.model.plan import Plan, UnableToDetermineOntologyException
-from tala.model.plan_item import IfThenElse, Findout, Raise, AssumeShared
+from tala.model.plan_item import IfThenElse, Findout, Raise, AssumeShared, ForgetAll, Greet
 from tala.model.semantic_object import OntologySpecificSemanticObject
 from tala.testing.lib_test_case import LibTestCase
 from tala.utils.json_api import IncludedObject
@@ -30,6 +30,11 @@ class PlanTests(LibTestCase):
     def _given_plan_with_nested_item(self):
         self.plan = Plan([self.if_then_else_item, self.findout_dest_city, self.findout_price])
 
+    def test_plan_as_dict_keeps_nested_blocks(self):
+        self._given_plan_with_nested_item()
+        expected_list = [self.findout_price, self.findout_dest_city, self.if_then_else_item]
+        self.assertEqual(expected_list, self.plan.as_dict()["stack"])
+
     def test_plan_iteration_after_modification(self):
         plan = Plan()
         plan.push(self.findout_price)
@@ -451,6 +456,18 @@ class PlanTests(LibTestCase):
         for original, created in zip(self._plan.iter_stack(), self._plan_from_json_api.iter_stack()):
             self.assertEqual(original, created)
 
+    def test_str_of_empty_plan(self):
+        self.assertEqual("Plan([])", str(Plan([])))
+
+    def test_str_of_plan_with_several_items(self):
+        self.assertEqual("Plan([type('greet',), type('forget_all',)])", str(Plan([ForgetAll(), Greet()])))
+
+    def test_repr_of_empty_plan(self):
+        self.assertEqual("Plan[]", repr(Plan([])))
+
+    def test_repr_of_plan_with_several_items(self):
+        self.assertEqual("Plan[type('greet',), type('forget_all',)]", repr(Plan([ForgetAll(), Greet()])))
+
 
 class SemanticObjectPlanTests(unittest.TestCase):
     def setUp(self):
@@ -1,7 +1,10 @@
+import pickle
+
 from tala.model.error import OntologyError
 from tala.model.predicate import Predicate
 from tala.model.sort import CustomSort, IntegerSort, RealSort
 from tala.testing.lib_test_case import LibTestCase
+from tala.utils.immutable import ImmutableObjectException
 
 
 class PredicateTests(LibTestCase):
@@ -37,6 +40,20 @@ class PredicateTests(LibTestCase):
         multi_instance_predicate = self.ontology.get_predicate("passenger_type_to_add")
         self.assertTrue(multi_instance_predicate.allows_multiple_instances())
 
+    def test_cached_hash_is_not_pickled(self):
+        predicate = self.ontology.get_predicate("dest_city")
+        hash(predicate)
+        unpickled_predicate = pickle.loads(pickle.dumps(predicate))
+        with self.assertRaises(AttributeError):
+            unpickled_predicate._hash
+        self.assertEqual(predicate, unpickled_predicate)
+
+    def test_predicate_is_immutable(self):
+        predicate = self.ontology.get_predicate("dest_city")
+        with self.assertRaises(ImmutableObjectException):
+            predicate.sort = IntegerSort()
+        self.assertEqual(self.sort_city, predicate.sort)
+
     def test_equality(self):
         predicate1 = Predicate(self.ontology_name, "dest_city", self._city_sort)
         predicate2 = Predicate(self.ontology_name, "dest_city", self._city_sort)
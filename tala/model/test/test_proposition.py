@@ -15,6 +15,7 @@ from tala.testing.lib_test_case import LibTestCase
 from tala.model.image import Image
 from tala.model.set import Set
 from tala.utils.json_api import IncludedObject
+from tala.utils.immutable import ImmutableObjectException
 
 
 class TestPropositionAsCondition(unittest.TestCase):
@@ -79,6 +80,19 @@ class PropositionTests(LibTestCase, unittest.TestCase):
         quit_proposition_2 = QuitProposition()
         self.assertEqual(quit_proposition_1, quit_proposition_2)
 
+    def test_predicate_proposition_is_immutable(self):
+        proposition = self.proposition_dest_city_paris
+        with self.assertRaises(ImmutableObjectException):
+            proposition.individual = self.individual_london
+        self.assertEqual(self.individual_paris, proposition.individual)
+
+    def test_negated_predicate_proposition_is_a_new_proposition(self):
+        proposition = self.proposition_dest_city_paris
+        negated_proposition = proposition.negate()
+        self.assertTrue(proposition.is_positive())
+        self.assertFalse(negated_proposition.is_positive())
+        self.assertEqual(proposition, negated_proposition.negate())
+
     def test_understanding_proposition_getters(self):
         proposition = self.proposition_dest_city_paris
         und = UnderstandingProposition(speaker.USR, proposition)
@@ -1,3 +1,4 @@
+import threading
 import unittest
 
 from tala.ddd.ddd_manager import DDDManager
@@ -363,3 +364,87 @@ class TestSemanticLogicWithPropositions(unittest.TestCase):
             self.proposition_not_dest_city_paris,
             SemanticLogic(self._ddd_manager).combine(self.positive_prop_set, self.individual_not_paris)
         )
+
+    def test_memoized_relevance_is_looked_up_in_cache(self):
+        semantic_logic = SemanticLogic(self._ddd_manager, cache_size=10)
+        semantic_logic.is_relevant(self.positive_prop_set, self.individual_paris)
+        stats_after_first_call = semantic_logic.cache_stats()
+        self.assertTrue(semantic_logic.is_relevant(self.positive_prop_set, self.individual_paris))
+        self.assertEqual(stats_after_first_call["hits"] + 1, semantic_logic.cache_stats()["hits"])
+        self.assertEqual(stats_after_first_call["misses"], semantic_logic.cache_stats()["misses"])
+
+    def test_memoized_results_are_kept_per_operation(self):
+        semantic_logic = SemanticLogic(self._ddd_manager, cache_size=100)
+        uncached_semantic_logic = SemanticLogic(self._ddd_manager)
+        for _ in range(2):
+            for operation in ["is_relevant", "are_combinable", "resolves"]:
+                self.assertEqual(
+                    getattr(uncached_semantic_logic, operation)(self.positive_prop_set, self.individual_not_paris),
+                    getattr(semantic_logic, operation)(self.positive_prop_set, self.individual_not_paris)
+                )
+
+    def test_cache_is_bounded(self):
+        semantic_logic = SemanticLogic(self._ddd_manager, cache_size=1)
+        semantic_logic.is_relevant(self.positive_prop_set, self.individual_paris)
+        semantic_logic.is_relevant(self.positive_prop_set, self.individual_london)
+        self.assertEqual(1, semantic_logic.cache_stats()["size"])
+
+    def test_result_is_recomputed_when_individuals_of_consulted_ontology_change(self):
+        semantic_logic = SemanticLogic(self._ddd_manager, cache_size=10)
+        semantic_logic.is_relevant(self.positive_prop_set, self.individual_paris)
+        self.ontology.add_individual("berlin", "city")
+        semantic_logic.is_relevant(self.positive_prop_set, self.individual_paris)
+        self.assertEqual(0, semantic_logic.cache_stats()["hits"])
+
+    def test_result_is_recomputed_when_consulted_ontology_is_replaced(self):
+        semantic_logic = SemanticLogic(self._ddd_manager, cache_size=10)
+        semantic_logic.is_relevant(self.positive_prop_set, self.individual_paris)
+        self._ddd_manager.add_ontology(self.ontology.create_session())
+        semantic_logic.is_relevant(self.positive_prop_set, self.individual_paris)
+        self.assertEqual(0, semantic_logic.cache_stats()["hits"])
+
+    def test_result_is_reused_when_individuals_of_other_ontology_change(self):
+        semantic_logic = SemanticLogic(self._ddd_manager, cache_size=10)
+        semantic_logic.is_relevant(self.positive_prop_set, self.individual_paris)
+        self.ontology.create_session().add_individual("berlin", "city")
+        semantic_logic.is_relevant(self.positive_prop_set, self.individual_paris)
+        self.assertEqual(1, semantic_logic.cache_stats()["hits"])
+
+    def test_ontologies_consulted_in_other_thread_are_not_recorded(self):
+        other_ontology = self._create_other_ontology()
+        other_prop_set = PropositionSet([
+            PredicateProposition(other_ontology.get_predicate("dest_town"), other_ontology.create_individual("rome"))
+        ])
+        semantic_logic = SemanticLogic(self._ddd_manager, cache_size=10)
+        get_ontology = self._ddd_manager.get_ontology
+
+        def get_ontology_while_other_thread_is_memoizing(name):
+            if name == self.ontology_name and threading.current_thread() is threading.main_thread():
+                other_thread = threading.Thread(
+                    target=semantic_logic.is_relevant, args=(other_prop_set, other_ontology.create_individual("rome"))
+                )
+                other_thread.start()
+                other_thread.join()
+            return get_ontology(name)
+
+        self._ddd_manager.get_ontology = get_ontology_while_other_thread_is_memoizing
+        semantic_logic.is_relevant(self.positive_prop_set, self.individual_paris)
+        self._ddd_manager.get_ontology = get_ontology
+        other_ontology.add_individual("milan", "town")
+        hits = semantic_logic.cache_stats()["hits"]
+        semantic_logic.is_relevant(self.positive_prop_set, self.individual_paris)
+        self.assertEqual(hits + 1, semantic_logic.cache_stats()["hits"])
+
+    def _create_other_ontology(self):
+        town_sort = CustomSort("other_ontology", "town")
+        ontology = Ontology(
+            "other_ontology", {town_sort}, {Predicate("other_ontology", "dest_town", town_sort)}, {"rome": town_sort},
+            set()
+        )
+        self._ddd_manager.add_ontology(ontology)
+        return ontology
+
+    def test_results_are_not_memoized_by_default(self):
+        semantic_logic = SemanticLogic(self._ddd_manager)
+        self.assertTrue(semantic_logic.is_relevant(self.positive_prop_set, self.individual_paris))
+        self.assertIsNone(semantic_logic.cache_stats())
@@ -12,6 +12,17 @@ class MockElement:
         return "MockElement(%r)" % self._name
 
 
+class MutableElement:
+    def __init__(self, name):
+        self.name = name
+
+    def __eq__(self, other):
+        return isinstance(other, MutableElement) and self.name == other.name
+
+    def __hash__(self):
+        return hash(self.name)
+
+
 class SetTests(unittest.TestCase, EqualityAssertionTestCaseMixin):
     def test_set(self):
         testset = Set()
@@ -232,3 +243,43 @@ class SetTests(unittest.TestCase, EqualityAssertionTestCaseMixin):
         test_set.extend(extension)
         expected_result = Set(["first", "second", "third"])
         self.assertEqual(expected_result, test_set)
+
+    def test_set_in_set_is_member(self):
+        test_set = Set([Set(["first"])])
+        self.assertIn(Set(["first"]), test_set)
+
+    def test_remove_set_in_set(self):
+        test_set = Set(["first", Set(["second"])])
+        test_set.remove(Set(["second"]))
+        self.assertEqual(("first", ), test_set.content)
+
+    def test_order_of_insertion_is_kept(self):
+        test_set = Set(["first", "second", "third"])
+        test_set.add("first")
+        test_set.remove("second")
+        test_set.add("second")
+        self.assertEqual(("first", "third", "second"), test_set.content)
+
+    def test_remove_missing_element_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            Set(["first"]).remove("second")
+
+    def test_element_changed_after_it_was_added_is_member(self):
+        element = MutableElement("first")
+        test_set = Set([element, MutableElement("second")])
+        element.name = "changed"
+        self.assertIn(MutableElement("changed"), test_set)
+
+    def test_remove_element_changed_after_it_was_added(self):
+        element = MutableElement("first")
+        test_set = Set([element, MutableElement("second")])
+        element.name = "changed"
+        test_set.remove(MutableElement("changed"))
+        self.assertEqual([MutableElement("second")], list(test_set))
+        self.assertNotIn(MutableElement("changed"), test_set)
+
+    def test_remove_unchanged_mutable_element(self):
+        test_set = Set([MutableElement("first"), MutableElement("second")])
+        test_set.remove(MutableElement("first"))
+        self.assertEqual([MutableElement("second")], list(test_set))
+        self.assertNotIn(MutableElement("first"), test_set)
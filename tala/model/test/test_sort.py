@@ -1,4 +1,6 @@
 from unittest.mock import patch
+import pickle
+
 import pytest
 
 from tala.model.ontology import Ontology, SortDoesNotExistException
@@ -12,6 +14,7 @@ from tala.model.webview import Webview
 from tala.model.date_time import DateTime
 from tala.model.person_name import PersonName
 from tala.testing.utils import EqualityAssertionTestCaseMixin
+from tala.utils.immutable import ImmutableObjectException
 
 
 class SortTestCase(object):
@@ -87,6 +90,36 @@ class TestSort(SortTestCase, EqualityAssertionTestCaseMixin):
     def test_sorts_hashable(self):
         {self.ontology.get_sort("city"), RealSort()}
 
+    def test_custom_sorts_of_different_ontologies_have_different_hashes(self):
+        assert hash(CustomSort("an_ontology", "city")) != hash(CustomSort("another_ontology", "city"))
+
+    def test_cached_hash_is_not_part_of_dict(self):
+        sort = CustomSort(self.ontology_name, "city")
+        hash(sort)
+        assert {"_name": "city", "_dynamic": False, "_ontology_name": self.ontology_name} == sort.as_dict()
+
+    def test_cached_hash_is_not_pickled(self):
+        sort = CustomSort(self.ontology_name, "city")
+        hash(sort)
+        unpickled_sort = pickle.loads(pickle.dumps(sort))
+        with pytest.raises(AttributeError):
+            unpickled_sort._hash
+        assert sort == unpickled_sort
+
+    def test_sort_is_immutable(self):
+        sort = CustomSort(self.ontology_name, "city")
+        with pytest.raises(ImmutableObjectException):
+            sort._name = "city_type"
+        with pytest.raises(ImmutableObjectException):
+            del sort._dynamic
+        assert "city" == sort.get_name()
+
+    def test_create_builtin_sort_returns_canonical_sort(self):
+        assert tala.model.sort.create_builtin_sort(REAL) is BuiltinSortRepository.get_sort(REAL)
+
+    def test_from_value_returns_canonical_sort(self):
+        assert Sort.from_value("a string") is BuiltinSortRepository.get_sort(STRING)
+
     def test_value_as_basic_type_returns_value_by_default(self):
         self.given_sort(CustomSort(self.ontology_name, "city", dynamic=False))
         self.when_call_value_as_basic_type("mock_value")
@@ -115,11 +115,33 @@ class StackTester(EqualityAssertionTestCaseMixin):
         result_stack.push_stack(upper_stack)
         self.assertEqual(expected_stack, result_stack)
 
+    def test_content_and_as_dict_are_top_first(self):
+        stack = self.create_stack(["bottom", "middle", "top"])
+        self.assertEqual(("top", "middle", "bottom"), stack.content)
+        self.assertEqual(["top", "middle", "bottom"], list(stack))
+        self.assertEqual(["top", "middle", "bottom"], list(stack.as_dict().values())[0])
+
+    def test_popped_element_is_no_longer_in_stack(self):
+        stack = self.create_stack(["bottom", "top"])
+        self.assertEqual("top", stack.pop())
+        self.assertTrue("top" not in stack)
+        self.assertEqual("bottom", stack.top())
+
+    def test_delete_missing_element_raises_value_error(self):
+        stack = self.create_stack(["bottom"])
+        with self.assertRaises(ValueError):
+            stack.remove("top")
+
 
 class TestStacks(unittest.TestCase, StackTester):
     def setUp(self):
         self.create_stack = Stack
 
+    def test_remove_takes_topmost_of_identical_elements(self):
+        stack = Stack(["first", "second", "first"])
+        stack.remove("first")
+        self.assertEqual(("second", "first"), stack.content)
+
     def test_string_representation(self):
         stack = Stack()
         stack.push(MockElement("bottom"))
@@ -165,3 +187,16 @@ class TestStackSets(unittest.TestCase, StackTester):
         set.remove_if_exists("third")
         expected_result = StackSet(["first", "second"])
         self.assertEqual(expected_result, set)
+
+    def test_stacking_unhashable_elements(self):
+        stack = StackSet()
+        stack.push(["first"])
+        stack.push(["second"])
+        stack.push(["first"])
+        self.assertEqual((["first"], ["second"]), stack.content)
+
+    def test_element_popped_from_stack_set_can_be_pushed_again(self):
+        stack = StackSet(["first", "second"])
+        stack.pop()
+        stack.push("second")
+        self.assertEqual(("second", "first"), stack.content)
@@ -1,7 +1,7 @@
 from typing import Text  # noqa: F401
 import re
 
-from tala.utils.equality import EqualityMixin
+from tala.utils.equality import FrozenEqualityMixin
 from tala.model import move
 
 ANSWER = move.ANSWER
@@ -22,7 +22,7 @@ def create(user_move_as_dict):
         return UserMove.from_dict(user_move_as_dict)
 
 
-class UserMove(EqualityMixin):
+class UserMove(FrozenEqualityMixin):
     @classmethod
     def from_dict(cls, move_as_json):
         perception_confidence = move_as_json["perception_confidence"]
@@ -1,8 +1,11 @@
+import hashlib
 import re
 import random
+import threading
 from string import Formatter
 
 from tala.utils.compression import ensure_decompressed_json
+from tala.utils.lru_cache import LRUCache
 
 PROTOCOL_VERSION = "1.0"
 
@@ -22,6 +25,11 @@ PREDICATE_WILDCARD = "*predicate"
 PROPOSITION_SET_WILDCARD = "*proposition_set"
 VALIDITY_WILDCARD = "*validity"
 
+MOVE_HEAD_PATTERN = re.compile(r'[^(:]*[(:]')
+PROPOSITIONAL_SLOT_FOR_INDIVIDUAL_PATTERN = r'([a-zA-Z0-9_]+\(' + re.escape(INDIVIDUAL_SLOT) + r'\))'
+
+COMPILED_MODEL_CACHE_SIZE = 32
+
 
 class SlotDefinitionException(Exception):
     def __init__(self, message):
@@ -57,6 +65,24 @@ def generate_all_utterances(moves, context, session, logger):
     return []
 
 
+def generate_batch(requests, session, logger):
+    """ Generates a result, as generate() does, for each (moves, context) pair in requests, using the NLG model of
+    the session. The model is decoded and indexed once for the whole batch, and pairs that share the same context
+    object also share their generator. The results are returned in the order of the requests. """
+    compiled_nlg_model = get_compiled_nlg_model(session.get("nlg"))
+    generators = {}
+    results = []
+    for moves, context in requests:
+        shared_context, generator = generators.get(id(context), (None, None))
+        if shared_context is not context:
+            generator = None
+        nlg = NLG(moves, context, session, logger, compiled_nlg_model=compiled_nlg_model, generator=generator)
+        generators[id(context)] = context, nlg.generator
+        nlg.generate()
+        results.append(nlg.result)
+    return results
+
+
 def get_predicate(proposition_expression):
     m = re.match(r"([a-zA-Z0-9_]+)\(.*", proposition_expression)
     if m:
@@ -85,23 +111,275 @@ def generate_moves_subsequences(moves):
         yield list_of_strings_to_string(moves[i:])
 
 
+def get_move_head(string):
+    m = MOVE_HEAD_PATTERN.match(string)
+    if m is None:
+        return None
+    head = m.group(0)
+    if head == "icm:":
+        m = MOVE_HEAD_PATTERN.match(string, len(head))
+        if m is None:
+            return None
+        head += m.group(0)
+    return head
+
+
+def get_matcher_pattern_for(move_pattern, slot_definitions):
+    replacement = "(.*)"
+    escaped_move_pattern = re.escape(move_pattern)
+    matcher_pattern = escaped_move_pattern
+    for slot_definition in slot_definitions:
+        escaped_slot_definition = re.escape(slot_definition)
+        matcher_pattern = matcher_pattern.replace(escaped_slot_definition, replacement)
+    return matcher_pattern
+
+
+def get_literal_prefix(move_pattern, slot_definitions):
+    positions = [move_pattern.find(slot) for slot in slot_definitions if slot in move_pattern]
+    if positions:
+        return move_pattern[:min(positions)]
+    return move_pattern
+
+
+class CompiledEntry:
+    def __init__(self, entry, slot_definitions, slot_reference=None, slot_matcher_slots=None):
+        self._entry = entry
+        self._slot_reference = slot_reference
+        self._matcher = re.compile(get_matcher_pattern_for(entry["match"], slot_definitions))
+        if slot_matcher_slots is None:
+            self._slot_matcher = self._matcher
+        else:
+            self._slot_matcher = re.compile(get_matcher_pattern_for(entry["match"], slot_matcher_slots))
+        self._literal_prefix = get_literal_prefix(entry["match"], slot_definitions)
+
+    @property
+    def entry(self):
+        return self._entry
+
+    @property
+    def match(self):
+        return self._entry["match"]
+
+    @property
+    def utterance(self):
+        return self._entry["utterance"]
+
+    @property
+    def persona(self):
+        return self._entry.get("persona")
+
+    @property
+    def slot_reference(self):
+        return self._slot_reference
+
+    @property
+    def literal_prefix(self):
+        return self._literal_prefix
+
+    def matches(self, move):
+        return self._matcher.match(move)
+
+    def match_slot(self, move):
+        return self._slot_matcher.match(move)
+
+
+class IndexedEntries:
+    """ Compiled entries of a section of the NLG model, bucketed by the head of the moves that they can match,
+    e.g. 'answer(' or 'icm:acc*neg:'. Entries whose pattern has no literal head are candidates for all moves.
+    Candidates are always returned in model order, so that the first matching entry is the same as when
+    scanning the whole section. """
+    def __init__(self):
+        self._entries_by_head = {}
+        self._generic_entries = []
+        self._candidates_by_head = {}
+        self._size = 0
+
+    def add(self, compiled_entry, is_generic=False):
+        head = None if is_generic else get_move_head(compiled_entry.literal_prefix)
+        indexed_entry = (self._size, compiled_entry)
+        if head is None:
+            self._generic_entries.append(indexed_entry)
+        else:
+            self._entries_by_head.setdefault(head, []).append(indexed_entry)
+        self._candidates_by_head = {}
+        self._size += 1
+
+    def __len__(self):
+        return self._size
+
+    def candidates_for(self, move):
+        head = get_move_head(move)
+        if head not in self._candidates_by_head:
+            bucket = self._entries_by_head.get(head, []) if head is not None else []
+            self._candidates_by_head[head] = [entry for _, entry in sorted(bucket + self._generic_entries)]
+        return self._candidates_by_head[head]
+
+
+class NLGModelIndex:
+    """ The wildcard sections of an NLG model, with their move patterns compiled once, and bucketed by move head
+    so that a move is only matched against the entries that can match it. Each section is compiled the first
+    time it is needed. """
+    def __init__(self, nlg_data):
+        self._nlg_data = nlg_data
+        self._sections = {}
+
+    def _docs_of(self, section):
+        return self._nlg_data.get(section, {}).get("docs", [])
+
+    def _section(self, name, create_entries):
+        if name not in self._sections:
+            indexed_entries = IndexedEntries()
+            for compiled_entry, is_generic in create_entries():
+                indexed_entries.add(compiled_entry, is_generic)
+            self._sections[name] = indexed_entries
+        return self._sections[name]
+
+    @property
+    def predicate_and_validity_entries(self):
+        def create_entries():
+            for section in ["validity_wildcard_entries", "predicate_wildcard_entries"]:
+                for entry in self._docs_of(section):
+                    if VALIDITY_WILDCARD in entry["match"] and PREDICATE_WILDCARD in entry["match"]:
+                        yield CompiledEntry(entry, [PREDICATE_WILDCARD, VALIDITY_WILDCARD]), False
+
+        return self._section("predicate_and_validity", create_entries)
+
+    @property
+    def validity_entries(self):
+        def create_entries():
+            for entry in self._docs_of("validity_wildcard_entries"):
+                if VALIDITY_WILDCARD in entry["match"]:
+                    yield CompiledEntry(entry, [VALIDITY_WILDCARD]), False
+
+        return self._section("validity", create_entries)
+
+    @property
+    def proposition_set_entries(self):
+        def create_entries():
+            for entry in self._docs_of("proposition_set_wildcard_entries"):
+                if PROPOSITION_SET_WILDCARD in entry["match"]:
+                    yield CompiledEntry(entry, [PROPOSITION_SET_WILDCARD]), False
+
+        return self._section("proposition_set", create_entries)
+
+    @property
+    def individual_entries(self):
+        def create_entries():
+            for entry in self._docs_of("individual_entries"):
+                m = re.search(PROPOSITIONAL_SLOT_FOR_INDIVIDUAL_PATTERN, entry["match"])
+                if m:
+                    propositional_slot = m.groups()[0]
+                    yield CompiledEntry(entry, [INDIVIDUAL_SLOT], propositional_slot, [propositional_slot]), False
+
+        return self._section("individual", create_entries)
+
+    @property
+    def propositional_entries(self):
+        def create_entries():
+            for entry in self._docs_of("propositional_entries"):
+                m = re.search(PROPOSITIONAL_SLOT_PATTERN, entry["match"])
+                if m:
+                    slot_reference = m.groups()[0]
+                    is_malformed = slot_reference not in entry["utterance"]
+                    yield CompiledEntry(entry, [slot_reference], slot_reference), is_malformed
+
+        return self._section("propositional", create_entries)
+
+    @property
+    def icm_slot_entries(self):
+        def create_entries():
+            for entry in self._docs_of("icm_slot_entries"):
+                m = re.search(ICM_SLOT_PATTERN, entry["match"])
+                if m:
+                    icm_slot_reference = m.groups()[0]
+                    yield CompiledEntry(entry, [icm_slot_reference], icm_slot_reference), False
+
+        return self._section("icm_slot", create_entries)
+
+
+class CompiledNLGModel:
+    """ A decoded NLG model together with its index. Instances are shared between requests, and must be treated
+    as read-only. """
+    def __init__(self, data):
+        self._data = data
+        self._index = NLGModelIndex(data)
+
+    @property
+    def data(self):
+        return self._data
+
+    @property
+    def index(self):
+        return self._index
+
+
+_compiled_models = LRUCache(COMPILED_MODEL_CACHE_SIZE)
+_compiled_models_lock = threading.Lock()
+
+
+def get_model_digest(compressed_model):
+    return hashlib.blake2b(compressed_model.encode("utf-8"), digest_size=16).digest()
+
+
+def get_compiled_nlg_model(model):
+    """ Returns the CompiledNLGModel for the model found in a session, which is normally compressed. Compressed
+    models are decoded and indexed once per process, and looked up by a digest of the compressed payload after
+    that. Models that are already decoded are compiled for each call. """
+    if not isinstance(model, str):
+        return CompiledNLGModel(ensure_decompressed_json(model))
+    digest = get_model_digest(model)
+    with _compiled_models_lock:
+        try:
+            return _compiled_models[digest]
+        except KeyError:
+            pass
+    compiled_model = CompiledNLGModel(ensure_decompressed_json(model))
+    with _compiled_models_lock:
+        _compiled_models[digest] = compiled_model
+    return compiled_model
+
+
+def compiled_nlg_model_cache_stats():
+    with _compiled_models_lock:
+        return _compiled_models.stats()
+
+
+def clear_compiled_nlg_model_cache():
+    with _compiled_models_lock:
+        _compiled_models.clear()
+        _compiled_models.hits = 0
+        _compiled_models.misses = 0
+
+
 class NLG:
-    def __init__(self, moves, context, session, logger):
+    def __init__(self, moves, context, session, logger, compiled_nlg_model=None, generator=None):
         self._moves = moves
         self._context = context
         self._session = session
         self._logger = logger
-        self._nlg_model = None
-        self._generator = Generator(
-            self.nlg_model, self.facts, self.facts_being_grounded, self.entities_under_discussion, self.logger
+        self._compiled_nlg_model = compiled_nlg_model
+        self._generator = generator or Generator(
+            self.nlg_model,
+            self.facts,
+            self.facts_being_grounded,
+            self.entities_under_discussion,
+            self.logger,
+            model_index=self.compiled_nlg_model.index
         )
 
+    @property
+    def compiled_nlg_model(self):
+        if self._compiled_nlg_model is None:
+            self._compiled_nlg_model = get_compiled_nlg_model(self.session.get("nlg"))
+        return self._compiled_nlg_model
+
     @property
     def nlg_model(self):
-        if not self._nlg_model:
-            nlg_model = self.session.get("nlg")
-            self._nlg_model = ensure_decompressed_json(nlg_model)
-        return self._nlg_model
+        return self.compiled_nlg_model.data
+
+    @property
+    def generator(self):
+        return self._generator
 
     @property
     def moves(self):
@@ -248,18 +526,50 @@ class NLG:
         return utterance
 
 
+class FillerDict(dict):
+    """ The grammar entries of the facts available to a generator, by predicate name. Each entry is created the first
+    time it is looked up, and then kept for the lifetime of the generator. """
+    def __init__(self, facts, grammar_entry_for):
+        super().__init__()
+        self._facts = facts
+        self._grammar_entry_for = grammar_entry_for
+
+    def __missing__(self, predicate_name):
+        if predicate_name not in self._facts:
+            raise KeyError(predicate_name)
+        grammar_entry = self._grammar_entry_for(self._facts[predicate_name])
+        self[predicate_name] = grammar_entry
+        return grammar_entry
+
+
 class Generator:
-    def __init__(self, nlg_data, facts, facts_being_grounded, entities_under_discussion, logger):
+    def __init__(self, nlg_data, facts, facts_being_grounded, entities_under_discussion, logger, model_index=None):
         self._facts = facts
         self._nlg_data = nlg_data
         self._facts_being_grounded = facts_being_grounded
         self._entities_under_discussion = entities_under_discussion
         self._logger = logger
+        self._model_index = model_index
+        self._filler_dict = None
+
+    @property
+    def model_index(self):
+        if self._model_index is None:
+            self._model_index = NLGModelIndex(self._nlg_data)
+        return self._model_index
+
+    @property
+    def filler_dict(self):
+        if self._filler_dict is None:
+            all_facts = self._facts | self._facts_being_grounded | self._entities_under_discussion
+            self._filler_dict = FillerDict(all_facts, self._grammar_entry_for)
+        return self._filler_dict
 
     def generate_sequence(self, moves):
         for moves_as_string in generate_moves_subsequences(moves):
             sequence_content = self._nlg_data.get(moves_as_string)
             if sequence_content:
+                sequence_content = dict(sequence_content)
                 utterance = self._select_candidate_utterance_from_string(sequence_content["utterance"])
                 if is_utterance_with_ng_slots(utterance):
                     sequence_content["utterance"] = self._populate_ng_slots_in(utterance)
@@ -354,27 +664,16 @@ class Generator:
         return [self._populate_ng_slots_in(utterance) for utterance in utterances]
 
     def _populate_ng_slots_in(self, utterance):
-        def all_facts_dict():
-            return self._facts | self._facts_being_grounded | self._entities_under_discussion
-
-        def create_filler_dict():
-            d = {}
-            all_facts = all_facts_dict()
-            for predicate_name in all_facts:
-                d[predicate_name] = grammar_entry(predicate_name, all_facts)
-            return d
-
-        def grammar_entry(entry, all_facts):
-            if all_facts[entry].get("grammar_entry", None):
-                return all_facts[entry].get("grammar_entry", None)
-            if all_facts[entry]["sort"] in ["integer", "real", "string"]:
-                return all_facts[entry].get("value")
-            individual = all_facts[entry].get("value", None)
-            result = self.generate(f"answer({individual})")
-            return result["utterance"]
-
-        filler_dict = create_filler_dict()
-        return utterance.format_map(filler_dict)
+        return utterance.format_map(self.filler_dict)
+
+    def _grammar_entry_for(self, fact):
+        if fact.get("grammar_entry", None):
+            return fact.get("grammar_entry", None)
+        if fact["sort"] in ["integer", "real", "string"]:
+            return fact.get("value")
+        individual = fact.get("value", None)
+        result = self.generate(f"answer({individual})")
+        return result["utterance"]
 
     def _get_all_candidate_utterances_from_string(self, candidates):
         return [candidate.strip() for candidate in candidates.split("|")]
@@ -408,15 +707,6 @@ class Generator:
         grammar_entry = self._get_grammar_entry_for(predicate)
         return utterance.replace(slot_definition, grammar_entry)
 
-    def _get_matcher_pattern_for(self, move_pattern, slot_definitions):
-        replacement = "(.*)"
-        escaped_move_pattern = re.escape(move_pattern)
-        matcher_pattern = escaped_move_pattern
-        for slot_definition in slot_definitions:
-            escaped_slot_definition = re.escape(slot_definition)
-            matcher_pattern = matcher_pattern.replace(escaped_slot_definition, replacement)
-        return matcher_pattern
-
     def _get_grammar_entry_for(self, predicate):
         for collection in [self._facts, self._facts_being_grounded, self._entities_under_discussion]:
             if predicate in collection:
@@ -432,127 +722,70 @@ class Generator:
         utterance = utterance_pattern.replace(slot_reference, grammar_entry)
         return utterance
 
-    def _pattern_matches_move(self, pattern, move, slot_references):
-        re_pattern = self._get_matcher_pattern_for(pattern, slot_references)
-        match_object = re.match(re_pattern, move)
-        return match_object
-
     def _populate_predicate_and_validity_patterns(self, move):
-        for entry in self._nlg_data["validity_wildcard_entries"]["docs"]:
-            if VALIDITY_WILDCARD in entry["match"] and PREDICATE_WILDCARD in entry["match"]:
-                matches_predicate = self._pattern_matches_move(
-                    entry["match"], move, [PREDICATE_WILDCARD, VALIDITY_WILDCARD]
-                )
-                if matches_predicate:
-                    return {"utterance": entry["utterance"], "persona": entry.get("persona")}
-
-        for entry in self._nlg_data["predicate_wildcard_entries"]["docs"]:
-            if VALIDITY_WILDCARD in entry["match"] and PREDICATE_WILDCARD in entry["match"]:
-                matches_predicate = self._pattern_matches_move(
-                    entry["match"], move, [PREDICATE_WILDCARD, VALIDITY_WILDCARD]
-                )
-                if matches_predicate:
-                    return {"utterance": entry["utterance"], "persona": entry.get("persona")}
+        for compiled_entry in self.model_index.predicate_and_validity_entries.candidates_for(move):
+            if compiled_entry.matches(move):
+                return {"utterance": compiled_entry.utterance, "persona": compiled_entry.persona}
 
     def _populate_validity_patterns(self, move):
-        for entry in self._nlg_data["validity_wildcard_entries"]["docs"]:
-            if VALIDITY_WILDCARD in entry["match"]:
-                if self._pattern_matches_move(entry["match"], move, [VALIDITY_WILDCARD]):
-                    return {"utterance": entry["utterance"], "persona": entry.get("persona")}
+        for compiled_entry in self.model_index.validity_entries.candidates_for(move):
+            if compiled_entry.matches(move):
+                return {"utterance": compiled_entry.utterance, "persona": compiled_entry.persona}
 
     def _populate_proposition_set_patterns(self, move):
-        for entry in self._nlg_data["proposition_set_wildcard_entries"]["docs"]:
-            if PROPOSITION_SET_WILDCARD in entry["match"]:
-                if self._pattern_matches_move(entry["match"], move, [PROPOSITION_SET_WILDCARD]):
-                    return {"utterance": entry["utterance"], "persona": entry.get("persona")}
+        for compiled_entry in self.model_index.proposition_set_entries.candidates_for(move):
+            if compiled_entry.matches(move):
+                return {"utterance": compiled_entry.utterance, "persona": compiled_entry.persona}
 
     def _populate_individual_slot_patterns(self, move):
-        def populate_pattern_with_individual_slots(utterance_pattern, move_pattern, propositional_slot):
-            re_pattern = self._get_matcher_pattern_for(move_pattern, [propositional_slot])
-            match_object = re.match(re_pattern, move)
+        def populate_pattern_with_individual_slots(compiled_entry):
+            match_object = compiled_entry.match_slot(move)
             if match_object:
                 proposition_expression = match_object.group(1)
                 predicate = get_predicate(proposition_expression)
                 grammar_entry = self._get_grammar_entry_for(predicate)
-                result = self._replace_slot(utterance_pattern, INDIVIDUAL_SLOT, grammar_entry)
+                result = self._replace_slot(compiled_entry.utterance, INDIVIDUAL_SLOT, grammar_entry)
                 return result
 
-        def get_propositional_slot_reference_for_individual(pattern):
-            m = re.search(r'([a-zA-Z0-9_]+\(' + INDIVIDUAL_SLOT + r'\))', pattern)
-            if m:
-                match = m.groups()[0]
-                return match
-            return None
-
-        for entry in self._nlg_data["individual_entries"]["docs"]:
-            utterance_pattern = entry["utterance"]
-            propositional_slot_for_individual = get_propositional_slot_reference_for_individual(entry["match"])
-            if propositional_slot_for_individual is not None:
-                if self._pattern_matches_move(entry["match"], move, ["&individual"]):
-                    if INDIVIDUAL_SLOT in entry["match"] and INDIVIDUAL_SLOT not in utterance_pattern:
-                        return {"utterance": utterance_pattern, "persona": entry.get("persona")}
-                    result_utterance = populate_pattern_with_individual_slots(
-                        utterance_pattern, entry["match"], propositional_slot_for_individual
-                    )
-                    return {"utterance": result_utterance, "persona": entry.get("persona")}
+        for compiled_entry in self.model_index.individual_entries.candidates_for(move):
+            if compiled_entry.matches(move):
+                utterance_pattern = compiled_entry.utterance
+                if INDIVIDUAL_SLOT in compiled_entry.match and INDIVIDUAL_SLOT not in utterance_pattern:
+                    return {"utterance": utterance_pattern, "persona": compiled_entry.persona}
+                result_utterance = populate_pattern_with_individual_slots(compiled_entry)
+                return {"utterance": result_utterance, "persona": compiled_entry.persona}
 
     def _populate_propositional_slot_patterns(self, move):
-        def populate_pattern_with_propositional_slots(utterance_pattern, move_pattern, slot_definition):
-            re_pattern = self._get_matcher_pattern_for(move_pattern, [slot_definition])
-            match_object = re.match(re_pattern, move)
+        def populate_pattern_with_propositional_slots(compiled_entry, match_object):
+            proposition_expression = match_object.group(1)
+            predicate = get_predicate(proposition_expression)
+            grammar_entry = self._get_grammar_entry_for(predicate)
+            if grammar_entry == "":
+                self._logger.warning(f"Expected move with entry in context, but got '{move}'.")
+                return ""
+            return self._replace_slot(compiled_entry.utterance, compiled_entry.slot_reference, grammar_entry)
+
+        for compiled_entry in self.model_index.propositional_entries.candidates_for(move):
+            slot_reference = compiled_entry.slot_reference
+            utterance_pattern = compiled_entry.utterance
+            if slot_reference not in utterance_pattern:
+                raise SlotDefinitionException(
+                    f"Expected '{compiled_entry.match}' and '{utterance_pattern}' to contain same slot."
+                )
+            match_object = compiled_entry.matches(move)
             if match_object:
-                proposition_expression = match_object.group(1)
-                predicate = get_predicate(proposition_expression)
-                grammar_entry = self._get_grammar_entry_for(predicate)
-                if grammar_entry == "":
-                    self._logger.warning(f"Expected move with entry in context, but got '{move}'.")
-                    return ""
-                return self._replace_slot(utterance_pattern, slot_definition, grammar_entry)
-
-        for entry in self._nlg_data["propositional_entries"]["docs"]:
-            slot_reference = self._get_propositional_slot_reference_for(entry["match"])
-            if slot_reference:
-                utterance_pattern = entry["utterance"]
-                if slot_reference in entry["match"] and slot_reference not in utterance_pattern:
-                    raise SlotDefinitionException(
-                        f"Expected '{entry['match']}' and '{utterance_pattern}' to contain same slot."
-                    )
-                if self._pattern_matches_move(entry["match"], move, [slot_reference]):
-                    result_utterance = populate_pattern_with_propositional_slots(
-                        utterance_pattern, entry["match"], slot_reference
-                    )
-                    return {"utterance": result_utterance, "persona": entry.get("persona")}
-
-    def _get_propositional_slot_reference_for(self, pattern):
-        m = re.search(PROPOSITIONAL_SLOT_PATTERN, pattern)
-        if m:
-            match = m.groups()[0]
-            return match
-        return None
+                result_utterance = populate_pattern_with_propositional_slots(compiled_entry, match_object)
+                return {"utterance": result_utterance, "persona": compiled_entry.persona}
 
     def _populate_icm_references(self, move):
-        def get_icm_slot_reference_for(match):
-            m = re.search(ICM_SLOT_PATTERN, match)
-            if m:
-                match = m.groups()[0]
-                return match
-            return None
-
-        def populate_pattern_with_string(entry, icm_slot_reference, move):
-            utterance_pattern = entry["utterance"]
-            re_pattern = self._get_matcher_pattern_for(entry["match"], [icm_slot_reference])
-            match_object = re.match(re_pattern, move)
+        for compiled_entry in self.model_index.icm_slot_entries.candidates_for(move):
+            match_object = compiled_entry.matches(move)
             if match_object:
                 embedded_string = match_object.group(1)
-                result = self._replace_slot(utterance_pattern, icm_slot_reference, embedded_string)
-                return result
-
-        for entry in self._nlg_data["icm_slot_entries"]["docs"]:
-            icm_slot_reference = get_icm_slot_reference_for(entry["match"])
-            if icm_slot_reference is not None \
-               and self._pattern_matches_move(entry["match"], move, [icm_slot_reference]):
-                result_utterance = populate_pattern_with_string(entry, icm_slot_reference, move)
-                return {"utterance": result_utterance, "persona": entry.get("persona")}
+                result_utterance = self._replace_slot(
+                    compiled_entry.utterance, compiled_entry.slot_reference, embedded_string
+                )
+                return {"utterance": result_utterance, "persona": compiled_entry.persona}
 
     def _get_string_from_string_answer_move(self, move):
         m = re.search(STRING_ANSWER_PATTERN, move)
@@ -5,6 +5,7 @@ from jinja2 import Environment
 import structlog
 
 from tala.nlg import nlg
+from tala.utils.compression import compress_json
 from tala.utils.func import configure_stdout_logging
 
 environment = Environment()
@@ -287,3 +288,150 @@ class TestGenerator():
 
     def then_result_is(self, expected_result):
         assert self._nlg.result == expected_result
+
+
+class TestNLGModelIndex():
+    def setup_method(self):
+        self._nlg_data = {
+            "individual_entries": {
+                "docs": [
+                    {"match": "answer(user_name(&individual))", "utterance": "I'll call you &individual."},
+                    {"match": "report(city(&individual))", "utterance": "The city is &individual."},
+                ]
+            },
+            "icm_slot_entries": {
+                "docs": [{"match": "icm:per*pos:&utterance", "utterance": "I heard you say &utterance."}]
+            },
+        }  # yapf: disable
+        self._index = nlg.NLGModelIndex(self._nlg_data)
+
+    def test_move_head_of_non_icm_move(self):
+        assert "answer(" == nlg.get_move_head("answer(user_name(Fred))")
+
+    def test_move_head_of_icm_move_includes_icm_type(self):
+        assert "icm:per*pos:" == nlg.get_move_head('icm:per*pos:"hello"')
+
+    def test_move_head_of_move_without_head(self):
+        assert nlg.get_move_head("greet") is None
+
+    def test_candidates_are_entries_with_same_move_head(self):
+        candidates = self._index.individual_entries.candidates_for("report(city(paris))")
+        assert ["report(city(&individual))"] == [candidate.match for candidate in candidates]
+
+    def test_no_candidates_for_unknown_move_head(self):
+        assert [] == self._index.individual_entries.candidates_for("ask(?X.city(X))")
+
+    def test_compiled_entry_matches_move(self):
+        candidates = self._index.icm_slot_entries.candidates_for('icm:per*pos:"hello"')
+        assert '"hello"' == candidates[0].matches('icm:per*pos:"hello"').group(1)
+
+    def test_generator_uses_given_index(self):
+        facts = {"city": {"sort": "city", "value": "paris", "grammar_entry": "Paris"}}
+        generator = nlg.Generator(self._nlg_data, facts, {}, {}, structlog.get_logger(__name__), self._index)
+        assert {"utterance": "The city is Paris.", "persona": None} == generator.generate("report(city(paris))")
+
+
+class TestCompiledNLGModelCache():
+    def setup_method(self):
+        nlg.clear_compiled_nlg_model_cache()
+        self._nlg_data = {"greet": {"utterance": "Hello|Hi", "persona": None}, "personas": {}}
+
+    def teardown_method(self):
+        nlg.clear_compiled_nlg_model_cache()
+
+    def test_compressed_model_is_compiled_once(self):
+        self.given_compressed_model()
+        self.when_getting_compiled_model_twice()
+        self.then_same_compiled_model_is_returned()
+
+    def given_compressed_model(self):
+        self._model = compress_json(self._nlg_data)
+
+    def when_getting_compiled_model_twice(self):
+        self._first = nlg.get_compiled_nlg_model(self._model)
+        self._second = nlg.get_compiled_nlg_model(self._model)
+
+    def then_same_compiled_model_is_returned(self):
+        assert self._first is self._second
+        assert self._nlg_data == self._first.data
+
+    def test_stats_count_hits_and_misses(self):
+        self.given_compressed_model()
+        self.when_getting_compiled_model_twice()
+        self.then_stats_are(hits=1, misses=1, size=1)
+
+    def then_stats_are(self, **expected):
+        stats = nlg.compiled_nlg_model_cache_stats()
+        assert expected == {key: stats[key] for key in expected}
+
+    def test_decompressed_model_is_not_cached(self):
+        self.given_decompressed_model()
+        self.when_getting_compiled_model_twice()
+        self.then_stats_are(hits=0, misses=0, size=0)
+
+    def given_decompressed_model(self):
+        self._model = self._nlg_data
+
+    def test_generating_does_not_modify_shared_model(self):
+        self.given_compressed_model()
+        self.when_generating("greet")
+        self.then_shared_model_is_unchanged()
+
+    def when_generating(self, move):
+        nlg.generate_utterance([move], {}, {"nlg": self._model}, structlog.get_logger(__name__))
+
+    def then_shared_model_is_unchanged(self):
+        assert self._nlg_data == nlg.get_compiled_nlg_model(self._model).data
+
+
+class TestGenerateBatch():
+    def setup_method(self):
+        self.logger = structlog.get_logger(__name__)
+        self._session = {
+            "nlg": {
+                "greet": {"utterance": "Hello {user_name}.", "persona": None},
+                "icm:acc*pos": {"utterance": "Ok.", "persona": None},
+                "personas": {},
+            }
+        }  # yapf: disable
+
+    def test_results_are_returned_in_order_of_requests(self):
+        self.given_requests([(["greet"], self._context_for("Fred")), (["icm:acc*pos"], {}),
+                             (["greet"], self._context_for("Anna"))])
+        self.when_generating_batch()
+        self.then_utterances_are(["Hello Fred.", "Ok.", "Hello Anna."])
+
+    def _context_for(self, user_name):
+        return {"facts": {"user_name": {"sort": "string", "value": user_name}}}
+
+    def given_requests(self, requests):
+        self._requests = requests
+
+    def when_generating_batch(self):
+        self._results = nlg.generate_batch(self._requests, self._session, self.logger)
+
+    def then_utterances_are(self, expected):
+        assert expected == [result["utterance"] for result in self._results]
+
+    def test_same_result_as_generate(self):
+        self.given_requests([(["greet"], self._context_for("Fred"))])
+        self.when_generating_batch()
+        self.then_results_are([nlg.generate(["greet"], self._context_for("Fred"), self._session, self.logger)])
+
+    def then_results_are(self, expected):
+        assert expected == self._results
+
+    def test_unknown_moves_fail_without_affecting_other_requests(self):
+        self.given_requests([(["unknown"], {}), (["icm:acc*pos"], {})])
+        self.when_generating_batch()
+        self.then_statuses_are([nlg.FAIL, nlg.SUCCESS])
+
+    def then_statuses_are(self, expected):
+        assert expected == [result["status"] for result in self._results]
+
+    def test_only_facts_referred_to_are_filled(self):
+        context = self._context_for("Fred")
+        context["facts"]["city"] = {"value": "paris"}
+        self.given_requests([(["greet"], context)])
+        self.when_generating_batch()
+        self.then_utterances_are(["Hello Fred."])
@@ -245,6 +245,21 @@ class TestInheritance(ConfigTester):
         self.when_reading()
         self.then_result_is({"key_to_override": "parent_value", "overrides": "parent.config.json"})
 
+    @patch.object(Config, "fields")
+    def test_parent_is_read_relative_to_child(self, mock_fields):
+        self.given_fields(mock_fields, {"key_to_override": OptionalConfigField(default_value="mock_default_value")})
+        os.mkdir("configs")
+        self.given_config_file_exists(
+            Config, {
+                "key_to_override": "parent_value",
+                "overrides": None
+            }, name="configs/parent.config.json"
+        )
+        self.given_config_file_exists(Config, {"overrides": "parent.config.json"}, name="configs/child.config.json")
+        self.given_created_config_object(Config, "configs/child.config.json")
+        self.when_reading()
+        self.then_result_is({"key_to_override": "parent_value", "overrides": "parent.config.json"})
+
     @patch.object(Config, "fields")
     def test_read_with_missing_parent_raises_exception(self, mock_fields):
         self.given_fields(mock_fields, {})
@@ -0,0 +1,340 @@
+import io
+import json
+import os
+import subprocess
+import sys
+from unittest.mock import Mock, patch
+
+import pytest
+
+import tala.domain_orchestration
+from tala.config import DddConfig
+from tala.ddd.loading.compile_cache import DDDCompileCache
+from tala.domain_orchestration import write_odb, ODBReader, InvalidODBException, write_odb_snapshot, \
+    read_odb_snapshot, load_odb, StaleODBSnapshotException, DDDCompilation
+from tala.model.action import Action
+from tala.model.goal import Perform
+from tala.model.proposition import GoalProposition, PropositionSet
+from tala.model.question import AltQuestion
+from tala.testing.ddd_mocker import DddMockingTestCase
+
+
+class TestWriteODB(object):
+    def test_written_odb_is_same_as_json_of_complete_odb(self):
+        self.given_settings({"ddd_names": ["first", "second"], "rerank_amount": 0.2, "should_greet": True})
+        self.given_ddds([{"data": {"id": "first"}}, {"data": {"id": "second"}}])
+        self.when_write_odb()
+        self.then_written_odb_is(
+            json.dumps({
+                "ddd_names": ["first", "second"],
+                "rerank_amount": 0.2,
+                "should_greet": True,
+                "ddds": [{
+                    "data": {
+                        "id": "first"
+                    }
+                }, {
+                    "data": {
+                        "id": "second"
+                    }
+                }]
+            })
+        )
+
+    def given_settings(self, settings):
+        self._settings = settings
+
+    def given_ddds(self, ddds):
+        self._ddds = ddds
+
+    def when_write_odb(self):
+        self._file = io.StringIO()
+        write_odb(self._settings, iter(self._ddds), self._file)
+
+    def then_written_odb_is(self, expected):
+        assert expected == self._file.getvalue()
+
+    def test_odb_without_ddds(self):
+        self.given_settings({"ddd_names": []})
+        self.given_ddds([])
+        self.when_write_odb()
+        self.then_written_odb_is(json.dumps({"ddd_names": [], "ddds": []}))
+
+
+class TestODBReader(object):
+    def test_settings(self):
+        self.given_odb({"ddd_names": ["first"], "rerank_amount": 0.2, "ddds": [{"data": {"id": "first"}}]})
+        self.when_create_reader()
+        self.then_settings_are({"ddd_names": ["first"], "rerank_amount": 0.2})
+
+    def given_odb(self, odb, indent=None):
+        self._odb_as_string = json.dumps(odb, indent=indent)
+
+    def when_create_reader(self, chunk_size=1024):
+        self._reader = ODBReader(io.StringIO(self._odb_as_string), chunk_size=chunk_size)
+
+    def then_settings_are(self, expected):
+        assert expected == self._reader.settings
+
+    def test_ddds(self):
+        self.given_odb({
+            "ddd_names": ["first", "second"],
+            "ddds": [{
+                "data": {
+                    "id": "first"
+                }
+            }, {
+                "data": {
+                    "id": "second"
+                }
+            }]
+        })
+        self.when_create_reader()
+        self.then_ddds_are([{"data": {"id": "first"}}, {"data": {"id": "second"}}])
+
+    def then_ddds_are(self, expected):
+        assert expected == list(self._reader.ddds_as_json())
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 8])
+    def test_values_split_between_chunks(self, chunk_size):
+        self.given_odb({"rerank_amount": 0.125, "ddds": [{"data": {"id": "first", "count": 12345}}], "count": 67890})
+        self.when_create_reader(chunk_size=chunk_size)
+        self.then_ddds_are([{"data": {"id": "first", "count": 12345}}])
+        self.then_settings_are({"rerank_amount": 0.125, "count": 67890})
+
+    def test_indented_odb(self):
+        self.given_odb({"ddd_names": ["first"], "ddds": [{"data": {"id": "first"}}]}, indent=4)
+        self.when_create_reader(chunk_size=3)
+        self.then_ddds_are([{"data": {"id": "first"}}])
+        self.then_settings_are({"ddd_names": ["first"]})
+
+    def test_settings_after_ddds_are_read_with_ddds(self):
+        self.given_odb({"ddds": [{"data": {"id": "first"}}], "ddd_names": ["first"]})
+        self.when_create_reader()
+        self.then_settings_are({})
+        self.then_ddds_are([{"data": {"id": "first"}}])
+        self.then_settings_are({"ddd_names": ["first"]})
+
+    def test_odb_without_ddds(self):
+        self.given_odb({"ddd_names": []})
+        self.when_create_reader()
+        self.then_settings_are({"ddd_names": []})
+        self.then_ddds_are([])
+
+    def test_odb_with_empty_ddds(self):
+        self.given_odb({"ddd_names": [], "ddds": []})
+        self.when_create_reader()
+        self.then_ddds_are([])
+        self.then_settings_are({"ddd_names": []})
+
+    @pytest.mark.parametrize("odb_as_string", ['', '["ddds"]', '{"ddds": [{"data": }]}', '{"ddds": [{}'])
+    def test_invalid_odb_raises_exception(self, odb_as_string):
+        with pytest.raises(InvalidODBException):
+            reader = ODBReader(io.StringIO(odb_as_string))
+            list(reader.ddds_as_json())
+
+
+class MockDomainIndex(object):
+    def build(self):
+        pass
+
+
+class MockDomain(object):
+    index = MockDomainIndex()
+
+
+class MockDDD(object):
+    def __init__(self, name):
+        self.name = name
+        self.domain = MockDomain()
+
+    def __eq__(self, other):
+        return self.name == other.name
+
+
+def create_alt_question():
+    return AltQuestion(
+        PropositionSet([
+            GoalProposition(Perform(Action("buy", "mockup_ontology"))),
+            GoalProposition(Perform(Action("sell", "mockup_ontology")))
+        ])
+    )
+
+
+class TestODBSnapshot(object):
+    @pytest.fixture(autouse=True)
+    def _paths(self, tmp_path):
+        self._odb_path = str(tmp_path / "odb.json")
+        self._snapshot_path = str(tmp_path / "odb.snapshot")
+
+    def test_read_snapshot_returns_written_ddds(self):
+        self.given_odb({"ddd_names": ["first"], "ddds": [{"data": {"id": "first"}}]})
+        self.given_snapshot_written([MockDDD("first")])
+        self.when_read_snapshot()
+        self.then_ddds_are([MockDDD("first")])
+
+    def given_odb(self, odb):
+        with open(self._odb_path, "w") as file:
+            json.dump(odb, file)
+
+    def given_snapshot_written(self, ddds):
+        write_odb_snapshot(ddds, self._odb_path, self._snapshot_path)
+
+    def when_read_snapshot(self):
+        self._ddds = read_odb_snapshot(self._snapshot_path, self._odb_path)
+
+    def then_ddds_are(self, expected):
+        assert expected == self._ddds
+
+    def test_snapshot_of_other_odb_is_stale(self):
+        self.given_odb({"ddd_names": ["first"], "ddds": [{"data": {"id": "first"}}]})
+        self.given_snapshot_written([MockDDD("first")])
+        self.given_odb({"ddd_names": ["second"], "ddds": [{"data": {"id": "second"}}]})
+        with pytest.raises(StaleODBSnapshotException):
+            self.when_read_snapshot()
+
+    def test_snapshot_of_other_tala_version_is_stale(self):
+        self.given_odb({"ddd_names": ["first"], "ddds": [{"data": {"id": "first"}}]})
+        with patch("{}.installed_tala_version".format(tala.domain_orchestration.__name__), return_value="0.0.1"):
+            self.given_snapshot_written([MockDDD("first")])
+        with pytest.raises(StaleODBSnapshotException):
+            self.when_read_snapshot()
+
+    def test_file_which_is_not_snapshot_is_stale(self):
+        self.given_odb({"ddd_names": ["first"], "ddds": [{"data": {"id": "first"}}]})
+        with open(self._snapshot_path, "w") as file:
+            file.write("not a snapshot")
+        with pytest.raises(StaleODBSnapshotException):
+            self.when_read_snapshot()
+
+    def test_alt_questions_are_found_in_snapshot_read_with_other_hash_seed(self):
+        self.given_odb({"ddd_names": ["first"], "ddds": [{"data": {"id": "first"}}]})
+        self.given_snapshot_written_with_alt_questions(hash_seed="1")
+        self.when_alt_questions_are_looked_up_in_snapshot(hash_seed="2")
+        self.then_output_is("True True True")
+
+    def given_snapshot_written_with_alt_questions(self, hash_seed):
+        self._run_with_hash_seed(
+            hash_seed, "from tala.domain_orchestration import write_odb_snapshot\n"
+            "from tala.test.test_domain_orchestration import MockDDD, create_alt_question\n"
+            "from tala.model.set import Set\n"
+            "ddd = MockDDD('first')\n"
+            "hash(create_alt_question())\n"
+            "ddd.alt_questions = Set([create_alt_question()])\n"
+            "ddd.alt_question_set = {create_alt_question()}\n"
+            "write_odb_snapshot([ddd], %r, %r)\n" % (self._odb_path, self._snapshot_path)
+        )
+
+    def _run_with_hash_seed(self, hash_seed, code):
+        completed_process = subprocess.run([sys.executable, "-c", code],
+                                           env=dict(os.environ, PYTHONHASHSEED=hash_seed),
+                                           capture_output=True,
+                                           text=True,
+                                           check=True)
+        return completed_process.stdout.strip()
+
+    def when_alt_questions_are_looked_up_in_snapshot(self, hash_seed):
+        self._output = self._run_with_hash_seed(
+            hash_seed, "from tala.domain_orchestration import read_odb_snapshot\n"
+            "from tala.test.test_domain_orchestration import create_alt_question\n"
+            "ddd, = read_odb_snapshot(%r, %r)\n"
+            "alt_question = create_alt_question()\n"
+            "print(alt_question in ddd.alt_questions, alt_question in ddd.alt_question_set,\n"
+            "      hash(alt_question) == hash(list(ddd.alt_questions)[0]))\n" % (self._snapshot_path, self._odb_path)
+        )
+
+    def then_output_is(self, expected):
+        assert expected == self._output
+
+    def test_load_odb_adds_ddds_from_snapshot(self):
+        self.given_odb({"ddd_names": ["first"], "ddds": [{"data": {"id": "first"}}]})
+        self.given_snapshot_written([MockDDD("first")])
+        self.when_load_odb(snapshot_path=self._snapshot_path)
+        self.then_settings_are({"ddd_names": ["first"]})
+        self._ddd_manager.add_built_ddds.assert_called_once_with(["first"], [MockDDD("first")])
+        self._ddd_manager.add_ddds_from_json_stream.assert_not_called()
+
+    def when_load_odb(self, snapshot_path):
+        self._ddd_manager = Mock()
+        self._ddd_manager.add_ddds_from_json_stream.side_effect = lambda ddd_names, ddds_as_json: list(ddds_as_json)
+        self._settings = load_odb(self._odb_path, self._ddd_manager, snapshot_path)
+
+    def then_settings_are(self, expected):
+        assert expected == self._settings
+
+    def test_load_odb_falls_back_to_json_for_stale_snapshot(self):
+        self.given_odb({"ddd_names": ["first"], "ddds": [{"data": {"id": "first"}}]})
+        self.given_snapshot_written([MockDDD("first")])
+        self.given_odb({"ddd_names": ["second"], "ddds": [{"data": {"id": "second"}}]})
+        self.when_load_odb(snapshot_path=self._snapshot_path)
+        self.then_settings_are({"ddd_names": ["second"]})
+        self._ddd_manager.add_built_ddds.assert_not_called()
+        self._ddd_manager.add_ddds_from_json_stream.assert_called_once()
+
+    def test_load_odb_falls_back_to_json_for_missing_snapshot(self):
+        self.given_odb({"ddd_names": ["first"], "ddds": [{"data": {"id": "first"}}]})
+        self.when_load_odb(snapshot_path=self._snapshot_path)
+        self._ddd_manager.add_built_ddds.assert_not_called()
+        self._ddd_manager.add_ddds_from_json_stream.assert_called_once()
+
+
+class TestDDDCompilation(DddMockingTestCase):
+    def setUp(self):
+        super(TestDDDCompilation, self).setUp()
+        self._cache = DDDCompileCache("cache")
+
+    def test_ddds_are_compiled_without_cache(self):
+        self._given_ddd("first_ddd", "FirstOntology")
+        self._when_compiling(["first_ddd"], cache=None)
+        self._then_compiled_and_reused_ddds_are(["first_ddd"], [])
+        self._then_ddd_names_of_json_are(["first_ddd"])
+
+    def _given_ddd(self, name, ontology_name):
+        self.create_mockup_file("%s/ontology.xml" % name, '<ontology name="%s"/>' % ontology_name)
+        self._given_domain_xml_file("%s/domain.xml" % name)
+        self._given_service_interface_xml_file("%s/service_interface.xml" % name)
+        DddConfig.write_default_config(path="%s/%s" % (name, DddConfig.default_name()))
+
+    def _when_compiling(self, ddd_names, cache):
+        self._compilation = DDDCompilation(ddd_names, None, 0.2, cache=cache)
+        self._ddds_as_json = list(self._compilation.ddds_as_json_api_dicts())
+
+    def _then_compiled_and_reused_ddds_are(self, compiled_ddd_names, reused_ddd_names):
+        self.assertEqual(compiled_ddd_names, self._compilation.compiled_ddd_names)
+        self.assertEqual(reused_ddd_names, self._compilation.reused_ddd_names)
+
+    def _then_ddd_names_of_json_are(self, expected):
+        self.assertEqual(expected, [ddd_as_json["data"]["attributes"]["name"] for ddd_as_json in self._ddds_as_json])
+
+    def test_unchanged_ddds_are_reused_from_cache(self):
+        self._given_ddd("first_ddd", "FirstOntology")
+        self._given_ddd("second_ddd", "SecondOntology")
+        self._given_compiled(["first_ddd", "second_ddd"])
+        self._when_compiling(["first_ddd", "second_ddd"], cache=self._cache)
+        self._then_compiled_and_reused_ddds_are([], ["first_ddd", "second_ddd"])
+        self._then_json_is_same_as_when_compiled()
+
+    def _given_compiled(self, ddd_names):
+        self._when_compiling(ddd_names, cache=self._cache)
+        self._compiled_ddds_as_json = self._ddds_as_json
+
+    def _then_json_is_same_as_when_compiled(self):
+        self.assertEqual(self._compiled_ddds_as_json, self._ddds_as_json)
+
+    def test_changed_ddd_is_recompiled(self):
+        self._given_ddd("first_ddd", "FirstOntology")
+        self._given_ddd("second_ddd", "SecondOntology")
+        self._given_compiled(["first_ddd", "second_ddd"])
+        self._given_domain_xml_file("second_ddd/domain.xml", "ChangedDomain")
+        self._when_compiling(["first_ddd", "second_ddd"], cache=self._cache)
+        self._then_compiled_and_reused_ddds_are(["second_ddd"], ["first_ddd"])
+        self._then_ddd_names_of_json_are(["first_ddd", "second_ddd"])
+
+    def test_reused_ddds_are_built_from_cache(self):
+        self._given_ddd("first_ddd", "FirstOntology")
+        self._given_compiled(["first_ddd"])
+        self._when_compiling(["first_ddd"], cache=self._cache)
+        self._then_built_ddds_have_ontologies(["FirstOntology"])
+
+    def _then_built_ddds_have_ontologies(self, expected):
+        self.assertEqual(expected, [ddd.ontology.get_name() for ddd in self._compilation.ddds()])
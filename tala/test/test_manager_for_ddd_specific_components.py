@@ -144,3 +144,11 @@ class TestManagerForExtendedDDD(unittest.TestCase):
 
     def _then_result_is(self, expected):
         self.assertEqual(expected, self._result)
+
+    def test_ddds_added_from_json_stream_are_indexed(self):
+        self._given_empty_manager_for_ddd_specific_components()
+        self._ddd_manager._parse_and_add = Mock()
+        ddd_as_json = {"ddd_name": "ddd", "ontology": {"_name": "ontology"}}
+        self._ddd_manager.add_ddds_from_json_stream(["ddd"], iter([ddd_as_json]))
+        self.assertEqual(ddd_as_json, self._ddd_manager._get_ddd_as_json("ddd"))
+        self.assertEqual([ddd_as_json], self._ddd_manager.ddds_as_json)
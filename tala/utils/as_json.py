@@ -8,25 +8,97 @@ def json_semantic_expression_of(object_):
 
 
 def convert_to_json(object_, verbose=True):
+    if verbose:
+        return _convert_verbosely(object_)
+    return _convert_compactly(object_)
+
+
+def _converter(verbose):
+    """ Create a conversion function with its own encoder per class. The encoder of a class is picked the first time
+    an object of that class is converted, instead of going through the type checks for every object. """
+    encoders = {}
+
+    def convert(object_):
+        encode = encoders.get(type(object_))
+        if encode is None:
+            encode = _compile_encoder(object_, verbose, convert)
+            encoders[type(object_)] = encode
+        return encode(object_)
+
+    return convert
+
+
+def _compile_encoder(object_, verbose, convert):
     if object_ is None:
-        return None
+        return _encode_none
     if object_ is True or object_ is False:
-        return object_
+        return _encode_as_is
     if isinstance(object_, list):
-        return [convert_to_json(element, verbose) for element in object_]
+        return _list_encoder(convert)
     if isinstance(object_, set):
-        return {"set": [convert_to_json(element, verbose) for element in object_]}
+        return _set_encoder(convert)
     if isinstance(object_, dict):
-        return {str(key): convert_to_json(value, verbose) for key, value in list(object_.items())}
+        return _dict_encoder(convert)
     if not verbose and isinstance(object_, AsSemanticExpressionMixin):
-        return json_semantic_expression_of(object_)
+        return json_semantic_expression_of
     if isinstance(object_, AsJSONMixin):
-        dict_ = object_.as_dict()
-        json = convert_to_json(dict_, verbose)
-        if isinstance(object_, AsSemanticExpressionMixin):
-            json.update(json_semantic_expression_of(object_))
+        return _as_json_mixin_encoder(object_, convert)
+    return str
+
+
+def _encode_none(object_):
+    return None
+
+
+def _encode_as_is(object_):
+    return object_
+
+
+def _list_encoder(convert):
+    def encode(object_):
+        return [convert(element) for element in object_]
+
+    return encode
+
+
+def _set_encoder(convert):
+    def encode(object_):
+        return {"set": [convert(element) for element in object_]}
+
+    return encode
+
+
+def _dict_encoder(convert):
+    def encode(object_):
+        return {str(key): convert(value) for key, value in list(object_.items())}
+
+    return encode
+
+
+def _as_json_mixin_encoder(object_, convert):
+    has_semantic_expression = isinstance(object_, AsSemanticExpressionMixin)
+    if getattr(type(object_), "as_dict", None) is AsJSONMixin.as_dict:
+
+        def as_json(object_):
+            return {str(key): convert(value) for key, value in list(object_.__dict__.items())}
+    else:
+
+        def as_json(object_):
+            return convert(object_.as_dict())
+
+    if not has_semantic_expression:
+        return as_json
+
+    def encode(object_):
+        json = as_json(object_)
+        json.update(json_semantic_expression_of(object_))
         return json
-    return str(object_)
+
+    return encode
+
+
+_convert_verbosely = _converter(verbose=True)
+_convert_compactly = _converter(verbose=False)
 
 
 def convert_to_human_readable_json(object_):
@@ -1,3 +1,6 @@
+_MISSING = object()
+
+
 class EqualityMixin(object):
     def __eq__(self, other):
         if isinstance(other, self.__class__):
@@ -14,6 +17,52 @@ class EqualityMixin(object):
         return hash(tuple(sorted(items(self))))
 
 
+class FrozenEqualityMixin(EqualityMixin):
+    """ An EqualityMixin for objects whose attributes are set when they are created. The hash covers the attribute
+    values and is cached together with the attribute values it was computed from. It is recomputed if an attribute
+    has since been assigned or deleted.
+
+    The hash is only cached when every attribute value has a stable hash, see has_stable_hash, so attributes should
+    hold tuples rather than lists. """
+    __slots__ = ("_structural_hash", )
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if isinstance(other, self.__class__):
+            return self.__dict__ == other.__dict__
+        return NotImplemented
+
+    def __hash__(self):
+        cached_hash = self._cached_hash()
+        if cached_hash is not None:
+            return cached_hash
+        structural_hash = hash(structural_key(self.__dict__))
+        frozen_values = []
+        if all(has_stable_hash(value, frozen_values) for value in self.__dict__.values()):
+            frozen_hashes = tuple((value, hash(value)) for value in frozen_values)
+            self._structural_hash = (dict(self.__dict__), frozen_hashes, structural_hash)
+        return structural_hash
+
+    def _cached_hash(self):
+        try:
+            attributes, frozen_hashes, structural_hash = self._structural_hash
+        except AttributeError:
+            return None
+        if len(attributes) != len(self.__dict__):
+            return None
+        for name, value in self.__dict__.items():
+            if attributes.get(name, _MISSING) is not value:
+                return None
+        for value, value_hash in frozen_hashes:
+            if value._cached_hash() != value_hash:
+                return None
+        return structural_hash
+
+    def __getstate__(self):
+        return self.__dict__
+
+
 def items(object_):
     if isinstance(object_, (list, tuple, set)):
         return (items(element) for element in object_)
@@ -26,3 +75,32 @@ def items(object_):
     if hasattr(object_, "__dict__"):
         return items(object_.__dict__)
     return object_
+
+
+def structural_key(object_):
+    if isinstance(object_, (list, tuple)):
+        return tuple(structural_key(element) for element in object_)
+    if isinstance(object_, (set, frozenset)):
+        return frozenset(structural_key(element) for element in object_)
+    if isinstance(object_, dict):
+        return frozenset((key, structural_key(value)) for key, value in object_.items())
+    try:
+        return hash(object_)
+    except TypeError:
+        return object_.__class__.__name__
+
+
+def has_stable_hash(object_, frozen_values):
+    """ Whether the hash of object_ stays the same as long as it is not replaced. Lists, dicts and sets can be
+    mutated in place, and so can objects using EqualityMixin. Hashable objects are trusted to keep their hash, as
+    Python requires, and unhashable ones only contribute their class name to structural_key. FrozenEqualityMixin
+    objects with stable hashes are added to frozen_values, so that their attributes can be checked later. """
+    if isinstance(object_, (tuple, frozenset)):
+        return all(has_stable_hash(element, frozen_values) for element in object_)
+    if isinstance(object_, FrozenEqualityMixin):
+        hash(object_)
+        if object_._cached_hash() is None:
+            return False
+        frozen_values.append(object_)
+        return True
+    return not isinstance(object_, (list, dict, set, bytearray, EqualityMixin))
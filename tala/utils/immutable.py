@@ -0,0 +1,37 @@
+class ImmutableObjectException(AttributeError):
+    pass
+
+
+class ImmutableMixin(object):
+    """ A mixin for objects that cannot be changed once created, so that equal instances can be shared.
+
+    Subclasses set their attributes in __init__ with _set_attributes. Assigning or deleting an attribute afterwards
+    raises ImmutableObjectException. The hash is computed once by _compute_hash and cached in a slot, which keeps it
+    out of __dict__ and thereby out of as_dict, equality and pickles. """
+    __slots__ = ("_hash", )
+
+    def _set_attributes(self, **attributes):
+        self.__dict__.update(attributes)
+
+    def __setattr__(self, name, value):
+        raise ImmutableObjectException(f"Expected {self.__class__.__name__} to be immutable but tried to set '{name}'")
+
+    def __delattr__(self, name):
+        raise ImmutableObjectException(
+            f"Expected {self.__class__.__name__} to be immutable but tried to delete '{name}'"
+        )
+
+    def _cached_hash(self):
+        try:
+            return self._hash
+        except AttributeError:
+            hash_ = self._compute_hash()
+            object.__setattr__(self, "_hash", hash_)
+            return hash_
+
+    def _compute_hash(self):
+        raise NotImplementedError()
+
+    def __getstate__(self):
+        """ Leaves out the cached hash, since hashes of strings differ between processes. """
+        return self.__dict__
@@ -13,39 +13,71 @@ def get_attribute(attribute_name, data):
 
 
 def get_object_from_relationship(included, key):
+    if isinstance(included, IncludedObject):
+        return included.get(key)
     for item in included:
         if item["type"] == key["type"] and item["id"] == key["id"]:
             return item
 
 
 class IncludedObject:
+    """ The included objects of a JSON:API document, indexed by type and id. An object is only included the first
+    time its type and id is seen. """
     def __init__(self, included_data):
         self._data = {}
-        for item in included_data:
-            self.include(item)
+        self.include_all(included_data)
 
     def include(self, item):
-        type_ = item["type"]
-        id_ = item["id"]
+        self.include_all([item])
 
-        if type_ not in self._data:
-            self._data[type_] = {}
-        if id_ not in self._data[type_]:
-            self._data[type_][id_] = item
+    def include_all(self, items):
+        data = self._data
+        for item in items:
+            ids = data.get(item["type"])
+            if ids is None:
+                ids = data[item["type"]] = {}
+            if item["id"] not in ids:
+                ids[item["id"]] = item
 
     def get_object_from_relationship(self, key):
         return self._data[key["type"]][key["id"]]
 
+    def get(self, key):
+        return self._data.get(key["type"], {}).get(key["id"])
+
     def get_data_for_relationship(self, relationship_name, data):
         return self.get_object_from_relationship(data["relationships"][relationship_name]["data"])
 
+    def subset_for(self, data):
+        """ Returns the included objects that data refers to through its relationships, directly or through other
+        included objects. """
+        subset = IncludedObject([])
+        referring = [data]
+        while referring:
+            for relationship in referring.pop().get("relationships", {}).values():
+                keys = relationship["data"]
+                if isinstance(keys, dict):
+                    keys = [keys]
+                for key in keys or []:
+                    if key in self and key not in subset:
+                        item = self.get_object_from_relationship(key)
+                        subset.include(item)
+                        referring.append(item)
+        return subset
+
+    def __contains__(self, key):
+        return key["id"] in self._data.get(key["type"], {})
+
+    def __iter__(self):
+        for ids in self._data.values():
+            yield from ids.values()
+
+    def __len__(self):
+        return sum(len(ids) for ids in self._data.values())
+
     @property
     def as_list(self):
-        included = []
-        for type_ in self._data:
-            for id_ in self._data[type_]:
-                included.append(self._data[type_][id_])
-        return included
+        return [item for ids in self._data.values() for item in ids.values()]
 
 
 class JSONAPIMixin:
@@ -122,6 +154,7 @@ class JSONAPIObject:
         self.relationships = relationships if relationships else {}
         self.included = IncludedObject(included if included else [])
         self.version = version
+        self._relationship_ids = {}
 
     def set_id(self, id_):
         self.id_ = id_
@@ -130,6 +163,7 @@ class JSONAPIObject:
         self.type_ = type_
 
     def add_relationship(self, name, entry):
+        self._relationship_ids.pop(name, None)
         if entry == []:
             self.relationships[name] = {"data": []}
         else:
@@ -137,31 +171,33 @@ class JSONAPIObject:
             if isinstance(entry["included"], dict):
                 self.include(entry["included"])
             else:
-                for item in entry["included"]:
-                    self.include(item)
+                self.included.include_all(entry["included"])
             self.include(entry["data"])
 
     def add_relationship_no_include(self, name, entry):
+        self._relationship_ids.pop(name, None)
         self.relationships[name] = {"data": {"type": entry["data"]["type"], "id": entry["data"]["id"]}}
 
     def append_relationship(self, name, entry):
         if name not in self.relationships:
             self.relationships[name] = {"data": []}
 
-        self.relationships[name]["data"].append({"type": entry["data"]["type"], "id": entry["data"]["id"]})
-        for item in entry["included"]:
-            self.include(item)
+        id_ = entry["data"]["id"]
+        self.relationships[name]["data"].append({"type": entry["data"]["type"], "id": id_})
+        if name in self._relationship_ids:
+            self._relationship_ids[name].add(id_)
+        self.included.include_all(entry["included"])
         self.include(entry["data"])
 
     def has_relationship(self, name, id_):
-        if name in self.relationships:
-            if type(self.relationships[name]["data"] is list):
-                for item in self.relationships[name]["data"]:
-                    if item["id"] == id_:
-                        return True
-                return False
-            else:
-                return self.relationships[name]["data"]["id"] == id_
+        if name not in self.relationships:
+            return False
+        data = self.relationships[name]["data"]
+        if isinstance(data, list):
+            if name not in self._relationship_ids:
+                self._relationship_ids[name] = {item["id"] for item in data}
+            return id_ in self._relationship_ids[name]
+        return data["id"] == id_
 
     def add_attribute(self, name, entry):
         self.attributes[name] = entry
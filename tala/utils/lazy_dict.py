@@ -0,0 +1,62 @@
+from collections.abc import MutableMapping
+
+NOT_LOADED = object()
+
+
+class LazyDict(MutableMapping):
+    """ A dict where a value can be given as a loader, which creates the value the first time it is looked up. The
+    keys are known up front and keep their insertion order, whether their values are loaded or not. """
+    def __init__(self, values=None):
+        self._values = dict(values) if values else {}
+        self._loaders = {}
+        self._revision = 0
+
+    def set_loader(self, key, load_value):
+        self._values[key] = NOT_LOADED
+        self._loaders[key] = load_value
+        self._revision += 1
+
+    def is_loaded(self, key):
+        return self._values[key] is not NOT_LOADED
+
+    @property
+    def revision(self):
+        """ A number that changes whenever a key is set, deleted or given a loader, but not when a value is loaded. """
+        return self._revision
+
+    @property
+    def loaded_count(self):
+        return len(self._values) - len(self._loaders)
+
+    def __getitem__(self, key):
+        value = self._values[key]
+        if value is NOT_LOADED:
+            value = self._loaders[key]()
+            self._values[key] = value
+            self._loaders.pop(key, None)
+        return value
+
+    def __setitem__(self, key, value):
+        self._values[key] = value
+        self._loaders.pop(key, None)
+        self._revision += 1
+
+    def __delitem__(self, key):
+        del self._values[key]
+        self._loaders.pop(key, None)
+        self._revision += 1
+
+    def __contains__(self, key):
+        return key in self._values
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, dict(self))
+
+    def __getstate__(self):
+        return {"_values": dict(self), "_loaders": {}, "_revision": self._revision}
@@ -120,6 +120,52 @@ class TestConvertToJson(object):
 
         self._object = MockCustomClass()
 
+    def test_attributes_of_as_json_mixin_with_default_as_dict_are_converted(self):
+        self.given_object(Attributes(name="name", values=[Attributes(value=True)]))
+        self.when_convert_to_json()
+        self.then_result_is({"name": "name", "values": [{"value": True}]})
+
+    def test_objects_of_same_class_with_different_attributes_are_converted(self):
+        self.given_object([Attributes(name="name"), Attributes(value=None)])
+        self.when_convert_to_json()
+        self.then_result_is([{"name": "name"}, {"value": None}])
+
+    def test_overridden_as_dict_is_used(self):
+        self.given_object(AttributesWithOverriddenAsDict(name="name"))
+        self.when_convert_to_json()
+        self.then_result_is({"key": "value"})
+
+    @pytest.mark.parametrize(
+        "verbose,expected", [
+            (True, {
+                "name": "name",
+                "semantic_expression": "expression"
+            }),
+            (False, {
+                "semantic_expression": "expression"
+            }),
+        ]
+    )
+    def test_as_json_mixin_with_semantic_expression(self, verbose, expected):
+        self.given_object(AttributesWithSemanticExpression(name="name"))
+        self.when_convert_to_json(verbose=verbose)
+        self.then_result_is(expected)
+
+
+class Attributes(AsJSONMixin):
+    def __init__(self, **attributes):
+        self.__dict__.update(attributes)
+
+
+class AttributesWithOverriddenAsDict(Attributes):
+    def as_dict(self):
+        return {"key": "value"}
+
+
+class AttributesWithSemanticExpression(Attributes, AsSemanticExpressionMixin):
+    def __str__(self):
+        return "expression"
+
 
 class TestAsJSONMixin(object):
     def setup_method(self):
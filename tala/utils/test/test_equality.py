@@ -0,0 +1,109 @@
+import pickle
+import unittest
+from unittest.mock import patch
+
+from tala.utils.equality import EqualityMixin, FrozenEqualityMixin, has_stable_hash, structural_key
+
+
+class Item(FrozenEqualityMixin):
+    def __init__(self, name, values):
+        self.name = name
+        self.values = values
+
+
+class FrozenEqualityMixinTest(unittest.TestCase):
+    def test_objects_with_equal_attributes_are_equal(self):
+        self.assertEqual(Item("a", [1, 2]), Item("a", [1, 2]))
+
+    def test_objects_with_different_attributes_are_unequal(self):
+        self.assertNotEqual(Item("a", [1, 2]), Item("a", [1, 3]))
+
+    def test_equal_objects_have_equal_hashes(self):
+        self.assertEqual(hash(Item("a", {"b": {1}})), hash(Item("a", {"b": {1}})))
+
+    def test_hash_covers_attribute_values(self):
+        self.assertNotEqual(hash(Item("a", [1, 2])), hash(Item("b", [1, 2])))
+
+    def test_assigning_attribute_forgets_hash(self):
+        item = Item("a", [1, 2])
+        hash(item)
+        item.name = "b"
+        self.assertEqual(hash(Item("b", [1, 2])), hash(item))
+        self.assertEqual(Item("b", [1, 2]), item)
+
+    def test_deleting_attribute_forgets_hash(self):
+        item = Item("a", [1, 2])
+        hash(item)
+        del item.values
+        self.assertEqual({"name": "a"}, item.__dict__)
+        self.assertNotEqual(hash(Item("a", [1, 2])), hash(item))
+
+    def test_hash_is_not_among_attributes(self):
+        item = Item("a", [1, 2])
+        hash(item)
+        self.assertEqual({"name": "a", "values": [1, 2]}, item.__dict__)
+
+    def test_pickled_object_is_equal_to_original(self):
+        item = Item("a", [1, 2])
+        hash(item)
+        unpickled_item = pickle.loads(pickle.dumps(item))
+        self.assertEqual(item, unpickled_item)
+        self.assertEqual(hash(item), hash(unpickled_item))
+
+    def test_objects_stay_equal_after_list_is_mutated_in_place(self):
+        item = Item("a", [1, 2])
+        hash(item)
+        item.values.append(3)
+        self.assertEqual(Item("a", [1, 2, 3]), item)
+        self.assertEqual(hash(Item("a", [1, 2, 3])), hash(item))
+
+    def test_hashed_objects_with_different_attributes_are_unequal(self):
+        item = Item("a", (1, 2))
+        other_item = Item("b", (1, 2))
+        hash(item)
+        hash(other_item)
+        self.assertNotEqual(item, other_item)
+
+    def test_hash_of_object_with_tuple_attributes_is_computed_once(self):
+        item = Item("a", (1, 2))
+        hash(item)
+        with patch("tala.utils.equality.structural_key", wraps=structural_key) as mock_structural_key:
+            hash(item)
+        mock_structural_key.assert_not_called()
+
+    def test_hash_of_object_with_list_attribute_is_computed_every_time(self):
+        item = Item("a", [1, 2])
+        hash(item)
+        with patch("tala.utils.equality.structural_key", wraps=structural_key) as mock_structural_key:
+            hash(item)
+        mock_structural_key.assert_called()
+
+    def test_assigning_attribute_of_nested_object_forgets_hash(self):
+        item = Item("a", (Item("b", (1, 2)), ))
+        hash(item)
+        item.values[0].name = "c"
+        self.assertEqual(hash(Item("a", (Item("c", (1, 2)), ))), hash(item))
+        self.assertEqual(Item("a", (Item("c", (1, 2)), )), item)
+
+
+class HasStableHashTest(unittest.TestCase):
+    def test_tuple_of_strings_has_stable_hash(self):
+        self.assertTrue(has_stable_hash(("a", 1, None), []))
+
+    def test_tuple_containing_list_has_unstable_hash(self):
+        self.assertFalse(has_stable_hash(("a", [1]), []))
+
+    def test_hashable_object_has_stable_hash(self):
+        self.assertTrue(has_stable_hash(object(), []))
+
+    def test_frozen_object_with_tuple_attributes_has_stable_hash(self):
+        item = Item("a", (1, 2))
+        frozen_values = []
+        self.assertTrue(has_stable_hash(item, frozen_values))
+        self.assertEqual([item], frozen_values)
+
+    def test_frozen_object_with_list_attribute_has_unstable_hash(self):
+        self.assertFalse(has_stable_hash(Item("a", [1, 2]), []))
+
+    def test_object_with_equality_mixin_has_unstable_hash(self):
+        self.assertFalse(has_stable_hash(EqualityMixin(), []))
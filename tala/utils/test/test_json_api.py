@@ -276,3 +276,91 @@ class TestJSONAPI:
                 'version:id': '2'
             }]
         })
+
+    def test_has_relationship_in_list_relationship(self):
+        self.given_json_api_created()
+        self.given_appended_relationship("list-relationship", self._entry("some-type", "some-id"))
+        self.given_appended_relationship("list-relationship", self._entry("some-type", "other-id"))
+        self.then_has_relationship("list-relationship", "other-id", True)
+        self.then_has_relationship("list-relationship", "missing-id", False)
+
+    def given_appended_relationship(self, name, entry):
+        self._json_api.append_relationship(name, entry)
+
+    def _entry(self, type_, id_):
+        return {"data": {"type": type_, "id": id_, "attributes": {}, "relationships": {}}, "included": []}
+
+    def then_has_relationship(self, name, id_, expected):
+        assert expected == self._json_api.has_relationship(name, id_)
+
+    def test_has_relationship_after_appending_to_list_relationship(self):
+        self.given_json_api_created()
+        self.given_appended_relationship("list-relationship", self._entry("some-type", "some-id"))
+        self.given_has_relationship_was_checked("list-relationship", "other-id")
+        self.given_appended_relationship("list-relationship", self._entry("some-type", "other-id"))
+        self.then_has_relationship("list-relationship", "other-id", True)
+
+    def given_has_relationship_was_checked(self, name, id_):
+        self._json_api.has_relationship(name, id_)
+
+    def test_has_relationship_in_single_relationship(self):
+        self.given_json_api_created()
+        self.given_added_relationship("single-relationship", self._entry("some-type", "some-id"))
+        self.then_has_relationship("single-relationship", "some-id", True)
+        self.then_has_relationship("single-relationship", "other-id", False)
+
+    def given_added_relationship(self, name, entry):
+        self._json_api.add_relationship(name, entry)
+
+    def test_has_no_relationship_with_unknown_name(self):
+        self.given_json_api_created()
+        self.then_has_relationship("unknown", "some-id", False)
+
+
+class TestIncludedObject:
+    def setup_method(self):
+        self._included = json_api.IncludedObject([
+            {"type": "some-type", "id": "some-id", "attributes": {"name": "first"}},
+            {"type": "other-type", "id": "some-id", "attributes": {}},
+            {"type": "some-type", "id": "other-id", "attributes": {}},
+        ])  # yapf: disable
+
+    def test_object_is_included_only_once(self):
+        self._included.include({"type": "some-type", "id": "some-id", "attributes": {"name": "second"}})
+        assert 3 == len(self._included)
+        assert {"name": "first"} == self._get("some-type", "some-id")["attributes"]
+
+    def _get(self, type_, id_):
+        return self._included.get_object_from_relationship({"type": type_, "id": id_})
+
+    def test_objects_are_grouped_by_type(self):
+        keys = [(item["type"], item["id"]) for item in self._included]
+        assert [("some-type", "some-id"), ("some-type", "other-id"), ("other-type", "some-id")] == keys
+        assert list(self._included) == self._included.as_list
+
+    def test_contains_key(self):
+        assert {"type": "other-type", "id": "some-id"} in self._included
+        assert {"type": "other-type", "id": "other-id"} not in self._included
+
+    def test_module_lookup_in_included_object(self):
+        key = {"type": "other-type", "id": "some-id"}
+        assert self._get("other-type", "some-id") is json_api.get_object_from_relationship(self._included, key)
+
+    def test_module_lookup_of_missing_object_in_list(self):
+        key = {"type": "missing-type", "id": "some-id"}
+        assert json_api.get_object_from_relationship(self._included.as_list, key) is None
+
+    def test_subset_for_data_has_only_objects_it_refers_to(self):
+        self._included.include({
+            "type": "referring-type",
+            "id": "some-id",
+            "relationships": {
+                "other": {
+                    "data": {"type": "some-type", "id": "other-id"}
+                }
+            }
+        })  # yapf: disable
+        data = {"relationships": {"items": {"data": [{"type": "referring-type", "id": "some-id"}]}}}
+        subset = self._included.subset_for(data)
+        keys = [(item["type"], item["id"]) for item in subset]
+        assert [("referring-type", "some-id"), ("some-type", "other-id")] == keys
@@ -0,0 +1,92 @@
+import copy
+import pickle
+import unittest
+
+from tala.utils.lazy_dict import LazyDict
+
+
+class LoaderMock:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+class LazyDictTest(unittest.TestCase):
+    def test_lookup_of_given_value(self):
+        lazy_dict = LazyDict({"key": "value"})
+        self.assertEqual("value", lazy_dict["key"])
+
+    def test_loader_is_called_on_first_lookup_only(self):
+        loader = LoaderMock("value")
+        lazy_dict = LazyDict()
+        lazy_dict.set_loader("key", loader)
+        self.assertEqual("value", lazy_dict["key"])
+        self.assertEqual("value", lazy_dict["key"])
+        self.assertEqual(1, loader.calls)
+
+    def test_membership_and_iteration_do_not_load(self):
+        loader = LoaderMock("value")
+        lazy_dict = LazyDict()
+        lazy_dict.set_loader("key", loader)
+        self.assertIn("key", lazy_dict)
+        self.assertEqual(["key"], list(lazy_dict))
+        self.assertEqual(1, len(lazy_dict))
+        self.assertFalse(lazy_dict.is_loaded("key"))
+        self.assertEqual(0, loader.calls)
+
+    def test_keys_keep_insertion_order(self):
+        lazy_dict = LazyDict({"first": 1})
+        lazy_dict.set_loader("second", LoaderMock(2))
+        lazy_dict["third"] = 3
+        self.assertEqual([("first", 1), ("second", 2), ("third", 3)], list(lazy_dict.items()))
+
+    def test_setting_value_replaces_loader(self):
+        loader = LoaderMock("loaded value")
+        lazy_dict = LazyDict()
+        lazy_dict.set_loader("key", loader)
+        lazy_dict["key"] = "value"
+        self.assertEqual("value", lazy_dict["key"])
+        self.assertEqual(0, loader.calls)
+
+    def test_missing_key_raises_key_error(self):
+        with self.assertRaises(KeyError):
+            LazyDict()["key"]
+
+    def test_equality_with_dict_loads_values(self):
+        lazy_dict = LazyDict()
+        lazy_dict.set_loader("key", LoaderMock("value"))
+        self.assertEqual({"key": "value"}, lazy_dict)
+
+    def test_pickling_loads_values(self):
+        lazy_dict = LazyDict()
+        lazy_dict.set_loader("key", LoaderMock("value"))
+        unpickled = pickle.loads(pickle.dumps(lazy_dict))
+        self.assertTrue(unpickled.is_loaded("key"))
+        self.assertEqual("value", unpickled["key"])
+
+    def test_deepcopy_loads_values(self):
+        lazy_dict = LazyDict()
+        lazy_dict.set_loader("key", LoaderMock("value"))
+        self.assertEqual("value", copy.deepcopy(lazy_dict)["key"])
+
+    def test_revision_changes_when_keys_change_but_not_when_value_is_loaded(self):
+        lazy_dict = LazyDict({"key": "value"})
+        revision = lazy_dict.revision
+        lazy_dict.set_loader("other key", LoaderMock("other value"))
+        self.assertNotEqual(revision, lazy_dict.revision)
+        revision = lazy_dict.revision
+        lazy_dict["other key"]
+        self.assertEqual(revision, lazy_dict.revision)
+        del lazy_dict["key"]
+        self.assertNotEqual(revision, lazy_dict.revision)
+
+    def test_loaded_count(self):
+        lazy_dict = LazyDict({"key": "value"})
+        lazy_dict.set_loader("other key", LoaderMock("other value"))
+        self.assertEqual(1, lazy_dict.loaded_count)
+        lazy_dict["other key"]
+        self.assertEqual(2, lazy_dict.loaded_count)
@@ -0,0 +1,72 @@
+import pickle
+import unittest
+
+from tala.utils.lru_cache import LRUCache
+
+
+class LRUCacheTest(unittest.TestCase):
+    def test_lookup_of_stored_value(self):
+        cache = LRUCache()
+        cache["key"] = "value"
+        self.assertEqual("value", cache["key"])
+
+    def test_missing_key_raises_key_error(self):
+        cache = LRUCache()
+        with self.assertRaises(KeyError):
+            cache["key"]
+
+    def test_counts_hits_and_misses(self):
+        cache = LRUCache()
+        cache["key"] = "value"
+        cache["key"]
+        try:
+            cache["other key"]
+        except KeyError:
+            pass
+        self.assertEqual({"hits": 1, "misses": 1, "size": 1, "max_size": None}, cache.stats())
+
+    def test_evicts_least_recently_used_entry(self):
+        cache = LRUCache(max_size=2)
+        cache["first"] = 1
+        cache["second"] = 2
+        cache["first"]
+        cache["third"] = 3
+        self.assertIn("first", cache)
+        self.assertNotIn("second", cache)
+        self.assertIn("third", cache)
+
+    def test_clear(self):
+        cache = LRUCache()
+        cache["key"] = "value"
+        cache.clear()
+        self.assertEqual(0, len(cache))
+
+    def test_get_counts_hits_and_misses(self):
+        cache = LRUCache()
+        cache["key"] = "value"
+        self.assertEqual("value", cache.get("key"))
+        self.assertEqual("default", cache.get("other key", "default"))
+        self.assertEqual({"hits": 1, "misses": 1, "size": 1, "max_size": None}, cache.stats())
+
+    def test_delete_and_iterate(self):
+        cache = LRUCache()
+        cache["first"] = 1
+        cache["second"] = 2
+        del cache["first"]
+        self.assertEqual(["second"], list(cache))
+
+    def test_entries_can_be_deleted_while_iterating(self):
+        cache = LRUCache()
+        cache["first"] = 1
+        cache["second"] = 2
+        for key in cache:
+            del cache[key]
+        self.assertEqual(0, len(cache))
+
+    def test_pickled_cache_keeps_its_entries(self):
+        cache = LRUCache(max_size=10)
+        cache["key"] = "value"
+        unpickled_cache = pickle.loads(pickle.dumps(cache))
+        self.assertEqual("value", unpickled_cache["key"])
+        unpickled_cache["other key"] = "other value"
+        self.assertEqual(2, len(unpickled_cache))
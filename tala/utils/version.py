@@ -0,0 +1,8 @@
+import importlib.metadata
+
+
+def installed_tala_version():
+    try:
+        return importlib.metadata.version("tala")
+    except importlib.metadata.PackageNotFoundError:
+        return None